@@ -1,5 +1,7 @@
 import logging
 
+from walkoff.appgateway import get_worker_app_data_cache
+from walkoff.appgateway.appdatacache import AppDataCache
 from walkoff.executiondb.device import get_app as get_db_app
 from apps.messaging import *
 from walkoff.appgateway.decorators import *
@@ -15,6 +17,9 @@ class App(object):
         device (apps.devicedb.Device): The ORM of the device with the ID passed into teh constructor
         device_fields (dict): A dict of the plaintext fields of the device
         device_type (str): The type of device associated with self.device
+        execution_cache (AppDataCache): A cache shared by the actions executed by this app instance during a workflow
+            execution
+        worker_cache (AppDataCache): A cache shared by all instances of this app in the worker process
 
     Args:
         app (str): The name of the app
@@ -33,6 +38,30 @@ class App(object):
             self.device_fields = {}
             self.device_type = None
         self.device_id = device
+        self._app_name = app
+        self._execution_cache = AppDataCache()
+
+    @property
+    def execution_cache(self):
+        """The cache shared by the actions executed by this app instance during a workflow execution. Use this
+            instead of returning large objects only so that later actions can reference them.
+
+        Returns:
+            (AppDataCache): The execution-scoped cache
+        """
+        if getattr(self, '_execution_cache', None) is None:
+            self._execution_cache = AppDataCache()
+        return self._execution_cache
+
+    @property
+    def worker_cache(self):
+        """The cache shared by all instances of this app in the worker process. Values persist across workflow
+            executions, so it is suited for state such as authentication tokens or parsed feeds.
+
+        Returns:
+            (AppDataCache): The worker-scoped cache
+        """
+        return get_worker_app_data_cache(getattr(self, '_app_name', None) or self.__class__.__module__)
 
     def get_all_devices(self):
         """Gets all the devices associated with this app
@@ -42,6 +71,27 @@ class App(object):
         """
         return list(self.app.devices) if self.app is not None else []
 
+    def export_state(self):
+        """Gets the state of this app instance which should be restored when a paused workflow resumes. Only this
+            state is saved, so apps which keep other state between actions should override this method and
+            import_state. By default, the contents of the execution cache are exported
+
+        Returns:
+            The state to save, preferably JSON-serializable, or None if there is nothing to save
+        """
+        if getattr(self, '_execution_cache', None):
+            return {'execution_cache': self._execution_cache}
+        return None
+
+    def import_state(self, state):
+        """Restores state exported by export_state after the app instance is recreated for a resumed workflow
+
+        Args:
+            state: The state returned by export_state
+        """
+        if isinstance(state, dict) and 'execution_cache' in state:
+            self._execution_cache = state['execution_cache']
+
     def shutdown(self):
         """When implemented, this method performs shutdown procedures for the app
         """
@@ -7,6 +7,7 @@ from walkoff.events import WalkoffEvent, EventType
 from walkoff.executiondb.executionelement import ExecutionElement
 from walkoff.executiondb.schemas import dump_element
 from walkoff.helpers import get_function_arg_names
+from walkoff.resultstore import resolve_result_reference
 from .dispatchers import AppEventDispatcher, EventDispatcher
 from .exceptions import UnknownEvent, InvalidEventHandler
 from .util import validate_events, add_docstring
@@ -80,16 +81,40 @@ class InterfaceEventDispatcher(object):
         """
 
         def dispatch_method(sender, **kwargs):
-            if event.event_type != EventType.controller:
-                sender_data = InterfaceEventDispatcher._format_data(sender, kwargs)
-            else:
-                sender_data = None
-            cls.event_dispatcher.dispatch(event, sender_data)
-            if event.event_type == EventType.action:
+            if event.event_type == EventType.controller:
+                if cls.event_dispatcher.has_listeners(event, EventType.controller.name):
+                    cls.event_dispatcher.dispatch(event, None)
+                return
+            sender_id, sender_name, app, action = InterfaceEventDispatcher._get_sender_keys(sender, kwargs)
+            has_event_listeners = cls.event_dispatcher.has_listeners(event, sender_id, sender_name)
+            has_action_listeners = (event.event_type == EventType.action
+                                    and cls.app_action_dispatcher.has_listeners(event, app, action))
+            if not (has_event_listeners or has_action_listeners):
+                return
+            sender_data = InterfaceEventDispatcher._format_data(sender, kwargs)
+            if has_event_listeners:
+                cls.event_dispatcher.dispatch(event, sender_data)
+            if has_action_listeners:
                 cls.app_action_dispatcher.dispatch(event, sender_data)
 
         return dispatch_method
 
+    @staticmethod
+    def _get_sender_keys(sender, kwargs):
+        """Gets the keys by which the dispatchers route an event, without formatting the data of the event
+
+        Args:
+            sender (dict|ExecutionElement): The sender of the event
+            kwargs (dict): The keyword arguments sent with the event
+
+        Returns:
+            tuple(str, str, str, str): The ID and name of the sender, and its app and action. They are None if they
+                cannot be found without formatting the data, in which case the event is routed by its type only
+        """
+        if not isinstance(sender, dict) or 'id' not in sender or 'id' in kwargs or 'name' in kwargs:
+            return None, None, None, None
+        return sender['id'], sender.get('name'), sender.get('app_name'), sender.get('action_name')
+
     @staticmethod
     def _format_data(sender, kwargs):
         if not isinstance(sender, dict) and isinstance(sender, ExecutionElement):
@@ -105,6 +130,8 @@ class InterfaceEventDispatcher(object):
                 additional_data['data'] = additional_data['data'].pop('data')
             if not additional_data['data']:
                 additional_data.pop('data')
+            elif isinstance(additional_data['data'], dict) and 'result' in additional_data['data']:
+                additional_data['data']['result'] = resolve_result_reference(additional_data['data']['result'])
         sender_data.update(additional_data)
         if 'id' in sender_data:
             sender_data['sender_id'] = sender_data.pop('id')
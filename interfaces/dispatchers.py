@@ -1,7 +1,8 @@
 import logging
-from weakref import WeakSet
+from weakref import WeakSet, ref
 
 import walkoff.config.config
+from interfaces.handlerpool import handler_pool
 from interfaces.util import convert_to_iterable
 from walkoff.events import EventType
 from walkoff.helpers import UnknownAppAction, UnknownApp
@@ -15,11 +16,14 @@ class CallbackContainer(object):
     Attributes:
         weak (WeakSet(func)): Weak references to callbacks
         strong (set(func)): Strong references to callbacks
+        version (int): The number of registrations in all containers. The dispatchers rebuild their dispatch tables
+            when it changes
 
     Args:
         weak (iterable(func), optional): The initial functions to add as weak references. Defaults to None
         strong (iterable(func), optional): The initial functions to add as strong references. Defaults to None
     """
+    version = 0
 
     def __init__(self, weak=None, strong=None):
         self.weak = WeakSet() if weak is None else WeakSet(weak)
@@ -36,6 +40,7 @@ class CallbackContainer(object):
             self.weak.add(func)
         else:
             self.strong.add(func)
+        CallbackContainer.version += 1
 
     def __iter__(self):
         for weak_callback in self.weak:
@@ -83,6 +88,8 @@ class AppActionEventDispatcher(object):
         app (str): The app associated with this dispatcher
         action (str): The action associated with this dispatcher
         _event_router(dict(WalkoffEvent: dict(int|str: CallbackContainer))): The router for events
+        _dispatch_table(dict(tuple: tuple)): The flattened callbacks for each event and device ID, and the version of
+            the registrations they were built from
 
     Args:
         app (str): The app associated with this dispatcher
@@ -93,6 +100,7 @@ class AppActionEventDispatcher(object):
         self.app = app
         self.action = action
         self._event_router = {}
+        self._dispatch_table = {}
 
     def register_event(self, event, device_ids, func, weak=True):
         """Registers an event and device_ids to a function
@@ -117,13 +125,18 @@ class AppActionEventDispatcher(object):
         """Dispatches an event to all registered callbacks
 
         Note:
-            All exceptions thrown by callbacks will be caught and logged, but not handled
+            All exceptions thrown by callbacks will be caught and logged, but not handled. If the handler pool is
+            enabled, the callbacks are queued to run on it
 
         Args:
             event_ (WalkoffEvent): The event to dispatch
             data (dict): The data to send to the functions
         """
+        use_pool = handler_pool.enabled
         for callback in self._get_callbacks(event_, data['device_id']):
+            if use_pool:
+                handler_pool.submit(callback, (data,))
+                continue
             try:
                 callback(data)
             except Exception as e:
@@ -150,16 +163,30 @@ class AppActionEventDispatcher(object):
             event (WalkoffEvent): The event whose callbacks to retrieve
             device_id (str|int): The device ID whose callbacks to receive
 
-        Yields:
-            func: The next callback
+        Returns:
+            tuple(func): The callbacks
         """
-        if event in self._event_router:
-            for callback in self._event_router[event].get('all', []):
-                yield callback
-            if device_id != 'all':
-                for callback in self._event_router[event].get(device_id, []):
-                    yield callback
-        raise StopIteration
+        devices = self._event_router.get(event)
+        if devices is None:
+            return ()
+        key = (event, device_id if device_id != 'all' and device_id in devices else None)
+        entry = self._dispatch_table.get(key)
+        if entry is None or entry[0] != CallbackContainer.version:
+            containers = [devices[device] for device in ('all', key[1]) if device in devices]
+            entry = (CallbackContainer.version,) + _flatten_callbacks(containers)
+            self._dispatch_table[key] = entry
+        return _live_callbacks(entry)
+
+    def has_listeners(self, event):
+        """Are any callbacks registered for an event?
+
+        Args:
+            event (WalkoffEvent): The event to check
+
+        Returns:
+            bool: Are any callbacks registered for the event?
+        """
+        return event in self._event_router
 
     def is_registered(self, event, device_id, func):
         """Is a function registered?
@@ -188,10 +215,12 @@ class AppEventDispatcher(object):
 
     Attributes:
         _router (dict(str: dict(str: AppActionEventDispatcher))): The router
+        _listened_events (set(WalkoffEvent)): The events which have registered callbacks
     """
 
     def __init__(self):
         self._router = {}
+        self._listened_events = set()
 
     def register_app_actions(self, func, app, events, actions='all', device_ids='all', weak=True):
         """Registers an callback for a given event, app, action, and device ID
@@ -219,6 +248,24 @@ class AppEventDispatcher(object):
                 self._router[app][action] = AppActionEventDispatcher(app, action)
             for event in events:
                 self._router[app][action].register_event(event, device_ids, func, weak=weak)
+        self._listened_events.update(events)
+
+    def has_listeners(self, event, app=None, action=None):
+        """Are any callbacks registered for an event from an app and action?
+
+        Args:
+            event (WalkoffEvent): The event to check
+            app (str, optional): The app of the action which sent the event. Defaults to None, meaning any app
+            action (str, optional): The action which sent the event. Defaults to None, meaning any action
+
+        Returns:
+            bool: Are any callbacks registered for the event?
+        """
+        if event not in self._listened_events:
+            return False
+        if app is None or action is None:
+            return True
+        return app in self._router and action in self._router[app] and self._router[app][action].has_listeners(event)
 
     def dispatch(self, event_, data):
         """Dispatches an event to all registered callbacks
@@ -287,10 +334,15 @@ class EventDispatcher(object):
 
     Attributes:
         _router (dict(str: dict(WalkoffEvent: CallbackContainer))): The router
+        _listened_events (set(WalkoffEvent)): The events which have registered callbacks
+        _dispatch_table(dict(tuple: tuple)): The flattened callbacks for each event, sender ID, and sender name, and the
+            version of the registrations they were built from
     """
 
     def __init__(self):
         self._router = {}
+        self._listened_events = set()
+        self._dispatch_table = {}
 
     def register_events(self, func, events, sender_ids=None, names=None, weak=True):
         """Registers an event for a given sender ID or name
@@ -321,23 +373,28 @@ class EventDispatcher(object):
             if event not in self._router[entry_id]:
                 self._router[entry_id][event] = CallbackContainer()
             self._router[entry_id][event].register(func, weak=weak)
+            self._listened_events.add(event)
 
     def dispatch(self, event_, data):
         """Dispatches an event to all its registered callbacks
 
         Note:
-            All exceptions thrown by callbacks will be caught and logged, but not handled
+            All exceptions thrown by callbacks will be caught and logged, but not handled. If the handler pool is
+            enabled, the callbacks are queued to run on it
 
         Args:
             event_ (WalkoffEvent): The event to dispatch
             data (dict): The data to send to all the events
         """
         sender_name, sender_id = self.__get_sender_ids(data, event_)
-        callbacks = self._get_callbacks(sender_id, sender_name, event_)
+        args = (data,) if event_.event_type != EventType.controller else tuple()
+        use_pool = handler_pool.enabled
 
-        for func in callbacks:
+        for func in self._get_callbacks(sender_id, sender_name, event_):
+            if use_pool:
+                handler_pool.submit(func, args)
+                continue
             try:
-                args = (data,) if event_.event_type != EventType.controller else tuple()
                 func(*args)
             except Exception as e:
                 _logger.exception('Error calling interface event handler: {}'.format(e))
@@ -361,14 +418,36 @@ class EventDispatcher(object):
             event (WalkoffEvent): The event
 
         Returns:
-            set(func): The callbacks registered
+            tuple(func): The callbacks registered, each of them once
         """
-        all_callbacks = set()
-        for sender_id_ in ('all', sender_id, sender_name):
-            if self.__is_event_registered_to_sender(sender_id_, event):
-                all_callbacks |= set(self._router[sender_id_][event])
+        key = (event,
+               sender_id if sender_id in self._router else None,
+               sender_name if sender_name in self._router else None)
+        entry = self._dispatch_table.get(key)
+        if entry is None or entry[0] != CallbackContainer.version:
+            containers = [self._router[sender_id_][event] for sender_id_ in ('all',) + key[1:]
+                          if self.__is_event_registered_to_sender(sender_id_, event)]
+            entry = (CallbackContainer.version,) + _flatten_callbacks(containers, unique=True)
+            self._dispatch_table[key] = entry
+        return _live_callbacks(entry)
+
+    def has_listeners(self, event, sender_id=None, sender_name=None):
+        """Are any callbacks registered for an event from a sender?
 
-        return all_callbacks
+        Args:
+            event (WalkoffEvent): The event to check
+            sender_id (str, optional): The ID of the sender of the event. Defaults to None, meaning any sender
+            sender_name (str, optional): The name of the sender of the event. Defaults to None
+
+        Returns:
+            bool: Are any callbacks registered for the event?
+        """
+        if event not in self._listened_events:
+            return False
+        if sender_id is None:
+            return True
+        return any(self.__is_event_registered_to_sender(sender_id_, event)
+                   for sender_id_ in ('all', sender_id, sender_name))
 
     def __is_event_registered_to_sender(self, sender_id, event):
         return (sender_id is not None
@@ -386,3 +465,38 @@ class EventDispatcher(object):
             bool: Is the function registered?
         """
         return entry in self._router and event in self._router[entry] and self._router[entry][event].is_registered(func)
+
+
+def _flatten_callbacks(containers, unique=False):
+    """Flattens the callbacks of some containers
+
+    Args:
+        containers (iterable(CallbackContainer)): The containers
+        unique (bool, optional): Should a callback registered in several containers be included once? Defaults to
+            False
+
+    Returns:
+        tuple(tuple(func), tuple(weakref)): The callbacks with strong references, and weak references to the callbacks
+            with weak references, so that the dispatch tables do not keep them alive
+    """
+    strong = [callback for container in containers for callback in container.strong]
+    weak = [callback for container in containers for callback in container.weak]
+    if unique:
+        strong = list(set(strong))
+        weak = list(set(weak) - set(strong))
+    return tuple(strong), tuple(ref(callback) for callback in weak)
+
+
+def _live_callbacks(entry):
+    """Gets the callbacks of a dispatch table entry whose weak references are alive
+
+    Args:
+        entry (tuple): The dispatch table entry
+
+    Returns:
+        tuple(func): The callbacks
+    """
+    _, strong, weak = entry
+    if not weak:
+        return strong
+    return strong + tuple(callback for callback in (reference() for reference in weak) if callback is not None)
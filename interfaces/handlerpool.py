@@ -0,0 +1,189 @@
+import logging
+from weakref import WeakKeyDictionary
+
+import gevent
+from gevent.lock import BoundedSemaphore
+from gevent.queue import Queue, Full
+
+import walkoff.config.config
+
+_logger = logging.getLogger(__name__)
+
+
+class HandlerQueue(object):
+    """The queue of events waiting to be handled by an interface event handler
+
+    Attributes:
+        name (str): The name of the handler
+        queue (Queue): The arguments of the events waiting to be handled
+        running (bool): Is a greenlet handling the events of the queue?
+        handled (int): The number of events which have been handled
+        dropped (int): The number of events which were dropped because the queue was full
+        timed_out (int): The number of events whose handling was interrupted because it took too long
+        failed (int): The number of events whose handling raised an exception
+
+    Args:
+        name (str): The name of the handler
+        maxsize (int): The maximum number of events waiting to be handled
+    """
+
+    def __init__(self, name, maxsize):
+        self.name = name
+        self.queue = Queue(maxsize=maxsize)
+        self.running = False
+        self.handled = 0
+        self.dropped = 0
+        self.timed_out = 0
+        self.failed = 0
+        self._warned = False
+
+    def as_json(self):
+        """Gets the JSON representation of the metrics of the queue
+
+        Returns:
+            (dict): The JSON representation of the metrics of the queue
+        """
+        return {'name': self.name,
+                'pending': self.queue.qsize(),
+                'handled': self.handled,
+                'dropped': self.dropped,
+                'timed_out': self.timed_out,
+                'failed': self.failed}
+
+
+class InterfaceHandlerPool(object):
+    """Runs interface event handlers on a bounded pool of greenlets, so that a slow handler does not stall the signal
+        which sent the event. Each handler has its own queue of events, which a single greenlet handles in the order
+        they were sent, and at most `size` handlers run at the same time
+
+    Note:
+        Timeouts interrupt a handler only when it yields to the gevent hub, for example while waiting for a
+        monkey-patched socket
+
+    Attributes:
+        size (int): The maximum number of handlers running at the same time. If None, the interface_handler_pool_size
+            value in walkoff.config.config is used, and handlers run as events are sent if it is None too
+        queue_size (int): The maximum number of events waiting for each handler. If None, the
+            interface_handler_queue_size value in walkoff.config.config is used
+        timeout (float): The number of seconds after which a handler is interrupted. If None, the
+            interface_handler_timeout value in walkoff.config.config is used
+
+    Args:
+        size (int, optional): The maximum number of handlers running at the same time. Defaults to None
+        queue_size (int, optional): The maximum number of events waiting for each handler. Defaults to None
+        timeout (float, optional): The number of seconds after which a handler is interrupted. Defaults to None
+    """
+
+    def __init__(self, size=None, queue_size=None, timeout=None):
+        self.size = size
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._queues = WeakKeyDictionary()
+        self._greenlets = set()
+        self._semaphore = None
+
+    @property
+    def enabled(self):
+        """Do handlers run on the pool?"""
+        return self.__get_size() is not None
+
+    def submit(self, handler, args):
+        """Queues an event to be handled by a handler on the pool
+
+        Args:
+            handler (func): The handler
+            args (tuple): The arguments to call the handler with
+
+        Returns:
+            (bool): True if the event was queued. False if it was dropped because the queue of the handler was full
+        """
+        handler_queue = self._queues.get(handler)
+        if handler_queue is None:
+            handler_queue = HandlerQueue(_get_handler_name(handler), self.__get_queue_size())
+            self._queues[handler] = handler_queue
+        try:
+            handler_queue.queue.put_nowait(args)
+        except Full:
+            handler_queue.dropped += 1
+            if not handler_queue._warned:
+                handler_queue._warned = True
+                _logger.warning('Event queue of interface event handler {} is full. Dropping events until it has '
+                                'room'.format(handler_queue.name))
+            return False
+        if not handler_queue.running:
+            handler_queue.running = True
+            greenlet = gevent.spawn(self.__drain, handler, handler_queue)
+            self._greenlets.add(greenlet)
+            greenlet.link(self._greenlets.discard)
+        return True
+
+    def flush(self, timeout=None):
+        """Waits for the handlers to handle all of the queued events
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait. Defaults to None, meaning no limit
+        """
+        gevent.joinall(list(self._greenlets), timeout=timeout)
+
+    def metrics(self):
+        """Gets the metrics of the queues of the handlers
+
+        Returns:
+            (list[dict]): The numbers of pending, handled, dropped, timed out, and failed events of each handler which
+                has been called on the pool
+        """
+        return sorted((handler_queue.as_json() for handler_queue in list(self._queues.values())),
+                      key=lambda handler_queue: handler_queue['name'])
+
+    def __drain(self, handler, handler_queue):
+        try:
+            while not handler_queue.queue.empty():
+                args = handler_queue.queue.get_nowait()
+                with self.__get_semaphore():
+                    self.__run(handler, handler_queue, args)
+        finally:
+            handler_queue.running = False
+
+    def __run(self, handler, handler_queue, args):
+        timeout = gevent.Timeout(self.__get_timeout())
+        timeout.start()
+        try:
+            handler(*args)
+        except gevent.Timeout as e:
+            if e is not timeout:
+                raise
+            handler_queue.timed_out += 1
+            _logger.warning('Interface event handler {0} timed out after {1} seconds'.format(handler_queue.name,
+                                                                                             timeout.seconds))
+        except Exception as e:
+            handler_queue.failed += 1
+            _logger.exception('Error calling interface event handler {0}: {1}'.format(handler_queue.name, e))
+        else:
+            handler_queue.handled += 1
+            handler_queue._warned = False
+        finally:
+            timeout.cancel()
+
+    def __get_semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = BoundedSemaphore(self.__get_size())
+        return self._semaphore
+
+    def __get_size(self):
+        return self.size if self.size is not None else walkoff.config.config.interface_handler_pool_size
+
+    def __get_queue_size(self):
+        return self.queue_size if self.queue_size is not None else walkoff.config.config.interface_handler_queue_size
+
+    def __get_timeout(self):
+        return self.timeout if self.timeout is not None else walkoff.config.config.interface_handler_timeout
+
+
+def _get_handler_name(handler):
+    module = getattr(handler, '__module__', None)
+    name = getattr(handler, '__qualname__', getattr(handler, '__name__', repr(handler)))
+    return '{0}.{1}'.format(module, name) if module else name
+
+
+handler_pool = InterfaceHandlerPool()
+"""InterfaceHandlerPool: The pool which runs the interface event handlers"""
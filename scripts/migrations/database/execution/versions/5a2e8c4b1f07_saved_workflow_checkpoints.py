@@ -0,0 +1,84 @@
+"""saved workflow checkpoints
+
+Revision ID: 5a2e8c4b1f07
+Revises: d3ad4b5a6ce0
+Create Date: 2018-06-04 14:21:37.216409
+
+"""
+import logging
+import pickle
+
+from alembic import op
+import sqlalchemy as sa
+
+from walkoff.executiondb.checkpoint import encode_checkpoint, decode_checkpoint
+
+
+# revision identifiers, used by Alembic.
+revision = '5a2e8c4b1f07'
+down_revision = 'd3ad4b5a6ce0'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+def _saved_workflow_table(*columns):
+    return sa.table('saved_workflow', sa.column('workflow_execution_id', sa.String(36)), *columns)
+
+
+def upgrade():
+    with op.batch_alter_table('saved_workflow') as batch_op:
+        batch_op.add_column(sa.Column('checkpoint', sa.LargeBinary(), nullable=True))
+
+    # The saved app instances are not converted, because checkpoints only hold the state an app instance exports.
+    # Resumed workflows create new app instances instead
+    connection = op.get_bind()
+    saved_workflow = _saved_workflow_table(sa.column('accumulator', sa.LargeBinary()),
+                                           sa.column('checkpoint', sa.LargeBinary()))
+    rows = connection.execute(sa.select([saved_workflow.c.workflow_execution_id,
+                                         saved_workflow.c.accumulator])).fetchall()
+    for execution_id, accumulator in rows:
+        where = saved_workflow.c.workflow_execution_id == execution_id
+        try:
+            checkpoint = encode_checkpoint(pickle.loads(accumulator) if accumulator is not None else {}, {})
+        except Exception:
+            logger.warning('Could not convert the saved state of workflow execution {}. Removing it'.format(
+                execution_id), exc_info=True)
+            connection.execute(saved_workflow.delete().where(where))
+        else:
+            connection.execute(saved_workflow.update().where(where).values(checkpoint=checkpoint))
+
+    with op.batch_alter_table('saved_workflow') as batch_op:
+        batch_op.alter_column('checkpoint', existing_type=sa.LargeBinary(), nullable=False)
+        batch_op.drop_column('accumulator')
+        batch_op.drop_column('app_instances')
+
+
+def downgrade():
+    with op.batch_alter_table('saved_workflow') as batch_op:
+        batch_op.add_column(sa.Column('app_instances', sa.PickleType(), nullable=True))
+        batch_op.add_column(sa.Column('accumulator', sa.PickleType(), nullable=True))
+
+    connection = op.get_bind()
+    saved_workflow = _saved_workflow_table(sa.column('checkpoint', sa.LargeBinary()),
+                                           sa.column('accumulator', sa.PickleType()),
+                                           sa.column('app_instances', sa.PickleType()))
+    rows = connection.execute(sa.select([saved_workflow.c.workflow_execution_id,
+                                         saved_workflow.c.checkpoint])).fetchall()
+    for execution_id, checkpoint in rows:
+        where = saved_workflow.c.workflow_execution_id == execution_id
+        try:
+            accumulator, _ = decode_checkpoint(checkpoint)
+            values = {'accumulator': dict(accumulator), 'app_instances': {}}
+        except Exception:
+            logger.warning('Could not convert the checkpoint of workflow execution {}. Removing it'.format(
+                execution_id), exc_info=True)
+            connection.execute(saved_workflow.delete().where(where))
+        else:
+            connection.execute(saved_workflow.update().where(where).values(**values))
+
+    with op.batch_alter_table('saved_workflow') as batch_op:
+        batch_op.alter_column('app_instances', existing_type=sa.PickleType(), nullable=False)
+        batch_op.alter_column('accumulator', existing_type=sa.PickleType(), nullable=False)
+        batch_op.drop_column('checkpoint')
@@ -0,0 +1,40 @@
+"""execution log
+
+Revision ID: 7c1f3e9a2b64
+Revises: 5a2e8c4b1f07
+Create Date: 2018-06-07 10:42:18.573190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy_utils
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1f3e9a2b64'
+down_revision = '5a2e8c4b1f07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('execution_log',
+                    sa.Column('id', sa.Integer(), nullable=False),
+                    sa.Column('workflow_execution_id', sqlalchemy_utils.types.uuid.UUIDType(binary=False),
+                              nullable=False),
+                    sa.Column('workflow_id', sqlalchemy_utils.types.uuid.UUIDType(binary=False), nullable=False),
+                    sa.Column('action_id', sqlalchemy_utils.types.uuid.UUIDType(binary=False), nullable=False),
+                    sa.Column('event', sa.String(length=80), nullable=False),
+                    sa.Column('status', sa.String(length=80), nullable=True),
+                    sa.Column('result', sa.Text(), nullable=True),
+                    sa.Column('result_id', sa.String(length=64), nullable=True),
+                    sa.Column('worker_id', sa.Integer(), nullable=True),
+                    sa.Column('timestamp', sa.DateTime(), nullable=True),
+                    sa.PrimaryKeyConstraint('id'))
+    op.create_index(op.f('ix_execution_log_workflow_execution_id'), 'execution_log', ['workflow_execution_id'],
+                    unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_execution_log_workflow_execution_id'), table_name='execution_log')
+    op.drop_table('execution_log')
@@ -0,0 +1,30 @@
+"""status indexes
+
+Revision ID: 9b4d2f6e8a13
+Revises: 7c1f3e9a2b64
+Create Date: 2018-06-12 14:05:37.218406
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4d2f6e8a13'
+down_revision = '7c1f3e9a2b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_workflow_status_workflow_id'), 'workflow_status', ['workflow_id'], unique=False)
+    op.create_index(op.f('ix_workflow_status_status'), 'workflow_status', ['status'], unique=False)
+    op.create_index(op.f('ix_workflow_status_started_at'), 'workflow_status', ['started_at'], unique=False)
+    op.create_index(op.f('ix_action_status__workflow_status_id'), 'action_status', ['_workflow_status_id'],
+                    unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_action_status__workflow_status_id'), table_name='action_status')
+    op.drop_index(op.f('ix_workflow_status_started_at'), table_name='workflow_status')
+    op.drop_index(op.f('ix_workflow_status_status'), table_name='workflow_status')
+    op.drop_index(op.f('ix_workflow_status_workflow_id'), table_name='workflow_status')
@@ -0,0 +1,34 @@
+"""workflow rollups
+
+Revision ID: e81a5c7d3f20
+Revises: 9b4d2f6e8a13
+Create Date: 2018-06-14 09:31:52.604117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy_utils
+
+
+# revision identifiers, used by Alembic.
+revision = 'e81a5c7d3f20'
+down_revision = '9b4d2f6e8a13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('workflow_rollup',
+                    sa.Column('workflow_id', sqlalchemy_utils.types.uuid.UUIDType(binary=False), nullable=False),
+                    sa.Column('hour', sa.DateTime(), nullable=False),
+                    sa.Column('count', sa.Integer(), nullable=False),
+                    sa.Column('failures', sa.Integer(), nullable=False),
+                    sa.Column('aborted', sa.Integer(), nullable=False),
+                    sa.Column('duration_p50', sa.Float(), nullable=True),
+                    sa.Column('duration_p90', sa.Float(), nullable=True),
+                    sa.Column('duration_p99', sa.Float(), nullable=True),
+                    sa.PrimaryKeyConstraint('workflow_id', 'hour'))
+
+
+def downgrade():
+    op.drop_table('workflow_rollup')
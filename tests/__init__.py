@@ -1,10 +1,20 @@
 __all__ = ['test_action',
+           'test_action_result_cache',
            'test_app_action_event_dispatcher',
            'test_app_api_server',
            'test_app_api_validation',
            'test_app_base',
            'test_app_blueprint',
            'test_app_cache',
+           'test_app_data_cache',
+           'test_liveness',
+           'test_accumulator',
+           'test_checkpoint',
+           'test_execution_log',
+           'test_execution_retention',
+           'test_status_writer',
+           'test_status_database',
+           'test_result_store',
            'test_app_event_dispatcher',
            'test_app_instance',
            'test_app_utilities',
@@ -13,6 +23,8 @@ __all__ = ['test_action',
            'test_branch',
            'test_callback_container',
            'test_case_config_db',
+           'test_case_event_partitions',
+           'test_case_event_sink',
            'test_case_database',
            'test_case_server',
            'test_case_subscriptions',
@@ -30,6 +42,7 @@ __all__ = ['test_action',
            'test_input_validation',
            'test_interface_event_dispatch_helpers',
            'test_interface_event_dispatcher',
+           'test_interface_handler_pool',
            'test_message',
            'test_message_db',
            'test_message_history_database',
@@ -45,12 +58,14 @@ __all__ = ['test_action',
            'test_scheduler_actions',
            'test_scheduler',
            'test_simple_workflow',
+           'test_sse_event_buffer',
            'test_system_server',
            'test_trigger_helpers',
            'test_triggers_server',
            'test_users_roles_database',
            'test_users_server',
            'test_walkoff_tag',
+           'test_workflow_loader',
            'test_workflow_manipulation',
            'test_workflow_authorization',
            'test_workflow_authorization_cache',
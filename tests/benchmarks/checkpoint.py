@@ -0,0 +1,114 @@
+import argparse
+import os
+import pickle
+import shutil
+import sys
+import timeit
+from uuid import uuid4
+
+sys.path.append(os.path.abspath('.'))
+
+import walkoff.appgateway
+import walkoff.config.config
+from tests.config import test_apps_path
+from tests.util import execution_db_help
+from walkoff import executiondb
+from walkoff.appgateway.appinstance import AppInstance
+from walkoff.executiondb.device import App, Device
+from walkoff.executiondb.checkpoint import encode_checkpoint, decode_checkpoint
+from walkoff.resultstore import ResultStore
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser("Workflow Checkpoint Benchmark")
+    parser.add_argument('-a', '--actions', type=int, default=50, help='Number of results in the accumulator')
+    parser.add_argument('-s', '--size', type=int, default=16 * 1024,
+                        help='Approximate size of each result in bytes')
+    parser.add_argument('-l', '--large', type=int, default=2,
+                        help='Number of results which are larger than the result store threshold')
+    parser.add_argument('-i', '--instances', type=int, default=5, help='Number of app instances')
+    parser.add_argument('-n', '--number', type=int, default=20, help='Number of times to write and load')
+    return parser.parse_args()
+
+
+def make_result(size):
+    record = {'ip': '10.0.0.1', 'host': 'host.example.com', 'tags': ['a', 'b', 'c'], 'score': 0.5}
+    record_size = len(pickle.dumps([dict(record, id=i) for i in range(100)], pickle.HIGHEST_PROTOCOL)) // 100
+    return {'records': [dict(record, id=i) for i in range(size // record_size)]}
+
+
+def make_accumulator(actions, size, large):
+    accumulator = {uuid4(): make_result(size) for _ in range(actions)}
+    for _ in range(large):
+        accumulator[uuid4()] = make_result(2 * walkoff.config.config.result_store_threshold)
+    return accumulator
+
+
+def make_app_instances(number, size):
+    session = executiondb.execution_db.session
+    for app in session.query(App).filter_by(name='HelloWorld').all():
+        session.delete(app)
+    devices = [Device('device{}'.format(i), [], [], 'test_type') for i in range(number)]
+    session.add(App(name='HelloWorld', devices=devices))
+    session.commit()
+    app_instances = {}
+    for device in devices:
+        app_instance = AppInstance.create('HelloWorld', device.id)
+        app_instance().lookup_table = make_result(size)
+        app_instance().execution_cache.set('token', 'a' * 64)
+        app_instances[('HelloWorld', device.id)] = app_instance
+    return app_instances
+
+
+def get_stored_size(path):
+    return sum(os.path.getsize(os.path.join(directory, filename))
+               for directory, _, filenames in os.walk(path) for filename in filenames)
+
+
+def load_checkpoint(checkpoint, store):
+    accumulator, app_instances = decode_checkpoint(checkpoint, store=store)
+    return [accumulator[key] for key in accumulator], app_instances
+
+
+def benchmark(actions, size, large, instances, number):
+    execution_db_help.setup_dbs()
+    walkoff.appgateway.cache_apps(test_apps_path)
+    walkoff.config.config.load_app_apis(test_apps_path)
+    store_path = os.path.join('.', 'tests', 'tmp', 'benchmark_results')
+    store = ResultStore(store_path, extension='pkl')
+
+    accumulator = make_accumulator(actions, size, large)
+    app_instances = make_app_instances(instances, size)
+
+    def write_pickle():
+        return pickle.dumps(accumulator), pickle.dumps(app_instances)
+
+    def write_checkpoint():
+        return encode_checkpoint(accumulator, app_instances, store=store)
+
+    try:
+        pickled = write_pickle()
+        checkpoint = write_checkpoint()
+        results = [
+            ('pickle', sum(len(blob) for blob in pickled), 0,
+             timeit.timeit(write_pickle, number=number),
+             timeit.timeit(lambda: [pickle.loads(blob) for blob in pickled], number=number)),
+            ('checkpoint', len(checkpoint), get_stored_size(store_path),
+             timeit.timeit(write_checkpoint, number=number),
+             timeit.timeit(lambda: load_checkpoint(checkpoint, store), number=number))]
+    finally:
+        shutil.rmtree(store_path, ignore_errors=True)
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_device_db()
+
+    print('{0} results of ~{1} bytes, {2} large results, {3} app instances, {4} runs'.format(
+        actions, size, large, instances, number))
+    print('Load times include looking up every result')
+    for name, blob_size, stored_size, write_time, load_time in results:
+        print('{0:>12}: {1:10d} bytes {2:10d} bytes stored {3:10.3f} ms/write {4:10.3f} ms/load'.format(
+            name, blob_size, stored_size, write_time * 1000 / number, load_time * 1000 / number))
+
+
+if __name__ == '__main__':
+    args = cmd_line()
+    benchmark(args.actions, args.size, args.large, args.instances, args.number)
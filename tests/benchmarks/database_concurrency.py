@@ -0,0 +1,115 @@
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from uuid import uuid4
+
+sys.path.append(os.path.abspath('.'))
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from walkoff.executiondb import Device_Base, WorkflowStatusEnum
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+from walkoff.helpers import create_database_engine
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser("Execution Database Concurrency Benchmark")
+    parser.add_argument('-w', '--workers', type=int, default=4, help='Number of worker processes reading')
+    parser.add_argument('-d', '--duration', type=float, default=5, help='Number of seconds to run each profile')
+    parser.add_argument('-r', '--rows', type=int, default=1000, help='Number of workflow statuses to start with')
+    parser.add_argument('-b', '--batch', type=int, default=10, help='Number of workflow statuses in each write')
+    return parser.parse_args()
+
+
+def make_session(path, profile):
+    return sessionmaker(bind=create_database_engine('sqlite', path, profile=profile))()
+
+
+def add_workflow_statuses(session, number):
+    execution_ids = []
+    for _ in range(number):
+        workflow_status = WorkflowStatus(uuid4(), uuid4(), 'wf')
+        workflow_status.running()
+        workflow_status.add_action_status(ActionStatus(uuid4(), uuid4(), 'action', 'HelloWorld', 'helloWorld'))
+        session.add(workflow_status)
+        execution_ids.append(workflow_status.execution_id)
+    session.commit()
+    return execution_ids
+
+
+def read(path, profile, execution_ids, duration, results):
+    session = make_session(path, profile)
+    reads = errors = 0
+    end = time.time() + duration
+    while time.time() < end:
+        try:
+            session.query(WorkflowStatus).get(random.choice(execution_ids))._action_statuses
+            session.query(WorkflowStatus).filter(WorkflowStatus.status == WorkflowStatusEnum.running).limit(10).all()
+            session.commit()
+            reads += 1
+        except OperationalError:
+            session.rollback()
+            errors += 1
+        session.expunge_all()
+    results.put((reads, errors))
+
+
+def write(session, batch, duration, results):
+    writes = errors = 0
+    end = time.time() + duration
+    while time.time() < end:
+        try:
+            add_workflow_statuses(session, batch)
+            writes += 1
+        except OperationalError:
+            session.rollback()
+            errors += 1
+    results.append((writes, errors))
+
+
+def run_profile(profile, workers, duration, rows, batch):
+    path = os.path.join('.', 'tests', 'tmp', 'benchmark_{}.db'.format(profile))
+    session = make_session(path, profile)
+    Device_Base.metadata.create_all(session.get_bind(), tables=[WorkflowStatus.__table__, ActionStatus.__table__])
+    execution_ids = add_workflow_statuses(session, rows)
+
+    read_results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=read, args=(path, profile, execution_ids, duration, read_results))
+                 for _ in range(workers)]
+    write_results = []
+    writer = threading.Thread(target=write, args=(session, batch, duration, write_results))
+    try:
+        for process in processes:
+            process.start()
+        writer.start()
+        writer.join()
+        reads = [read_results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    finally:
+        session.close()
+        session.get_bind().dispose()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+    writes, write_errors = write_results[0]
+    return (sum(count for count, _ in reads), sum(errors for _, errors in reads), writes, write_errors)
+
+
+def benchmark(workers, duration, rows, batch):
+    results = [(profile, run_profile(profile, workers, duration, rows, batch)) for profile in ('unpooled', 'pooled')]
+    print('{0} reading workers and one writing controller for {1} s, {2} workflow statuses per write'.format(
+        workers, duration, batch))
+    for profile, (reads, read_errors, writes, write_errors) in results:
+        print('{0:>10}: {1:10.1f} reads/s {2:6d} failed reads {3:10.1f} writes/s {4:6d} failed writes'.format(
+            profile, reads / duration, read_errors, writes / duration, write_errors))
+
+
+if __name__ == '__main__':
+    args = cmd_line()
+    benchmark(args.workers, args.duration, args.rows, args.batch)
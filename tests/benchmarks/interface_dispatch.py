@@ -0,0 +1,77 @@
+import argparse
+import os
+import sys
+import timeit
+from uuid import uuid4
+
+sys.path.append(os.path.abspath('.'))
+
+import walkoff.config.config
+from interfaces.dispatchers import AppEventDispatcher, CallbackContainer, EventDispatcher
+from walkoff.events import WalkoffEvent
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser("Interface Event Dispatch Benchmark")
+    parser.add_argument('-c', '--handlers', type=int, default=200, help='Number of registered interface handlers')
+    parser.add_argument('-n', '--number', type=int, default=10000, help='Number of events to dispatch')
+    return parser.parse_args()
+
+
+def make_handler():
+    def handler(data):
+        pass
+
+    return handler
+
+
+def make_dispatchers(num_handlers):
+    walkoff.config.config.app_apis = {'App': {'actions': {'action{}'.format(i): None for i in range(10)}}}
+    event_dispatcher = EventDispatcher()
+    app_dispatcher = AppEventDispatcher()
+    sender_ids = [str(uuid4()) for _ in range(20)]
+    handlers = [make_handler() for _ in range(num_handlers)]
+    for i, handler in enumerate(handlers):
+        if i % 4 == 0:
+            event_dispatcher.register_events(handler, {WalkoffEvent.ActionExecutionSuccess}, weak=False)
+        elif i % 4 == 1:
+            event_dispatcher.register_events(handler, {WalkoffEvent.ActionExecutionSuccess},
+                                             sender_ids=sender_ids[i % len(sender_ids)], weak=False)
+        elif i % 4 == 2:
+            event_dispatcher.register_events(handler, {WalkoffEvent.ActionExecutionSuccess},
+                                             names='action{}'.format(i % 10), weak=False)
+        else:
+            app_dispatcher.register_app_actions(handler, 'App', {WalkoffEvent.ActionExecutionSuccess},
+                                                actions='action{}'.format(i % 10), device_ids=[1, 'all'][i % 2],
+                                                weak=False)
+    events = [{'sender_id': sender_ids[i % len(sender_ids)], 'sender_name': 'action{}'.format(i % 10),
+               'app_name': 'App', 'action_name': 'action{}'.format(i % 10), 'device_id': i % 3}
+              for i in range(100)]
+    return event_dispatcher, app_dispatcher, events
+
+
+def dispatch(event_dispatcher, app_dispatcher, events, number, rebuild=False):
+    for i in range(number):
+        if rebuild:
+            CallbackContainer.version += 1
+        data = events[i % len(events)]
+        event_dispatcher.dispatch(WalkoffEvent.ActionExecutionSuccess, data)
+        app_dispatcher.dispatch(WalkoffEvent.ActionExecutionSuccess, data)
+
+
+def benchmark(num_handlers, number):
+    event_dispatcher, app_dispatcher, events = make_dispatchers(num_handlers)
+    results = [
+        ('rebuilt on every event', timeit.timeit(
+            lambda: dispatch(event_dispatcher, app_dispatcher, events, number, rebuild=True), number=1)),
+        ('dispatch tables', timeit.timeit(
+            lambda: dispatch(event_dispatcher, app_dispatcher, events, number), number=1))]
+
+    print('{0} events dispatched to {1} registered interface handlers'.format(number, num_handlers))
+    for name, total in results:
+        print('{0:>25}: {1:10.3f} us/event'.format(name, total * 1000000 / number))
+
+
+if __name__ == '__main__':
+    args = cmd_line()
+    benchmark(args.handlers, args.number)
@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import timeit
+from copy import deepcopy
+
+sys.path.append(os.path.abspath('.'))
+
+import walkoff.appgateway
+import walkoff.config.config
+from tests.config import test_apps_path
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.transform import Transform
+
+
+def cmd_line():
+    parser = argparse.ArgumentParser("Transform Chain Benchmark")
+    parser.add_argument('-s', '--size', type=int, default=1024 * 1024,
+                        help='Approximate size of the input payload in bytes')
+    parser.add_argument('-d', '--depth', type=int, default=5, help='Number of transforms in the chain')
+    parser.add_argument('-n', '--number', type=int, default=20, help='Number of times to execute the chain')
+    return parser.parse_args()
+
+
+def make_payload(size, depth):
+    record = {'ip': '10.0.0.1', 'host': 'host.example.com', 'tags': ['a', 'b', 'c'], 'score': 0.5}
+    record_size = len(str(record))
+    payload = {'records': [dict(record, id=i) for i in range(size // record_size)]}
+    for _ in range(depth):
+        payload = {'payload': payload, 'metadata': {'source': 'benchmark'}}
+    return payload
+
+
+def make_chain(depth):
+    return [Transform('HelloWorld', action_name='select json', arguments=[Argument('element', value='payload')])
+            for _ in range(depth)]
+
+
+def run_chain(transforms, payload):
+    data = payload
+    for transform in transforms:
+        data = transform(data, {})
+    return data
+
+
+def run_copying_chain(transforms, payload):
+    data = payload
+    for transform in transforms:
+        deepcopy(data)
+        data = transform(data, {})
+    return data
+
+
+def benchmark(size, depth, number):
+    walkoff.appgateway.cache_apps(test_apps_path)
+    walkoff.config.config.load_app_apis(test_apps_path)
+
+    payload = make_payload(size, depth)
+    chain = make_chain(depth)
+    compiled = [transform.compile(emit_events=False) for transform in chain]
+    executed = [transform.execute for transform in chain]
+
+    results = [
+        ('copy on every transform', timeit.timeit(lambda: run_copying_chain(compiled, payload), number=number)),
+        ('execute', timeit.timeit(lambda: run_chain(executed, payload), number=number)),
+        ('compiled', timeit.timeit(lambda: run_chain(compiled, payload), number=number))]
+
+    print('Payload of ~{0} bytes through {1} transforms, {2} runs'.format(size, depth, number))
+    for name, total in results:
+        print('{0:>25}: {1:10.3f} ms/chain'.format(name, total * 1000 / number))
+
+
+if __name__ == '__main__':
+    args = cmd_line()
+    benchmark(args.size, args.depth, args.number)
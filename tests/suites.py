@@ -7,7 +7,8 @@ def add_tests_to_suite(suite, test_modules):
     suite.addTests([TestLoader().loadTestsFromModule(test_module) for test_module in test_modules])
 
 
-__case_tests = [test_case_subscriptions, test_case_database, test_case_config_db]
+__case_tests = [test_case_subscriptions, test_case_database, test_case_config_db, test_case_event_sink,
+                test_case_event_partitions]
 case_suite = TestSuite()
 add_tests_to_suite(case_suite, __case_tests)
 
@@ -18,17 +19,20 @@ __server_tests = [test_workflow_server, test_app_api_server, test_case_server, t
                   test_users_server, test_message_history_database, test_message_db,
                   test_message, test_messaging_endpoints, test_workflow_authorization,
                   test_workflow_authorized_user_set, test_workflow_authorization_cache, test_trigger_helpers,
-                  test_system_server, test_workflow_status, test_problem]
+                  test_system_server, test_workflow_status, test_problem, test_sse_event_buffer]
 server_suite = TestSuite()
 add_tests_to_suite(server_suite, __server_tests)
 
-__execution_tests = [test_argument, test_execution_events, test_execution_modes,
+__execution_tests = [test_argument, test_action_result_cache, test_execution_events, test_execution_modes,
                      test_action, test_helper_functions, test_transform, test_condition, test_branch,
                      test_app_instance, test_metrics,
                      test_app_utilities, test_input_validation, test_decorators,
                      test_app_api_validation, test_condition_transform_validation,
                      test_roles_pages_database, test_users_roles_database, test_playbook,
-                     test_scheduler, test_walkoff_tag, test_app_cache, test_app_base]
+                     test_scheduler, test_walkoff_tag, test_app_cache, test_app_data_cache, test_app_base,
+                     test_liveness, test_result_store, test_accumulator, test_checkpoint,
+                     test_execution_log, test_status_writer, test_execution_retention,
+                     test_status_database, test_workflow_loader]
 execution_suite = TestSuite()
 add_tests_to_suite(execution_suite, __execution_tests)
 
@@ -41,7 +45,8 @@ integration_suite = TestSuite()
 add_tests_to_suite(integration_suite, __integration_tests)
 
 __interface_tests = [test_callback_container, test_interface_event_dispatch_helpers, test_app_action_event_dispatcher,
-                     test_app_event_dispatcher, test_event_dispatcher, test_interface_event_dispatcher, test_events]
+                     test_app_event_dispatcher, test_event_dispatcher, test_interface_event_dispatcher, test_events,
+                     test_interface_handler_pool]
 interface_suite = TestSuite()
 add_tests_to_suite(interface_suite, __interface_tests)
 
@@ -0,0 +1,182 @@
+import os
+import pickle
+import shutil
+import unittest
+
+import walkoff.config.config
+import walkoff.config.paths
+from walkoff.appgateway.appdatacache import estimate_size
+from walkoff.executiondb.accumulator import SpillableAccumulator
+from walkoff.resultstore import ResultStore
+
+
+class TestSpillableAccumulator(unittest.TestCase):
+    def setUp(self):
+        self.original_spill_path = walkoff.config.paths.accumulator_spill_path
+        self.original_read_cache_size = walkoff.config.config.accumulator_read_cache_size
+        self.spill_path = os.path.join('.', 'tests', 'tmp', 'spill')
+        walkoff.config.paths.accumulator_spill_path = self.spill_path
+        self.accumulator = SpillableAccumulator(max_memory=10 * 1024)
+
+    def tearDown(self):
+        walkoff.config.paths.accumulator_spill_path = self.original_spill_path
+        walkoff.config.config.accumulator_read_cache_size = self.original_read_cache_size
+        shutil.rmtree(self.spill_path, ignore_errors=True)
+
+    def test_init_results(self):
+        accumulator = SpillableAccumulator(results={'a': 1, 'b': 2})
+        self.assertDictEqual(dict(accumulator), {'a': 1, 'b': 2})
+
+    def test_empty_is_falsy(self):
+        self.assertFalse(self.accumulator)
+        self.accumulator['a'] = 1
+        self.assertTrue(self.accumulator)
+
+    def test_set_get(self):
+        self.accumulator['a'] = {'key': [1, 2]}
+        self.assertDictEqual(self.accumulator['a'], {'key': [1, 2]})
+        self.assertIn('a', self.accumulator)
+        self.assertFalse(self.accumulator.is_spilled('a'))
+
+    def test_get_missing(self):
+        with self.assertRaises(KeyError):
+            self.accumulator['a']
+
+    def test_spills_over_budget(self):
+        self.accumulator['a'] = 'a' * 6000
+        self.accumulator['b'] = 'b' * 6000
+        self.assertTrue(self.accumulator.is_spilled('a'))
+        self.assertFalse(self.accumulator.is_spilled('b'))
+        self.assertLessEqual(self.accumulator.memory_usage, 10 * 1024)
+        self.assertEqual(self.accumulator['a'], 'a' * 6000)
+        self.assertEqual(len(self.accumulator), 2)
+
+    def test_spills_least_recently_used(self):
+        self.accumulator['a'] = 'a' * 4000
+        self.accumulator['b'] = 'b' * 4000
+        self.accumulator['a']
+        self.accumulator['c'] = 'c' * 4000
+        self.assertTrue(self.accumulator.is_spilled('b'))
+        self.assertFalse(self.accumulator.is_spilled('a'))
+
+    def test_delete_spilled_removes_file(self):
+        self.accumulator['a'] = 'a' * 20 * 1024
+        path = self.accumulator._spilled['a']
+        self.assertTrue(os.path.isfile(path))
+        del self.accumulator['a']
+        self.assertFalse(os.path.isfile(path))
+        self.assertNotIn('a', self.accumulator)
+
+    def test_overwrite_spilled(self):
+        self.accumulator['a'] = 'a' * 20 * 1024
+        self.accumulator['a'] = 'small'
+        self.assertFalse(self.accumulator.is_spilled('a'))
+        self.assertEqual(self.accumulator['a'], 'small')
+
+    def test_no_budget(self):
+        original = walkoff.config.config.accumulator_max_memory
+        walkoff.config.config.accumulator_max_memory = None
+        try:
+            accumulator = SpillableAccumulator()
+            accumulator['a'] = 'a' * 20 * 1024
+            self.assertFalse(accumulator.is_spilled('a'))
+        finally:
+            walkoff.config.config.accumulator_max_memory = original
+
+    def test_unpicklable_kept_in_memory(self):
+        value = [lambda x: x] * 2000
+        self.accumulator['a'] = value
+        self.assertFalse(self.accumulator.is_spilled('a'))
+        self.assertIs(self.accumulator['a'], value)
+
+    def test_pickle(self):
+        self.accumulator['a'] = 'a' * 20 * 1024
+        self.accumulator['b'] = 'b'
+        accumulator = pickle.loads(pickle.dumps(self.accumulator))
+        self.assertDictEqual(dict(accumulator), {'a': 'a' * 20 * 1024, 'b': 'b'})
+        self.assertTrue(accumulator.is_spilled('a'))
+        self.assertNotEqual(accumulator._spilled['a'], self.accumulator._spilled['a'])
+
+    def test_add_pickled_result(self):
+        data = pickle.dumps({1: (2, 3)}, pickle.HIGHEST_PROTOCOL)
+        self.accumulator.add_pickled_result('a', data)
+        self.assertEqual(self.accumulator.memory_usage, len(data))
+        self.assertDictEqual(self.accumulator['a'], {1: (2, 3)})
+        self.assertEqual(self.accumulator.get_pickled_result('a'), data)
+        self.accumulator['a'] = 'value'
+        self.assertIsNone(self.accumulator.get_pickled_result('a'))
+
+    def test_spill_pickled_result(self):
+        data = pickle.dumps('a' * 20 * 1024, pickle.HIGHEST_PROTOCOL)
+        self.accumulator.add_pickled_result('a', data)
+        self.assertTrue(self.accumulator.is_spilled('a'))
+        self.assertEqual(self.accumulator.get_pickled_result('a'), data)
+        self.assertEqual(self.accumulator['a'], 'a' * 20 * 1024)
+
+    def test_spill_path(self):
+        self.accumulator['a'] = 'a' * 20 * 1024
+        path = os.path.abspath(self.accumulator._spilled['a'])
+        self.assertEqual(os.path.dirname(path), os.path.abspath(self.spill_path))
+
+    def test_read_cache(self):
+        walkoff.config.config.accumulator_read_cache_size = 64 * 1024
+        self.accumulator['a'] = ['a' * 20 * 1024]
+        value = self.accumulator['a']
+        self.assertIs(self.accumulator['a'], value)
+        self.accumulator['a'] = ['b' * 20 * 1024]
+        self.assertEqual(self.accumulator['a'], ['b' * 20 * 1024])
+
+    def test_read_cache_is_bounded(self):
+        walkoff.config.config.accumulator_read_cache_size = 30 * 1024
+        self.accumulator['a'] = ['a' * 20 * 1024]
+        self.accumulator['b'] = ['b' * 20 * 1024]
+        self.accumulator['a']
+        self.accumulator['b']
+        self.assertListEqual(list(self.accumulator._read_cache.keys()), ['b'])
+        self.assertLessEqual(self.accumulator._read_cache_size, 30 * 1024)
+
+    def test_read_cache_disabled(self):
+        walkoff.config.config.accumulator_read_cache_size = 0
+        self.accumulator['a'] = ['a' * 20 * 1024]
+        self.assertIsNot(self.accumulator['a'], self.accumulator['a'])
+
+    def test_pickle_passes_spilled_results_through(self):
+        self.accumulator['a'] = 'a' * 20 * 1024
+        data = self.accumulator.get_pickled_result('a')
+        state = self.accumulator.__getstate__()
+        self.assertListEqual(state['entries'], [('a', 1, data)])
+
+    def test_pickle_stored_result(self):
+        store = ResultStore(path=self.spill_path)
+        result_id = store.put(b'{"key": 1}')
+        self.accumulator.add_stored_result('a', result_id, store)
+        accumulator = pickle.loads(pickle.dumps(self.accumulator))
+        self.assertEqual(accumulator.get_stored_result('a'), (result_id, 'json'))
+        self.assertDictEqual(accumulator['a'], {'key': 1})
+
+    def test_peek_does_not_cache(self):
+        walkoff.config.config.accumulator_read_cache_size = 64 * 1024
+        self.accumulator['a'] = 'a' * 20 * 1024
+        self.assertEqual(self.accumulator.peek('a'), 'a' * 20 * 1024)
+        self.assertDictEqual(dict(self.accumulator._read_cache), {})
+
+    def test_get_json_result(self):
+        store = ResultStore(path=self.spill_path)
+        self.accumulator.add_stored_result('a', store.put(b'{"key": 1}'), store)
+        self.accumulator['b'] = 'b'
+        self.assertEqual(self.accumulator.get_json_result('a'), '{"key": 1}')
+        self.assertIsNone(self.accumulator.get_json_result('b'))
+
+    def test_remove_spilled(self):
+        self.accumulator['a'] = 'a' * 20 * 1024
+        self.accumulator['b'] = 'b'
+        path = self.accumulator._spilled['a']
+        self.accumulator.remove_spilled()
+        self.assertFalse(os.path.isfile(path))
+        self.assertListEqual(list(self.accumulator.keys()), ['b'])
+
+    def test_estimate_size_is_bounded(self):
+        value = [[i] for i in range(10000)]
+        estimate = estimate_size(value, max_objects=100)
+        self.assertGreater(estimate, estimate_size(value) // 4)
+        self.assertLess(estimate, estimate_size(value) * 4)
@@ -318,6 +318,26 @@ class TestAction(unittest.TestCase):
         self.assertEqual(result.status, 'Success')
         self.assertEqual(action._output, result)
 
+    def test_execute_cacheable_action(self):
+        from tests.testapps.HelloWorld.actions import call_counts
+        walkoff.appgateway.invalidate_cached_action_results('HelloWorld')
+        call_counts['cached_global'] = 0
+        action = Action(app_name='HelloWorld', action_name='cachedGlobal', name='cached',
+                        arguments=[Argument('arg1', value='something')])
+        instance = AppInstance.create(app_name='HelloWorld', device_name='')
+        first = action.execute(instance.instance, {})
+        second = action.execute(instance.instance, {})
+        self.assertEqual(first, second)
+        self.assertEqual(second.result, 'something')
+        self.assertEqual(call_counts['cached_global'], 1)
+
+        action.execute(instance.instance, {}, arguments=[Argument('arg1', value='other')])
+        self.assertEqual(call_counts['cached_global'], 2)
+
+        walkoff.appgateway.invalidate_cached_action_results('HelloWorld')
+        action.execute(instance.instance, {})
+        self.assertEqual(call_counts['cached_global'], 3)
+
     def test_set_args_valid(self):
         action = Action(app_name='HelloWorld', action_name='Add Three', name='helloWorld',
                         arguments=[Argument('num1', value='-5.6'),
@@ -365,3 +385,20 @@ class TestAction(unittest.TestCase):
         AppInstance.create(app_name='HelloWorld', device_name='device1')
         self.assertFalse(action.execute_trigger({"data_in": {"data": 'a'}}, {}))
         self.assertTrue(action.execute_trigger({"data_in": {"data": 'aaa'}}, {}))
+
+    def test_execute_trigger_compiles_once(self):
+        trigger = ConditionalExpression(
+            'and',
+            conditions=[Condition('HelloWorld', action_name='regMatch', arguments=[Argument('regex', value='aaa')])])
+        action = Action(app_name='HelloWorld', action_name='helloWorld', name='helloWorld', trigger=trigger)
+        compile_trigger = trigger.compile
+        result = {'count': 0}
+
+        def count_compiles(*args, **kwargs):
+            result['count'] += 1
+            return compile_trigger(*args, **kwargs)
+
+        trigger.compile = count_compiles
+        self.assertFalse(action.execute_trigger({"data_in": {"data": 'a'}}, {}))
+        self.assertTrue(action.execute_trigger({"data_in": {"data": 'aaa'}}, {}))
+        self.assertEqual(result['count'], 1)
@@ -0,0 +1,127 @@
+import threading
+import unittest
+
+from tests.util.mock_objects import MockLoadBalancer
+from walkoff.appgateway import cache_action_result, invalidate_cached_action_results
+from walkoff.appgateway.actionresult import ActionResult
+from walkoff.appgateway.actionresultcache import ActionResultCache, combine_action_result_cache_metrics
+from walkoff.multiprocessedexecutor.multiprocessedexecutor import MultiprocessedExecutor
+
+
+class TestActionResultCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ActionResultCache(max_size=3)
+
+    def test_get_empty(self):
+        self.assertIsNone(self.cache.get('app1', 'action1', None, {'a': 1}))
+
+    def test_put_get(self):
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.assertEqual(self.cache.get('app1', 'action1', None, {'a': 1}), ActionResult('result', 'Success'))
+
+    def test_get_returns_copy(self):
+        result = ActionResult('result', 'Success')
+        self.cache.put('app1', 'action1', None, {'a': 1}, result)
+        self.assertIsNot(self.cache.get('app1', 'action1', None, {'a': 1}), result)
+
+    def test_modifying_hit_does_not_modify_cache(self):
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult({'b': [1, 2]}, 'Success'))
+        self.cache.get('app1', 'action1', None, {'a': 1}).result['b'].append(3)
+        self.assertDictEqual(self.cache.get('app1', 'action1', None, {'a': 1}).result, {'b': [1, 2]})
+
+    def test_modifying_stored_result_does_not_modify_cache(self):
+        result = ActionResult({1: (1, 2)}, 'Success')
+        self.cache.put('app1', 'action1', None, {'a': 1}, result)
+        result.result[2] = 'c'
+        self.assertDictEqual(self.cache.get('app1', 'action1', None, {'a': 1}).result, {1: (1, 2)})
+
+    def test_unpicklable_result_not_cached(self):
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult(threading.Lock(), 'Success'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_key_canonicalizes_arguments(self):
+        self.cache.put('app1', 'action1', None, {'a': 1, 'b': {'c': 2, 'd': 3}}, ActionResult('result', 'Success'))
+        self.assertIsNotNone(self.cache.get('app1', 'action1', None, {'b': {'d': 3, 'c': 2}, 'a': 1}))
+
+    def test_key_includes_device_and_action(self):
+        self.cache.put('app1', 'action1', 1, {'a': 1}, ActionResult('result', 'Success'))
+        self.assertIsNone(self.cache.get('app1', 'action1', 2, {'a': 1}))
+        self.assertIsNone(self.cache.get('app1', 'action2', 1, {'a': 1}))
+        self.assertIsNotNone(self.cache.get('app1', 'action1', 1, {'a': 1}))
+
+    def test_uncanonicalizable_arguments_not_cached(self):
+        self.cache.put('app1', 'action1', None, {'a': object()}, ActionResult('result', 'Success'))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_expired_result(self):
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'), ttl=0)
+        self.assertIsNone(self.cache.get('app1', 'action1', None, {'a': 1}))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_evicts_least_recently_used(self):
+        for i in range(3):
+            self.cache.put('app1', 'action1', None, {'a': i}, ActionResult(i, 'Success'))
+        self.cache.get('app1', 'action1', None, {'a': 0})
+        self.cache.put('app1', 'action1', None, {'a': 3}, ActionResult(3, 'Success'))
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNone(self.cache.get('app1', 'action1', None, {'a': 1}))
+        self.assertIsNotNone(self.cache.get('app1', 'action1', None, {'a': 0}))
+
+    def test_invalidate_app(self):
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.cache.put('app2', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.cache.invalidate('app1')
+        self.assertIsNone(self.cache.get('app1', 'action1', None, {'a': 1}))
+        self.assertIsNotNone(self.cache.get('app2', 'action1', None, {'a': 1}))
+
+    def test_invalidate_all(self):
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.cache.put('app2', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_metrics(self):
+        self.cache.get('app1', 'action1', None, {'a': 1})
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.cache.get('app1', 'action1', None, {'a': 1})
+        self.cache.get('app1', 'action1', None, {'a': 1})
+        self.assertDictEqual(self.cache.get_metrics(), {'app1': {'hits': 2, 'misses': 1, 'size': 1}})
+
+    def test_clear(self):
+        self.cache.put('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.cache.get('app1', 'action1', None, {'a': 1})
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertDictEqual(self.cache.get_metrics(), {})
+
+    def test_combine_metrics(self):
+        combined = combine_action_result_cache_metrics([{'app1': {'hits': 1, 'misses': 2, 'size': 3}},
+                                                        {'app1': {'hits': 4, 'misses': 0, 'size': 1},
+                                                         'app2': {'hits': 0, 'misses': 1, 'size': 0}}])
+        self.assertDictEqual(combined, {'app1': {'hits': 5, 'misses': 2, 'size': 4},
+                                        'app2': {'hits': 0, 'misses': 1, 'size': 0}})
+
+
+class TestWorkerActionResultCaches(unittest.TestCase):
+    def setUp(self):
+        self.executor = MultiprocessedExecutor()
+        self.executor.manager = MockLoadBalancer()
+        self.executor.receiver = self.executor.manager.results_queue
+        invalidate_cached_action_results()
+
+    def tearDown(self):
+        invalidate_cached_action_results()
+
+    def test_get_action_result_cache_metrics(self):
+        cache_action_result('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        metrics = self.executor.get_action_result_cache_metrics()
+        self.assertEqual(metrics['app1']['size'], 1)
+        self.assertDictEqual(self.executor.receiver.cache_metrics['Worker-0'], metrics)
+
+    def test_invalidate_cached_action_results(self):
+        cache_action_result('app1', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        cache_action_result('app2', 'action1', None, {'a': 1}, ActionResult('result', 'Success'))
+        self.executor.invalidate_cached_action_results('app1')
+        metrics = self.executor.get_action_result_cache_metrics()
+        self.assertNotIn('app1', metrics)
+        self.assertEqual(metrics['app2']['size'], 1)
@@ -158,3 +158,15 @@ class TestAppActionEventDispatcher(TestCase):
     def test_is_registered_event_correct_device_incorrect_func(self):
         self.router.register_event('event1', [1, 2, 3], func2)
         self.assertFalse(self.router.is_registered('event1', 1, func))
+
+    def test_get_callbacks_reuses_dispatch_table(self):
+        self.router.register_event('event1', 'all', func, weak=False)
+        callbacks = self.router._get_callbacks('event1', 'a')
+        self.assertIs(self.router._get_callbacks('event1', 'b'), callbacks)
+
+    def test_get_callbacks_rebuilds_dispatch_table_on_registration(self):
+        self.router.register_event('event1', 'all', func, weak=False)
+        self.assertTupleEqual(self.router._get_callbacks('event1', 'a'), (func,))
+        self.router.register_event('event1', 'a', func2, weak=False)
+        self.assertTupleEqual(self.router._get_callbacks('event1', 'a'), (func, func2))
+        self.assertTupleEqual(self.router._get_callbacks('event1', 'b'), (func,))
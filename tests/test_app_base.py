@@ -86,3 +86,17 @@ class TestAppBase(TestCase):
     def test_get_all_devices_invalid_app(self):
         app = AppBase('Invalid', self.device2.id)
         self.assertListEqual(app.get_all_devices(), [])
+
+    def test_execution_cache_per_instance(self):
+        app1 = AppBase(self.test_app_name, self.device1.id)
+        app2 = AppBase(self.test_app_name, self.device1.id)
+        app1.execution_cache.set('key', 'value')
+        self.assertEqual(app1.execution_cache.get('key'), 'value')
+        self.assertIsNone(app2.execution_cache.get('key'))
+
+    def test_worker_cache_shared_by_app(self):
+        app1 = AppBase(self.test_app_name, self.device1.id)
+        app2 = AppBase(self.test_app_name, self.device2.id)
+        app1.worker_cache.set('key', 'value')
+        self.assertEqual(app2.worker_cache.get('key'), 'value')
+        app1.worker_cache.clear()
@@ -0,0 +1,100 @@
+import pickle
+import unittest
+
+import walkoff.appgateway
+from walkoff.appgateway.appdatacache import AppDataCache, estimate_size
+
+
+class TestAppDataCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = AppDataCache(max_entries=3, max_memory=10 * 1024)
+
+    def test_get_empty(self):
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.cache.get('key', 'default'), 'default')
+
+    def test_set_get(self):
+        self.assertTrue(self.cache.set('key', {'a': [1, 2, 3]}))
+        self.assertDictEqual(self.cache.get('key'), {'a': [1, 2, 3]})
+        self.assertIn('key', self.cache)
+
+    def test_set_overwrites(self):
+        self.cache.set('key', 'value1')
+        self.cache.set('key', 'value2')
+        self.assertEqual(self.cache.get('key'), 'value2')
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.memory_usage, estimate_size('value2'))
+
+    def test_expired(self):
+        self.cache.set('key', 'value', ttl=0)
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.memory_usage, 0)
+
+    def test_remove_expired(self):
+        self.cache.set('key1', 'value', ttl=0)
+        self.cache.set('key2', 'value')
+        self.cache.remove_expired()
+        self.assertEqual(len(self.cache), 1)
+
+    def test_evicts_least_recently_used_by_count(self):
+        for i in range(3):
+            self.cache.set(i, i)
+        self.cache.get(0)
+        self.cache.set(3, 3)
+        self.assertEqual(len(self.cache), 3)
+        self.assertNotIn(1, self.cache)
+        self.assertIn(0, self.cache)
+
+    def test_evicts_by_memory(self):
+        value = 'a' * 4000
+        for i in range(3):
+            self.cache.set(i, value + str(i))
+        self.assertEqual(len(self.cache), 2)
+        self.assertNotIn(0, self.cache)
+        self.assertLessEqual(self.cache.memory_usage, 10 * 1024)
+
+    def test_value_too_large(self):
+        self.assertFalse(self.cache.set('key', 'a' * 20 * 1024))
+        self.assertNotIn('key', self.cache)
+
+    def test_get_or_set(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return 'value'
+
+        self.assertEqual(self.cache.get_or_set('key', factory), 'value')
+        self.assertEqual(self.cache.get_or_set('key', factory), 'value')
+        self.assertEqual(len(calls), 1)
+
+    def test_delete(self):
+        self.cache.set('key', 'value')
+        self.assertTrue(self.cache.delete('key'))
+        self.assertFalse(self.cache.delete('key'))
+        self.assertEqual(self.cache.memory_usage, 0)
+
+    def test_clear(self):
+        self.cache.set('key1', 'value')
+        self.cache.set('key2', 'value')
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.memory_usage, 0)
+
+    def test_pickle(self):
+        self.cache.set('key', 'value')
+        cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(cache.get('key'), 'value')
+        cache.set('key2', 'value')
+
+    def test_estimate_size_includes_contents(self):
+        self.assertGreater(estimate_size({'a': 'b' * 1000}), 1000)
+        self.assertGreater(estimate_size(['b' * 1000]), 1000)
+
+    def test_worker_cache_per_app(self):
+        walkoff.appgateway.clear_worker_app_data_caches()
+        cache = walkoff.appgateway.get_worker_app_data_cache('app1')
+        self.assertIs(walkoff.appgateway.get_worker_app_data_cache('app1'), cache)
+        self.assertIsNot(walkoff.appgateway.get_worker_app_data_cache('app2'), cache)
+        walkoff.appgateway.clear_worker_app_data_caches()
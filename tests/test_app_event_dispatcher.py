@@ -191,3 +191,14 @@ class TestAppEventDispatcher(TestCase):
         self.router.register_app_actions(func, 'App1', {WalkoffEvent.ActionStarted},
                                          actions=['action1', 'action2'], device_ids=1)
         self.assertTrue(self.router.is_registered('App1', 'action1', WalkoffEvent.ActionStarted, 1, func))
+
+    def test_has_listeners_no_registrations(self):
+        self.assertFalse(self.router.has_listeners(WalkoffEvent.ActionStarted))
+
+    def test_has_listeners(self):
+        self.router.register_app_actions(func, 'App1', {WalkoffEvent.ActionStarted}, actions='action1')
+        self.assertTrue(self.router.has_listeners(WalkoffEvent.ActionStarted))
+        self.assertTrue(self.router.has_listeners(WalkoffEvent.ActionStarted, 'App1', 'action1'))
+        self.assertFalse(self.router.has_listeners(WalkoffEvent.ActionStarted, 'App1', 'action2'))
+        self.assertFalse(self.router.has_listeners(WalkoffEvent.ActionStarted, 'App2', 'action1'))
+        self.assertFalse(self.router.has_listeners(WalkoffEvent.ActionExecutionError, 'App1', 'action1'))
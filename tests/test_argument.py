@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from walkoff.executiondb.accumulator import SpillableAccumulator
 from walkoff.executiondb.argument import Argument
 from walkoff.helpers import InvalidArgument
 
@@ -131,6 +132,14 @@ class TestArgument(TestCase):
         arg = Argument('test', reference='a')
         self.assertEqual(arg._get_action_from_reference({'a': 1, 'b': 3, 'c': 7}), 1)
 
+    def test_get_value_spilled_reference(self):
+        accumulator = SpillableAccumulator(max_memory=1024)
+        accumulator['a'] = {'b': ['c' * 2048, 'd']}
+        accumulator['e'] = 1
+        self.assertTrue(accumulator.is_spilled('a'))
+        arg = Argument('test', reference='a', selection=['b', 1])
+        self.assertEqual(arg.get_value(accumulator), 'd')
+
     def test_get_value_value_only(self):
         arg = Argument('test', value=42)
         self.assertEqual(arg.get_value({}), 42)
@@ -88,6 +88,15 @@ class TestBranch(unittest.TestCase):
             else:
                 self.assertIsNone(branch.execute(input_str, {}))
 
+    def test_execute_compiled(self):
+        condition = ConditionalExpression(
+            'and',
+            conditions=[Condition('HelloWorld', action_name='regMatch', arguments=[Argument('regex', value='a')])])
+        branch = Branch(source_id=1, destination_id=2, condition=condition)
+        branch.compile()
+        self.assertEqual(branch.execute(ActionResult('aaaa', 'Success'), {}), 2)
+        self.assertIsNone(branch.execute(ActionResult('bbbb', 'Success'), {}))
+
     def test_get_branch_no_branchs(self):
         workflow = Workflow('test', 1)
         self.assertIsNone(workflow.get_branch(None, {}))
@@ -1,7 +1,10 @@
 import json
 import unittest
+from datetime import datetime
 
 import walkoff.case.database as case_database
+import walkoff.config.config
+from walkoff.case.eventsink import CaseEventSink
 from tests.util import execution_db_help
 from tests.util.assertwrappers import orderless_list_compare
 from walkoff.case.subscription import *
@@ -209,3 +212,77 @@ class TestCaseDatabase(unittest.TestCase):
         for event in event_json_list:
             self.assertIn(event['message'], input_output)
             self.assertEqual(event['data'], input_output[event['message']])
+
+    def add_search_events(self):
+        TestCaseDatabase.__construct_basic_db()
+        events = [('ACTION', 'Action firewall executed', {'host': 'gateway'}, datetime(2018, 6, 1, 10)),
+                  ('ACTION', 'Action scan executed', {'host': 'firewall', 'note': 'firewall firewall'},
+                   datetime(2018, 6, 1, 11)),
+                  ('WORKFLOW', 'Workflow started', {'target': 'firewall'}, datetime(2018, 6, 1, 12)),
+                  ('ACTION', 'Action ping executed', {'host': 'router'}, datetime(2018, 6, 1, 13))]
+        for event_type, message, data, timestamp in events:
+            event = case_database.Event(type=event_type, message=message, data=json.dumps(data), timestamp=timestamp)
+            case_database.case_db.add_event(event=event, cases=['case1' if event_type == 'ACTION' else 'case2'])
+
+    def test_search_events_ranked(self):
+        self.add_search_events()
+        hits, cursor = case_database.case_db.search_events('firewall', 10)
+        self.assertIsNone(cursor)
+        self.assertEqual(hits[0]['message'], 'Action scan executed')
+        self.assertSetEqual({hit['message'] for hit in hits[1:]}, {'Action firewall executed', 'Workflow started'})
+        self.assertGreater(hits[0]['score'], hits[1]['score'])
+        self.assertGreaterEqual(hits[1]['score'], hits[2]['score'])
+
+    def test_search_events_filters(self):
+        self.add_search_events()
+        hits, _ = case_database.case_db.search_events('firewall', 10, event_types=['WORKFLOW'])
+        self.assertListEqual([hit['message'] for hit in hits], ['Workflow started'])
+        hits, _ = case_database.case_db.search_events('firewall', 10, since=datetime(2018, 6, 1, 10, 30),
+                                                      until=datetime(2018, 6, 1, 12))
+        self.assertListEqual([hit['message'] for hit in hits], ['Action scan executed'])
+        case_id = case_database.case_db.session.query(case_database.Case).filter_by(name='case2').first().id
+        hits, _ = case_database.case_db.search_events('firewall', 10, case_id=case_id)
+        self.assertListEqual([hit['message'] for hit in hits], ['Workflow started'])
+
+    def test_search_events_pages(self):
+        self.add_search_events()
+        first, cursor = case_database.case_db.search_events('executed', 2)
+        second, last_cursor = case_database.case_db.search_events('executed', 2, cursor=cursor)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertIsNone(last_cursor)
+        self.assertSetEqual({hit['id'] for hit in first + second}, {1, 2, 4})
+
+    def test_search_events_invalid_query(self):
+        self.add_search_events()
+        with self.assertRaises(ValueError):
+            case_database.case_db.search_events('"unterminated', 10)
+        with self.assertRaises(ValueError):
+            case_database.case_db.search_events('firewall', 10, cursor='invalid')
+
+    def test_search_events_index_tracks_deletes(self):
+        self.add_search_events()
+        case_database.case_db.session.query(case_database.Event).filter(
+            case_database.Event.type == 'WORKFLOW').delete()
+        case_database.case_db.session.commit()
+        hits, _ = case_database.case_db.search_events('firewall', 10)
+        self.assertEqual(len(hits), 2)
+
+    def test_search_events_without_index(self):
+        walkoff.config.config.case_event_search_index = False
+        try:
+            self.add_search_events()
+            hits, _ = case_database.case_db.search_events('firewall', 10)
+        finally:
+            walkoff.config.config.case_event_search_index = True
+        self.assertListEqual([hit['message'] for hit in hits],
+                             ['Workflow started', 'Action scan executed', 'Action firewall executed'])
+        self.assertIsNone(hits[0]['score'])
+
+    def test_search_events_indexes_sink_events(self):
+        TestCaseDatabase.__construct_basic_db()
+        sink = CaseEventSink()
+        sink.add('ACTION', 'id1', 'Action firewall executed', '{}', ['case1'])
+        sink.flush()
+        hits, _ = case_database.case_db.search_events('firewall', 10)
+        self.assertListEqual([hit['message'] for hit in hits], ['Action firewall executed'])
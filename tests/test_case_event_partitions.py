@@ -0,0 +1,175 @@
+import json
+import sqlite3
+import unittest
+from datetime import datetime
+
+import walkoff.case.database as case_database
+import walkoff.config.config
+import walkoff.config.paths
+from tests.util import execution_db_help
+from walkoff.case.database import EventPartition, maintain_partitions, partition_period_start
+from walkoff.case.eventsink import CaseEventSink
+from walkoff.case.subscription import set_subscriptions
+
+
+class TestCaseEventPartitions(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_device_db()
+        case_database.case_db.tear_down()
+
+    def setUp(self):
+        case_database.initialize()
+        set_subscriptions({'case1': {}, 'case2': {}})
+
+    def tearDown(self):
+        walkoff.config.config.case_event_partition_period = None
+        walkoff.config.config.case_event_retention_age = None
+        walkoff.config.config.case_event_search_index = True
+        case_database.initialize()
+
+    @staticmethod
+    def add_events(day, messages, case='case1'):
+        for hour, message in enumerate(messages):
+            event = case_database.Event(type='ACTION', originator='id1', message=message,
+                                        data=json.dumps({'day': day}), timestamp=datetime(2018, 6, day, hour))
+            case_database.case_db.add_event(event, [case])
+
+    @staticmethod
+    def maintain(now, period='day'):
+        walkoff.config.config.case_event_partition_period = period
+        try:
+            with case_database.case_db.engine.begin() as connection:
+                maintain_partitions(connection, now=now)
+        finally:
+            walkoff.config.config.case_event_partition_period = None
+
+    def add_partitioned_events(self):
+        self.add_events(1, ['firewall one', 'scan one'])
+        self.maintain(datetime(2018, 6, 2, 10))
+        self.add_events(2, ['firewall two', 'scan two'])
+        self.maintain(datetime(2018, 6, 3, 10))
+        self.add_events(3, ['firewall three'])
+
+    @staticmethod
+    def get_tables():
+        connection = sqlite3.connect(walkoff.config.paths.case_db_path)
+        try:
+            return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        finally:
+            connection.close()
+
+    @staticmethod
+    def get_partitions():
+        return {partition.name: partition for partition in case_database.case_db.session.query(EventPartition)}
+
+    @staticmethod
+    def get_case_id(name='case1'):
+        return case_database.case_db.session.query(case_database.Case).filter_by(name=name).first().id
+
+    def test_partition_period_start(self):
+        self.assertEqual(partition_period_start(datetime(2018, 6, 7, 13, 30), 'day'), datetime(2018, 6, 7))
+        self.assertEqual(partition_period_start(datetime(2018, 6, 7, 13, 30), 'week'), datetime(2018, 6, 4))
+        with self.assertRaises(ValueError):
+            partition_period_start(datetime(2018, 6, 7), 'month')
+
+    def test_seal_partitions(self):
+        self.add_partitioned_events()
+        partitions = self.get_partitions()
+        self.assertSetEqual(set(partitions), {'event', 'event_p20180601', 'event_p20180602'})
+        self.assertEqual(partitions['event'].period, datetime(2018, 6, 3))
+        self.assertEqual((partitions['event_p20180601'].first_id, partitions['event_p20180601'].last_id), (1, 2))
+        self.assertEqual((partitions['event_p20180602'].first_id, partitions['event_p20180602'].last_id), (3, 4))
+        self.assertEqual(partitions['event_p20180602'].start, datetime(2018, 6, 2, 0))
+        self.assertEqual(partitions['event_p20180602'].end, datetime(2018, 6, 2, 1))
+        self.assertTrue({'event_p20180601', 'case_event_p20180601', 'event_p20180602',
+                         'case_event_p20180602'} <= self.get_tables())
+        self.assertListEqual([event.id for event in case_database.case_db.session.query(case_database.Event)], [5])
+
+    def test_seal_partitions_does_not_seal_empty_partition(self):
+        self.maintain(datetime(2018, 6, 1))
+        self.maintain(datetime(2018, 6, 2))
+        self.assertSetEqual(set(self.get_partitions()), {'event'})
+        self.assertEqual(self.get_partitions()['event'].period, datetime(2018, 6, 2))
+
+    def test_seal_partitions_by_week(self):
+        self.add_events(5, ['one'])
+        self.maintain(datetime(2018, 6, 6), period='week')
+        self.assertSetEqual(set(self.get_partitions()), {'event'})
+        self.maintain(datetime(2018, 6, 11), period='week')
+        self.assertIn('event_p20180604', self.get_partitions())
+
+    def test_case_events_page_spans_partitions(self):
+        self.add_partitioned_events()
+        self.add_events(3, ['other'], case='case2')
+        case_id = self.get_case_id()
+        messages, cursor = [], None
+        while True:
+            page, cursor = case_database.case_db.case_events_page(case_id, 2, cursor=cursor)
+            messages.append([event['message'] for event in page])
+            if cursor is None:
+                break
+        self.assertListEqual(messages, [['firewall one', 'scan one'], ['firewall two', 'scan two'],
+                                        ['firewall three']])
+
+    def test_stream_case_events_spans_partitions(self):
+        self.add_partitioned_events()
+        events = list(case_database.case_db.stream_case_events(self.get_case_id(), batch_size=1))
+        self.assertListEqual([event['id'] for event in events], [1, 2, 3, 4, 5])
+        self.assertListEqual([event['data']['day'] for event in events], [1, 1, 2, 2, 3])
+        self.assertEqual(len(case_database.case_db.case_events_as_json(self.get_case_id())), 5)
+
+    def test_get_and_edit_sealed_event(self):
+        self.add_partitioned_events()
+        case_database.case_db.edit_event_note(3, 'Note')
+        event = case_database.case_db.event_as_json(3)
+        self.assertEqual(event['message'], 'firewall two')
+        self.assertEqual(event['note'], 'Note')
+        self.assertIsNone(case_database.case_db.get_event(100))
+
+    def test_search_spans_partitions(self):
+        self.add_partitioned_events()
+        self.assertTrue(all(partition.indexed for name, partition in self.get_partitions().items()
+                            if name != 'event'))
+        hits, _ = case_database.case_db.search_events('firewall', 10)
+        self.assertSetEqual({hit['message'] for hit in hits}, {'firewall one', 'firewall two', 'firewall three'})
+        hits, _ = case_database.case_db.search_events('firewall', 10, since=datetime(2018, 6, 2),
+                                                      until=datetime(2018, 6, 3))
+        self.assertListEqual([hit['message'] for hit in hits], ['firewall two'])
+
+    def test_search_without_index_spans_partitions(self):
+        self.add_partitioned_events()
+        walkoff.config.config.case_event_search_index = False
+        hits, _ = case_database.case_db.search_events('scan', 10)
+        self.assertListEqual([hit['message'] for hit in hits], ['scan two', 'scan one'])
+
+    def test_retention_drops_partitions(self):
+        self.add_partitioned_events()
+        walkoff.config.config.case_event_retention_age = 24 * 60 * 60
+        with case_database.case_db.engine.begin() as connection:
+            maintain_partitions(connection, now=datetime(2018, 6, 3, 0, 30))
+        self.assertSetEqual(set(self.get_partitions()), {'event', 'event_p20180602'})
+        tables = self.get_tables()
+        self.assertNotIn('event_p20180601', tables)
+        self.assertNotIn('case_event_p20180601', tables)
+        self.assertNotIn('event_search_p20180601', tables)
+        events = list(case_database.case_db.stream_case_events(self.get_case_id()))
+        self.assertListEqual([event['id'] for event in events], [3, 4, 5])
+
+    def test_sink_writes_after_sealed_partitions(self):
+        self.add_partitioned_events()
+        sink = CaseEventSink()
+        sink.add('ACTION', 'id1', 'sink event', '{}', ['case1'])
+        sink.flush()
+        self.assertEqual(sink.written, 1)
+        events = list(case_database.case_db.stream_case_events(self.get_case_id()))
+        self.assertListEqual([event['id'] for event in events], [1, 2, 3, 4, 5, 6])
+
+    def test_initialize_drops_partitions(self):
+        self.add_partitioned_events()
+        case_database.initialize()
+        self.assertFalse(any(table.startswith('event_p2018') for table in self.get_tables()))
@@ -0,0 +1,144 @@
+import threading
+import unittest
+
+import walkoff.case.database as case_database
+import walkoff.case.subscription as case_subscription
+import walkoff.config.config
+from tests.util import execution_db_help
+from walkoff.case.callbacks import add_entry_to_case
+from walkoff.case.eventsink import CaseEventSink
+
+
+class TestCaseEventSink(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_device_db()
+        case_database.case_db.tear_down()
+
+    def setUp(self):
+        case_database.initialize()
+        case_subscription.set_subscriptions({'case1': {'id1': ['e1']}, 'case2': {'id1': ['e1'], 'id2': ['e2']}})
+        self.sink = CaseEventSink(queue_size=100, batch_size=10, policy='drop')
+        self.original_policy = walkoff.config.config.case_event_queue_policy
+
+    def tearDown(self):
+        walkoff.config.config.case_event_queue_policy = self.original_policy
+        case_subscription.clear_subscriptions()
+        case_database.case_db.session.query(case_database.Event).delete()
+        case_database.case_db.session.query(case_database.Case).delete()
+        case_database.case_db.session.commit()
+
+    def block_writes(self):
+        release = threading.Event()
+        write = self.sink._CaseEventSink__write
+
+        def blocked_write(batch):
+            release.wait()
+            write(batch)
+
+        self.sink._CaseEventSink__write = blocked_write
+        return release
+
+    @staticmethod
+    def get_case_events(case_name):
+        case_database.case_db.session.expire_all()
+        case = case_database.case_db.session.query(case_database.Case).filter_by(name=case_name).first()
+        return case.events.order_by(case_database.Event.id).all()
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            CaseEventSink(policy='invalid')
+
+    def test_add_and_flush(self):
+        for i in range(25):
+            self.assertTrue(self.sink.add('ACTION', 'id1', 'message {}'.format(i), '{"a": 1}', ['case1', 'case2']))
+        self.assertTrue(self.sink.add('ACTION', 'id2', 'other', '', ['case2']))
+        self.sink.flush()
+        self.assertEqual(self.sink.pending, 0)
+        self.assertEqual(self.sink.written, 26)
+        case1_events = self.get_case_events('case1')
+        self.assertListEqual([event.message for event in case1_events], ['message {}'.format(i) for i in range(25)])
+        self.assertDictEqual(case1_events[0].as_json(with_cases=False)['data'], {'a': 1})
+        self.assertEqual(len(self.get_case_events('case2')), 26)
+
+    def test_untracked_case(self):
+        self.sink.add('ACTION', 'id1', 'message', '', ['case1', 'invalid'])
+        self.sink.flush()
+        self.assertEqual(len(self.get_case_events('case1')), 1)
+        self.assertEqual(self.sink.failed, 0)
+
+    def test_add_entry_to_case(self):
+        from walkoff.case.eventsink import case_event_sink
+        add_entry_to_case({'id': 'id1'}, {'data': {'result': 3}}, 'ACTION', 'action message', 'e1')
+        add_entry_to_case({'id': 'id2'}, 'raw', 'ACTION', 'action message', 'e1')
+        case_event_sink.flush()
+        events = self.get_case_events('case2')
+        self.assertEqual(len(events), 1)
+        self.assertDictEqual(events[0].as_json()['data'], {'result': 3})
+
+    def test_write_error_keeps_thread_running(self):
+        import walkoff.case.eventsink as eventsink
+        insert = eventsink._insert
+
+        def failing_insert(batch):
+            eventsink._insert = insert
+            raise RuntimeError('write failed')
+
+        eventsink._insert = failing_insert
+        try:
+            self.sink.add('ACTION', 'id1', 'lost', '', ['case1'])
+            self.sink.flush()
+        finally:
+            eventsink._insert = insert
+        self.assertEqual(self.sink.failed, 1)
+        self.sink.add('ACTION', 'id1', 'written', '', ['case1'])
+        self.sink.flush()
+        self.assertListEqual([event.message for event in self.get_case_events('case1')], ['written'])
+
+    def test_drop_policy(self):
+        sink = CaseEventSink(queue_size=2, batch_size=10, policy='drop')
+        self.sink = sink
+        release = self.block_writes()
+        added = [sink.add('ACTION', 'id1', str(i), '', ['case1']) for i in range(5)]
+        self.assertGreaterEqual(sink.dropped, 1)
+        self.assertEqual(sink.dropped, added.count(False))
+        release.set()
+        sink.flush()
+        self.assertEqual(sink.written + sink.dropped, 5)
+        self.assertEqual(len(self.get_case_events('case1')), sink.written)
+
+    def test_block_policy(self):
+        walkoff.config.config.case_event_queue_policy = 'block'
+        self.sink = CaseEventSink(queue_size=1, batch_size=10)
+        release = self.block_writes()
+        adder = threading.Thread(target=lambda: [self.sink.add('ACTION', 'id1', str(i), '', ['case1'])
+                                                 for i in range(4)])
+        adder.start()
+        adder.join(timeout=0.2)
+        self.assertTrue(adder.is_alive())
+        release.set()
+        adder.join(timeout=5)
+        self.assertFalse(adder.is_alive())
+        self.sink.flush()
+        self.assertEqual(self.sink.dropped, 0)
+        self.assertListEqual([event.message for event in self.get_case_events('case1')], ['0', '1', '2', '3'])
+
+    def test_metrics(self):
+        release = self.block_writes()
+        self.sink.add('ACTION', 'id1', 'message', '', ['case1'])
+        self.sink.add('ACTION', 'id1', 'message', '', ['case1'])
+        metrics = self.sink.metrics()
+        self.assertGreaterEqual(metrics['pending'], 1)
+        self.assertGreaterEqual(metrics['lag'], 0)
+        release.set()
+        self.sink.flush()
+        metrics = self.sink.metrics()
+        self.assertEqual(metrics['pending'], 0)
+        self.assertEqual(metrics['lag'], 0)
+        self.assertEqual(metrics['written'], 2)
+        self.assertGreaterEqual(metrics['max_lag'], metrics['last_lag'])
+        self.assertGreater(metrics['max_lag'], 0)
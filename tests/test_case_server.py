@@ -1,3 +1,4 @@
+import csv
 import json
 import os
 
@@ -316,3 +317,88 @@ class TestCaseServer(ServerTestCase):
             self.assertSetEqual(set(events),
                                 {event.signal_name for event in WalkoffEvent if
                                  event.event_type.name == event_type and event != WalkoffEvent.SendMessage})
+
+    def add_case_events(self, case_name, count):
+        for i in range(count):
+            event = case_database.Event(type='ACTION', originator='id1', message='message {}'.format(i),
+                                        data=json.dumps({'index': i}))
+            case_database.case_db.add_event(event, [case_name])
+        return case_database.case_db.session.query(case_database.Case).filter_by(name=case_name).first().id
+
+    def test_read_events_pages(self):
+        self.__basic_case_setup()
+        case_id = self.add_case_events('case1', 5)
+        self.add_case_events('case2', 2)
+        response = self.app.get('/api/cases/{}/events?limit=2'.format(case_id), headers=self.headers)
+        self.assertEqual(response.status_code, SUCCESS)
+        self.assertListEqual([event['data']['index'] for event in json.loads(response.get_data(as_text=True))],
+                             [0, 1])
+        cursor = response.headers['X-Next-Cursor']
+        response = self.app.get('/api/cases/{0}/events?limit=3&cursor={1}'.format(case_id, cursor),
+                                headers=self.headers)
+        self.assertListEqual([event['data']['index'] for event in json.loads(response.get_data(as_text=True))],
+                             [2, 3, 4])
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_read_events_without_limit_reads_all(self):
+        self.__basic_case_setup()
+        case_id = self.add_case_events('case1', 60)
+        response = self.get_with_status_check('/api/cases/{}/events'.format(case_id), headers=self.headers)
+        self.assertEqual(len(response), 60)
+
+    def test_read_events_invalid_cursor(self):
+        self.__basic_case_setup()
+        case_id = self.add_case_events('case1', 1)
+        self.get_with_status_check('/api/cases/{}/events?cursor=invalid'.format(case_id), headers=self.headers,
+                                   status_code=BAD_REQUEST)
+
+    def test_read_events_page_case_not_found(self):
+        self.get_with_status_check('/api/cases/404/events?limit=2', headers=self.headers,
+                                   status_code=OBJECT_DNE_ERROR)
+
+    def test_export_events_ndjson(self):
+        self.__basic_case_setup()
+        case_id = self.add_case_events('case1', 3)
+        response = self.app.get('/api/cases/{}/events/export'.format(case_id), headers=self.headers)
+        self.assertEqual(response.status_code, SUCCESS)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertIn('case1-events.ndjson', response.headers['Content-Disposition'])
+        events = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertListEqual([event['message'] for event in events], ['message 0', 'message 1', 'message 2'])
+        self.assertDictEqual(events[0]['data'], {'index': 0})
+
+    def test_export_events_csv(self):
+        self.__basic_case_setup()
+        case_id = self.add_case_events('case1', 2)
+        response = self.app.get('/api/cases/{}/events/export?file_format=csv'.format(case_id), headers=self.headers)
+        self.assertEqual(response.status_code, SUCCESS)
+        self.assertEqual(response.mimetype, 'text/csv')
+        rows = list(csv.reader(response.get_data(as_text=True).splitlines()))
+        self.assertListEqual(rows[0], ['id', 'timestamp', 'type', 'originator', 'message', 'note', 'data'])
+        self.assertListEqual([row[4] for row in rows[1:]], ['message 0', 'message 1'])
+        self.assertDictEqual(json.loads(rows[1][6]), {'index': 0})
+
+    def test_export_events_case_not_found(self):
+        self.get_with_status_check('/api/cases/404/events/export', headers=self.headers,
+                                   status_code=OBJECT_DNE_ERROR)
+
+    def test_search_events(self):
+        self.__basic_case_setup()
+        case_id = self.add_case_events('case1', 5)
+        self.add_case_events('case2', 2)
+        response = self.app.get('/api/events/search?query=message&case_id={}&limit=3'.format(case_id),
+                                headers=self.headers)
+        self.assertEqual(response.status_code, SUCCESS)
+        hits = json.loads(response.get_data(as_text=True))
+        self.assertEqual(len(hits), 3)
+        self.assertIn('score', hits[0])
+        response = self.app.get('/api/events/search?query=message&case_id={0}&limit=3&cursor={1}'.format(
+            case_id, response.headers['X-Next-Cursor']), headers=self.headers)
+        self.assertEqual(len(json.loads(response.get_data(as_text=True))), 2)
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+    def test_search_events_invalid_query(self):
+        self.__basic_case_setup()
+        self.add_case_events('case1', 1)
+        self.get_with_status_check('/api/events/search?query=%22unterminated', headers=self.headers,
+                                   status_code=BAD_REQUEST)
@@ -183,3 +183,46 @@ class TestCases(unittest.TestCase):
         subs.remove_subscription_node('case1', 'id1')
         cases['case1'].pop('id1')
         self.assertInMemoryCasesAreCorrect(cases)
+
+    def test_get_cases_subscribed_after_add_cases(self):
+        subs.add_cases(self.cases1)
+        subs.add_cases(self.cases_overlap)
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'e2')), {'case1', 'case2'})
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'a')), {'case3'})
+        self.assertSetEqual(set(subs.get_cases_subscribed('id3', 'e')), set())
+
+    def test_get_cases_subscribed_after_delete_cases(self):
+        subs.set_subscriptions(self.cases1)
+        subs.delete_cases(['case2'])
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'e2')), {'case1'})
+
+    def test_get_cases_subscribed_after_rename_case(self):
+        subs.set_subscriptions(self.cases1)
+        subs.rename_case('case2', 'renamed')
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'e3')), {'case1', 'renamed'})
+
+    def test_get_cases_subscribed_after_modify_subscription(self):
+        subs.set_subscriptions(self.cases1)
+        subs.modify_subscription('case1', 'id1', ['e1', 'new'])
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'e2')), {'case2'})
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'new')), {'case1'})
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'e1')), {'case1'})
+
+    def test_get_cases_subscribed_after_remove_subscription_node(self):
+        subs.set_subscriptions(self.cases1)
+        subs.remove_subscription_node('case1', 'id1')
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'e3')), {'case2'})
+        self.assertSetEqual(set(subs.get_cases_subscribed('id2', 'e1')), {'case1'})
+
+    def test_get_cases_subscribed_replaced_subscriptions(self):
+        subs.set_subscriptions(self.cases1)
+        subs.subscriptions = self.cases2
+        self.assertSetEqual(set(subs.get_cases_subscribed('id1', 'e2')), set())
+        self.assertSetEqual(set(subs.get_cases_subscribed('id4', 'd')), {'case3'})
+
+    def test_has_subscriptions(self):
+        self.assertFalse(subs.has_subscriptions())
+        subs.set_subscriptions(self.cases1)
+        self.assertTrue(subs.has_subscriptions())
+        subs.delete_cases(['case1', 'case2'])
+        self.assertFalse(subs.has_subscriptions())
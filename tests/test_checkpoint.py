@@ -0,0 +1,147 @@
+import json
+import os
+import pickle
+import shutil
+import unittest
+import zlib
+from uuid import uuid4
+
+import tests.config
+import walkoff.appgateway
+import walkoff.config.config
+import walkoff.executiondb.checkpoint
+from tests.util import execution_db_help
+from walkoff import executiondb
+from walkoff.appgateway.appinstance import AppInstance
+from walkoff.executiondb.accumulator import SpillableAccumulator
+from walkoff.executiondb.checkpoint import encode_checkpoint, decode_checkpoint, InvalidCheckpoint, \
+    CHECKPOINT_MAGIC
+from walkoff.executiondb.saved_workflow import SavedWorkflow
+from walkoff.resultstore import ResultStore
+
+
+class TestCheckpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+        walkoff.appgateway.cache_apps(tests.config.test_apps_path)
+        walkoff.config.config.load_app_apis(apps_path=tests.config.test_apps_path)
+
+    def setUp(self):
+        self.path = os.path.join('.', 'tests', 'tmp', 'results')
+        self.store = ResultStore(self.path, extension='pkl')
+        self.original_threshold = walkoff.config.config.result_store_threshold
+        walkoff.config.config.result_store_threshold = 1024
+
+    def tearDown(self):
+        walkoff.config.config.result_store_threshold = self.original_threshold
+        shutil.rmtree(self.path, ignore_errors=True)
+        executiondb.execution_db.session.query(SavedWorkflow).delete()
+        executiondb.execution_db.session.commit()
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_device_db()
+
+    def round_trip(self, accumulator, app_instances=None):
+        checkpoint = encode_checkpoint(accumulator, app_instances or {}, store=self.store)
+        return decode_checkpoint(checkpoint, store=self.store)
+
+    def test_header(self):
+        checkpoint = encode_checkpoint({}, {}, store=self.store)
+        self.assertTrue(checkpoint.startswith(CHECKPOINT_MAGIC))
+
+    def test_accumulator_round_trip(self):
+        key1, key2 = uuid4(), 'key2'
+        accumulator, _ = self.round_trip({key1: {'a': [1, 2]}, key2: 'value'})
+        self.assertDictEqual(dict(accumulator), {key1: {'a': [1, 2]}, key2: 'value'})
+
+    def test_large_value_stored_by_reference(self):
+        key = uuid4()
+        value = {'data': 'a' * 100 * 1024}
+        checkpoint = encode_checkpoint({key: value}, {}, store=self.store)
+        self.assertLess(len(checkpoint), 1024)
+        accumulator, _ = decode_checkpoint(checkpoint, store=self.store)
+        self.assertDictEqual(accumulator[key], value)
+
+    def test_large_value_keeps_types(self):
+        key = uuid4()
+        value = {1: ('a' * 2048, 2), 'set': {3, 4}}
+        checkpoint = encode_checkpoint({key: value}, {}, store=self.store)
+        accumulator, _ = decode_checkpoint(checkpoint, store=self.store)
+        result_id, encoding = accumulator.get_stored_result(key)
+        self.assertEqual(encoding, 'pickle')
+        self.assertEqual(pickle.loads(self.store.read(result_id)), value)
+        self.assertDictEqual(accumulator[key], value)
+
+    def test_checkpoint_of_restored_accumulator(self):
+        large, small = uuid4(), uuid4()
+        accumulator, _ = self.round_trip({large: 'a' * 2048, small: (1, 2)})
+        pickled = accumulator.get_pickled_result(small)
+        self.assertIsNotNone(pickled)
+        checkpoint = encode_checkpoint(accumulator, {}, store=self.store)
+        body = pickle.loads(zlib.decompress(checkpoint[len(CHECKPOINT_MAGIC) + 1:]))
+        entries = {key: value for key, _, value in body['accumulator']}
+        self.assertEqual(entries[large], accumulator.get_stored_result(large)[0])
+        self.assertEqual(entries[small], pickled)
+        accumulator, _ = decode_checkpoint(checkpoint, store=self.store)
+        self.assertDictEqual(dict(accumulator), {large: 'a' * 2048, small: (1, 2)})
+
+    def test_json_result_reference(self):
+        json_store = ResultStore(self.path, extension='log')
+        original_store = walkoff.executiondb.checkpoint.log_result_store
+        walkoff.executiondb.checkpoint.log_result_store = json_store
+        try:
+            accumulator = SpillableAccumulator()
+            accumulator.add_stored_result('key', json_store.put(json.dumps([1, 2])), json_store)
+            restored, _ = self.round_trip(accumulator)
+            self.assertEqual(restored.get_stored_result('key')[1], 'json')
+            self.assertListEqual(restored['key'], [1, 2])
+        finally:
+            walkoff.executiondb.checkpoint.log_result_store = original_store
+
+    def test_missing_reference(self):
+        checkpoint = encode_checkpoint({'key': 'a' * 2048}, {}, store=self.store)
+        shutil.rmtree(self.path)
+        with self.assertRaises(InvalidCheckpoint):
+            decode_checkpoint(checkpoint, store=self.store)
+
+    def test_non_json_value(self):
+        accumulator, _ = self.round_trip({'key': {1, 2, 3}})
+        self.assertSetEqual(accumulator['key'], {1, 2, 3})
+
+    def test_invalid_checkpoint(self):
+        for checkpoint in (None, b'', b'abcdefgh', CHECKPOINT_MAGIC + b'\x01abcd'):
+            with self.assertRaises(InvalidCheckpoint):
+                decode_checkpoint(checkpoint, store=self.store)
+
+    def test_unsupported_version(self):
+        checkpoint = bytearray(encode_checkpoint({}, {}, store=self.store))
+        checkpoint[len(CHECKPOINT_MAGIC)] = 99
+        with self.assertRaises(InvalidCheckpoint):
+            decode_checkpoint(bytes(checkpoint), store=self.store)
+
+    def test_app_instance_state(self):
+        app_instance = AppInstance.create('HelloWorld', None)
+        app_instance().execution_cache.set('token', 'abc')
+        _, app_instances = self.round_trip({}, {('HelloWorld', None): app_instance})
+        restored = app_instances[('HelloWorld', None)]()
+        self.assertIsNot(restored, app_instance())
+        self.assertEqual(restored.execution_cache.get('token'), 'abc')
+        self.assertEqual(restored.introMessage, {'message': 'HELLO WORLD'})
+
+    def test_app_instance_no_state(self):
+        _, app_instances = self.round_trip({}, {('HelloWorld', None): AppInstance.create('HelloWorld', None)})
+        self.assertEqual(len(app_instances[('HelloWorld', None)]().execution_cache), 0)
+
+    def test_saved_workflow_save(self):
+        execution_id, workflow_id, key = uuid4(), uuid4(), uuid4()
+        session = executiondb.execution_db.session
+        SavedWorkflow.save(session, execution_id, workflow_id, uuid4(), {key: 1}, {})
+        action_id = uuid4()
+        SavedWorkflow.save(session, execution_id, workflow_id, action_id, {key: 2}, {})
+        saved_states = session.query(SavedWorkflow).filter_by(workflow_execution_id=execution_id).all()
+        self.assertEqual(len(saved_states), 1)
+        self.assertEqual(saved_states[0].action_id, action_id)
+        self.assertDictEqual(dict(saved_states[0].accumulator), {key: 2})
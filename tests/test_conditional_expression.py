@@ -202,6 +202,85 @@ class TestCondition(unittest.TestCase):
         self.assertFalse(expression.execute('any', {}))
         self.assertTrue(result['triggered'])
 
+    def test_compile_matches_execute(self):
+        expression = ConditionalExpression(
+            operator='xor',
+            conditions=[self.get_regex_condition('aa')],
+            child_expressions=[
+                ConditionalExpression(conditions=[self.get_regex_condition('bb')]),
+                ConditionalExpression(conditions=[self.get_regex_condition('cc')])])
+        compiled = expression.compile()
+        for pattern in ('aa', 'bb', 'cc', 'aabb', 'bbcc', 'aacc', 'd'):
+            self.assertEqual(compiled(pattern, {}), expression.execute(pattern, {}))
+
+    def test_compile_without_events(self):
+        expression = ConditionalExpression(
+            conditions=[self.get_regex_condition('a')],
+            child_expressions=[ConditionalExpression(conditions=[self.get_regex_condition('aa')])])
+        result = {'count': 0}
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def callback_is_sent(sender, **kwargs):
+            if isinstance(sender, (ConditionalExpression, Condition)):
+                result['count'] += 1
+
+        compiled = expression.compile(emit_events=False)
+        self.assertTrue(compiled('aa', {}))
+        self.assertFalse(compiled('bb', {}))
+        self.assertEqual(result['count'], 0)
+
+    def test_compile_short_circuits(self):
+        expression = ConditionalExpression(
+            operator='or',
+            conditions=[self.get_regex_condition('aa'), self.get_regex_condition('bb')])
+        result = {'count': 0}
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def callback_is_sent(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.ConditionSuccess:
+                result['count'] += 1
+
+        self.assertTrue(expression.compile()('aa', {}))
+        self.assertEqual(result['count'], 1)
+
+    def test_compile_invalid_static_argument_sends_error_event(self):
+        condition = self.get_regex_condition()
+        condition.arguments = [Argument('regex', value=['not', 'a', 'string'])]
+        expression = ConditionalExpression(conditions=[condition])
+        result = {'triggered': False}
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def callback_is_sent(sender, **kwargs):
+            if isinstance(sender, ConditionalExpression):
+                self.assertEqual(kwargs['event'], WalkoffEvent.ConditionalExpressionError)
+                result['triggered'] = True
+
+        self.assertFalse(expression.compile()('aa', {}))
+        self.assertTrue(result['triggered'])
+
+    def test_execute_reuses_compiled_expression(self):
+        expression = ConditionalExpression(conditions=[self.get_regex_condition('aa')])
+        compile_expression = expression.compile
+        result = {'count': 0}
+
+        def count_compiles(*args, **kwargs):
+            result['count'] += 1
+            return compile_expression(*args, **kwargs)
+
+        expression.compile = count_compiles
+        self.assertTrue(expression.execute('aa', {}))
+        self.assertFalse(expression.execute('bb', {}))
+        self.assertEqual(result['count'], 1)
+
+    def test_execute_recompiles_after_change(self):
+        expression = ConditionalExpression(conditions=[self.get_regex_condition('aa')])
+        self.assertTrue(expression.execute('aa', {}))
+        expression.conditions[0].arguments[0].value = 'bb'
+        self.assertFalse(expression.execute('aa', {}))
+        self.assertTrue(expression.execute('bb', {}))
+        expression.conditions.append(self.get_regex_condition('cc'))
+        self.assertFalse(expression.execute('bb', {}))
+
     def test_read_does_not_infinitely_recurse(self):
         expression = ConditionalExpression(
             operator='xor',
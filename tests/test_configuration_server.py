@@ -54,6 +54,25 @@ class TestConfigurationServer(ServerTestCase):
         response = self.get_with_status_check('/api/configuration', headers=self.headers)
         self.assertDictEqual(response, expected)
 
+    def test_load_config_falsy_values(self):
+        settings = {'result_store_threshold': None,
+                    'accumulator_read_cache_size': 0,
+                    'archive_executions': False,
+                    'db_path': ''}
+        originals = {key: getattr(walkoff.config.config, key) for key in settings if key != 'db_path'}
+        original_db_path = walkoff.config.paths.db_path
+        with open(walkoff.config.paths.config_path, 'w') as config_file:
+            config_file.write(json.dumps(settings))
+        try:
+            walkoff.config.config.load_config()
+            self.assertIsNone(walkoff.config.config.result_store_threshold)
+            self.assertEqual(walkoff.config.config.accumulator_read_cache_size, 0)
+            self.assertFalse(walkoff.config.config.archive_executions)
+            self.assertEqual(walkoff.config.paths.db_path, original_db_path)
+        finally:
+            for key, value in originals.items():
+                setattr(walkoff.config.config, key, value)
+
     def put_post_to_config(self, verb):
         send_func = self.put_with_status_check if verb == 'put' else self.patch_with_status_check
         data = {"db_path": 'db_path_reset',
@@ -32,6 +32,25 @@ class TestDecorators(unittest.TestCase):
 
         self.assertEqual(add_three(1, 2, 3), ActionResult(6, 'Custom'))
 
+    def test_action_decorator_not_cacheable_by_default(self):
+        @action
+        def add_three(a, b, c):
+            return a + b + c
+
+        self.assertFalse(getattr(add_three, 'cacheable'))
+        self.assertIsNone(getattr(add_three, 'cache_ttl'))
+
+    def test_action_decorator_cacheable(self):
+        @action(cacheable=True, ttl=30)
+        def add_three(a, b, c):
+            return a + b + c
+
+        self.assertTrue(getattr(add_three, 'action'))
+        self.assertTrue(getattr(add_three, 'cacheable'))
+        self.assertEqual(getattr(add_three, 'cache_ttl'), 30)
+        self.assertListEqual(getattr(add_three, '__arg_names'), ['a', 'b', 'c'])
+        self.assertEqual(add_three(1, 2, 3), ActionResult(6, None))
+
     def test_flag_decorator_is_tagged(self):
         @condition
         def is_even(x):
@@ -47,3 +66,20 @@ class TestDecorators(unittest.TestCase):
 
         self.assertTrue(getattr(add_one, 'transform'))
         self.assertEqual(add_one(1), 2)
+
+    def test_filter_decorator_mutates_default(self):
+        @transform
+        def add_one(x):
+            return x + 1
+
+        self.assertFalse(getattr(add_one, 'mutates'))
+
+    def test_filter_decorator_with_mutates(self):
+        @transform(mutates=True)
+        def append_one(x):
+            x.append(1)
+            return x
+
+        self.assertTrue(getattr(append_one, 'transform'))
+        self.assertTrue(getattr(append_one, 'mutates'))
+        self.assertListEqual(append_one([]), [1])
@@ -216,3 +216,41 @@ class TestEventDispatcher(TestCase):
     def test_is_registered_valid(self):
         self.router.register_events(func, {WalkoffEvent.ActionArgumentsInvalid}, names='a')
         self.assertTrue(self.router.is_registered('a', WalkoffEvent.ActionArgumentsInvalid, func))
+
+    def test_has_listeners_no_registrations(self):
+        self.assertFalse(self.router.has_listeners(WalkoffEvent.ActionStarted))
+
+    def test_has_listeners_event_not_registered(self):
+        self.router.register_events(func, {WalkoffEvent.ActionStarted})
+        self.assertFalse(self.router.has_listeners(WalkoffEvent.ActionExecutionError, 'a', 'b'))
+
+    def test_has_listeners_all_senders(self):
+        self.router.register_events(func, {WalkoffEvent.ActionStarted})
+        self.assertTrue(self.router.has_listeners(WalkoffEvent.ActionStarted))
+        self.assertTrue(self.router.has_listeners(WalkoffEvent.ActionStarted, 'a', 'b'))
+
+    def test_has_listeners_sender_id_and_name(self):
+        self.router.register_events(func, {WalkoffEvent.ActionStarted}, sender_ids='a', names='b')
+        self.assertTrue(self.router.has_listeners(WalkoffEvent.ActionStarted))
+        self.assertTrue(self.router.has_listeners(WalkoffEvent.ActionStarted, 'a'))
+        self.assertTrue(self.router.has_listeners(WalkoffEvent.ActionStarted, 'c', 'b'))
+        self.assertFalse(self.router.has_listeners(WalkoffEvent.ActionStarted, 'c', 'd'))
+
+    def test_get_callbacks_reuses_dispatch_table(self):
+        self.router.register_events(func, {WalkoffEvent.ActionStarted}, names='a', weak=False)
+        callbacks = self.router._get_callbacks('b', 'a', WalkoffEvent.ActionStarted)
+        self.assertIs(self.router._get_callbacks('c', 'a', WalkoffEvent.ActionStarted), callbacks)
+
+    def test_get_callbacks_rebuilds_dispatch_table_on_registration(self):
+        self.router.register_events(func, {WalkoffEvent.ActionStarted}, names='a', weak=False)
+        self.assertTupleEqual(self.router._get_callbacks('b', 'a', WalkoffEvent.ActionStarted), (func,))
+        self.router.register_events(func2, {WalkoffEvent.ActionStarted}, weak=False)
+        self.assertSetEqual(set(self.router._get_callbacks('b', 'a', WalkoffEvent.ActionStarted)), {func, func2})
+
+    def test_get_callbacks_dispatch_table_does_not_keep_weak_callbacks(self):
+        def func3(): pass
+
+        self.router.register_events(func3, {WalkoffEvent.ActionStarted})
+        self.assertTupleEqual(self.router._get_callbacks('b', None, WalkoffEvent.ActionStarted), (func3,))
+        del func3
+        self.assertTupleEqual(self.router._get_callbacks('b', None, WalkoffEvent.ActionStarted), ())
@@ -1,21 +1,18 @@
-from copy import deepcopy
 from unittest import TestCase
 
+import walkoff.case.subscription as case_subscription
 from walkoff.events import *
 
 
 class TestEvents(TestCase):
-    original_signals = deepcopy(WalkoffSignal._signals)
-
     def setUp(self):
+        # The stored callbacks are the only strong references to weakly connected receivers, such as those of the case
+        # database, so they must be kept until the test is over
+        self.original_signals = WalkoffSignal._signals
         WalkoffSignal._signals = {}
 
-    @classmethod
-    def tearDownClass(cls):
-        WalkoffSignal._signals = cls.original_signals
-        for x, value in WalkoffSignal._signals.items():
-            if hasattr(value, '__test'):
-                WalkoffSignal._signals.pop(x)
+    def tearDown(self):
+        WalkoffSignal._signals = self.original_signals
 
     def test_walkoff_signal_init_default(self):
         signal = WalkoffSignal('name', EventType.action)
@@ -75,6 +72,65 @@ class TestEvents(TestCase):
         self.assertEqual(result['sender'], 5)
         self.assertDictEqual(result['kwargs'], {'x': 42})
 
+    def test_walkoff_signal_send_counts_sends(self):
+        signal = WalkoffSignal('name', EventType.action, loggable=False)
+
+        def xx(sender, **kwargs): pass
+
+        setattr(xx, '__test', True)
+        signal.connect(xx)
+        signal.send(5)
+        signal.send(5)
+        metrics = signal.metrics()
+        self.assertEqual(metrics['name'], 'name')
+        self.assertEqual(metrics['sends'], 2)
+        self.assertEqual(metrics['skipped'], 0)
+        self.assertGreater(metrics['handler_time'], 0)
+
+    def test_walkoff_signal_send_skips_dormant_case_receiver(self):
+        original_subscriptions = case_subscription.subscriptions
+        case_subscription.subscriptions = {}
+        try:
+            signal = WalkoffSignal('name', EventType.action)
+            signal.send({'id': 'abc'})
+            self.assertEqual(signal.sends, 1)
+            self.assertEqual(signal.skipped, 1)
+            self.assertEqual(signal.handler_time, 0)
+        finally:
+            case_subscription.subscriptions = original_subscriptions
+
+    def test_walkoff_signal_send_dispatches_when_cases_subscribed(self):
+        original_subscriptions = case_subscription.subscriptions
+        case_subscription.subscriptions = {'case1': {'def': ['name']}}
+        try:
+            signal = WalkoffSignal('name', EventType.action)
+            signal.send({'id': 'abc'})
+            self.assertEqual(signal.skipped, 0)
+        finally:
+            case_subscription.subscriptions = original_subscriptions
+
+    def test_walkoff_signal_send_dispatches_after_receiver_connected(self):
+        original_subscriptions = case_subscription.subscriptions
+        case_subscription.subscriptions = {}
+        result = {'triggered': False}
+
+        def xx(sender, **kwargs):
+            result['triggered'] = True
+
+        setattr(xx, '__test', True)
+        try:
+            signal = WalkoffSignal('name', EventType.action)
+            signal.send({'id': 'abc'})
+            signal.connect(xx)
+            signal.send({'id': 'abc'})
+            self.assertTrue(result['triggered'])
+            self.assertEqual(signal.skipped, 1)
+            del xx
+            signal.send({'id': 'abc'})
+            self.assertEqual(signal.skipped, 2)
+        finally:
+            case_subscription.subscriptions = original_subscriptions
+
     def test_walkoff_signal_store_callback(self):
         def xx(): pass
 
@@ -200,3 +256,8 @@ class TestEvents(TestCase):
         self.assertTrue(result['triggered'])
         self.assertEqual(result['sender'], 5)
         self.assertDictEqual(result['kwargs'], {'x': 42})
+
+    def test_walkoff_event_metrics(self):
+        metrics = WalkoffEvent.metrics()
+        self.assertEqual(len(metrics), len(WalkoffEvent))
+        self.assertIn(WalkoffEvent.ActionStarted.value.metrics(), metrics)
@@ -0,0 +1,262 @@
+import os
+import shutil
+import unittest
+from uuid import uuid4
+
+import tests.config
+import walkoff.appgateway
+import walkoff.config.config
+import walkoff.config.paths
+from tests.util import execution_db_help
+from walkoff import executiondb
+from walkoff.appgateway.actionresult import ActionResult
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
+from walkoff.events import WalkoffEvent
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.executionlog import ExecutionLogEntry, append_log_entry, clear_log, \
+    get_recoverable_executions, load_recovery_state, log_result_store, ACTION_COMPLETED, WORKFLOW_PAUSED
+from walkoff.executiondb.playbook import Playbook
+from walkoff.executiondb.workflow import Workflow
+from walkoff.multiprocessedexecutor import multiprocessedexecutor
+
+
+class TestExecutionLog(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+        walkoff.appgateway.cache_apps(tests.config.test_apps_path)
+        walkoff.config.config.load_app_apis(apps_path=tests.config.test_apps_path)
+
+    def setUp(self):
+        self.original_durable = walkoff.config.config.durable_workflows
+        self.original_threshold = walkoff.config.config.result_store_threshold
+        self.original_result_store_path = walkoff.config.paths.result_store_path
+        self.result_store_path = os.path.join('.', 'tests', 'tmp', 'results')
+        walkoff.config.paths.result_store_path = self.result_store_path
+        self.execution_id = uuid4()
+        self.workflow_id = uuid4()
+
+    def tearDown(self):
+        walkoff.config.config.durable_workflows = self.original_durable
+        walkoff.config.config.result_store_threshold = self.original_threshold
+        walkoff.config.paths.result_store_path = self.original_result_store_path
+        executiondb.execution_db.session.query(ExecutionLogEntry).delete()
+        executiondb.execution_db.session.commit()
+        shutil.rmtree(self.result_store_path, ignore_errors=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_device_db()
+
+    @staticmethod
+    def make_chain(length):
+        actions = [Action('HelloWorld', 'global2', 'action0', id=uuid4(), arguments=[Argument('arg1', value='a')])]
+        for i in range(1, length):
+            actions.append(Action('HelloWorld', 'global2', 'action{}'.format(i), id=uuid4(),
+                                  arguments=[Argument('arg1', reference=actions[i - 1].id)]))
+        branches = [Branch(actions[i].id, actions[i + 1].id) for i in range(length - 1)]
+        return actions, branches
+
+    def get_entries(self, execution_id):
+        return executiondb.execution_db.session.query(ExecutionLogEntry).filter_by(
+            workflow_execution_id=execution_id).order_by(ExecutionLogEntry.id).all()
+
+    def test_append_log_entry(self):
+        action_id = uuid4()
+        append_log_entry(self.execution_id, self.workflow_id, action_id, ACTION_COMPLETED,
+                         result=ActionResult({'a': 1}, 'Success'), worker_id=2)
+        entries = self.get_entries(self.execution_id)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].action_id, action_id)
+        self.assertEqual(entries[0].status, 'Success')
+        self.assertEqual(entries[0].worker_id, 2)
+        self.assertEqual(entries[0].result, '{"a": 1}')
+        self.assertIsNone(entries[0].result_id)
+
+    def test_append_log_entry_large_result(self):
+        walkoff.config.config.result_store_threshold = 16
+        append_log_entry(self.execution_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('a' * 32, 'Success'))
+        entry = self.get_entries(self.execution_id)[0]
+        self.assertIsNone(entry.result)
+        self.assertEqual(log_result_store.get(entry.result_id), '"{}"'.format('a' * 32))
+
+    def test_load_recovery_state(self):
+        action_ids = [uuid4(), uuid4()]
+        append_log_entry(self.execution_id, self.workflow_id, action_ids[0], ACTION_COMPLETED,
+                         result=ActionResult('first', 'Success'))
+        append_log_entry(self.execution_id, self.workflow_id, action_ids[1], ACTION_COMPLETED,
+                         result=ActionResult([1, 2], 'Error'))
+        workflow_id, accumulator, action_id, result = load_recovery_state(self.execution_id)
+        self.assertEqual(workflow_id, self.workflow_id)
+        self.assertEqual(action_id, action_ids[1])
+        self.assertEqual(result, ActionResult([1, 2], 'Error'))
+        self.assertDictEqual(dict(accumulator), {action_ids[0]: 'first', action_ids[1]: [1, 2]})
+
+    def test_load_recovery_state_no_completed_actions(self):
+        append_log_entry(self.execution_id, self.workflow_id, uuid4(), WORKFLOW_PAUSED)
+        self.assertIsNone(load_recovery_state(self.execution_id))
+
+    def test_get_recoverable_executions(self):
+        paused_id = uuid4()
+        other_worker_id = uuid4()
+        append_log_entry(self.execution_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('a', 'Success'), worker_id=1)
+        append_log_entry(paused_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('a', 'Success'), worker_id=1)
+        append_log_entry(paused_id, self.workflow_id, uuid4(), WORKFLOW_PAUSED, worker_id=1)
+        append_log_entry(other_worker_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('a', 'Success'), worker_id=2)
+        self.assertListEqual(get_recoverable_executions(worker_id=1), [(self.execution_id, self.workflow_id)])
+        self.assertSetEqual({execution_id for execution_id, _ in get_recoverable_executions()},
+                            {self.execution_id, other_worker_id})
+
+    def test_clear_log(self):
+        append_log_entry(self.execution_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('a', 'Success'))
+        clear_log(self.execution_id)
+        self.assertListEqual(self.get_entries(self.execution_id), [])
+
+    def test_clear_log_removes_unreferenced_results(self):
+        walkoff.config.config.result_store_threshold = 16
+        other_execution_id = uuid4()
+        append_log_entry(self.execution_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('a' * 32, 'Success'))
+        append_log_entry(self.execution_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('b' * 32, 'Success'))
+        append_log_entry(other_execution_id, self.workflow_id, uuid4(), ACTION_COMPLETED,
+                         result=ActionResult('b' * 32, 'Success'))
+        shared_id, unshared_id = (entry.result_id for entry in reversed(self.get_entries(self.execution_id)))
+        clear_log(self.execution_id)
+        self.assertIsNone(log_result_store.get_path(unshared_id))
+        self.assertIsNotNone(log_result_store.get_path(shared_id))
+        clear_log(other_execution_id)
+        self.assertIsNone(log_result_store.get_path(shared_id))
+
+    def execute_workflow(self, workflow, recovery_state=None):
+        executed = []
+        result = {}
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def shutdown(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.WorkflowShutdown:
+                result['data'] = kwargs['data']
+                result['entries'] = self.get_entries(self.execution_id)
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def action_executed(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.ActionExecutionSuccess:
+                executed.append(sender.id)
+
+        workflow._instance_repo = AppInstanceRepo()
+        if recovery_state is None:
+            workflow.execute(self.execution_id)
+        else:
+            workflow.recover(self.execution_id, *recovery_state)
+        return executed, result
+
+    def test_durable_execution_logs_each_action(self):
+        walkoff.config.config.durable_workflows = True
+        actions, branches = self.make_chain(3)
+        workflow = Workflow('wf', actions[0].id, id=uuid4(), actions=actions, branches=branches)
+        entries = []
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def action_executed(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.ActionExecutionSuccess:
+                entries.append(len(self.get_entries(self.execution_id)))
+
+        self.execute_workflow(workflow)
+        self.assertListEqual(entries, [0, 1, 2])
+        self.assertListEqual(self.get_entries(self.execution_id), [])
+
+    def test_non_durable_execution_does_not_log(self):
+        walkoff.config.config.durable_workflows = False
+        actions, branches = self.make_chain(2)
+        workflow = Workflow('wf', actions[0].id, id=uuid4(), actions=actions, branches=branches)
+        executed, result = self.execute_workflow(workflow)
+        self.assertListEqual(result['entries'], [])
+
+    def test_recover_resumes_after_last_completed_action(self):
+        walkoff.config.config.durable_workflows = True
+        actions, branches = self.make_chain(3)
+        workflow = Workflow('wf', actions[0].id, id=uuid4(), actions=actions, branches=branches)
+        append_log_entry(self.execution_id, workflow.id, actions[0].id, ACTION_COMPLETED,
+                         result=ActionResult('recovered', 'Success'))
+        self.assertListEqual(get_recoverable_executions(), [(self.execution_id, workflow.id)])
+
+        workflow_id, accumulator, action_id, last_result = load_recovery_state(self.execution_id)
+        executed, result = self.execute_workflow(workflow, (accumulator, action_id, last_result))
+        self.assertListEqual(executed, [actions[1].id, actions[2].id])
+        self.assertEqual(workflow.get_accumulator()[actions[2].id], 'recovered')
+        self.assertListEqual(self.get_entries(self.execution_id), [])
+
+    def test_recover_after_last_action(self):
+        walkoff.config.config.durable_workflows = True
+        actions, branches = self.make_chain(2)
+        workflow = Workflow('wf', actions[0].id, id=uuid4(), actions=actions, branches=branches)
+        append_log_entry(self.execution_id, workflow.id, actions[1].id, ACTION_COMPLETED,
+                         result=ActionResult('done', 'Success'))
+        workflow_id, accumulator, action_id, last_result = load_recovery_state(self.execution_id)
+        executed, result = self.execute_workflow(workflow, (accumulator, action_id, last_result))
+        self.assertListEqual(executed, [])
+        self.assertIn('data', result)
+        self.assertListEqual(self.get_entries(self.execution_id), [])
+
+    def test_restart_worker_recovers_its_executions(self):
+        walkoff.config.config.durable_workflows = True
+        actions, branches = self.make_chain(2)
+        workflow = Workflow('wf', actions[0].id, id=uuid4(), actions=actions, branches=branches)
+        playbook = Playbook('restart', workflows=[workflow])
+        executiondb.execution_db.session.add(playbook)
+        executiondb.execution_db.session.commit()
+        other_execution_id = uuid4()
+        append_log_entry(self.execution_id, workflow.id, actions[0].id, ACTION_COMPLETED,
+                         result=ActionResult('a', 'Success'), worker_id=1)
+        append_log_entry(other_execution_id, workflow.id, actions[0].id, ACTION_COMPLETED,
+                         result=ActionResult('a', 'Success'), worker_id=0)
+
+        class MockProcess(object):
+            def __init__(self, alive):
+                self.alive = alive
+                self.exitcode = None if alive else -9
+
+            def is_alive(self):
+                return self.alive
+
+        class MockLoadBalancer(object):
+            def __init__(self):
+                self.removed = []
+                self.added = []
+
+            def remove_worker(self, worker):
+                self.removed.append(worker)
+
+            def add_workflow(self, workflow_id, workflow_execution_id, recover=False, **kwargs):
+                self.added.append((workflow_id, workflow_execution_id, recover))
+
+        spawned = []
+
+        def spawn_worker_process(worker_id, worker_environment_setup=None):
+            spawned.append((worker_id, worker_environment_setup))
+            return MockProcess(True)
+
+        executor = multiprocessedexecutor.MultiprocessedExecutor()
+        executor.pids = [MockProcess(True), MockProcess(False)]
+        executor.manager = MockLoadBalancer()
+        original_spawn = multiprocessedexecutor.spawn_worker_process
+        multiprocessedexecutor.spawn_worker_process = spawn_worker_process
+        try:
+            self.assertListEqual(executor.restart_worker(1), [str(self.execution_id)])
+        finally:
+            multiprocessedexecutor.spawn_worker_process = original_spawn
+            executiondb.execution_db.session.delete(playbook)
+            executiondb.execution_db.session.commit()
+
+        self.assertListEqual(spawned, [(1, None)])
+        self.assertTrue(executor.pids[1].is_alive())
+        self.assertListEqual(executor.manager.removed, [b'Worker-1'])
+        self.assertListEqual(executor.manager.added, [(workflow.id, str(self.execution_id), True)])
@@ -9,6 +9,7 @@ import walkoff.config.config
 import walkoff.config.paths
 from tests import config
 from tests.util import execution_db_help
+from walkoff.case.eventsink import case_event_sink
 from walkoff.events import WalkoffEvent, EventType
 from walkoff.scheduler import scheduler
 
@@ -43,6 +44,7 @@ class TestExecutionModes(unittest.TestCase):
         scheduler.start()
         time.sleep(0.1)
         scheduler.stop(wait=False)
+        case_event_sink.flush()
 
         start_stop_event_history = case_database.case_db.session.query(case_database.Case) \
             .filter(case_database.Case.name == 'case1').first().events.all()
@@ -62,6 +64,7 @@ class TestExecutionModes(unittest.TestCase):
         scheduler.resume()
         time.sleep(0.1)
         scheduler.stop(wait=False)
+        case_event_sink.flush()
 
         pause_resume_event_history = case_database.case_db.session.query(case_database.Case) \
             .filter(case_database.Case.name == 'pauseResume').first().events.all()
@@ -0,0 +1,211 @@
+import gzip
+import json
+import os
+import shutil
+import unittest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import walkoff.config.config
+from tests.util import execution_db_help
+from walkoff import executiondb
+from walkoff.executiondb.retention import ExecutionRetention, get_rollups
+from walkoff.executiondb.statuswriter import status_writer
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+
+
+class TestExecutionRetention(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+
+    def setUp(self):
+        # Retention writes the pending status transitions first, so those left by earlier tests are written now
+        status_writer.flush()
+        execution_db_help.cleanup_device_db()
+        self.archive_path = os.path.join('.', 'tests', 'tmp', 'archive')
+        self.retention = ExecutionRetention(archive_path=self.archive_path)
+        self.workflow_id = uuid4()
+        self.hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(hours=5)
+        self.original_age = walkoff.config.config.execution_retention_age
+        self.original_interval = walkoff.config.config.execution_retention_interval
+        self.original_max_chunks = walkoff.config.config.execution_retention_max_chunks
+        self.original_chunk_size = walkoff.config.config.execution_retention_chunk_size
+        self.original_max_hours = walkoff.config.config.execution_rollup_max_hours
+
+    def tearDown(self):
+        self.retention.wait()
+        walkoff.config.config.execution_retention_age = self.original_age
+        walkoff.config.config.execution_retention_interval = self.original_interval
+        walkoff.config.config.execution_retention_max_chunks = self.original_max_chunks
+        walkoff.config.config.execution_retention_chunk_size = self.original_chunk_size
+        walkoff.config.config.execution_rollup_max_hours = self.original_max_hours
+        execution_db_help.cleanup_device_db()
+        shutil.rmtree(self.archive_path, ignore_errors=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_device_db()
+
+    def add_execution(self, completed_at, duration=10, aborted=False, failed_action=False, workflow_id=None):
+        workflow_status = WorkflowStatus(uuid4(), workflow_id or self.workflow_id, 'wf')
+        workflow_status.running(started_at=completed_at - timedelta(seconds=duration))
+        action_status = ActionStatus(uuid4(), uuid4(), 'action', 'HelloWorld', 'helloWorld')
+        workflow_status.add_action_status(action_status)
+        if failed_action:
+            action_status.completed_failure({'result': 'error'})
+        else:
+            action_status.completed_success({'result': 'done'})
+        if aborted:
+            workflow_status.aborted(completed_at=completed_at)
+        else:
+            workflow_status.completed(completed_at=completed_at)
+        executiondb.execution_db.session.add(workflow_status)
+        executiondb.execution_db.session.commit()
+        return workflow_status.execution_id
+
+    def count_executions(self):
+        executiondb.execution_db.session.expire_all()
+        return (executiondb.execution_db.session.query(WorkflowStatus).count(),
+                executiondb.execution_db.session.query(ActionStatus).count())
+
+    def read_archives(self):
+        lines = []
+        for filename in sorted(os.listdir(self.archive_path)):
+            with gzip.open(os.path.join(self.archive_path, filename), 'rb') as archive_file:
+                lines.extend(json.loads(line.decode('utf-8')) for line in archive_file)
+        return lines
+
+    def test_update_rollups(self):
+        for duration in range(1, 11):
+            self.add_execution(self.hour + timedelta(minutes=duration), duration=duration)
+        self.add_execution(self.hour + timedelta(minutes=20), duration=100, aborted=True)
+        self.add_execution(self.hour + timedelta(minutes=30), duration=1, failed_action=True)
+        self.add_execution(self.hour + timedelta(hours=1, minutes=5), duration=7)
+
+        self.assertEqual(self.retention.update_rollups(), 2)
+        first, second = get_rollups(workflow_id=self.workflow_id)
+        self.assertDictEqual(first.as_json(), {'workflow_id': str(self.workflow_id),
+                                               'hour': self.hour.isoformat('T') + 'Z',
+                                               'count': 12,
+                                               'failures': 1,
+                                               'aborted': 1,
+                                               'duration_p50': 5.0,
+                                               'duration_p90': 10.0,
+                                               'duration_p99': 100.0})
+        self.assertEqual(second.hour, self.hour + timedelta(hours=1))
+        self.assertEqual(second.count, 1)
+        self.assertEqual(second.duration_p50, 7.0)
+
+    def test_update_rollups_only_rolls_up_new_hours(self):
+        self.add_execution(self.hour + timedelta(minutes=1))
+        self.assertEqual(self.retention.update_rollups(), 1)
+        self.add_execution(self.hour + timedelta(minutes=2))
+        self.add_execution(self.hour + timedelta(hours=2))
+        self.assertEqual(self.retention.update_rollups(), 1)
+        self.assertListEqual([rollup.count for rollup in get_rollups(workflow_id=self.workflow_id)], [1, 1])
+
+    def test_update_rollups_max_hours(self):
+        self.add_execution(self.hour + timedelta(minutes=1))
+        self.add_execution(self.hour + timedelta(hours=2, minutes=1))
+        self.add_execution(self.hour + timedelta(hours=3, minutes=1))
+        self.assertEqual(self.retention.update_rollups(max_hours=3), 2)
+        self.assertEqual(self.retention.update_rollups(max_hours=3), 1)
+        self.assertEqual(len(get_rollups(workflow_id=self.workflow_id)), 3)
+
+    def test_aborted_execution_with_failed_action(self):
+        self.add_execution(self.hour + timedelta(minutes=1), aborted=True, failed_action=True)
+        self.retention.update_rollups()
+        rollup = get_rollups(workflow_id=self.workflow_id)[0]
+        self.assertEqual(rollup.failures, 0)
+        self.assertEqual(rollup.aborted, 1)
+
+    def test_update_rollups_skips_current_hour(self):
+        self.add_execution(datetime.utcnow())
+        self.assertEqual(self.retention.update_rollups(), 0)
+
+    def test_get_rollups_filters(self):
+        other_workflow_id = uuid4()
+        self.add_execution(self.hour + timedelta(minutes=1))
+        self.add_execution(self.hour + timedelta(hours=1, minutes=1))
+        self.add_execution(self.hour + timedelta(minutes=1), workflow_id=other_workflow_id)
+        self.retention.update_rollups()
+        self.assertEqual(len(get_rollups(workflow_id=other_workflow_id)), 1)
+        rollups = get_rollups(since=self.hour + timedelta(hours=1), until=self.hour + timedelta(hours=2))
+        self.assertListEqual([rollup.workflow_id for rollup in rollups], [self.workflow_id])
+
+    def test_apply_removes_old_executions_in_chunks(self):
+        old = [self.add_execution(self.hour + timedelta(minutes=i)) for i in range(5)]
+        recent = self.add_execution(self.hour + timedelta(hours=4, minutes=30))
+        removed = self.retention.apply(2 * 60 * 60, chunk_size=2, archive=True)
+        self.assertEqual(removed, 5)
+        self.assertTupleEqual(self.count_executions(), (1, 1))
+        self.assertIsNotNone(executiondb.execution_db.session.query(WorkflowStatus).get(recent))
+
+        archived = self.read_archives()
+        self.assertListEqual([execution['execution_id'] for execution in archived], [str(id_) for id_ in old])
+        self.assertEqual(archived[0]['action_statuses'][0]['result'], 'done')
+        self.assertEqual(get_rollups(workflow_id=self.workflow_id)[0].count, 5)
+
+    def test_apply_without_archive(self):
+        self.add_execution(self.hour)
+        self.assertEqual(self.retention.apply(60 * 60, archive=False), 1)
+        self.assertTupleEqual(self.count_executions(), (0, 0))
+        self.assertFalse(os.path.exists(self.archive_path))
+
+    def test_apply_keeps_unfinished_executions(self):
+        workflow_status = WorkflowStatus(uuid4(), self.workflow_id, 'wf')
+        workflow_status.running(started_at=self.hour)
+        executiondb.execution_db.session.add(workflow_status)
+        executiondb.execution_db.session.commit()
+        self.assertEqual(self.retention.apply(0, archive=False), 0)
+        self.assertTupleEqual(self.count_executions(), (1, 0))
+
+    def test_apply_max_chunks(self):
+        for i in range(5):
+            self.add_execution(self.hour + timedelta(minutes=i))
+        self.assertEqual(self.retention.apply(60 * 60, chunk_size=2, archive=False, max_chunks=2), 4)
+        self.assertTupleEqual(self.count_executions(), (1, 1))
+
+    def test_apply_only_removes_rolled_up_hours(self):
+        self.add_execution(self.hour + timedelta(minutes=1))
+        self.add_execution(self.hour + timedelta(hours=2, minutes=1))
+        self.assertEqual(self.retention.apply(60 * 60, archive=False, max_hours=1), 1)
+        self.assertTupleEqual(self.count_executions(), (1, 1))
+
+    def test_apply_if_due(self):
+        walkoff.config.config.execution_retention_age = 60 * 60
+        walkoff.config.config.execution_retention_interval = 60 * 60
+        self.add_execution(self.hour)
+        self.assertTrue(self.retention.apply_if_due())
+        self.retention.wait()
+        self.assertTupleEqual(self.count_executions(), (0, 0))
+        self.add_execution(self.hour)
+        self.assertFalse(self.retention.apply_if_due())
+        walkoff.config.config.execution_retention_interval = 0
+        self.assertTrue(self.retention.apply_if_due())
+        self.retention.wait()
+        self.assertTupleEqual(self.count_executions(), (0, 0))
+
+    def test_apply_if_due_continues_when_behind(self):
+        walkoff.config.config.execution_retention_age = 60 * 60
+        walkoff.config.config.execution_retention_interval = 60 * 60
+        walkoff.config.config.execution_retention_chunk_size = 2
+        walkoff.config.config.execution_retention_max_chunks = 1
+        for i in range(3):
+            self.add_execution(self.hour + timedelta(minutes=i))
+        self.assertTrue(self.retention.apply_if_due())
+        self.retention.wait()
+        self.assertTupleEqual(self.count_executions(), (1, 1))
+        self.assertTrue(self.retention.apply_if_due())
+        self.retention.wait()
+        self.assertTupleEqual(self.count_executions(), (0, 0))
+        self.assertFalse(self.retention.apply_if_due())
+
+    def test_apply_if_due_disabled_only_rolls_up(self):
+        walkoff.config.config.execution_retention_age = None
+        self.add_execution(self.hour)
+        self.assertTrue(self.retention.apply_if_due())
+        self.retention.wait()
+        self.assertTupleEqual(self.count_executions(), (1, 1))
+        self.assertEqual(len(get_rollups(workflow_id=self.workflow_id)), 1)
@@ -1,8 +1,11 @@
+import os
 import types
 import unittest
 from os import sep
 from os.path import join
 
+from sqlalchemy.pool import NullPool, QueuePool
+
 import walkoff.appgateway
 import walkoff.config.paths
 from tests.config import test_apps_path
@@ -133,6 +136,29 @@ class TestHelperFunctions(unittest.TestCase):
         self.assertEqual(format_db_path('sqlite', 'aa.db'), 'sqlite:///aa.db')
         self.assertEqual(format_db_path('postgresql', 'aa.db'), 'postgresql://aa.db')
 
+    def test_create_database_engine_pooled_sqlite(self):
+        path = join('.', 'tests', 'tmp', 'pooled.db')
+        engine = create_database_engine('sqlite', path)
+        try:
+            self.assertIsInstance(engine.pool, QueuePool)
+            connection = engine.connect()
+            self.assertEqual(connection.execute('PRAGMA journal_mode').scalar(), 'wal')
+            self.assertEqual(connection.execute('PRAGMA synchronous').scalar(), 1)
+            connection.close()
+        finally:
+            engine.dispose()
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+    def test_create_database_engine_unpooled(self):
+        engine = create_database_engine('sqlite', ':memory:', profile='unpooled')
+        self.assertIsInstance(engine.pool, NullPool)
+
+    def test_create_database_engine_invalid_profile(self):
+        with self.assertRaises(ValueError):
+            create_database_engine('sqlite', ':memory:', profile='invalid')
+
     def test_get_app_action_api_invalid_app(self):
         with self.assertRaises(UnknownApp):
             get_app_action_api('InvalidApp', 'pause')
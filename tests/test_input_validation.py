@@ -1,6 +1,6 @@
 import unittest
 
-from walkoff.appgateway.validator import validate_parameter, validate_parameters, convert_json
+from walkoff.appgateway.validator import validate_parameter, validate_parameters, convert_json, compile_parameters
 from walkoff.config.config import initialize
 from walkoff.executiondb.argument import Argument
 from walkoff.helpers import InvalidArgument
@@ -417,3 +417,9 @@ class TestInputValidation(unittest.TestCase):
         expected = ['@action1', 2, {'a': 'v', 'b': 6}]
         converted = convert_json(parameter_api, value, self.message)
         self.assertListEqual(converted, expected)
+
+    def test_compile_parameters_copies_mutable_static_values(self):
+        parameter_apis = [{'name': 'name1', 'schema': {'type': 'array'}}]
+        validate = compile_parameters(parameter_apis, [Argument('name1', value=[1, 2])], self.message)
+        validate({})['name1'].append(3)
+        self.assertListEqual(validate({})['name1'], [1, 2])
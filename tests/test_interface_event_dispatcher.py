@@ -1,7 +1,11 @@
+import json
+import os
+import shutil
 import uuid
 from unittest import TestCase
 
 import walkoff.config.config
+import walkoff.config.paths
 import walkoff.executiondb.schemas
 from interfaces import InterfaceEventDispatcher, dispatcher
 from interfaces.exceptions import UnknownEvent, InvalidEventHandler
@@ -9,6 +13,7 @@ from tests.util import execution_db_help
 from walkoff.events import WalkoffEvent, EventType
 from walkoff.executiondb.executionelement import ExecutionElement
 from walkoff.helpers import UnknownAppAction, UnknownApp
+from walkoff.resultstore import result_store
 
 
 class MockWorkflow(ExecutionElement):
@@ -453,3 +458,74 @@ class TestInterfaceEventDispatcher(TestCase):
         expected['sender_id'] = expected.pop('id')
         expected['sender_name'] = expected.pop('name')
         self.assertDictEqual(result['data'], expected)
+
+    def test_format_data_resolves_result_reference(self):
+        original_path = walkoff.config.paths.result_store_path
+        walkoff.config.paths.result_store_path = os.path.join('.', 'tests', 'tmp', 'results')
+        try:
+            reference = {'result_id': result_store.put(json.dumps({'key': 'value'})), 'size': 16, 'preview': '{'}
+            sender_data = {'id': uuid.uuid4(), 'name': 'b', 'device_id': 2, 'app_name': 'App1',
+                           'action_name': 'action1', 'execution_id': uuid.uuid4()}
+            kwargs = {'data': {'workflow': {'execution_id': str(uuid.uuid4())},
+                               'data': {'result': reference, 'status': 'Success'}}}
+            data = InterfaceEventDispatcher._format_data(sender_data, kwargs)
+            self.assertDictEqual(data['data'], {'result': {'key': 'value'}, 'status': 'Success'})
+            self.assertIs(kwargs['data']['data']['result'], reference)
+        finally:
+            shutil.rmtree(walkoff.config.paths.result_store_path, ignore_errors=True)
+            walkoff.config.paths.result_store_path = original_path
+
+    def record_dispatches(self):
+        dispatches = {'formatted': 0, 'events': [], 'actions': []}
+        format_data = InterfaceEventDispatcher._format_data
+
+        def count_format(sender, kwargs):
+            dispatches['formatted'] += 1
+            return format_data(sender, kwargs)
+
+        InterfaceEventDispatcher._format_data = staticmethod(count_format)
+        self.addCleanup(setattr, InterfaceEventDispatcher, '_format_data', staticmethod(format_data))
+        dispatcher.event_dispatcher.dispatch = lambda event, data: dispatches['events'].append(data)
+        dispatcher.app_action_dispatcher.dispatch = lambda event, data: dispatches['actions'].append(data)
+        return dispatches
+
+    @staticmethod
+    def send_action_started(sender_id, app_name='App1', action_name='action1'):
+        sender = {'id': sender_id, 'name': 'b', 'device_id': 2, 'app_name': app_name, 'action_name': action_name,
+                  'execution_id': str(uuid.uuid4())}
+        dispatch = InterfaceEventDispatcher._make_dispatch_method(WalkoffEvent.ActionStarted)
+        dispatch(sender, data={'workflow': {'execution_id': str(uuid.uuid4())}, 'data': {'a': 42}})
+
+    def test_dispatch_no_listeners_does_not_format_data(self):
+        dispatches = self.record_dispatches()
+        self.send_action_started(str(uuid.uuid4()))
+        self.assertEqual(dispatches['formatted'], 0)
+        self.assertListEqual(dispatches['events'], [])
+        self.assertListEqual(dispatches['actions'], [])
+
+    def test_dispatch_listeners_for_other_senders_does_not_format_data(self):
+        dispatcher.on_walkoff_events(WalkoffEvent.ActionStarted, sender_ids=str(uuid.uuid4()))(lambda data: None)
+        dispatcher.on_app_actions('App1', actions='action2', events=WalkoffEvent.ActionStarted)(lambda data: None)
+        dispatches = self.record_dispatches()
+        self.send_action_started(str(uuid.uuid4()))
+        self.assertEqual(dispatches['formatted'], 0)
+
+    def test_dispatch_formats_data_once(self):
+        sender_id = str(uuid.uuid4())
+        dispatcher.on_walkoff_events(WalkoffEvent.ActionStarted, sender_ids=sender_id, weak=False)(lambda data: None)
+        dispatcher.on_app_actions('App1', actions='action1', events=WalkoffEvent.ActionStarted,
+                                  weak=False)(lambda data: None)
+        dispatches = self.record_dispatches()
+        self.send_action_started(sender_id)
+        self.assertEqual(dispatches['formatted'], 1)
+        self.assertEqual(len(dispatches['events']), 1)
+        self.assertIs(dispatches['events'][0], dispatches['actions'][0])
+        self.assertEqual(dispatches['events'][0]['sender_id'], sender_id)
+
+    def test_dispatch_only_to_dispatchers_with_listeners(self):
+        dispatcher.on_app_actions('App1', events=WalkoffEvent.ActionStarted, weak=False)(lambda data: None)
+        dispatches = self.record_dispatches()
+        self.send_action_started(str(uuid.uuid4()))
+        self.assertEqual(dispatches['formatted'], 1)
+        self.assertListEqual(dispatches['events'], [])
+        self.assertEqual(len(dispatches['actions']), 1)
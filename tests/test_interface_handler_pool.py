@@ -0,0 +1,150 @@
+from unittest import TestCase
+
+import gevent
+
+import walkoff.config.config
+from interfaces.dispatchers import EventDispatcher
+from interfaces.handlerpool import InterfaceHandlerPool, handler_pool
+from walkoff.events import WalkoffEvent
+
+
+class TestInterfaceHandlerPool(TestCase):
+    def setUp(self):
+        self.pool = InterfaceHandlerPool(size=2, queue_size=10, timeout=5)
+
+    def test_enabled(self):
+        self.assertTrue(self.pool.enabled)
+        self.assertFalse(InterfaceHandlerPool().enabled)
+
+    def test_submit_does_not_call_handler(self):
+        calls = []
+
+        def handler(data):
+            calls.append(data)
+
+        self.assertTrue(self.pool.submit(handler, (1,)))
+        self.assertListEqual(calls, [])
+        self.pool.flush()
+        self.assertListEqual(calls, [1])
+
+    def test_events_are_handled_in_order(self):
+        calls = []
+
+        def handler(data):
+            gevent.sleep(0.01 * (data % 3))
+            calls.append(data)
+
+        for i in range(8):
+            self.pool.submit(handler, (i,))
+        self.pool.flush()
+        self.assertListEqual(calls, list(range(8)))
+
+    def test_running_handlers_are_bounded(self):
+        running = {'now': 0, 'max': 0}
+
+        def make_handler():
+            def handler(data):
+                running['now'] += 1
+                running['max'] = max(running['max'], running['now'])
+                gevent.sleep(0.02)
+                running['now'] -= 1
+
+            return handler
+
+        handlers = [make_handler() for _ in range(5)]
+        for handler in handlers:
+            self.pool.submit(handler, (None,))
+        self.pool.flush()
+        self.assertEqual(running['max'], 2)
+        self.assertEqual(sum(handler_queue['handled'] for handler_queue in self.pool.metrics()), 5)
+
+    def test_full_queue_drops_events(self):
+        self.pool = InterfaceHandlerPool(size=2, queue_size=2, timeout=5)
+        calls = []
+
+        def handler(data):
+            calls.append(data)
+
+        results = [self.pool.submit(handler, (i,)) for i in range(5)]
+        self.pool.flush()
+        self.assertListEqual(results, [True, True, False, False, False])
+        self.assertListEqual(calls, [0, 1])
+        metrics, = self.pool.metrics()
+        self.assertEqual(metrics['dropped'], 3)
+        self.assertEqual(metrics['handled'], 2)
+
+    def test_slow_handler_times_out(self):
+        self.pool = InterfaceHandlerPool(size=2, queue_size=10, timeout=0.05)
+        calls = []
+
+        def handler(data):
+            if data == 'slow':
+                gevent.sleep(1)
+            calls.append(data)
+
+        self.pool.submit(handler, ('slow',))
+        self.pool.submit(handler, ('fast',))
+        self.pool.flush()
+        self.assertListEqual(calls, ['fast'])
+        metrics, = self.pool.metrics()
+        self.assertEqual(metrics['timed_out'], 1)
+        self.assertEqual(metrics['handled'], 1)
+
+    def test_slow_handler_does_not_block_other_handlers(self):
+        calls = []
+
+        def slow(data):
+            gevent.sleep(0.2)
+            calls.append('slow')
+
+        def fast(data):
+            calls.append('fast')
+
+        self.pool.submit(slow, (None,))
+        self.pool.submit(fast, (None,))
+        self.pool.flush()
+        self.assertListEqual(calls, ['fast', 'slow'])
+
+    def test_failing_handler(self):
+        calls = []
+
+        def handler(data):
+            if data == 'error':
+                raise ValueError()
+            calls.append(data)
+
+        self.pool.submit(handler, ('error',))
+        self.pool.submit(handler, ('ok',))
+        self.pool.flush()
+        self.assertListEqual(calls, ['ok'])
+        metrics, = self.pool.metrics()
+        self.assertEqual(metrics['failed'], 1)
+        self.assertEqual(metrics['handled'], 1)
+
+    def test_dispatcher_uses_pool(self):
+        calls = []
+
+        def handler(data):
+            calls.append(data['sender_id'])
+
+        router = EventDispatcher()
+        router.register_events(handler, {WalkoffEvent.ActionStarted}, weak=False)
+        walkoff.config.config.interface_handler_pool_size = 2
+        try:
+            router.dispatch(WalkoffEvent.ActionStarted, {'sender_id': 'a'})
+            self.assertListEqual(calls, [])
+            handler_pool.flush()
+        finally:
+            walkoff.config.config.interface_handler_pool_size = None
+        self.assertListEqual(calls, ['a'])
+
+    def test_dispatcher_without_pool(self):
+        calls = []
+
+        def handler(data):
+            calls.append(data['sender_id'])
+
+        router = EventDispatcher()
+        router.register_events(handler, {WalkoffEvent.ActionStarted}, weak=False)
+        router.dispatch(WalkoffEvent.ActionStarted, {'sender_id': 'a'})
+        self.assertListEqual(calls, ['a'])
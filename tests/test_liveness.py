@@ -0,0 +1,163 @@
+import unittest
+from uuid import uuid4
+
+import tests.config
+import walkoff.appgateway
+import walkoff.config.config
+from tests.util import execution_db_help
+from walkoff.appgateway.appinstancerepo import AppInstanceRepo
+from walkoff.events import WalkoffEvent
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.liveness import get_references, get_live_results, summarize_result
+from walkoff.executiondb.workflow import Workflow
+
+
+class TestLiveness(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+        walkoff.appgateway.cache_apps(tests.config.test_apps_path)
+        walkoff.config.config.load_app_apis(apps_path=tests.config.test_apps_path)
+
+    def setUp(self):
+        self.original_pruning = walkoff.config.config.accumulator_pruning
+
+    def tearDown(self):
+        walkoff.config.config.accumulator_pruning = self.original_pruning
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_device_db()
+
+    @staticmethod
+    def make_action(name, reference=None):
+        argument = Argument('arg1', reference=reference) if reference else Argument('arg1', value=name)
+        return Action('HelloWorld', 'global2', name, id=uuid4(), arguments=[argument])
+
+    @staticmethod
+    def make_condition(reference):
+        return ConditionalExpression(
+            conditions=[Condition('HelloWorld', 'count', arguments=[Argument('operator', value='g'),
+                                                                    Argument('threshold', reference=reference)])])
+
+    def make_chain(self, length):
+        actions = [self.make_action('action0')]
+        for i in range(1, length):
+            actions.append(self.make_action('action{}'.format(i), reference=actions[i - 1].id))
+        branches = [Branch(actions[i].id, actions[i + 1].id) for i in range(length - 1)]
+        return actions, branches
+
+    def test_get_references_action(self):
+        reference = uuid4()
+        action = self.make_action('action', reference=reference)
+        self.assertSetEqual(get_references(action), {str(reference)})
+
+    def test_get_references_value_argument(self):
+        self.assertSetEqual(get_references(self.make_action('action')), set())
+
+    def test_get_references_nested_condition(self):
+        reference1, reference2 = uuid4(), uuid4()
+        expression = self.make_condition(reference1)
+        expression.child_expressions = [self.make_condition(reference2)]
+        branch = Branch(uuid4(), uuid4(), condition=expression)
+        self.assertSetEqual(get_references(branch), {str(reference1), str(reference2)})
+
+    def test_get_live_results_chain(self):
+        actions, branches = self.make_chain(3)
+        workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+        live = get_live_results(workflow)
+        ids = [str(action.id) for action in actions]
+        self.assertSetEqual(live[ids[0]], {ids[0]})
+        self.assertSetEqual(live[ids[1]], {ids[1]})
+        self.assertSetEqual(live[ids[2]], {ids[2]})
+
+    def test_get_live_results_long_lived_reference(self):
+        actions = [self.make_action('action0'), self.make_action('action1')]
+        actions.append(self.make_action('action2', reference=actions[0].id))
+        branches = [Branch(actions[0].id, actions[1].id), Branch(actions[1].id, actions[2].id)]
+        workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+        live = get_live_results(workflow)
+        ids = [str(action.id) for action in actions]
+        self.assertSetEqual(live[ids[1]], {ids[0], ids[1]})
+        self.assertSetEqual(live[ids[2]], {ids[2]})
+
+    def test_get_live_results_branch_condition(self):
+        actions = [self.make_action('action0'), self.make_action('action1'), self.make_action('action2')]
+        branches = [Branch(actions[0].id, actions[1].id),
+                    Branch(actions[1].id, actions[2].id, condition=self.make_condition(actions[0].id))]
+        workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+        live = get_live_results(workflow)
+        ids = [str(action.id) for action in actions]
+        self.assertSetEqual(live[ids[0]], {ids[0]})
+        self.assertSetEqual(live[ids[1]], {ids[0], ids[1]})
+
+    def test_get_live_results_loop(self):
+        actions = [self.make_action('action0'), self.make_action('action1')]
+        actions[0].arguments = [Argument('arg1', reference=actions[1].id)]
+        branches = [Branch(actions[0].id, actions[1].id), Branch(actions[1].id, actions[0].id)]
+        workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+        live = get_live_results(workflow)
+        ids = [str(action.id) for action in actions]
+        self.assertSetEqual(live[ids[1]], {ids[1]})
+        self.assertSetEqual(live[ids[0]], {ids[0]})
+
+    def test_summarize_result(self):
+        summary = summarize_result('a' * 1000)
+        self.assertTrue(summary['released'])
+        self.assertEqual(summary['type'], 'str')
+        self.assertGreater(summary['size'], 1000)
+
+    def execute_workflow(self, workflow):
+        result = {}
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def shutdown(sender, **kwargs):
+            if kwargs['event'] == WalkoffEvent.WorkflowShutdown:
+                result['data'] = kwargs['data']
+
+        workflow._instance_repo = AppInstanceRepo()
+        workflow.execute('test')
+        return result['data']
+
+    def test_execute_releases_dead_results(self):
+        walkoff.config.config.accumulator_pruning = 'release'
+        actions, branches = self.make_chain(3)
+        workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+        data = self.execute_workflow(workflow)
+        self.assertListEqual(list(workflow.get_accumulator().keys()), [actions[2].id])
+        self.assertNotIn(str(actions[0].id), data)
+
+    def test_execute_summarizes_dead_results(self):
+        walkoff.config.config.accumulator_pruning = 'summarize'
+        actions, branches = self.make_chain(3)
+        workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+        data = self.execute_workflow(workflow)
+        self.assertListEqual(list(workflow.get_accumulator().keys()), [actions[2].id])
+        self.assertIn(str(actions[0].id), data)
+        self.assertIn('released', data)
+
+    def test_execute_removes_spilled_results(self):
+        original_max_memory = walkoff.config.config.accumulator_max_memory
+        walkoff.config.config.accumulator_max_memory = 0
+        walkoff.config.config.accumulator_pruning = 'keep'
+        try:
+            actions, branches = self.make_chain(3)
+            workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+            data = self.execute_workflow(workflow)
+        finally:
+            walkoff.config.config.accumulator_max_memory = original_max_memory
+        for action in actions:
+            self.assertIn(str(action.id), data)
+        self.assertDictEqual(workflow.get_accumulator()._spilled, {})
+
+    def test_execute_keep(self):
+        walkoff.config.config.accumulator_pruning = 'keep'
+        actions, branches = self.make_chain(3)
+        workflow = Workflow('wf', actions[0].id, actions=actions, branches=branches)
+        self.execute_workflow(workflow)
+        self.assertSetEqual(set(workflow.get_accumulator().keys()), {action.id for action in actions})
@@ -1,12 +1,20 @@
 import json
-from datetime import timedelta
+from datetime import datetime, timedelta
+from uuid import uuid4
 
+import walkoff.server.endpoints.metrics
 import walkoff.server.metrics as metrics
+from interfaces.handlerpool import InterfaceHandlerPool
 from tests.util import execution_db_help
 from tests.util.assertwrappers import orderless_list_compare
 from tests.util.servertestcase import ServerTestCase
+from walkoff.case.eventsink import case_event_sink
+from walkoff.events import WalkoffEvent
+from walkoff import executiondb
+from walkoff.executiondb.retention import WorkflowRollup
 from walkoff.server import flaskserver as server
 from walkoff.server.endpoints.metrics import _convert_action_time_averages, _convert_workflow_time_averages
+from walkoff.server.returncodes import *
 
 
 class MetricsServerTest(ServerTestCase):
@@ -125,3 +133,58 @@ class MetricsServerTest(ServerTestCase):
         self.assertEqual(response.status_code, 200)
         response = json.loads(response.get_data(as_text=True))
         self.assertDictEqual(response, _convert_workflow_time_averages())
+
+    def test_read_workflow_rollups(self):
+        workflow_id = uuid4()
+        hour = datetime(2018, 6, 1, 12)
+        executiondb.execution_db.session.add_all([WorkflowRollup(workflow_id, hour, 3, 1, 1, [1, 2, 3]),
+                                                  WorkflowRollup(workflow_id, hour + timedelta(hours=1), 1, 0, 0, [4]),
+                                                  WorkflowRollup(uuid4(), hour, 1, 0, 0, [])])
+        executiondb.execution_db.session.commit()
+
+        response = self.get_with_status_check('/api/metrics/workflows/rollups?workflow_id={}'.format(workflow_id),
+                                              headers=self.headers)
+        self.assertListEqual([rollup['count'] for rollup in response], [3, 1])
+        self.assertDictEqual(response[0], {'workflow_id': str(workflow_id),
+                                           'hour': '2018-06-01T12:00:00Z',
+                                           'count': 3,
+                                           'failures': 1,
+                                           'aborted': 1,
+                                           'duration_p50': 2.0,
+                                           'duration_p90': 3.0,
+                                           'duration_p99': 3.0})
+        response = self.get_with_status_check(
+            '/api/metrics/workflows/rollups?workflow_id={}&since=2018-06-01T13:00:00Z'.format(workflow_id),
+            headers=self.headers)
+        self.assertListEqual([rollup['count'] for rollup in response], [1])
+
+    def test_read_workflow_rollups_invalid_time(self):
+        self.get_with_status_check('/api/metrics/workflows/rollups?since=yesterday', headers=self.headers,
+                                   status_code=BAD_REQUEST)
+
+    def test_read_case_event_metrics(self):
+        response = self.get_with_status_check('/api/metrics/cases/events', headers=self.headers)
+        self.assertDictEqual(response, case_event_sink.metrics())
+
+    def test_read_interface_handler_metrics(self):
+        pool = InterfaceHandlerPool(size=1)
+
+        def handler(data):
+            pass
+
+        original_pool = walkoff.server.endpoints.metrics.handler_pool
+        walkoff.server.endpoints.metrics.handler_pool = pool
+        try:
+            pool.submit(handler, ({},))
+            pool.flush()
+            response = self.get_with_status_check('/api/metrics/interfaces/handlers', headers=self.headers)
+        finally:
+            walkoff.server.endpoints.metrics.handler_pool = original_pool
+        self.assertEqual(len(response), 1)
+        self.assertEqual(response[0]['handled'], 1)
+        self.assertTrue(response[0]['name'].endswith('handler'))
+
+    def test_read_event_metrics(self):
+        response = self.get_with_status_check('/api/metrics/events', headers=self.headers)
+        self.assertEqual(len(response), len(WalkoffEvent))
+        self.assertIn('Action Started', {signal['name'] for signal in response})
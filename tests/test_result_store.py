@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+import time
+import unittest
+
+import walkoff.config.config
+from walkoff.resultstore import ResultStore, externalize_action_result, is_result_reference, is_valid_result_id, \
+    resolve_result_reference
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join('.', 'tests', 'tmp', 'results')
+        self.store = ResultStore(self.path)
+        self.original_threshold = walkoff.config.config.result_store_threshold
+        self.original_preview_size = walkoff.config.config.result_preview_size
+        self.original_max_age = walkoff.config.config.result_store_max_age
+        walkoff.config.config.result_store_threshold = 100
+        walkoff.config.config.result_preview_size = 10
+
+    def tearDown(self):
+        walkoff.config.config.result_store_threshold = self.original_threshold
+        walkoff.config.config.result_preview_size = self.original_preview_size
+        walkoff.config.config.result_store_max_age = self.original_max_age
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_put_get(self):
+        result_id = self.store.put('{"a": 1}')
+        self.assertTrue(is_valid_result_id(result_id))
+        self.assertEqual(self.store.get(result_id), '{"a": 1}')
+
+    def test_put_is_content_addressed(self):
+        self.assertEqual(self.store.put('{"a": 1}'), self.store.put(b'{"a": 1}'))
+        self.assertNotEqual(self.store.put('{"a": 1}'), self.store.put('{"a": 2}'))
+
+    def test_get_missing(self):
+        self.assertIsNone(self.store.get('a' * 64))
+        self.assertIsNone(self.store.get_path('a' * 64))
+
+    def test_get_path_invalid_id(self):
+        self.store.put('{"a": 1}')
+        self.assertIsNone(self.store.get_path('../results'))
+        self.assertIsNone(self.store.get_path(None))
+
+    def test_delete(self):
+        result_id = self.store.put('{"a": 1}')
+        self.assertTrue(self.store.delete(result_id))
+        self.assertFalse(self.store.delete(result_id))
+        self.assertIsNone(self.store.get(result_id))
+
+    def test_externalize_small_result(self):
+        data = {'result': 'small', 'status': 'Success'}
+        self.assertIs(externalize_action_result(data, store=self.store), data)
+
+    def test_externalize_large_result(self):
+        result = {'key': 'a' * 200}
+        data = externalize_action_result({'result': result, 'status': 'Success'}, store=self.store)
+        self.assertEqual(data['status'], 'Success')
+        reference = data['result']
+        self.assertTrue(is_result_reference(reference))
+        body = json.dumps(result)
+        self.assertEqual(reference['size'], len(body))
+        self.assertEqual(reference['preview'], body[:10])
+        self.assertDictEqual(json.loads(self.store.get(reference['result_id'])), result)
+
+    def test_externalize_disabled(self):
+        walkoff.config.config.result_store_threshold = None
+        data = {'result': 'a' * 200, 'status': 'Success'}
+        self.assertIs(externalize_action_result(data, store=self.store), data)
+
+    def test_is_result_reference(self):
+        self.assertFalse(is_result_reference('a'))
+        self.assertFalse(is_result_reference({'result_id': 'a'}))
+        self.assertTrue(is_result_reference({'result_id': 'a', 'size': 1, 'preview': 'a'}))
+
+    def expire(self, result_id, store=None):
+        path = (store or self.store).get_path(result_id)
+        os.utime(path, (time.time() - 120, time.time() - 120))
+
+    def test_prune(self):
+        old_id, new_id = self.store.put('{"a": 1}'), self.store.put('{"a": 2}')
+        other_store = ResultStore(self.path, extension='pkl')
+        other_id = other_store.put(b'other')
+        self.expire(old_id)
+        self.expire(other_id, other_store)
+        self.assertEqual(self.store.prune(60), 1)
+        self.assertIsNone(self.store.get_path(old_id))
+        self.assertIsNotNone(self.store.get_path(new_id))
+        self.assertIsNotNone(other_store.get_path(other_id))
+
+    def test_put_renews_result(self):
+        result_id = self.store.put('{"a": 1}')
+        self.expire(result_id)
+        self.store.put('{"a": 1}')
+        self.assertEqual(self.store.prune(60), 0)
+        self.assertIsNotNone(self.store.get_path(result_id))
+
+    def test_prune_if_due(self):
+        walkoff.config.config.result_store_max_age = 60
+        result_id = self.store.put('{"a": 1}')
+        self.assertEqual(self.store.prune_if_due(), 0)
+        self.expire(result_id)
+        self.assertEqual(self.store.prune_if_due(), 0)
+        self.store._last_pruned = None
+        self.assertEqual(self.store.prune_if_due(), 1)
+
+    def test_prune_if_due_disabled(self):
+        walkoff.config.config.result_store_max_age = None
+        self.expire(self.store.put('{"a": 1}'))
+        self.assertEqual(self.store.prune_if_due(), 0)
+
+    def test_resolve_result_reference(self):
+        result = {'key': 'a' * 200}
+        reference = externalize_action_result({'result': result}, store=self.store)['result']
+        self.assertDictEqual(resolve_result_reference(reference, store=self.store), result)
+        self.assertEqual(resolve_result_reference('inline', store=self.store), 'inline')
+        self.store.delete(reference['result_id'])
+        self.assertIs(resolve_result_reference(reference, store=self.store), reference)
@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+import gevent
+
+import walkoff.config.config
+from walkoff.helpers import create_sse_event
+from walkoff.server.eventbuffer import SseEventBuffer
+
+
+class TestSseEventBuffer(TestCase):
+
+    def test_init_default_size_from_config(self):
+        original_size = walkoff.config.config.sse_event_buffer_size
+        walkoff.config.config.sse_event_buffer_size = 2
+        try:
+            buffer = SseEventBuffer()
+            for i in range(3):
+                buffer.publish('started', {'index': i})
+        finally:
+            walkoff.config.config.sse_event_buffer_size = original_size
+        self.assertListEqual(buffer.events_after(0), [(2, 'started', {'index': 1}), (3, 'started', {'index': 2})])
+
+    def test_publish_numbers_events(self):
+        buffer = SseEventBuffer(maxlen=10)
+        self.assertEqual(buffer.publish('started', {}), 1)
+        self.assertEqual(buffer.publish('success', {}), 2)
+        self.assertEqual(buffer.sequence, 2)
+
+    def test_events_after(self):
+        buffer = SseEventBuffer(maxlen=10)
+        for i in range(5):
+            buffer.publish('started', i)
+        self.assertListEqual(buffer.events_after(3), [(4, 'started', 3), (5, 'started', 4)])
+        self.assertListEqual(buffer.events_after(5), [])
+
+    def test_events_after_evicted_cursor(self):
+        buffer = SseEventBuffer(maxlen=2)
+        for i in range(5):
+            buffer.publish('started', i)
+        self.assertListEqual(buffer.events_after(1), [(4, 'started', 3), (5, 'started', 4)])
+
+    def test_get_cursor(self):
+        buffer = SseEventBuffer(maxlen=10)
+        for i in range(5):
+            buffer.publish('started', i)
+        self.assertEqual(buffer.get_cursor(), 5)
+        self.assertEqual(buffer.get_cursor('3'), 3)
+
+    def test_get_cursor_invalid_last_event_id(self):
+        buffer = SseEventBuffer(maxlen=10)
+        for i in range(5):
+            buffer.publish('started', i)
+        for last_event_id in ('invalid', '-1', '6'):
+            self.assertEqual(buffer.get_cursor(last_event_id), 5)
+
+    def test_subscribe_replays_missed_events(self):
+        buffer = SseEventBuffer(maxlen=10)
+        for i in range(3):
+            buffer.publish('started', i)
+        stream = buffer.subscribe(buffer.get_cursor('1'))
+        self.assertEqual(next(stream), create_sse_event(event_id=2, event='started', data=1))
+        self.assertEqual(next(stream), create_sse_event(event_id=3, event='started', data=2))
+
+    def test_subscribers_read_independently(self):
+        buffer = SseEventBuffer(maxlen=10)
+        fast = buffer.subscribe(buffer.get_cursor())
+        slow = buffer.subscribe(buffer.get_cursor())
+        received = []
+
+        def read_fast():
+            for _ in range(3):
+                received.append(next(fast))
+
+        reader = gevent.spawn(read_fast)
+        gevent.sleep(0)
+        for i in range(3):
+            buffer.publish('started', i)
+        reader.join(timeout=1)
+        self.assertListEqual(received, [create_sse_event(event_id=i + 1, event='started', data=i) for i in range(3)])
+        self.assertEqual(next(slow), create_sse_event(event_id=1, event='started', data=0))
@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import unittest
+from datetime import datetime
+from uuid import uuid4
+
+import walkoff.config.paths
+from tests.config import test_execution_db_path
+from tests.util import execution_db_help
+from walkoff import executiondb
+from walkoff.appgateway.actionresult import ActionResult
+from walkoff.executiondb.executionlog import ExecutionLogEntry, append_log_entry, ACTION_COMPLETED
+from walkoff.executiondb.playbook import Playbook
+from walkoff.executiondb.retention import ExecutionRetention, get_rollups
+from walkoff.executiondb.saved_workflow import SavedWorkflow
+from walkoff.executiondb.statuswriter import StatusWriter
+from walkoff.executiondb.workflow import Workflow
+from walkoff.executiondb.workflowresults import WorkflowStatus
+
+
+class TestStatusDatabase(unittest.TestCase):
+    status_db_path = os.path.join('.', 'tests', 'tmp', 'status_test.db')
+
+    @classmethod
+    def setUpClass(cls):
+        cls.remove_database(test_execution_db_path)
+        walkoff.config.paths.status_db_path = cls.status_db_path
+        execution_db_help.setup_dbs()
+
+    def tearDown(self):
+        executiondb.execution_db.session.query(ExecutionLogEntry).delete()
+        executiondb.execution_db.session.query(SavedWorkflow).delete()
+        executiondb.execution_db.session.commit()
+        execution_db_help.cleanup_device_db()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_device_db()
+        walkoff.config.paths.status_db_path = None
+        cls.remove_database(cls.status_db_path)
+
+    @staticmethod
+    def remove_database(path):
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    @staticmethod
+    def get_tables(path):
+        connection = sqlite3.connect(path)
+        try:
+            return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        finally:
+            connection.close()
+
+    @staticmethod
+    def count_rows(path, table):
+        connection = sqlite3.connect(path)
+        try:
+            return connection.execute('SELECT COUNT(*) FROM {}'.format(table)).fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_status_tables_are_in_status_database(self):
+        status_tables = {'workflow_status', 'action_status', 'saved_workflow', 'execution_log', 'workflow_rollup'}
+        self.assertTrue(status_tables <= self.get_tables(self.status_db_path))
+        execution_tables = self.get_tables(test_execution_db_path)
+        self.assertIn('workflow', execution_tables)
+        self.assertTrue(status_tables.isdisjoint(execution_tables))
+
+    def test_rows_are_written_to_their_databases(self):
+        execution_id = uuid4()
+        executiondb.execution_db.session.add(Playbook('play', workflows=[Workflow('wf', uuid4())]))
+        executiondb.execution_db.session.commit()
+        writer = StatusWriter(batch_size=100, flush_interval=60)
+        writer.workflow_pending(execution_id, uuid4(), 'wf')
+        writer.flush()
+        append_log_entry(execution_id, uuid4(), uuid4(), ACTION_COMPLETED, result=ActionResult('a', 'Success'))
+        SavedWorkflow.save(executiondb.execution_db.session, execution_id, uuid4(), uuid4(), {}, {})
+
+        self.assertEqual(self.count_rows(self.status_db_path, 'workflow_status'), 1)
+        self.assertEqual(self.count_rows(self.status_db_path, 'execution_log'), 1)
+        self.assertEqual(self.count_rows(self.status_db_path, 'saved_workflow'), 1)
+        self.assertEqual(self.count_rows(test_execution_db_path, 'workflow'), 1)
+        self.assertEqual(executiondb.execution_db.session.query(WorkflowStatus).get(execution_id).name, 'wf')
+
+    def test_status_writes_are_not_blocked_by_definition_writes(self):
+        blocker = sqlite3.connect(test_execution_db_path)
+        try:
+            blocker.execute('BEGIN IMMEDIATE')
+            execution_id = uuid4()
+            writer = StatusWriter(batch_size=100, flush_interval=60)
+            writer.workflow_pending(execution_id, uuid4(), 'wf')
+            writer.workflow_running(execution_id)
+            writer.flush()
+            self.assertEqual(writer.pending, 0)
+        finally:
+            blocker.rollback()
+            blocker.close()
+
+    def test_retention_uses_status_database(self):
+        workflow_id = uuid4()
+        workflow_status = WorkflowStatus(uuid4(), workflow_id, 'wf')
+        workflow_status.running(started_at=datetime(2018, 6, 1, 10))
+        workflow_status.completed(completed_at=datetime(2018, 6, 1, 11))
+        executiondb.execution_db.session.add(workflow_status)
+        executiondb.execution_db.session.commit()
+        self.assertEqual(ExecutionRetention().apply(60 * 60, archive=False), 1)
+        self.assertEqual(len(get_rollups(workflow_id=workflow_id)), 1)
+        self.assertEqual(self.count_rows(self.status_db_path, 'workflow_rollup'), 1)
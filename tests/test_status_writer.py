@@ -0,0 +1,195 @@
+import json
+import time
+import unittest
+from uuid import uuid4
+
+from sqlalchemy.exc import OperationalError
+
+from tests.util import execution_db_help
+from walkoff import executiondb
+from walkoff.executiondb import WorkflowStatusEnum, ActionStatusEnum
+from walkoff.executiondb.saved_workflow import SavedWorkflow
+from walkoff.executiondb.statuswriter import StatusWriter
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+
+
+class TestStatusWriter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+
+    def setUp(self):
+        self.writer = StatusWriter(batch_size=100, flush_interval=60)
+        self.execution_id = str(uuid4())
+        self.workflow_id = str(uuid4())
+
+    def tearDown(self):
+        self.writer.flush()
+        execution_db_help.cleanup_device_db()
+
+    @classmethod
+    def tearDownClass(cls):
+        execution_db_help.tear_down_device_db()
+
+    def get_from_db(self, execution_id):
+        executiondb.execution_db.session.expire_all()
+        return executiondb.execution_db.session.query(WorkflowStatus).filter_by(execution_id=execution_id).first()
+
+    def start_action(self, writer=None):
+        action_execution_id = str(uuid4())
+        (writer or self.writer).action_started(action_execution_id, self.execution_id, str(uuid4()), 'action1',
+                                               'HelloWorld', 'helloWorld', json.dumps([]))
+        return action_execution_id
+
+    def test_transitions_are_not_written_until_flush(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.assertEqual(self.writer.pending, 1)
+        self.assertIsNone(self.get_from_db(self.execution_id))
+
+        self.writer.flush()
+        self.assertEqual(self.writer.pending, 0)
+        workflow_status = self.get_from_db(self.execution_id)
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.pending)
+        self.assertEqual(workflow_status.name, 'wf')
+
+    def test_running_is_written_immediately(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.workflow_running(self.execution_id)
+        self.assertEqual(self.writer.pending, 0)
+        workflow_status = self.get_from_db(self.execution_id)
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.running)
+        self.assertIsNotNone(workflow_status.started_at)
+
+        self.writer.workflow_paused(self.execution_id)
+        self.assertEqual(self.writer.pending, 0)
+        self.assertEqual(self.get_from_db(self.execution_id).status, WorkflowStatusEnum.paused)
+
+    def test_overlay_of_pending_workflow(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.workflow_running(self.execution_id)
+        workflow_status = self.writer.get_workflow_status(self.execution_id)
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.running)
+        self.assertEqual(workflow_status.as_json()['workflow_id'], self.workflow_id)
+
+    def test_overlay_of_existing_workflow(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.workflow_running(self.execution_id)
+        self.writer.workflow_completed(self.execution_id)
+        self.assertEqual(self.writer.get_workflow_status(self.execution_id).status, WorkflowStatusEnum.completed)
+        self.assertEqual(self.get_from_db(self.execution_id).status, WorkflowStatusEnum.running)
+
+    def test_get_workflow_status_without_pending_transitions(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.flush()
+        self.assertIs(self.writer.get_workflow_status(self.execution_id), self.get_from_db(self.execution_id))
+
+    def test_get_workflow_status_does_not_exist(self):
+        self.assertIsNone(self.writer.get_workflow_status(str(uuid4())))
+        self.assertIsNone(self.writer.get_workflow_status('invalid'))
+
+    def test_overlay_of_actions(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.workflow_running(self.execution_id)
+        first = self.start_action()
+        self.writer.action_succeeded(first, self.execution_id, {'result': 'done'})
+        self.writer.flush()
+        second = self.start_action()
+
+        status_json = self.writer.get_workflow_status(self.execution_id).as_json(full_actions=True)
+        self.assertListEqual([action['execution_id'] for action in status_json['action_statuses']], [first, second])
+        self.assertEqual(status_json['action_statuses'][0]['result'], 'done')
+        self.assertEqual(status_json['action_statuses'][1]['status'], 'executing')
+        self.assertEqual(len(self.get_from_db(self.execution_id)._action_statuses), 1)
+
+    def test_flush_on_batch_size(self):
+        writer = StatusWriter(batch_size=3, flush_interval=60)
+        writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.start_action(writer)
+        self.assertIsNone(self.get_from_db(self.execution_id))
+        self.start_action(writer)
+        self.assertEqual(writer.pending, 0)
+        self.assertEqual(len(self.get_from_db(self.execution_id)._action_statuses), 2)
+
+    def test_flush_if_due(self):
+        writer = StatusWriter(batch_size=100, flush_interval=60)
+        writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        writer.flush_if_due()
+        self.assertEqual(writer.pending, 1)
+        writer.flush_interval = 0
+        writer.flush_if_due()
+        self.assertEqual(writer.pending, 0)
+        self.assertIsNotNone(self.get_from_db(self.execution_id))
+
+    def test_awaiting_data_and_aborted(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.workflow_running(self.execution_id)
+        action_execution_id = self.start_action()
+        self.writer.workflow_awaiting_data(self.execution_id)
+        self.writer.flush()
+        workflow_status = self.get_from_db(self.execution_id)
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.awaiting_data)
+        self.assertEqual(workflow_status._action_statuses[-1].status, ActionStatusEnum.awaiting_data)
+
+        writer = StatusWriter(batch_size=100, flush_interval=60)
+        writer.workflow_aborted(self.execution_id)
+        writer.flush()
+        workflow_status = self.get_from_db(self.execution_id)
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.aborted)
+        self.assertIsNotNone(workflow_status.completed_at)
+        action_status = executiondb.execution_db.session.query(ActionStatus).filter_by(
+            execution_id=action_execution_id).first()
+        self.assertEqual(action_status.status, ActionStatusEnum.aborted)
+
+    def test_completed_removes_saved_workflow(self):
+        SavedWorkflow.save(executiondb.execution_db.session, self.execution_id, self.workflow_id, uuid4(), {}, {})
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.workflow_completed(self.execution_id)
+        self.writer.flush()
+        self.assertEqual(self.get_from_db(self.execution_id).status, WorkflowStatusEnum.completed)
+        self.assertIsNone(executiondb.execution_db.session.query(SavedWorkflow).filter_by(
+            workflow_execution_id=self.execution_id).first())
+
+    def test_update_of_missing_workflow_is_skipped(self):
+        self.writer.workflow_running(self.execution_id)
+        self.writer.flush()
+        self.assertEqual(self.writer.pending, 0)
+        self.assertIsNone(self.get_from_db(self.execution_id))
+
+    def test_failed_flush_is_retried(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.start_action()
+
+        def fail_commit():
+            raise OperationalError('commit', {}, Exception('database is locked'))
+
+        executiondb.execution_db.session.commit = fail_commit
+        try:
+            self.writer.flush()
+        finally:
+            del executiondb.execution_db.session.commit
+        self.assertEqual(self.writer.pending, 2)
+        self.assertIsNone(self.get_from_db(self.execution_id))
+
+        self.writer.workflow_running(self.execution_id)
+        self.assertEqual(self.writer.pending, 0)
+        workflow_status = self.get_from_db(self.execution_id)
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.running)
+        self.assertEqual(len(workflow_status._action_statuses), 1)
+
+    def test_flush_on_interval(self):
+        writer = StatusWriter(batch_size=100, flush_interval=0.05)
+        writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        for _ in range(100):
+            if not writer.pending:
+                break
+            time.sleep(0.05)
+        self.assertEqual(writer.pending, 0)
+        self.assertIsNotNone(self.get_from_db(self.execution_id))
+
+    def test_timestamps_are_taken_when_recorded(self):
+        self.writer.workflow_pending(self.execution_id, self.workflow_id, 'wf')
+        self.writer.workflow_running(self.execution_id)
+        started_at = self.writer.get_workflow_status(self.execution_id).started_at
+        time.sleep(0.01)
+        self.writer.flush()
+        self.assertEqual(self.get_from_db(self.execution_id).started_at, started_at)
@@ -3,6 +3,7 @@ import unittest
 import walkoff.appgateway
 import walkoff.config.config
 from tests.config import test_apps_path
+from walkoff.events import WalkoffEvent
 from walkoff.executiondb.argument import Argument
 from walkoff.executiondb.transform import Transform
 from walkoff.helpers import InvalidExecutionElement
@@ -96,3 +97,28 @@ class TestTransform(unittest.TestCase):
             Transform('HelloWorld', action_name='mod1_filter2', arguments=[Argument('arg1', value='10.3')]).execute(
                 'invalid', {}),
             'invalid')
+
+    def test_execute_invalid_input_returns_original_by_reference(self):
+        data = {'a': 1}
+        self.assertIs(Transform('HelloWorld', action_name='select json',
+                                arguments=[Argument('element', value='b')]).execute(data, {}), data)
+
+    def test_execute_mutating_transform_does_not_modify_input(self):
+        data = {'a': 1, 'b': 2}
+        result = Transform('HelloWorld', action_name='pop json', arguments=[Argument('element', value='a')]).execute(
+            data, {})
+        self.assertDictEqual(result, {'b': 2})
+        self.assertDictEqual(data, {'a': 1, 'b': 2})
+
+    def test_compile_without_events(self):
+        result = {'count': 0}
+
+        @WalkoffEvent.CommonWorkflowSignal.connect
+        def callback_is_sent(sender, **kwargs):
+            if isinstance(sender, Transform):
+                result['count'] += 1
+
+        compiled = Transform('HelloWorld', 'Top Transform').compile(emit_events=False)
+        self.assertAlmostEqual(compiled('5.4', {}), 5.4)
+        self.assertEqual(compiled('invalid', {}), 'invalid')
+        self.assertEqual(result['count'], 0)
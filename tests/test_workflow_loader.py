@@ -0,0 +1,114 @@
+import unittest
+from uuid import uuid4
+
+from sqlalchemy import event
+
+import walkoff.appgateway
+import walkoff.config.config
+from tests.config import test_apps_path
+from tests.util import execution_db_help
+from walkoff import executiondb
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.loader import load_playbook, load_workflow, expression_depth
+from walkoff.executiondb.playbook import Playbook
+from walkoff.executiondb.position import Position
+from walkoff.executiondb.schemas import PlaybookSchema, WorkflowSchema
+from walkoff.executiondb.transform import Transform
+from walkoff.executiondb.workflow import Workflow
+
+
+class TestWorkflowLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        execution_db_help.setup_dbs()
+        walkoff.appgateway.cache_apps(test_apps_path)
+        walkoff.config.config.load_app_apis(apps_path=test_apps_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        walkoff.appgateway.clear_cache()
+        execution_db_help.tear_down_device_db()
+
+    def setUp(self):
+        self.statements = []
+        event.listen(executiondb.execution_db.engine, 'before_cursor_execute', self.count_statement)
+
+    def tearDown(self):
+        event.remove(executiondb.execution_db.engine, 'before_cursor_execute', self.count_statement)
+        execution_db_help.cleanup_device_db()
+
+    def count_statement(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            self.statements.append(statement)
+
+    @staticmethod
+    def make_condition():
+        return Condition('HelloWorld', action_name='regMatch', arguments=[Argument('regex', value='(.*)')],
+                         transforms=[Transform('HelloWorld', action_name='mod1_filter2',
+                                               arguments=[Argument('arg1', value='5.4')])])
+
+    def make_expression(self, depth):
+        children = [self.make_expression(depth - 1)] if depth > 1 else []
+        return ConditionalExpression('and', child_expressions=children,
+                                     conditions=[self.make_condition(), self.make_condition()])
+
+    def make_workflow(self, name, size, depth=2):
+        actions = [Action('HelloWorld', 'repeatBackToMe', 'action{}'.format(i),
+                          arguments=[Argument('call', value=str(i))], position=Position(i, i),
+                          trigger=self.make_expression(depth), id=uuid4())
+                   for i in range(size)]
+        branches = [Branch(actions[i].id, actions[i + 1].id, condition=self.make_expression(depth))
+                    for i in range(size - 1)]
+        return Workflow(name, actions[0].id, actions=actions, branches=branches)
+
+    def add_playbook(self, name, workflow_sizes, depth=2):
+        workflows = [self.make_workflow('{}_{}'.format(name, i), size, depth=depth)
+                     for i, size in enumerate(workflow_sizes)]
+        playbook = Playbook(name, workflows=workflows)
+        executiondb.execution_db.session.add(playbook)
+        executiondb.execution_db.session.commit()
+        return playbook.id, [workflow.id for workflow in workflows]
+
+    def count_workflow_load(self, workflow_id):
+        executiondb.execution_db.session.expunge_all()
+        self.statements = []
+        WorkflowSchema().dump(load_workflow(workflow_id))
+        return len(self.statements)
+
+    def count_playbook_load(self, playbook_id):
+        executiondb.execution_db.session.expunge_all()
+        self.statements = []
+        PlaybookSchema().dump(load_playbook(playbook_id))
+        return len(self.statements)
+
+    def test_load_workflow_is_complete(self):
+        _, (workflow_id,) = self.add_playbook('play', [3])
+        executiondb.execution_db.session.expunge_all()
+        expected = WorkflowSchema().dump(executiondb.execution_db.session.query(Workflow).get(workflow_id)).data
+        executiondb.execution_db.session.expunge_all()
+        self.assertDictEqual(WorkflowSchema().dump(load_workflow(workflow_id)).data, expected)
+
+    def test_load_workflow_does_not_exist(self):
+        self.assertIsNone(load_workflow(uuid4()))
+
+    def test_load_workflow_query_count_is_independent_of_size(self):
+        _, (small_id, large_id) = self.add_playbook('play', [2, 40])
+        small = self.count_workflow_load(small_id)
+        large = self.count_workflow_load(large_id)
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, 5 + 2 * 6 * expression_depth)
+
+    def test_load_workflow_query_count_with_deep_expressions(self):
+        _, (workflow_id,) = self.add_playbook('play', [5], depth=expression_depth)
+        shallow_id = self.add_playbook('other', [5], depth=1)[1][0]
+        self.assertEqual(self.count_workflow_load(workflow_id), self.count_workflow_load(shallow_id) + 2 * 5 * (
+            expression_depth - 1))
+
+    def test_load_playbook_query_count_is_independent_of_size(self):
+        small_id, _ = self.add_playbook('small', [2])
+        large_id, _ = self.add_playbook('large', [10, 20, 30])
+        self.assertEqual(self.count_playbook_load(small_id), self.count_playbook_load(large_id))
@@ -1,7 +1,11 @@
 import json
+import os
+import shutil
+from datetime import datetime, timedelta
 from uuid import uuid4
 
 import walkoff.case.database as case_database
+import walkoff.config.paths
 import walkoff.executiondb.schemas
 from tests.util import execution_db_help
 from tests.util.case_db_help import setup_subscriptions_for_action
@@ -13,6 +17,7 @@ from walkoff.executiondb.executionelement import ExecutionElement
 from walkoff.executiondb.workflow import Workflow
 from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
 from walkoff.multiprocessedexecutor.multiprocessedexecutor import MultiprocessedExecutor
+from walkoff.resultstore import result_store
 from walkoff.server import flaskserver as flask_server
 from walkoff.server.returncodes import *
 
@@ -134,6 +139,74 @@ class TestWorkflowStatus(ServerTestCase):
                         'name': 'name'}}
         self.assertDictEqual(response, expected)
 
+    def add_started_workflow_statuses(self, number, workflow_id=None):
+        start = datetime(2018, 6, 1)
+        statuses = []
+        for i in range(number):
+            workflow_status = WorkflowStatus(uuid4(), workflow_id or uuid4(), 'wf{}'.format(i))
+            workflow_status.running(started_at=start + timedelta(minutes=i))
+            if i % 2:
+                workflow_status.completed()
+            statuses.append(workflow_status)
+        executiondb.execution_db.session.add_all(statuses)
+        executiondb.execution_db.session.commit()
+        return [str(workflow_status.execution_id) for workflow_status in statuses]
+
+    def get_workflow_status_page(self, query):
+        response = self.app.get('/api/workflowqueue?{}'.format(query), headers=self.headers)
+        self.assertEqual(response.status_code, SUCCESS)
+        execution_ids = [status['execution_id'] for status in json.loads(response.get_data(as_text=True))]
+        return execution_ids, response.headers.get('X-Next-Cursor')
+
+    def test_read_all_workflow_status_pages(self):
+        execution_ids = self.add_started_workflow_statuses(5)
+        executiondb.execution_db.session.add(self.make_generic_workflow_status())
+        executiondb.execution_db.session.commit()
+
+        page, cursor = self.get_workflow_status_page('limit=2&status=running,completed')
+        self.assertListEqual(page, execution_ids[:2:-1])
+        page, cursor = self.get_workflow_status_page('limit=2&cursor={}'.format(cursor))
+        self.assertListEqual(page, execution_ids[2:0:-1])
+        page, cursor = self.get_workflow_status_page('limit=2&cursor={}'.format(cursor))
+        self.assertListEqual(page, execution_ids[:1])
+        self.assertIsNone(cursor)
+
+    def test_read_all_workflow_status_filters(self):
+        workflow_id = uuid4()
+        execution_ids = self.add_started_workflow_statuses(4, workflow_id=workflow_id)
+        self.add_started_workflow_statuses(2)
+
+        page, cursor = self.get_workflow_status_page('workflow_id={}'.format(workflow_id))
+        self.assertListEqual(page, execution_ids[::-1])
+        self.assertIsNone(cursor)
+        page, _ = self.get_workflow_status_page('workflow_id={}&status=completed'.format(workflow_id))
+        self.assertListEqual(page, [execution_ids[3], execution_ids[1]])
+        page, _ = self.get_workflow_status_page(
+            'workflow_id={}&started_after=2018-06-01T00:01:00Z&started_before=2018-06-01T00:03:00.000000Z'.format(
+                workflow_id))
+        self.assertListEqual(page, [execution_ids[2], execution_ids[1]])
+
+    def test_read_all_workflow_status_paginate(self):
+        execution_ids = self.add_started_workflow_statuses(3)
+
+        page, cursor = self.get_workflow_status_page('limit=2&paginate=true')
+        self.assertListEqual(page, execution_ids[:0:-1])
+        page, cursor = self.get_workflow_status_page('limit=2&cursor={}'.format(cursor))
+        self.assertListEqual(page, execution_ids[:1])
+        self.assertIsNone(cursor)
+
+    def test_read_all_workflow_status_limits_executing(self):
+        execution_ids = self.add_started_workflow_statuses(5)
+
+        page, cursor = self.get_workflow_status_page('limit=2')
+        self.assertListEqual(page, [execution_ids[0], execution_ids[2]])
+        self.assertIsNone(cursor)
+
+    def test_read_all_workflow_status_invalid_cursor(self):
+        self.get_with_status_check('/api/workflowqueue?cursor=invalid', headers=self.headers, status_code=BAD_REQUEST)
+        self.get_with_status_check('/api/workflowqueue?started_after=yesterday', headers=self.headers,
+                                   status_code=BAD_REQUEST)
+
     def test_read_workflow_status(self):
         wf_exec_id = uuid4()
         wf_id = uuid4()
@@ -177,6 +250,22 @@ class TestWorkflowStatus(ServerTestCase):
         self.get_with_status_check('/api/workflowqueue/{}'.format(str(uuid4())), headers=self.headers,
                                    status_code=OBJECT_DNE_ERROR)
 
+    def test_read_action_result(self):
+        original_path = walkoff.config.paths.result_store_path
+        walkoff.config.paths.result_store_path = os.path.join('.', 'tests', 'tmp', 'results')
+        try:
+            result_id = result_store.put(json.dumps({'key': 'value'}))
+            response = self.app.get('/api/workflowqueue/results/{}'.format(result_id), headers=self.headers)
+            self.assertEqual(response.status_code, SUCCESS)
+            self.assertDictEqual(json.loads(response.get_data(as_text=True)), {'key': 'value'})
+        finally:
+            shutil.rmtree(walkoff.config.paths.result_store_path, ignore_errors=True)
+            walkoff.config.paths.result_store_path = original_path
+
+    def test_read_action_result_invalid_id(self):
+        self.get_with_status_check('/api/workflowqueue/results/{}'.format('a' * 64), headers=self.headers,
+                                   status_code=OBJECT_DNE_ERROR)
+
     def test_execute_workflow(self):
         playbook = execution_db_help.standard_load()
 
@@ -4,6 +4,7 @@ import threading
 import time
 import unittest
 from datetime import datetime
+from uuid import uuid4
 
 import walkoff.appgateway
 import walkoff.config.config
@@ -13,7 +14,10 @@ from tests.util import execution_db_help
 from tests.util.case_db_help import *
 from tests.util.thread_control import modified_setup_worker_env
 from walkoff import executiondb
-from walkoff.executiondb.workflowresults import WorkflowStatus, WorkflowStatusEnum
+from walkoff.appgateway.actionresult import ActionResult
+from walkoff.executiondb.executionlog import append_log_entry, get_recoverable_executions, ACTION_COMPLETED
+from walkoff.executiondb.statuswriter import status_writer
+from walkoff.executiondb.workflowresults import WorkflowStatusEnum
 from walkoff.multiprocessedexecutor.multiprocessedexecutor import multiprocessedexecutor
 from walkoff.server import workflowresults  # Need this import
 
@@ -26,7 +30,7 @@ class TestZMQCommunication(unittest.TestCase):
         from walkoff.multiprocessedexecutor.multiprocessedexecutor import spawn_worker_processes
         walkoff.config.config.num_processes = 2
         pids = spawn_worker_processes(worker_environment_setup=modified_setup_worker_env)
-        multiprocessedexecutor.initialize_threading(pids)
+        multiprocessedexecutor.initialize_threading(pids, worker_environment_setup=modified_setup_worker_env)
         walkoff.appgateway.cache_apps(config.test_apps_path)
         walkoff.config.config.load_app_apis(apps_path=config.test_apps_path)
         walkoff.config.config.num_processes = 2
@@ -89,6 +93,27 @@ class TestZMQCommunication(unittest.TestCase):
         for result in [action['data'] for action in actions]:
             self.assertIn(result, expected_results)
 
+    def test_recover_interrupted_workflow(self):
+        workflow = execution_db_help.load_workflow('multiactionWorkflowTest', 'multiactionWorkflow')
+        start_action = next(action for action in workflow.actions if action.name == 'start')
+        execution_id = str(uuid4())
+        original_durable = walkoff.config.config.durable_workflows
+        walkoff.config.config.durable_workflows = True
+        try:
+            append_log_entry(execution_id, workflow.id, start_action.id, ACTION_COMPLETED,
+                             result=ActionResult({'message': 'HELLO WORLD'}, 'Success'), worker_id=5)
+            self.assertListEqual(multiprocessedexecutor.recover_workflows(), [execution_id])
+            multiprocessedexecutor.wait_and_reset(1)
+        finally:
+            walkoff.config.config.durable_workflows = original_durable
+
+        workflow_status = status_writer.get_workflow_status(execution_id)
+        self.assertEqual(workflow_status.status, WorkflowStatusEnum.completed)
+        action_statuses = workflow_status.as_json(full_actions=True)['action_statuses']
+        self.assertListEqual([(action['name'], action['result']) for action in action_statuses],
+                             [('1', 'REPEATING: Hello World')])
+        self.assertListEqual(get_recoverable_executions(), [])
+
     def test_error_workflow(self):
         workflow = execution_db_help.load_workflow('multiactionError', 'multiactionErrorWorkflow')
         action_names = ['start', '1', 'error']
@@ -160,10 +185,7 @@ class TestZMQCommunication(unittest.TestCase):
         @WalkoffEvent.WorkflowPaused.connect
         def workflow_paused_listener(sender, **kwargs):
             result['paused'] = True
-            wf_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-                execution_id=sender['execution_id']).first()
-            wf_status.paused()
-            executiondb.execution_db.session.commit()
+            status_writer.workflow_paused(sender['execution_id'])
 
             multiprocessedexecutor.resume_workflow(execution_id)
 
@@ -180,8 +202,7 @@ class TestZMQCommunication(unittest.TestCase):
 
         while True:
             executiondb.execution_db.session.expire_all()
-            workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-                execution_id=execution_id).first()
+            workflow_status = status_writer.get_workflow_status(execution_id)
             if workflow_status and workflow_status.status == WorkflowStatusEnum.running:
                 threading.Thread(target=pause_resume_thread).start()
                 time.sleep(0)
@@ -4,3 +4,12 @@ from walkoff.appgateway.decorators import action
 @action
 def global2(arg1):
     return arg1
+
+
+call_counts = {'cached_global': 0}
+
+
+@action(cacheable=True, ttl=60)
+def cached_global(arg1):
+    call_counts['cached_global'] += 1
+    return arg1
@@ -28,6 +28,12 @@ def json_select(json_in, element):
     return json_in[element]
 
 
+@transform(mutates=True)
+def json_pop(json_in, element):
+    json_in.pop(element)
+    return json_in
+
+
 @transform
 def filter2(value, arg1):
     return value + arg1
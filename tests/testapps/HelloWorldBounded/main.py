@@ -54,20 +54,22 @@ class Main(App):
 
         workflow_id = str(workflow_status.workflow_id)
 
-        events = case_database.case_db.session.query(Event).filter_by(originator=workflow_id).all()
-
-        pause = False
-        resume = False
-        for event in events:
-            if event.message == 'Workflow paused':
-                pause = True
-            elif event.message == 'Workflow resumed':
-                resume = True
-
-        if pause and resume:
-            return "success"
-
-        time.sleep(0.1)
+        # The server writes case events in the background, so they may not be in the database yet
+        for _ in range(50):
+            events = case_database.case_db.session.query(Event).filter_by(originator=workflow_id).all()
+
+            pause = False
+            resume = False
+            for event in events:
+                if event.message == 'Workflow paused':
+                    pause = True
+                elif event.message == 'Workflow resumed':
+                    resume = True
+
+            if pause and resume:
+                return "success"
+
+            time.sleep(0.1)
         return "failure"
 
     def shutdown(self):
@@ -13,6 +13,7 @@ from walkoff.executiondb.branch import Branch
 from walkoff.executiondb.condition import Condition
 from walkoff.executiondb.conditionalexpression import ConditionalExpression
 from walkoff.executiondb.playbook import Playbook
+from walkoff.executiondb.retention import WorkflowRollup
 from walkoff.executiondb.schemas import PlaybookSchema
 from walkoff.executiondb.transform import Transform
 from walkoff.executiondb.workflow import Workflow
@@ -75,6 +76,7 @@ def cleanup_device_db():
 
     for instance in executiondb.execution_db.session.query(WorkflowStatus).all():
         executiondb.execution_db.session.delete(instance)
+    executiondb.execution_db.session.query(WorkflowRollup).delete()
     executiondb.execution_db.session.commit()
 
 
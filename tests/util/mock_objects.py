@@ -5,11 +5,15 @@ import gevent
 from zmq.utils.strtypes import cast_unicode
 
 from walkoff import executiondb
+from walkoff.appgateway import invalidate_cached_action_results, get_action_result_cache_metrics
+from walkoff.case.eventsink import case_event_sink
 from walkoff.events import WalkoffEvent
+from walkoff.executiondb.executionlog import load_recovery_state
 from walkoff.executiondb.saved_workflow import SavedWorkflow
+from walkoff.executiondb.statuswriter import status_writer
 from walkoff.executiondb.workflow import Workflow
 from walkoff.multiprocessedexecutor import loadbalancer
-from walkoff.multiprocessedexecutor.worker import convert_to_protobuf
+from walkoff.multiprocessedexecutor.worker import convert_to_protobuf, convert_cache_metrics_to_proto
 
 try:
     from Queue import Queue
@@ -19,11 +23,12 @@ except ImportError:
 workflows_executed = 0
 
 
-def mock_initialize_threading(self, pids=None):
+def mock_initialize_threading(self, pids=None, worker_environment_setup=None):
     global workflows_executed
     workflows_executed = 0
 
     self.manager = MockLoadBalancer()
+    self.receiver = self.manager.results_queue
     self.manager_thread = threading.Thread(target=self.manager.manage_workflows)
     self.manager_thread.start()
 
@@ -41,11 +46,13 @@ def mock_wait_and_reset(self, num_workflows):
         timeout += 0.1
         gevent.sleep(0.1)
     workflows_executed = 0
+    status_writer.flush()
+    case_event_sink.flush()
 
 
 def mock_shutdown_pool(self):
     if self.manager_thread and self.manager_thread.is_alive():
-        self.manager.pending_workflows.put(("Exit", "Exit", "Exit", "Exit", "Exit"))
+        self.manager.pending_workflows.put(("Exit", "Exit", "Exit", "Exit", "Exit", "Exit"))
         self.manager_thread.join(timeout=1)
     self.threading_is_initialized = False
     WalkoffEvent.CommonWorkflowSignal.signal.receivers = {}
@@ -70,13 +77,12 @@ class MockLoadBalancer(object):
     def on_data_sent(self, sender, **kwargs):
         workflow = self.workflow_comms[self.exec_id]
         if kwargs['event'] in [WalkoffEvent.TriggerActionAwaitingData, WalkoffEvent.WorkflowPaused]:
-            saved_workflow = SavedWorkflow(workflow_execution_id=workflow.get_execution_id(),
-                                           workflow_id=workflow.id,
-                                           action_id=workflow.get_executing_action_id(),
-                                           accumulator=workflow.get_accumulator(),
-                                           app_instances=workflow.get_instances())
-            executiondb.execution_db.session.add(saved_workflow)
-            executiondb.execution_db.session.commit()
+            SavedWorkflow.save(executiondb.execution_db.session,
+                               workflow_execution_id=workflow.get_execution_id(),
+                               workflow_id=workflow.id,
+                               action_id=workflow.get_executing_action_id(),
+                               accumulator=workflow.get_accumulator(),
+                               app_instances=workflow.get_instances())
 
         if self.exec_id or not hasattr(sender, "_execution_id"):
             packet_bytes = convert_to_protobuf(sender, workflow, **kwargs)
@@ -86,12 +92,13 @@ class MockLoadBalancer(object):
 
         self.results_queue.send(packet_bytes)
 
-    def add_workflow(self, workflow_id, workflow_execution_id, start=None, start_arguments=None, resume=False):
-        self.pending_workflows.put((workflow_id, workflow_execution_id, start, start_arguments, resume))
+    def add_workflow(self, workflow_id, workflow_execution_id, start=None, start_arguments=None, resume=False,
+                     recover=False):
+        self.pending_workflows.put((workflow_id, workflow_execution_id, start, start_arguments, resume, recover))
 
     def manage_workflows(self):
         while True:
-            workflow_id, workflow_execution_id, start, start_arguments, resume = self.pending_workflows.recv()
+            workflow_id, workflow_execution_id, start, start_arguments, resume, recover = self.pending_workflows.recv()
             if workflow_id == "Exit":
                 return
 
@@ -102,9 +109,12 @@ class MockLoadBalancer(object):
 
             self.exec_id = workflow_execution_id
 
-            start = start if start else workflow.start
-            workflow.execute(execution_id=workflow_execution_id, start=start, start_arguments=start_arguments,
-                             resume=resume)
+            if recover:
+                workflow.recover(workflow_execution_id, *load_recovery_state(workflow_execution_id)[1:])
+            else:
+                start = start if start else workflow.start
+                workflow.execute(execution_id=workflow_execution_id, start=start, start_arguments=start_arguments,
+                                 resume=resume)
             self.exec_id = ''
 
     def pause_workflow(self, workflow_execution_id):
@@ -115,11 +125,18 @@ class MockLoadBalancer(object):
         self.workflow_comms[workflow_execution_id].abort()
         return True
 
+    def invalidate_cached_action_results(self, app_name=None):
+        invalidate_cached_action_results(app_name)
+
+    def request_action_result_cache_metrics(self):
+        self.results_queue.send(convert_cache_metrics_to_proto('Worker-0', get_action_result_cache_metrics()))
+        return 1
+
 
 class MockReceiveQueue(loadbalancer.Receiver):
 
     def __init__(self):
-        pass
+        self.cache_metrics = {}
 
     def send(self, packet):
         self.send_callback(packet)
@@ -1,6 +1,13 @@
+import threading
+
+from walkoff.appgateway.actionresultcache import ActionResultCache
 from walkoff.appgateway.appcache import AppCache
+from walkoff.appgateway.appdatacache import AppDataCache
 
 _cache = AppCache()
+_action_result_cache = ActionResultCache()
+_worker_app_data_caches = {}
+_worker_app_data_caches_lock = threading.Lock()
 
 
 def get_app(app_name):
@@ -144,3 +151,75 @@ def is_app_action_bound(app_name, action_name):
         UnknownAppAction: If the app does not have the action
     """
     return _cache.is_app_action_bound(app_name, action_name)
+
+
+def get_cached_action_result(app_name, action_name, device_id, arguments):
+    """Gets the result of a cacheable action from the global action result cache
+
+    Args:
+        app_name (str): Name of the app
+        action_name (str): Name of the action
+        device_id (int): ID of the device used to execute the action
+        arguments (dict): The validated arguments passed into the action
+
+    Returns:
+        (ActionResult) The cached result, or None if no unexpired result is cached
+    """
+    return _action_result_cache.get(app_name, action_name, device_id, arguments)
+
+
+def cache_action_result(app_name, action_name, device_id, arguments, result, ttl=None):
+    """Stores the result of a cacheable action in the global action result cache
+
+    Args:
+        app_name (str): Name of the app
+        action_name (str): Name of the action
+        device_id (int): ID of the device used to execute the action
+        arguments (dict): The validated arguments passed into the action
+        result (ActionResult): The result of the action
+        ttl (int|float, optional): Number of seconds the result is valid for. Defaults to None (no expiration)
+    """
+    _action_result_cache.put(app_name, action_name, device_id, arguments, result, ttl=ttl)
+
+
+def invalidate_cached_action_results(app_name=None):
+    """Removes results from the action result cache of this process. The controller sends invalidations to the
+        workers through MultiprocessedExecutor.invalidate_cached_action_results
+
+    Args:
+        app_name (str, optional): Name of the app whose results should be removed. Defaults to None, which removes
+            the results of all apps
+    """
+    _action_result_cache.invalidate(app_name)
+
+
+def get_action_result_cache_metrics():
+    """Gets the hit, miss, and size metrics of the action result cache of this process. The controller gets the
+        combined metrics of the workers through MultiprocessedExecutor.get_action_result_cache_metrics
+
+    Returns:
+        (dict) A dict of form {app_name: {'hits': int, 'misses': int, 'size': int}}
+    """
+    return _action_result_cache.get_metrics()
+
+
+def get_worker_app_data_cache(app_name):
+    """Gets the worker-scoped data cache for an app, which is shared by all executions of the app in this process
+
+    Args:
+        app_name (str): Name of the app
+
+    Returns:
+        (AppDataCache) The app's data cache
+    """
+    with _worker_app_data_caches_lock:
+        if app_name not in _worker_app_data_caches:
+            _worker_app_data_caches[app_name] = AppDataCache()
+        return _worker_app_data_caches[app_name]
+
+
+def clear_worker_app_data_caches():
+    """Clears the worker-scoped data caches of all apps
+    """
+    with _worker_app_data_caches_lock:
+        _worker_app_data_caches.clear()
@@ -0,0 +1,167 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from six.moves import cPickle as pickle
+
+import walkoff.config.config
+from walkoff.appgateway.actionresult import ActionResult
+
+_logger = logging.getLogger(__name__)
+
+CachedActionResult = namedtuple('CachedActionResult', ['data', 'status', 'expiration'])
+
+
+class ActionResultCache(object):
+    """A bounded, thread-safe LRU cache of the results of actions tagged as cacheable. Results are stored pickled, so
+        every hit returns a new copy which the caller is free to modify
+
+    Attributes:
+        max_size (int): The maximum number of results to hold. If None, the action_result_cache_size value in
+            walkoff.config.config is used
+
+    Args:
+        max_size (int, optional): The maximum number of results to hold. Defaults to None
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self._results = OrderedDict()
+        self._hits = {}
+        self._misses = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(app_name, action_name, device_id, arguments):
+        """Creates the key used to look up the result of an action
+
+        Args:
+            app_name (str): The name of the app
+            action_name (str): The name of the action
+            device_id (int): The ID of the device used to execute the action
+            arguments (dict): The validated arguments passed into the action
+
+        Returns:
+            (tuple): The key, or None if the arguments could not be canonicalized
+        """
+        try:
+            canonical_arguments = json.dumps(arguments, sort_keys=True, separators=(',', ':'))
+        except (TypeError, ValueError):
+            _logger.debug('Arguments for app {0} action {1} cannot be cached'.format(app_name, action_name))
+            return None
+        return app_name, action_name, device_id, canonical_arguments
+
+    def get(self, app_name, action_name, device_id, arguments):
+        """Gets a result from the cache
+
+        Args:
+            app_name (str): The name of the app
+            action_name (str): The name of the action
+            device_id (int): The ID of the device used to execute the action
+            arguments (dict): The validated arguments passed into the action
+
+        Returns:
+            (ActionResult): A copy of the cached ActionResult, or None if there is no unexpired result
+        """
+        key = self.make_key(app_name, action_name, device_id, arguments)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is not None and entry.expiration is not None and entry.expiration <= time.time():
+                self._results.pop(key)
+                entry = None
+            if entry is None:
+                self._misses[app_name] = self._misses.get(app_name, 0) + 1
+                return None
+            self._results.pop(key)
+            self._results[key] = entry
+            self._hits[app_name] = self._hits.get(app_name, 0) + 1
+        return ActionResult(pickle.loads(entry.data), entry.status)
+
+    def put(self, app_name, action_name, device_id, arguments, result, ttl=None):
+        """Puts a result into the cache, evicting the least recently used results if the cache is full
+
+        Args:
+            app_name (str): The name of the app
+            action_name (str): The name of the action
+            device_id (int): The ID of the device used to execute the action
+            arguments (dict): The validated arguments passed into the action
+            result (ActionResult): The result of the action
+            ttl (int|float, optional): The number of seconds the result is valid for. Defaults to None, meaning the
+                result only leaves the cache when it is evicted or invalidated
+        """
+        key = self.make_key(app_name, action_name, device_id, arguments)
+        if key is None:
+            return
+        try:
+            data = pickle.dumps(result.result, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            _logger.debug('Result of app {0} action {1} cannot be cached'.format(app_name, action_name))
+            return
+        expiration = time.time() + ttl if ttl is not None else None
+        max_size = self.max_size if self.max_size is not None else walkoff.config.config.action_result_cache_size
+        with self._lock:
+            self._results.pop(key, None)
+            self._results[key] = CachedActionResult(data, result.status, expiration)
+            while len(self._results) > max_size:
+                self._results.popitem(last=False)
+
+    def invalidate(self, app_name=None):
+        """Removes results from the cache
+
+        Args:
+            app_name (str, optional): The name of the app whose results should be removed. Defaults to None, meaning
+                all results are removed
+        """
+        with self._lock:
+            if app_name is None:
+                self._results.clear()
+            else:
+                for key in [key for key in self._results if key[0] == app_name]:
+                    self._results.pop(key)
+
+    def get_metrics(self):
+        """Gets the hit and miss counts and current number of cached results for each app
+
+        Returns:
+            (dict): A dict of form {app_name: {'hits': int, 'misses': int, 'size': int}}
+        """
+        with self._lock:
+            apps = set(self._hits) | set(self._misses) | {key[0] for key in self._results}
+            return {app: {'hits': self._hits.get(app, 0),
+                          'misses': self._misses.get(app, 0),
+                          'size': sum(1 for key in self._results if key[0] == app)}
+                    for app in apps}
+
+    def clear(self):
+        """Clears the cache and its metrics
+        """
+        with self._lock:
+            self._results.clear()
+            self._hits = {}
+            self._misses = {}
+
+    def __len__(self):
+        return len(self._results)
+
+
+def combine_action_result_cache_metrics(all_metrics):
+    """Combines the metrics of several action result caches, such as the caches of the workers, into one
+
+    Args:
+        all_metrics (list[dict]): The metrics of each cache, of form {app_name: {'hits': int, 'misses': int,
+            'size': int}}
+
+    Returns:
+        (dict): The summed metrics, of form {app_name: {'hits': int, 'misses': int, 'size': int}}
+    """
+    combined = {}
+    for metrics in all_metrics:
+        for app_name, app_metrics in metrics.items():
+            totals = combined.setdefault(app_name, {'hits': 0, 'misses': 0, 'size': 0})
+            for metric in totals:
+                totals[metric] += app_metrics.get(metric, 0)
+    return combined
@@ -0,0 +1,206 @@
+import logging
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict, namedtuple
+
+import walkoff.config.config
+
+_logger = logging.getLogger(__name__)
+
+CacheEntry = namedtuple('CacheEntry', ['value', 'size', 'expiration'])
+
+_missing = object()
+
+_opaque_types = (type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+
+def estimate_size(value, max_objects=None):
+    """Estimates the memory used by a value, including the contents of containers
+
+    Args:
+        value: The value to inspect
+        max_objects (int, optional): The maximum number of objects whose contents are inspected. Once that many have
+            been inspected, the objects still waiting to be inspected are counted by their own size, without their
+            contents. Defaults to None, meaning every object is inspected
+
+    Returns:
+        (int): The estimated number of bytes used by the value
+    """
+    seen = set()
+    size = 0
+    stack = [value]
+    while stack:
+        if max_objects is not None and len(seen) >= max_objects:
+            return size + sum(sys.getsizeof(obj) for obj in stack)
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__') and not isinstance(obj, _opaque_types):
+            stack.append(obj.__dict__)
+    return size
+
+
+class AppDataCache(object):
+    """A thread-safe key/value store which apps can use to share expensive state, such as authentication tokens or
+        parsed lookup tables, between actions. The store is bounded by both its number of entries and the estimated
+        memory used by its values. Least recently used entries are evicted first, and entries can expire after a TTL.
+
+    Attributes:
+        max_entries (int): The maximum number of entries. If None, the app_cache_max_entries value in
+            walkoff.config.config is used
+        max_memory (int): The maximum estimated number of bytes used by the values. If None, the app_cache_max_memory
+            value in walkoff.config.config is used
+
+    Args:
+        max_entries (int, optional): The maximum number of entries. Defaults to None
+        max_memory (int, optional): The maximum estimated number of bytes used by the values. Defaults to None
+    """
+
+    def __init__(self, max_entries=None, max_memory=None):
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self._entries = OrderedDict()
+        self._memory_usage = 0
+        self._lock = threading.RLock()
+
+    @property
+    def memory_usage(self):
+        """The estimated number of bytes used by the values in the cache"""
+        return self._memory_usage
+
+    def get(self, key, default=None):
+        """Gets a value from the cache
+
+        Args:
+            key (str): The key of the value
+            default (optional): The value to return if the key is not in the cache or has expired. Defaults to None
+
+        Returns:
+            The cached value, or the default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if self.__is_expired(entry):
+                self.__remove(key)
+                return default
+            self._entries.pop(key)
+            self._entries[key] = entry
+            return entry.value
+
+    def set(self, key, value, ttl=None):
+        """Puts a value into the cache, evicting the least recently used values if the cache is over its bounds
+
+        Args:
+            key (str): The key of the value
+            value: The value to store
+            ttl (int|float, optional): The number of seconds the value is valid for. Defaults to None, meaning the
+                value does not expire
+
+        Returns:
+            (bool): True if the value was stored, False if the value alone is larger than the memory bound
+        """
+        size = estimate_size(value)
+        max_memory = self.__get_max_memory()
+        if size > max_memory:
+            _logger.warning('Value for key {0} uses ~{1} bytes which exceeds the cache bound of {2} bytes. '
+                            'Not caching'.format(key, size, max_memory))
+            return False
+        expiration = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self.__remove(key)
+            self._entries[key] = CacheEntry(value, size, expiration)
+            self._memory_usage += size
+            self.__evict(max_memory)
+        return True
+
+    def get_or_set(self, key, factory, ttl=None):
+        """Gets a value from the cache, computing and storing it if it is not present
+
+        Args:
+            key (str): The key of the value
+            factory (func): A function with no arguments which computes the value
+            ttl (int|float, optional): The number of seconds a computed value is valid for. Defaults to None
+
+        Returns:
+            The cached or computed value
+        """
+        value = self.get(key, _missing)
+        if value is _missing:
+            value = factory()
+            self.set(key, value, ttl=ttl)
+        return value
+
+    def delete(self, key):
+        """Removes a value from the cache
+
+        Args:
+            key (str): The key of the value
+
+        Returns:
+            (bool): True if the key was in the cache, False otherwise
+        """
+        with self._lock:
+            if key in self._entries:
+                self.__remove(key)
+                return True
+            return False
+
+    def clear(self):
+        """Removes all values from the cache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._memory_usage = 0
+
+    def remove_expired(self):
+        """Removes all expired values from the cache
+        """
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if self.__is_expired(entry)]:
+                self.__remove(key)
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('_lock')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def __is_expired(entry):
+        return entry.expiration is not None and entry.expiration <= time.time()
+
+    def __remove(self, key):
+        entry = self._entries.pop(key)
+        self._memory_usage -= entry.size
+
+    def __evict(self, max_memory):
+        max_entries = self.max_entries if self.max_entries is not None else walkoff.config.config.app_cache_max_entries
+        if len(self._entries) > max_entries or self._memory_usage > max_memory:
+            self.remove_expired()
+        while self._entries and (len(self._entries) > max_entries or self._memory_usage > max_memory):
+            key, entry = self._entries.popitem(last=False)
+            self._memory_usage -= entry.size
+
+    def __get_max_memory(self):
+        return self.max_memory if self.max_memory is not None else walkoff.config.config.app_cache_max_memory
@@ -31,22 +31,34 @@ def tag(func, tag_name):
     setattr(func, tag_name, True)
 
 
-def action(func):
-    """Decorator used to tag a method or function as an action
+def action(func=None, cacheable=False, ttl=None):
+    """Decorator used to tag a method or function as an action. Can be used as either @action or
+        @action(cacheable=True, ttl=300)
 
     Args:
-        func (func): Function to tag
+        func (func, optional): Function to tag
+        cacheable (bool, optional): Is the action pure, so its results can be cached and reused for identical
+            arguments and devices? Defaults to False.
+        ttl (int|float, optional): Number of seconds a cached result is valid for. Defaults to None, meaning cached
+            results only expire when they are evicted or invalidated.
     Returns:
         (func) Tagged function
     """
 
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        return format_result(func(*args, **kwargs))
+    def decorator(func_):
+        @wraps(func_)
+        def wrapper(*args, **kwargs):
+            return format_result(func_(*args, **kwargs))
+
+        WalkoffTag.action.tag(wrapper)
+        wrapper.__arg_names = get_function_arg_names(func_)
+        wrapper.cacheable = cacheable
+        wrapper.cache_ttl = ttl
+        return wrapper
 
-    WalkoffTag.action.tag(wrapper)
-    wrapper.__arg_names = get_function_arg_names(func)
-    return wrapper
+    if func is None:
+        return decorator
+    return decorator(func)
 
 
 def condition(func):
@@ -61,13 +73,24 @@ def condition(func):
     return func
 
 
-def transform(func):
-    """Decorator used to tag a method or function as a transform
+def transform(func=None, mutates=False):
+    """Decorator used to tag a method or function as a transform. Can be used as either @transform or
+        @transform(mutates=True)
 
     Args:
-        func (func): Function to tag
+        func (func, optional): Function to tag
+        mutates (bool, optional): Does the transform modify its input in place? Transforms which mutate their input
+            are given a copy of it so that the original can be returned if the transform fails. Defaults to False.
     Returns:
         (func) Tagged function
     """
-    WalkoffTag.transform.tag(func)
-    return func
+
+    def decorator(func_):
+        WalkoffTag.transform.tag(func_)
+        setattr(func_, 'mutates', mutates)
+        return func_
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
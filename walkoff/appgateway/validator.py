@@ -404,6 +404,69 @@ def validate_parameters(api, arguments, message_prefix, accumulator=None):
     return converted
 
 
+def compile_parameters(api, arguments, message_prefix, runtime_params=()):
+    """Validates the static Arguments of an api ahead of time so that only references and runtime values need to be
+        validated on each execution
+
+    Args:
+        api (list[dict]): The api of the parameters
+        arguments (list[Argument]): The Arguments to validate. Arguments which are references are validated when the
+            returned function is called.
+        message_prefix (str): The prefix to use in error messages
+        runtime_params (iterable(str), optional): The names of the parameters whose values are only known at call time.
+            Defaults to no parameters.
+
+    Returns:
+        (func): A function with signature (runtime_values, accumulator) which returns the converted parameters or
+            raises an InvalidArgument. Static values which are mutable are copied on each call, so that an action
+            which modifies its arguments does not change them for later calls
+    """
+    runtime_params = tuple(runtime_params)
+    api_dict = {param['name']: param for param in api}
+    static_api = [param for param in api if param['name'] not in runtime_params]
+    static_arguments = [argument for argument in arguments if argument.name not in runtime_params]
+    try:
+        static_converted = validate_parameters(static_api, static_arguments, message_prefix)
+        static_error = None
+    except InvalidArgument as e:
+        static_converted = {}
+        static_error = e
+    mutable_static = [name for name, value in static_converted.items() if isinstance(value, (dict, list, set))]
+    references = [(argument, api_dict[argument.name]) for argument in static_arguments
+                  if argument.is_ref() and argument.name in api_dict]
+    runtime_apis = [(param_name, api_dict[param_name]) for param_name in runtime_params]
+
+    def validate(runtime_values, accumulator=None):
+        if static_error is not None:
+            raise static_error
+        converted = dict(static_converted)
+        for name in mutable_static:
+            converted[name] = deepcopy(converted[name])
+        errors = {}
+        if accumulator:
+            for argument, param_api in references:
+                try:
+                    converted[argument.name] = validate_parameter(
+                        argument.get_value(accumulator), param_api, message_prefix)
+                except InvalidArgument as e:
+                    errors[argument.name] = e.message
+        for param_name, param_api in runtime_apis:
+            value = runtime_values.get(param_name)
+            if value is None:
+                message = 'Input {} must have either value or reference. Input has neither'.format(param_name)
+                logger.error(message)
+                raise InvalidArgument(message)
+            try:
+                converted[param_name] = validate_parameter(value, param_api, message_prefix)
+            except InvalidArgument as e:
+                errors[param_name] = e.message
+        if errors:
+            raise InvalidArgument('Invalid arguments', errors=errors)
+        return converted
+
+    return validate
+
+
 def get_argument_by_name(arguments, name):
     for argument in arguments:
         if argument.name == name:
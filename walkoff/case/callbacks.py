@@ -1,14 +1,12 @@
-import datetime
 import json
 from six import string_types
 
 import walkoff.case.subscription as case_subscription
-from walkoff.case import database
-from walkoff.case.database import Event
+from walkoff.case.eventsink import case_event_sink
 
 
 def add_entry_to_case(sender, data, event_type, entry_message, message_name):
-    """Adds an entry to all appropriate case logs
+    """Queues an entry to be added to all appropriate case logs
 
     Args:
         sender (Object|dict): Object that initiated the event
@@ -17,6 +15,8 @@ def add_entry_to_case(sender, data, event_type, entry_message, message_name):
         entry_message (str): The message for the event entry
         message_name (str): The name of the message
     """
+    if not case_subscription.has_subscriptions():
+        return
     if isinstance(sender, dict):
         originator = sender['id']
     else:
@@ -30,10 +30,4 @@ def add_entry_to_case(sender, data, event_type, entry_message, message_name):
                 data = json.dumps(data)
             except TypeError:
                 data = str(data)
-        event = Event(type=event_type,
-                      timestamp=datetime.datetime.utcnow(),
-                      originator=originator,
-                      message=entry_message,
-                      data=data)
-        database.case_db.add_event(event, cases_to_add)
-
+        case_event_sink.add(event_type, originator, entry_message, data, cases_to_add)
@@ -1,20 +1,27 @@
+import base64
 import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, create_engine
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Float, Boolean, select, text, column, null, \
+    or_, func, table, union_all
+from sqlalchemy.event import listens_for
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker, scoped_session
 
 import walkoff.config.config
 import walkoff.config.paths
-from walkoff.helpers import format_db_path
+from walkoff.helpers import create_database_engine
 from walkoff.helpers import utc_as_rfc_datetime
 
 logger = logging.getLogger(__name__)
 
 Case_Base = declarative_base()
 
+current_partition = 'event'
+"""The name of the current partition of events, which holds the events which are being written"""
+
 
 class _CaseEventLink(Case_Base):
     __tablename__ = 'case_event'
@@ -70,24 +77,52 @@ class Event(Case_Base):
         Returns:
             The JSON representation of an Event object.
         """
-        output = {'id': self.id,
-                  'timestamp': utc_as_rfc_datetime(self.timestamp),
-                  'type': self.type,
-                  'originator': str(self.originator),
-                  'message': self.message if self.message is not None else '',
-                  'note': self.note if self.note is not None else ''}
-        if self.data is not None:
-            try:
-                output['data'] = json.loads(self.data)
-            except (ValueError, TypeError):
-                output['data'] = str(self.data)
-        else:
-            output['data'] = ''
+        output = event_as_json(self)
         if with_cases:
             output['cases'] = [case.as_json(with_events=False) for case in self.cases]
         return output
 
 
+def event_as_json(event):
+    """Gets the JSON representation of an event, without its cases
+
+    Args:
+        event (Event|RowProxy): The event, or a row of the event table
+
+    Returns:
+        The JSON representation of the event
+    """
+    output = {'id': event.id,
+              'timestamp': utc_as_rfc_datetime(event.timestamp),
+              'type': event.type,
+              'originator': str(event.originator),
+              'message': event.message if event.message is not None else '',
+              'note': event.note if event.note is not None else ''}
+    if event.data is not None:
+        try:
+            output['data'] = json.loads(event.data)
+        except (ValueError, TypeError):
+            output['data'] = str(event.data)
+    else:
+        output['data'] = ''
+    return output
+
+
+class EventPartition(Case_Base):
+    """ORM for a partition of the events in the events database. The current partition holds the events which are
+        being written, in the event and case_event tables. When its period ends, its tables are renamed, and it becomes
+        a sealed partition whose tables are dropped as a whole once its events are older than the retention age
+    """
+    __tablename__ = 'event_partition'
+    name = Column(String, primary_key=True)
+    period = Column(DateTime)
+    start = Column(DateTime)
+    end = Column(DateTime)
+    first_id = Column(Integer)
+    last_id = Column(Integer)
+    indexed = Column(Boolean, default=False)
+
+
 class CaseDatabase(object):
     """Wrapper for the SQLAlchemy Case database object
     """
@@ -95,8 +130,8 @@ class CaseDatabase(object):
     __instance = None
 
     def __init__(self):
-        self.engine = create_engine(
-            format_db_path(walkoff.config.config.case_db_type, walkoff.config.paths.case_db_path))
+        self.engine = create_database_engine(walkoff.config.config.case_db_type, walkoff.config.paths.case_db_path,
+                                             profile=walkoff.config.config.case_db_profile)
         self.connection = self.engine.connect()
         self.transaction = self.connection.begin()
 
@@ -106,6 +141,9 @@ class CaseDatabase(object):
 
         Case_Base.metadata.bind = self.engine
         Case_Base.metadata.create_all(self.engine)
+        if search_index_enabled(self.engine):
+            with self.engine.begin() as connection:
+                create_search_index(connection)
 
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
@@ -161,10 +199,9 @@ class CaseDatabase(object):
             note (str): The event's note
         """
         if event_id:
-            event = self.session.query(Event).filter(Event.id == event_id).first()
-            if event:
-                event.note = note
-                self.session.commit()
+            events, _ = _partition_tables(self.__find_partition(event_id))
+            self.session.execute(events.update().where(events.c.id == event_id).values(note=note))
+            self.session.commit()
 
     def add_event(self, event, cases):
         """ Adds an event to some cases
@@ -173,7 +210,11 @@ class CaseDatabase(object):
             event (cls): A core.case.database.Event object to add to the cases
             cases (list[str]): The names of the cases to add the event to
         """
+        with self.engine.begin() as connection:
+            maintain_partitions(connection)
         event.originator = str(event.originator)
+        if event.id is None:
+            event.id = next_event_id(self.session)
         existing_cases = case_db.session.query(Case).all()
         existing_case_names = [case.name for case in existing_cases]
         for case in cases:
@@ -194,13 +235,25 @@ class CaseDatabase(object):
         """
         return [case.as_json(with_events=False) for case in self.session.query(Case).all()]
 
+    def get_event(self, event_id):
+        """Gets an event from the partition which holds it
+
+        Args:
+            event_id (int): The ID of the event
+
+        Returns:
+            (RowProxy): The row of the event, or None if it does not exist
+        """
+        events, _ = _partition_tables(self.__find_partition(event_id))
+        return self.session.execute(select([events]).where(events.c.id == event_id)).first()
+
     def event_as_json(self, event_id):
         """Gets the JSON representation of an event in the case database.
         
         Returns:
             The JSON representation of an Event object.
         """
-        return self.session.query(Event).filter(Event.id == event_id).first().as_json()
+        return event_as_json(self.get_event(event_id))
 
     def case_events_as_json(self, case_id):
         """Gets the JSON representation of all the events in the case database.
@@ -212,9 +265,414 @@ class CaseDatabase(object):
         if not event_id:
             raise Exception
 
-        result = [event.as_json()
-                  for event in event_id.events]
-        return result
+        return list(self.stream_case_events(case_id))
+
+    def case_events_page(self, case_id, limit, cursor=None):
+        """Gets a page of the events of a case, ordered by their IDs
+
+        Args:
+            case_id (int): The ID of the case
+            limit (int): The maximum number of events to return
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None
+
+        Returns:
+            (list[dict], str): The JSON representations of the events, and the cursor of the next page, which is None
+                if this is the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_event_cursor(cursor) if cursor is not None else None
+        page = []
+        for partition in self.__partitions(after=after):
+            query = _case_events_query(partition, case_id, after=after)
+            page.extend(self.session.execute(query.limit(limit + 1 - len(page))).fetchall())
+            if len(page) > limit:
+                break
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_event_cursor(page[-1].id)
+        return [event_as_json(event) for event in page], next_cursor
+
+    def search_events(self, query, limit, cursor=None, event_types=None, since=None, until=None, case_id=None):
+        """Searches the messages and data of events. If the search index is enabled, the query uses the SQLite FTS5
+            query syntax, and the hits are ranked by relevance. Otherwise, the hits are the events whose message or
+            data contain the query, newest first
+
+        Args:
+            query (str): The search query
+            limit (int): The maximum number of hits to return
+            cursor (str, optional): The cursor returned with the previous page. Defaults to None
+            event_types (list[str], optional): Only return events of these types. Defaults to None
+            since (datetime, optional): Only return events which happened at or after this time. Defaults to None
+            until (datetime, optional): Only return events which happened before this time. Defaults to None
+            case_id (int, optional): Only return events of this case. Defaults to None
+
+        Returns:
+            (list[dict], str): The JSON representations of the events, each with its relevance score, and the cursor
+                of the next page, which is None if this is the last page
+
+        Raises:
+            ValueError: If the query or cursor is malformed
+        """
+        offset = decode_search_cursor(cursor) if cursor is not None else 0
+        indexed = search_index_enabled(self.engine)
+        branches = []
+        for partition in self.__partitions(indexed=indexed):
+            events, links = _partition_tables(partition)
+            if indexed:
+                hits = text('SELECT rowid, rank FROM {0} WHERE {0} MATCH :query'.format(_search_name(partition))). \
+                    bindparams(query=query). \
+                    columns(column('rowid', Integer), column('rank', Float)). \
+                    alias()
+                branch = select([events, (-hits.c.rank).label('score')]). \
+                    select_from(events.join(hits, hits.c.rowid == events.c.id))
+            else:
+                branch = select([events, null().label('score')]). \
+                    where(or_(events.c.message.contains(query, autoescape=True),
+                              events.c.data.contains(query, autoescape=True)))
+            if event_types:
+                branch = branch.where(events.c.type.in_(event_types))
+            if since is not None:
+                branch = branch.where(events.c.timestamp >= since)
+            if until is not None:
+                branch = branch.where(events.c.timestamp < until)
+            if case_id is not None:
+                branch = branch.where(events.c.id.in_(select([links.c.event_id]).where(links.c.case_id == case_id)))
+            branches.append(branch)
+        results = union_all(*branches).alias('results')
+        order = (results.c.score.desc(), results.c.id) if indexed else (results.c.id.desc(),)
+        try:
+            page = self.session.execute(
+                select([results]).order_by(*order).offset(offset).limit(limit + 1)).fetchall()
+        except OperationalError:
+            self.session.rollback()
+            raise ValueError('Invalid search query {}'.format(query))
+        next_cursor = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_cursor = encode_search_cursor(offset + limit)
+        return [dict(event_as_json(event), score=event.score) for event in page], next_cursor
+
+    def stream_case_events(self, case_id, batch_size=1000):
+        """Iterates over the events of a case, ordered by their IDs, without loading all of them into memory. The
+            events are read from a server-side cursor on a connection which is held until the iteration ends
+
+        Args:
+            case_id (int): The ID of the case
+            batch_size (int, optional): The number of rows fetched from the cursor at a time. Defaults to 1000
+
+        Returns:
+            (iterator[dict]): The JSON representations of the events
+        """
+        connection = self.engine.connect().execution_options(stream_results=True)
+        try:
+            for partition in self.__partitions(bind=connection):
+                result = connection.execute(_case_events_query(partition, case_id))
+                while True:
+                    rows = result.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield event_as_json(row)
+        finally:
+            connection.close()
+
+    def __partitions(self, bind=None, after=None, indexed=False):
+        query = select([EventPartition.name]).where(EventPartition.name != current_partition)
+        if after is not None:
+            query = query.where(EventPartition.last_id > after)
+        if indexed:
+            query = query.where(EventPartition.indexed)
+        sealed = (bind if bind is not None else self.session).execute(query.order_by(EventPartition.first_id))
+        return [row.name for row in sealed] + [current_partition]
+
+    def __find_partition(self, event_id):
+        partition = self.session.execute(
+            select([EventPartition.name]).
+            where(EventPartition.name != current_partition).
+            where(EventPartition.first_id <= event_id).
+            where(EventPartition.last_id >= event_id)).first()
+        return partition.name if partition is not None else current_partition
+
+
+def encode_event_cursor(event_id):
+    """Encodes the position of an event as an opaque cursor
+
+    Args:
+        event_id (int): The ID of the last event of a page
+
+    Returns:
+        (str): The cursor
+    """
+    return _encode_cursor(event_id)
+
+
+def decode_event_cursor(cursor):
+    """Decodes a cursor created by encode_event_cursor
+
+    Args:
+        cursor (str): The cursor
+
+    Returns:
+        (int): The ID of the last event of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    return _decode_cursor(cursor)
+
+
+def encode_search_cursor(offset):
+    """Encodes the position of a page of search hits as an opaque cursor
+
+    Args:
+        offset (int): The number of hits before the next page
+
+    Returns:
+        (str): The cursor
+    """
+    return _encode_cursor(offset)
+
+
+def decode_search_cursor(cursor):
+    """Decodes a cursor created by encode_search_cursor
+
+    Args:
+        cursor (str): The cursor
+
+    Returns:
+        (int): The number of hits before the page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    return _decode_cursor(cursor)
+
+
+def _encode_cursor(position):
+    return base64.urlsafe_b64encode(str(position).encode('utf-8')).decode('utf-8')
+
+
+def _decode_cursor(cursor):
+    try:
+        position = int(base64.urlsafe_b64decode(str(cursor)).decode('utf-8'))
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Invalid cursor {}'.format(cursor))
+    if position < 0:
+        raise ValueError('Invalid cursor {}'.format(cursor))
+    return position
+
+
+_fts5_unavailable = False
+
+
+def search_index_enabled(bind):
+    """Checks if the full-text search index of events is used. It is only available for SQLite case databases
+
+    Args:
+        bind (Engine|Connection): The engine or connection of the case database
+
+    Returns:
+        (bool): True if the index is used
+    """
+    return walkoff.config.config.case_event_search_index and bind.dialect.name == 'sqlite' and not _fts5_unavailable
+
+
+def create_search_index(connection, partition=current_partition):
+    """Creates the SQLite FTS5 index of the messages and data of the events of a partition, and the triggers which
+        keep it up to date as events are inserted and deleted, if they do not exist. If the index is created for
+        existing events, they are indexed
+
+    Args:
+        connection (Connection): The connection to the case database
+        partition (str, optional): The name of the partition. Defaults to the current partition
+    """
+    global _fts5_unavailable
+    search = _search_name(partition)
+    if connection.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name=:name"),
+                          name=search).first():
+        return
+    try:
+        connection.execute(text("CREATE VIRTUAL TABLE {0} USING fts5(message, data, content='{1}', "
+                                "content_rowid='id')".format(search, partition)))
+    except OperationalError:
+        _fts5_unavailable = True
+        logger.warning('SQLite does not support FTS5. Case event searches will not use a search index')
+        return
+    connection.execute(text('CREATE TRIGGER IF NOT EXISTS {0}_insert AFTER INSERT ON {1} BEGIN '
+                            'INSERT INTO {0}(rowid, message, data) VALUES (new.id, new.message, new.data); '
+                            'END'.format(search, partition)))
+    connection.execute(text("CREATE TRIGGER IF NOT EXISTS {0}_delete AFTER DELETE ON {1} BEGIN "
+                            "INSERT INTO {0}({0}, rowid, message, data) "
+                            "VALUES ('delete', old.id, old.message, old.data); END".format(search, partition)))
+    connection.execute(text("INSERT INTO {0}({0}) VALUES ('rebuild')".format(search)))
+
+
+def _drop_search_index(connection, partition):
+    search = _search_name(partition)
+    connection.execute(text('DROP TRIGGER IF EXISTS {}_insert'.format(search)))
+    connection.execute(text('DROP TRIGGER IF EXISTS {}_delete'.format(search)))
+    connection.execute(text('DROP TABLE IF EXISTS {}'.format(search)))
+
+
+@listens_for(Event.__table__, 'after_create')
+def __create_search_index(target, connection, **kwargs):
+    if search_index_enabled(connection):
+        create_search_index(connection)
+
+
+@listens_for(Event.__table__, 'before_drop')
+def __drop_search_index(target, connection, **kwargs):
+    if connection.dialect.name == 'sqlite':
+        _drop_search_index(connection, current_partition)
+
+
+valid_partition_periods = ('day', 'week')
+
+
+def partition_period_start(timestamp, period):
+    """Gets the start of the partition period which contains a time
+
+    Args:
+        timestamp (datetime): The time
+        period (str): The partition period, either 'day' or 'week'
+
+    Returns:
+        (datetime): The start of the day, or of the week starting on Monday, which contains the time
+
+    Raises:
+        ValueError: If the period is invalid
+    """
+    if period not in valid_partition_periods:
+        raise ValueError('Invalid case event partition period {}'.format(period))
+    start = datetime(timestamp.year, timestamp.month, timestamp.day)
+    if period == 'week':
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+def maintain_partitions(connection, now=None):
+    """Seals the current partition of events if its period has ended, drops the sealed partitions whose newest events
+        are older than the case_event_retention_age value in walkoff.config.config, and indexes the sealed partitions
+        which are not in the search index. Events are only partitioned if the case_event_partition_period value in
+        walkoff.config.config is set. This must be called in the transaction which writes the events
+
+    Args:
+        connection (Connection): The connection to the case database
+        now (datetime, optional): The current UTC time. Defaults to the current time
+    """
+    period = walkoff.config.config.case_event_partition_period
+    max_age = walkoff.config.config.case_event_retention_age
+    if period is None and max_age is None:
+        return
+    now = now if now is not None else datetime.utcnow()
+    partitions = EventPartition.__table__
+    if period is not None:
+        current_period = connection.execute(
+            select([partitions.c.period]).where(partitions.c.name == current_partition)).scalar()
+        if current_period is None:
+            oldest = connection.execute(select([func.min(Event.timestamp)])).scalar()
+            current_period = partition_period_start(oldest if oldest is not None else now, period)
+            connection.execute(partitions.insert(), {'name': current_partition, 'period': current_period})
+        next_period = partition_period_start(now, period)
+        if current_period < next_period:
+            _seal_partition(connection, current_period, next_period)
+    if max_age is not None:
+        expired = connection.execute(
+            select([partitions.c.name]).
+            where(partitions.c.name != current_partition).
+            where(partitions.c.end < now - timedelta(seconds=max_age))).fetchall()
+        for partition in expired:
+            drop_partition(connection, partition.name)
+    if search_index_enabled(connection):
+        unindexed = connection.execute(
+            select([partitions.c.name]).
+            where(partitions.c.name != current_partition).
+            where(partitions.c.indexed.is_(False))).fetchall()
+        for partition in unindexed:
+            create_search_index(connection, partition.name)
+            connection.execute(partitions.update().where(partitions.c.name == partition.name).values(indexed=True))
+
+
+def drop_partition(connection, name):
+    """Drops the tables of a sealed partition of events
+
+    Args:
+        connection (Connection): The connection to the case database
+        name (str): The name of the partition
+    """
+    _drop_search_index(connection, name)
+    connection.execute(text('DROP TABLE IF EXISTS {}'.format(_link_name(name))))
+    connection.execute(text('DROP TABLE IF EXISTS {}'.format(name)))
+    connection.execute(EventPartition.__table__.delete().where(EventPartition.name == name))
+    logger.info('Dropped case event partition {}'.format(name))
+
+
+def next_event_id(bind):
+    """Gets the ID of the next event written to the case database. Event IDs increase across partitions
+
+    Args:
+        bind (Connection|Session): The connection to or session of the case database
+
+    Returns:
+        (int): The ID
+    """
+    last_id = max(bind.execute(select([func.max(Event.id)])).scalar() or 0,
+                  bind.execute(select([func.max(EventPartition.last_id)])).scalar() or 0)
+    return last_id + 1
+
+
+def _seal_partition(connection, period, next_period):
+    partitions = EventPartition.__table__
+    bounds = connection.execute(select([func.min(Event.timestamp), func.max(Event.timestamp),
+                                        func.min(Event.id), func.max(Event.id)])).first()
+    if bounds[2] is not None:
+        name = 'event_p{}'.format(period.strftime('%Y%m%d'))
+        _drop_search_index(connection, current_partition)
+        connection.execute(text('ALTER TABLE {0} RENAME TO {1}'.format(current_partition, name)))
+        connection.execute(text('ALTER TABLE {0} RENAME TO {1}'.format(_link_name(current_partition),
+                                                                         _link_name(name))))
+        Event.__table__.create(connection)
+        _CaseEventLink.__table__.create(connection)
+        connection.execute(partitions.insert(), {'name': name, 'period': period, 'start': bounds[0],
+                                                 'end': bounds[1], 'first_id': bounds[2], 'last_id': bounds[3],
+                                                 'indexed': False})
+        logger.info('Sealed case event partition {}'.format(name))
+    connection.execute(partitions.update().where(partitions.c.name == current_partition).values(period=next_period))
+
+
+def _link_name(partition):
+    return 'case_' + partition
+
+
+def _search_name(partition):
+    return partition.replace('event', 'event_search', 1)
+
+
+def _partition_tables(partition):
+    events = table(partition, *(column(event_column.name, event_column.type)
+                                for event_column in Event.__table__.columns))
+    links = table(_link_name(partition), *(column(link_column.name, link_column.type)
+                                           for link_column in _CaseEventLink.__table__.columns))
+    return events, links
+
+
+def _case_events_query(partition, case_id, after=None):
+    events, links = _partition_tables(partition)
+    query = select([events]). \
+        select_from(events.join(links, links.c.event_id == events.c.id)). \
+        where(links.c.case_id == case_id)
+    if after is not None:
+        query = query.where(events.c.id > after)
+    return query.order_by(events.c.id)
+
+
+@listens_for(EventPartition.__table__, 'before_drop')
+def __drop_partitions(target, connection, **kwargs):
+    for partition in connection.execute(select([target.c.name]).where(target.c.name != current_partition)).fetchall():
+        drop_partition(connection, partition.name)
 
 
 def get_case_db(_singleton=None):
@@ -0,0 +1,198 @@
+import logging
+import threading
+import time
+from datetime import datetime
+
+from six.moves import queue
+from sqlalchemy import select
+
+import walkoff.config.config
+from walkoff.case import database
+from walkoff.case.database import Case, Event, _CaseEventLink, maintain_partitions, next_event_id
+
+logger = logging.getLogger(__name__)
+
+valid_policies = ('drop', 'block')
+
+
+class CaseEventSink(object):
+    """Queues case events in memory and writes them to the case database from a background thread, so that logging an
+        event does not wait for the database. The thread writes the events which were queued while it wrote the
+        previous batch in a single transaction, inserting the events and their links to cases with one executemany
+        statement each. The sink must be the only writer of events to the case database, because it assigns the IDs of
+        the events it inserts.
+
+    Attributes:
+        queue_size (int): The maximum number of queued events. If None, the case_event_queue_size value in
+            walkoff.config.config is used
+        batch_size (int): The maximum number of events written in a transaction. If None, the case_event_batch_size
+            value in walkoff.config.config is used
+        policy (str): What to do with an event when the queue is full, either 'drop' or 'block'. If None, the
+            case_event_queue_policy value in walkoff.config.config is used
+        written (int): The number of events which have been written
+        dropped (int): The number of events which have been dropped because the queue was full
+        failed (int): The number of events which could not be written
+        last_lag (float): The number of seconds the oldest event of the last batch waited in the queue
+        max_lag (float): The largest number of seconds an event has waited in the queue
+
+    Args:
+        queue_size (int, optional): The maximum number of queued events. Defaults to None
+        batch_size (int, optional): The maximum number of events written in a transaction. Defaults to None
+        policy (str, optional): What to do with an event when the queue is full. Defaults to None
+    """
+
+    def __init__(self, queue_size=None, batch_size=None, policy=None):
+        if policy is not None and policy not in valid_policies:
+            raise ValueError('Invalid case event queue policy {}'.format(policy))
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.policy = policy
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_lag = 0.
+        self.max_lag = 0.
+        self._queue = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._warned = False
+
+    @property
+    def pending(self):
+        """The number of events which are queued"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def add(self, event_type, originator, message, data, cases):
+        """Queues an event to be added to some cases
+
+        Args:
+            event_type (str): The type of the event
+            originator (str): The ID of the element from which the event originated
+            message (str): The message of the event
+            data (str): The JSON-encoded data of the event
+            cases (list[str]): The names of the cases to add the event to
+
+        Returns:
+            (bool): True if the event was queued. False if it was dropped because the queue was full
+        """
+        self.__start()
+        entry = (time.time(), {'timestamp': datetime.utcnow(),
+                               'type': event_type,
+                               'originator': str(originator),
+                               'message': message,
+                               'data': data}, cases)
+        if self.__get_policy() == 'block':
+            self._queue.put(entry)
+            return True
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            if not self._warned:
+                self._warned = True
+                logger.warning('Case event queue is full. Dropping case events until it has room')
+            return False
+
+    def flush(self):
+        """Waits for the background thread to write all of the queued events to the case database. Readers which must
+            see the events logged before they read, rather than eventually, call this first
+        """
+        if self._queue is not None:
+            self._queue.join()
+
+    def metrics(self):
+        """Gets the metrics of the sink
+
+        Returns:
+            (dict): The numbers of pending, written, dropped, and failed events, the number of seconds the oldest
+                pending event has waited, and the last and largest numbers of seconds an event waited to be written
+        """
+        lag = 0.
+        if self._queue is not None:
+            try:
+                lag = max(time.time() - self._queue.queue[0][0], 0.)
+            except IndexError:
+                pass
+        return {'pending': self.pending,
+                'written': self.written,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'lag': lag,
+                'last_lag': self.last_lag,
+                'max_lag': self.max_lag}
+
+    def __start(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._queue = queue.Queue(maxsize=self.__get_queue_size())
+                    self._thread = threading.Thread(target=self.__run)
+                    self._thread.daemon = True
+                    self._thread.start()
+
+    def __run(self):
+        while True:
+            try:
+                self.__write(self.__take())
+            except Exception:
+                logger.exception('Unexpected error in the case event sink')
+
+    def __take(self):
+        batch = [self._queue.get()]
+        batch_size = self.__get_batch_size()
+        try:
+            while len(batch) < batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def __write(self, batch):
+        try:
+            lag = time.time() - batch[0][0]
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            try:
+                _insert(batch)
+            except Exception:
+                self.failed += len(batch)
+                logger.exception('Could not write {} case events'.format(len(batch)))
+            else:
+                self.written += len(batch)
+                self._warned = False
+                logger.debug('Wrote {} case events'.format(len(batch)))
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def __get_queue_size(self):
+        return self.queue_size if self.queue_size is not None else walkoff.config.config.case_event_queue_size
+
+    def __get_batch_size(self):
+        return self.batch_size if self.batch_size is not None else walkoff.config.config.case_event_batch_size
+
+    def __get_policy(self):
+        return self.policy if self.policy is not None else walkoff.config.config.case_event_queue_policy
+
+
+def _insert(batch):
+    case_names = {case_name for _, _, cases in batch for case_name in cases}
+    with database.case_db.engine.begin() as connection:
+        maintain_partitions(connection)
+        case_ids = dict(connection.execute(select([Case.name, Case.id]).where(Case.name.in_(case_names))).fetchall())
+        next_id = next_event_id(connection)
+        events, links = [], []
+        for event_id, (_, event, cases) in enumerate(batch, start=next_id):
+            events.append(dict(event, id=event_id))
+            for case_name in cases:
+                if case_name in case_ids:
+                    links.append({'case_id': case_ids[case_name], 'event_id': event_id})
+                else:
+                    logger.error('Case {} is not tracked'.format(case_name))
+        connection.execute(Event.__table__.insert(), events)
+        if links:
+            connection.execute(_CaseEventLink.__table__.insert(), links)
+
+
+case_event_sink = CaseEventSink()
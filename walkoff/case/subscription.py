@@ -4,6 +4,9 @@ from walkoff.case import database
 
 subscriptions = {}
 
+_subscribed_cases = {}
+_indexed_subscriptions = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +38,7 @@ def add_cases(cases):
     for case_name, case in cases.items():
         if case_name not in subscriptions:
             subscriptions[case_name] = case
+            _index_case(case_name, case)
             valid_cases.append(case_name)
     database.case_db.add_cases(valid_cases)
 
@@ -49,7 +53,7 @@ def delete_cases(cases):
     valid_cases = []
     for case_name in cases:
         if case_name in subscriptions:
-            del subscriptions[case_name]
+            _unindex_case(case_name, subscriptions.pop(case_name))
             valid_cases.append(case_name)
     database.case_db.delete_cases(valid_cases)
 
@@ -63,7 +67,10 @@ def rename_case(old_case_name, new_case_name):
     """
     global subscriptions
     if old_case_name in subscriptions and new_case_name not in subscriptions:
-        subscriptions[new_case_name] = subscriptions.pop(old_case_name)
+        case = subscriptions.pop(old_case_name)
+        _unindex_case(old_case_name, case)
+        subscriptions[new_case_name] = case
+        _index_case(new_case_name, case)
         database.case_db.rename_case(old_case_name, new_case_name)
         return True
     else:
@@ -86,9 +93,20 @@ def get_cases_subscribed(originator, message_name):
         originator (str): The id of the element from which the event originated
         message_name (str): The name of the message to check
     """
-    global subscriptions
-    return [case for case, case_subscriptions in subscriptions.items()
-            if (str(originator) in case_subscriptions and message_name in case_subscriptions[str(originator)])]
+    if subscriptions is not _indexed_subscriptions:
+        _build_index()
+    return list(_subscribed_cases.get((str(originator), message_name), ()))
+
+
+def has_subscriptions():
+    """ Checks if any case is subscribed to any event
+
+    Returns:
+        True if there are any subscriptions. False otherwise.
+    """
+    if subscriptions is not _indexed_subscriptions:
+        _build_index()
+    return bool(_subscribed_cases)
 
 
 def modify_subscription(case, originator, events):
@@ -104,7 +122,9 @@ def modify_subscription(case, originator, events):
     """
     global subscriptions
     if case in subscriptions:
+        _unindex_case(case, {originator: subscriptions[case].get(originator, [])})
         subscriptions[case][originator] = events
+        _index_case(case, {originator: events})
 
 
 def remove_subscription_node(case, originator):
@@ -117,4 +137,37 @@ def remove_subscription_node(case, originator):
     """
     global subscriptions
     if case in subscriptions:
-        subscriptions[case].pop(originator, False)
+        _unindex_case(case, {originator: subscriptions[case].pop(originator, [])})
+
+
+def _build_index():
+    """Rebuilds the index of the cases subscribed to each event of each element from the subscriptions. The index is
+        rebuilt when it is next read after the subscriptions are replaced, and is otherwise updated along with them.
+        Its sets of cases are replaced rather than modified, so that they can be read while they are being updated
+    """
+    global _subscribed_cases, _indexed_subscriptions
+    index = {}
+    for case_name, case in subscriptions.items():
+        for originator, events in case.items():
+            for event in events:
+                index.setdefault((str(originator), event), set()).add(case_name)
+    _subscribed_cases = {key: frozenset(cases) for key, cases in index.items()}
+    _indexed_subscriptions = subscriptions
+
+
+def _index_case(case_name, case):
+    for originator, events in case.items():
+        for event in events:
+            key = (str(originator), event)
+            _subscribed_cases[key] = _subscribed_cases.get(key, frozenset()) | {case_name}
+
+
+def _unindex_case(case_name, case):
+    for originator, events in case.items():
+        for event in events:
+            key = (str(originator), event)
+            cases = _subscribed_cases.get(key, frozenset()) - {case_name}
+            if cases:
+                _subscribed_cases[key] = cases
+            else:
+                _subscribed_cases.pop(key, None)
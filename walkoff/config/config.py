@@ -12,6 +12,8 @@ __logger = logging.getLogger(__name__)
 
 def load_config():
     """ Loads Walkoff configuration from JSON file
+
+    Every setting in the file is loaded, including those which are null, 0, or false. Empty paths are ignored
     """
     self = sys.modules[__name__]
     if isfile(walkoff.config.paths.config_path):
@@ -19,11 +21,11 @@ def load_config():
             with open(walkoff.config.paths.config_path) as config_file:
                 config = json.loads(config_file.read())
                 for key, value in config.items():
-                    if value:
-                        if hasattr(walkoff.config.paths, key):
+                    if hasattr(walkoff.config.paths, key):
+                        if value:
                             setattr(walkoff.config.paths, key, value)
-                        elif hasattr(self, key):
-                            setattr(self, key, value)
+                    elif hasattr(self, key):
+                        setattr(self, key, value)
         except (IOError, OSError, ValueError):
             __logger.warning('Could not read config file.', exc_info=True)
 
@@ -66,11 +68,123 @@ zmq_communication_address = 'tcp://127.0.0.1:5557'
 num_processes = 4
 num_threads_per_process = 3
 
+# The maximum number of results of cacheable actions each worker process holds in memory
+action_result_cache_size = 1000
+
+# The maximum number of entries and estimated bytes held by each app's execution-scoped and worker-scoped caches
+app_cache_max_entries = 1000
+app_cache_max_memory = 64 * 1024 * 1024
+
+# How workflows handle results which no remaining action, trigger, or branch references. 'keep' holds every result
+# until the workflow completes, so the data sent with the Workflow Shutdown event holds the result of every action.
+# 'release' drops them from memory, and so from that data, and 'summarize' also records their type and estimated size
+# in it in place of the result
+accumulator_pruning = 'keep'
+
+# The maximum estimated number of bytes of action results each workflow holds in memory. Results over this budget are
+# spilled to files in the accumulator_spill_path directory of walkoff.config.paths and read back when they are
+# referenced. Set to None to keep every result in memory
+accumulator_max_memory = 128 * 1024 * 1024
+
+# Each workflow keeps the results which it decodes from spill files, the result store, or checkpoints in a read cache
+# holding up to this many bytes of encoded results. Set to 0 to decode a result every time it is looked up
+accumulator_read_cache_size = 8 * 1024 * 1024
+
+# In durable mode, workflows record each completed action in the execution database, and the server queues workflows
+# which were interrupted to be resumed from the last completed action when it starts
+durable_workflows = False
+
+# The server checks this often, in seconds, whether a worker process has died. Dead workers are restarted, and in
+# durable mode the workflows which were running on them are resumed. Set to None to not monitor the workers
+worker_monitor_interval = 5
+
+# The server writes the status transitions of workflows and actions to the execution database in batches. A batch is
+# written once it holds this many transitions, or once its oldest transition has waited this many seconds. Set the
+# batch size to None to write every transition as it happens
+status_write_batch_size = 100
+status_write_interval = 0.5
+
+# Action results whose JSON encoding is longer than this many bytes are written to the result store and sent to the
+# server as a reference holding a preview of this many bytes. Set the threshold to None to always send results inline
+result_store_threshold = 1024 * 1024
+result_preview_size = 1024
+
+# Results in the result store which have not been stored again for this many seconds are removed. The store is checked
+# at most once every result_store_prune_interval seconds, when a workflow finishes. Set the maximum age to None to keep
+# results forever
+result_store_max_age = 7 * 24 * 60 * 60
+result_store_prune_interval = 60 * 60
+
+# Finished workflow executions are rolled up into hourly per-workflow counts, failures, aborts, and duration
+# percentiles, and those which finished more than execution_retention_age seconds ago are removed from the execution
+# database in chunks of execution_retention_chunk_size. This happens in a background thread, at most once every
+# execution_retention_interval seconds, when a workflow finishes. Each run rolls up at most execution_rollup_max_hours
+# hours and removes at most execution_retention_max_chunks chunks, and the next run starts as soon as another workflow
+# finishes if work is left. If archive_executions is set, removed executions are first appended to compressed NDJSON
+# files in the execution_archive_path directory of walkoff.config.paths. Set the maximum age to None to keep executions
+# forever
+execution_retention_age = None
+execution_retention_chunk_size = 500
+execution_retention_interval = 60 * 60
+execution_retention_max_chunks = 10
+execution_rollup_max_hours = 24
+archive_executions = True
+
+# Case events are queued in memory and written to the case database by a background thread, in transactions of up to
+# case_event_batch_size events. The queue holds up to case_event_queue_size events. When it is full, new events are
+# dropped if case_event_queue_policy is 'drop', or the signal which logged them waits for room if it is 'block'
+case_event_queue_size = 10000
+case_event_batch_size = 500
+case_event_queue_policy = 'drop'
+
+# If set, the messages and data of case events in SQLite case databases are indexed in an FTS5 full-text search index
+# as they are inserted, and event searches are ranked by relevance. Otherwise, searches match substrings of the
+# messages and data
+case_event_search_index = True
+
+# If case_event_partition_period is 'day' or 'week', the events of each day or week are kept in their own tables of the
+# case database. The tables of a partition are dropped as a whole once its newest event is more than
+# case_event_retention_age seconds old. Set the period to None to keep every event in the same tables, and the
+# retention age to None to keep events forever
+case_event_partition_period = None
+case_event_retention_age = None
+
+# If interface_handler_pool_size is set, interface event handlers run on a pool of greenlets, at most this many at a
+# time, instead of in the signal which sent the event. Each handler handles its events in the order they were sent,
+# from a queue of up to interface_handler_queue_size events. Events are dropped while the queue of a handler is full,
+# and a handler is interrupted once it has run for interface_handler_timeout seconds. Set the pool size to None to run
+# handlers as events are sent
+interface_handler_pool_size = None
+interface_handler_queue_size = 1000
+interface_handler_timeout = 30
+
+# The workflow and action event streams keep their newest sse_event_buffer_size events, so that a client which
+# reconnects with the Last-Event-ID header is sent the events it missed
+sse_event_buffer_size = 1000
+
 # Database types
 walkoff_db_type = 'sqlite'
 case_db_type = 'sqlite'
 device_db_type = 'sqlite'
 
+# Engine profiles of the execution and case databases. 'pooled' keeps up to database_pool_size open connections, plus
+# database_max_overflow more under load, and opens SQLite databases in write-ahead logging mode with synchronous=NORMAL
+# so that the workers can read while the server writes. 'unpooled' opens a new connection for each use. SQLite
+# connections wait up to sqlite_busy_timeout seconds for a lock, and connections to other databases are replaced after
+# database_pool_recycle seconds
+execution_db_profile = 'pooled'
+case_db_profile = 'pooled'
+database_pool_size = 5
+database_max_overflow = 10
+database_pool_recycle = 60 * 60
+sqlite_busy_timeout = 30
+
+# The type and engine profile of the database holding the workflow and action statuses, saved workflows, execution log,
+# and rollups. It is only used if the status_db_path of walkoff.config.paths is set. Otherwise they are kept in the
+# execution database
+status_db_type = 'sqlite'
+status_db_profile = 'pooled'
+
 # Secret key
 secret_key = 'SHORTSTOPKEYTEST'
 
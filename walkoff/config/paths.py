@@ -2,6 +2,7 @@ from os.path import join
 
 data_path = join('.', 'data')
 
+accumulator_spill_path = join(data_path, 'spill')
 api_path = join('.', 'walkoff', 'api')
 apps_path = join('.', 'apps')
 case_db_path = join(data_path, 'events.db')
@@ -11,9 +12,12 @@ config_path = join(data_path, 'walkoff.config')
 db_path = join(data_path, 'walkoff.db')
 default_appdevice_export_path = join(data_path, 'appdevice.json')
 default_case_export_path = join(data_path, 'cases.json')
+execution_archive_path = join(data_path, 'archive')
 execution_db_path = join(data_path, 'execution.db')
 interfaces_path = join('.', 'interfaces')
 logging_config_path = join(data_path, 'log', 'logging.json')
+result_store_path = join(data_path, 'results')
+status_db_path = None
 
 walkoff_schema_path = join(data_path, 'walkoff_schema.json')
 workflows_path = join('.', 'workflows')
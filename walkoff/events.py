@@ -1,11 +1,13 @@
 import logging
 from functools import partial
+from timeit import default_timer
 
 from apscheduler.events import (EVENT_SCHEDULER_START, EVENT_SCHEDULER_SHUTDOWN, EVENT_SCHEDULER_PAUSED,
     EVENT_SCHEDULER_RESUMED, EVENT_JOB_ADDED, EVENT_JOB_REMOVED, EVENT_JOB_EXECUTED, EVENT_JOB_ERROR)
 from blinker import Signal
 from enum import unique, Enum
 
+import walkoff.case.subscription as case_subscription
 from walkoff.case.callbacks import add_entry_to_case
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,9 @@ class WalkoffSignal(object):
         event_type (EventType): The event type of this signal
         is_loggable (bool): Should this event get logged into cases?
         message (str): The message log with this signal to a case
+        sends (int): The number of times the signal has been sent
+        skipped (int): The number of sends which were skipped because only dormant receivers were connected
+        handler_time (float): The cumulative number of seconds spent in the receivers of the signal
 
     Args:
         name (str): The name of the signal
@@ -51,6 +56,13 @@ class WalkoffSignal(object):
         self.signal = Signal(name)
         self.event_type = event_type
         self.is_loggable = loggable
+        self.sends = 0
+        self.skipped = 0
+        self.handler_time = 0.
+        self._receivers_version = 0
+        self._dormant_receivers = {}
+        self._indexed_receivers = None
+        self._dormant_checks = None
         if loggable:
             signal_callback = partial(add_entry_to_case,
                                       data='',
@@ -58,17 +70,34 @@ class WalkoffSignal(object):
                                       entry_message=message,
                                       message_name=name)
             self.connect(signal_callback, weak=False)
+            self._mark_dormant(signal_callback, _has_no_case_subscriptions)
 
     def send(self, sender, **kwargs):
         """Sends the signal with data
 
+        The send is skipped if every connected receiver is a built-in receiver which is currently dormant, such as
+        the receiver which logs the event to cases when no case is subscribed to anything
+
         Args:
             sender: The thing that is sending the signal
 
         Kwargs:
             data: Additional data to send with the signal
         """
-        self.signal.send(sender, **kwargs)
+        self.sends += 1
+        receivers = self.signal.receivers
+        key = (self._receivers_version, id(receivers), len(receivers))
+        if key != self._indexed_receivers:
+            self.__index_receivers(receivers, key)
+        dormant_checks = self._dormant_checks
+        if dormant_checks is not None and all(is_dormant() for is_dormant in dormant_checks):
+            self.skipped += 1
+            return
+        start = default_timer()
+        try:
+            self.signal.send(sender, **kwargs)
+        finally:
+            self.handler_time += default_timer() - start
 
     def connect(self, func, weak=True):
         """A decorator which registers a function as a callback for this signal
@@ -81,10 +110,41 @@ class WalkoffSignal(object):
             func: The function connected
         """
         self.signal.connect(func)
+        self._receivers_version += 1
         if not weak:
             WalkoffSignal._store_callback(func)
         return func
 
+    def metrics(self):
+        """Gets the metrics of this signal
+
+        Returns:
+            (dict): The number of sends, the number of skipped sends, and the cumulative number of seconds spent in the
+                receivers of this signal
+        """
+        return {'name': self.name,
+                'sends': self.sends,
+                'skipped': self.skipped,
+                'handler_time': self.handler_time}
+
+    def _mark_dormant(self, func, is_dormant):
+        """Marks a connected receiver as one which does nothing while a condition holds
+
+        Args:
+            func (func): The receiver
+            is_dormant (func): A function taking no arguments which returns True while the receiver does nothing
+        """
+        self._dormant_receivers[id(func)] = is_dormant
+        self._receivers_version += 1
+
+    def __index_receivers(self, receivers, key):
+        receiver_ids = list(receivers)
+        if all(receiver_id in self._dormant_receivers for receiver_id in receiver_ids):
+            self._dormant_checks = tuple(self._dormant_receivers[receiver_id] for receiver_id in receiver_ids)
+        else:
+            self._dormant_checks = None
+        self._indexed_receivers = key
+
     @classmethod
     def _store_callback(cls, func):
         """
@@ -93,6 +153,10 @@ class WalkoffSignal(object):
         cls._signals[id(func)] = func
 
 
+def _has_no_case_subscriptions():
+    return not case_subscription.has_subscriptions()
+
+
 class ControllerSignal(WalkoffSignal):
     """A signal used by controller events
 
@@ -283,3 +347,13 @@ class WalkoffEvent(Enum):
 
     def is_loggable(self):
         return self.value.is_loggable
+
+    @classmethod
+    def metrics(cls):
+        """Gets the metrics of the signals of all the events
+
+        Returns:
+            (list[dict]): The number of sends, the number of skipped sends, and the cumulative number of seconds spent in
+                the receivers of the signal of each event
+        """
+        return [event.value.metrics() for event in cls]
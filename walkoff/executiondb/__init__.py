@@ -1,18 +1,19 @@
 import enum
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
-from sqlalchemy.pool import NullPool
 
 import walkoff.config.config
 import walkoff.config.paths
-from walkoff.helpers import format_db_path
+from walkoff.helpers import create_database_engine
 
 Device_Base = declarative_base()
 
 
 class ExecutionDatabase(object):
-    """Wrapper for the SQLAlchemy database connection object
+    """Wrapper for the SQLAlchemy database connection object. The runtime state of executions, which are the workflow
+        and action statuses, saved workflows, execution log, and rollups, is kept in the database at the status_db_path
+        of walkoff.config.paths if it is set, so that writing it does not lock the workflow definitions. Otherwise it
+        is kept in the execution database
     """
 
     __instance = None
@@ -31,18 +32,34 @@ class ExecutionDatabase(object):
         from walkoff.executiondb.workflow import Workflow
         from walkoff.executiondb.saved_workflow import SavedWorkflow
         from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
-
-        self.engine = create_engine(format_db_path(
-            walkoff.config.config.device_db_type, walkoff.config.paths.execution_db_path), poolclass=NullPool)
+        from walkoff.executiondb.executionlog import ExecutionLogEntry
+        from walkoff.executiondb.retention import WorkflowRollup
+
+        self.engine = create_database_engine(walkoff.config.config.device_db_type,
+                                             walkoff.config.paths.execution_db_path,
+                                             profile=walkoff.config.config.execution_db_profile)
+        if walkoff.config.paths.status_db_path is not None:
+            self.status_engine = create_database_engine(walkoff.config.config.status_db_type,
+                                                        walkoff.config.paths.status_db_path,
+                                                        profile=walkoff.config.config.status_db_profile)
+        else:
+            self.status_engine = self.engine
         self.connection = self.engine.connect()
         self.transaction = self.connection.begin()
 
+        status_models = (WorkflowStatus, ActionStatus, SavedWorkflow, ExecutionLogEntry, WorkflowRollup)
         Session = sessionmaker()
-        Session.configure(bind=self.engine)
+        Session.configure(bind=self.engine, binds={model: self.status_engine for model in status_models})
         self.session = scoped_session(Session)
 
         Device_Base.metadata.bind = self.engine
-        Device_Base.metadata.create_all(self.engine)
+        if self.status_engine is self.engine:
+            Device_Base.metadata.create_all(self.engine)
+        else:
+            status_tables = [model.__table__ for model in status_models]
+            Device_Base.metadata.create_all(self.engine, tables=[table for table in Device_Base.metadata.sorted_tables
+                                                                 if table not in status_tables])
+            Device_Base.metadata.create_all(self.status_engine, tables=status_tables)
 
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
@@ -53,6 +70,7 @@ class ExecutionDatabase(object):
         self.session.rollback()
         self.connection.close()
         self.engine.dispose()
+        self.status_engine.dispose()
 
 
 execution_db = None
@@ -0,0 +1,340 @@
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+
+from six.moves import cPickle as pickle
+
+import walkoff.config.config
+import walkoff.config.paths
+from walkoff.appgateway.appdatacache import estimate_size
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+logger = logging.getLogger(__name__)
+
+_size_sample = 1000
+_object_entry = 0
+_pickled_entry = 1
+_stored_entry = 2
+
+
+class SpillableAccumulator(MutableMapping):
+    """A dict of Action IDs to their results which keeps the estimated memory used by its results under a budget.
+        When the budget is exceeded, the least recently used results are pickled to files in the accumulator_spill_path
+        directory of walkoff.config.paths. A spilled result is unpickled from its file whenever it is looked up, and is
+        not counted against the budget again. Results can also be held in a ResultStore, or be added in their pickled
+        form, in which case they are only decoded when they are looked up. The most recently decoded results are kept
+        in a small read cache, bounded by the accumulator_read_cache_size value in walkoff.config.config, so that a
+        result which is looked up repeatedly is only decoded once. Changes made to decoded results are not kept once
+        they leave the cache.
+
+    Attributes:
+        max_memory (int): The maximum estimated number of bytes of results held in memory. If None, the
+            accumulator_max_memory value in walkoff.config.config is used. If that value is also None, results are
+            never spilled
+
+    Args:
+        max_memory (int, optional): The maximum estimated number of bytes of results held in memory. Defaults to None
+        results (dict, optional): Initial results for the accumulator. Defaults to None
+    """
+
+    def __init__(self, max_memory=None, results=None):
+        self.max_memory = max_memory
+        self._results = OrderedDict()
+        self._sizes = {}
+        self._spilled = {}
+        self._stored = {}
+        self._memory_usage = 0
+        self._read_cache = OrderedDict()
+        self._read_cache_size = 0
+        if results:
+            self.update(results)
+
+    @property
+    def memory_usage(self):
+        """The estimated number of bytes used by the results held in memory"""
+        return self._memory_usage
+
+    def is_spilled(self, key):
+        """Checks whether a result has been spilled to disk
+
+        Args:
+            key: The ID of the Action
+
+        Returns:
+            (bool): True if the result is held in a temporary file, False otherwise
+        """
+        return key in self._spilled
+
+    def add_stored_result(self, key, result_id, store, encoding='json'):
+        """Adds a result which is held in a ResultStore. The result is loaded from the store whenever it is looked up
+
+        Args:
+            key: The ID of the Action
+            result_id (str): The ID of the encoded result in the store
+            store (ResultStore): The store holding the result
+            encoding (str, optional): The encoding of the result, either 'json' or 'pickle'. Defaults to 'json'
+        """
+        if encoding not in _decoders:
+            raise ValueError('Unknown result encoding {}'.format(encoding))
+        if key in self:
+            del self[key]
+        self._stored[key] = (result_id, store, encoding)
+
+    def get_stored_result(self, key):
+        """Gets the ID and encoding of a result which is held in a ResultStore
+
+        Args:
+            key: The ID of the Action
+
+        Returns:
+            (tuple(str, str)): The ID of the result in the store and its encoding, or None if the result is not held
+                in a store
+        """
+        if key not in self._stored:
+            return None
+        result_id, _, encoding = self._stored[key]
+        return result_id, encoding
+
+    def add_pickled_result(self, key, data):
+        """Adds a result in its pickled form. The result is counted against the budget by the length of its pickled
+            form, and is unpickled whenever it is looked up
+
+        Args:
+            key: The ID of the Action
+            data (bytes): The pickled result
+        """
+        if key in self:
+            del self[key]
+        self.__add(key, _Pickled(data), len(data))
+
+    def get_pickled_result(self, key):
+        """Gets the pickled form of a result, if the accumulator already holds it
+
+        Args:
+            key: The ID of the Action
+
+        Returns:
+            (bytes): The pickled result, or None if the result is held as an object or in a ResultStore
+        """
+        value = self._results.get(key)
+        if isinstance(value, _Pickled):
+            return value.data
+        if key in self._spilled:
+            return self.__read(self._spilled[key])
+        return None
+
+    def __getitem__(self, key):
+        if key in self._read_cache:
+            cached = self._read_cache.pop(key)
+            self._read_cache[key] = cached
+            if key in self._results:
+                self._results[key] = self._results.pop(key)
+            return cached[0]
+        if key in self._results:
+            self._results[key] = self._results.pop(key)
+        value, size = self.__load(key)
+        if size is not None:
+            self.__cache(key, value, size)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self:
+            del self[key]
+        self.__add(key, value, estimate_size(value, max_objects=_size_sample))
+
+    def __delitem__(self, key):
+        if key in self._read_cache:
+            self._read_cache_size -= self._read_cache.pop(key)[1]
+        if key in self._results:
+            self._results.pop(key)
+            self._memory_usage -= self._sizes.pop(key)
+        elif key in self._spilled:
+            self.__remove_file(self._spilled.pop(key))
+        elif key in self._stored:
+            self._stored.pop(key)
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._results or key in self._spilled or key in self._stored
+
+    def __iter__(self):
+        for key in list(self._results.keys()) + list(self._spilled.keys()) + list(self._stored.keys()):
+            yield key
+
+    def __len__(self):
+        return len(self._results) + len(self._spilled) + len(self._stored)
+
+    def __repr__(self):
+        return '{0}(in_memory={1}, spilled={2}, stored={3})'.format(
+            self.__class__.__name__, len(self._results), len(self._spilled), len(self._stored))
+
+    def __getstate__(self):
+        entries = []
+        for key, value in self._results.items():
+            if isinstance(value, _Pickled):
+                entries.append((key, _pickled_entry, value.data))
+            else:
+                entries.append((key, _object_entry, value))
+        for key, path in self._spilled.items():
+            entries.append((key, _pickled_entry, self.__read(path)))
+        for key, stored in self._stored.items():
+            entries.append((key, _stored_entry, stored))
+        return {'max_memory': self.max_memory, 'entries': entries}
+
+    def __setstate__(self, state):
+        self.__init__(max_memory=state['max_memory'])
+        for key, entry_type, value in state['entries']:
+            if entry_type == _pickled_entry:
+                self.add_pickled_result(key, value)
+            elif entry_type == _stored_entry:
+                result_id, store, encoding = value
+                self.add_stored_result(key, result_id, store, encoding=encoding)
+            else:
+                self[key] = value
+
+    def peek(self, key):
+        """Gets a result without adding it to the read cache or marking it as recently used, so that reading every
+            result only decodes one spilled, pickled, or stored result at a time
+
+        Args:
+            key: The ID of the Action
+
+        Returns:
+            The result
+        """
+        if key in self._read_cache:
+            return self._read_cache[key][0]
+        return self.__load(key)[0]
+
+    def get_json_result(self, key):
+        """Gets the JSON encoding of a result which is held in a ResultStore as JSON, without decoding it
+
+        Args:
+            key: The ID of the Action
+
+        Returns:
+            (str): The JSON encoding of the result, or None if the result is not held in a ResultStore as JSON
+        """
+        stored = self._stored.get(key)
+        if stored is None or stored[2] != 'json':
+            return None
+        result_id, store, _ = stored
+        body = store.read(result_id)
+        if body is None:
+            raise KeyError(key)
+        return body.decode('utf-8')
+
+    def remove_spilled(self):
+        """Removes the results which have been spilled to disk, along with their files. Workflows call this once they
+            complete or are aborted, so that their spill files do not outlive them
+        """
+        for key in list(self._spilled.keys()):
+            self._read_cache_size -= self._read_cache.pop(key, (None, 0))[1]
+            self.__remove_file(self._spilled.pop(key))
+
+    def __del__(self):
+        try:
+            for path in self._spilled.values():
+                self.__remove_file(path)
+        except Exception:
+            pass
+
+    def __load(self, key):
+        if key in self._results:
+            value = self._results[key]
+            if not isinstance(value, _Pickled):
+                return value, None
+            return pickle.loads(value.data), len(value.data)
+        if key in self._spilled:
+            with open(self._spilled[key], 'rb') as spill_file:
+                value = pickle.load(spill_file)
+                return value, spill_file.tell()
+        if key in self._stored:
+            result_id, store, encoding = self._stored[key]
+            body = store.read(result_id)
+            if body is None:
+                raise KeyError(key)
+            return _decoders[encoding](body), len(body)
+        raise KeyError(key)
+
+    def __add(self, key, value, size):
+        self._results[key] = value
+        self._sizes[key] = size
+        self._memory_usage += size
+        self.__spill()
+
+    def __cache(self, key, value, size):
+        max_size = walkoff.config.config.accumulator_read_cache_size
+        if not max_size or size > max_size:
+            return
+        while self._read_cache and self._read_cache_size + size > max_size:
+            self._read_cache_size -= self._read_cache.popitem(last=False)[1][1]
+        self._read_cache[key] = (value, size)
+        self._read_cache_size += size
+
+    def __get_max_memory(self):
+        return self.max_memory if self.max_memory is not None else walkoff.config.config.accumulator_max_memory
+
+    def __spill(self):
+        max_memory = self.__get_max_memory()
+        if max_memory is None:
+            return
+        for key in list(self._results.keys()):
+            if self._memory_usage <= max_memory:
+                break
+            path = self.__dump(self._results[key])
+            if path is None:
+                continue
+            self._results.pop(key)
+            self._memory_usage -= self._sizes.pop(key)
+            self._spilled[key] = path
+            logger.debug('Spilled result of action {0} to {1}'.format(key, path))
+
+    @staticmethod
+    def __dump(value):
+        try:
+            data = value.data if isinstance(value, _Pickled) else pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.warning('Result of type {} cannot be spilled to disk. Keeping it in memory'.format(
+                type(value).__name__))
+            return None
+        directory = walkoff.config.paths.accumulator_spill_path
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            file_descriptor, path = tempfile.mkstemp(dir=directory, prefix='walkoff-accumulator-', suffix='.pkl')
+            with os.fdopen(file_descriptor, 'wb') as spill_file:
+                spill_file.write(data)
+        except (IOError, OSError):
+            logger.exception('Could not spill result to {}. Keeping it in memory'.format(directory))
+            return None
+        return path
+
+    @staticmethod
+    def __read(path):
+        with open(path, 'rb') as spill_file:
+            return spill_file.read()
+
+    @staticmethod
+    def __remove_file(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class _Pickled(object):
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+
+_decoders = {'json': lambda body: json.loads(body.decode('utf-8')), 'pickle': pickle.loads}
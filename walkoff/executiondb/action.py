@@ -6,7 +6,7 @@ from sqlalchemy import Column, Integer, ForeignKey, String, orm
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
-from walkoff.appgateway import get_app_action, is_app_action_bound
+from walkoff.appgateway import get_app_action, is_app_action_bound, get_cached_action_result, cache_action_result
 from walkoff.appgateway.actionresult import ActionResult
 from walkoff.appgateway.validator import validate_app_action_parameters
 from walkoff.events import WalkoffEvent
@@ -67,6 +67,7 @@ class Action(ExecutionElement, Device_Base):
         self._arguments_api = None
         self._output = None
         self._execution_id = 'default'
+        self._trigger_executable = None
 
         self.validate()
         self._action_executable = get_app_action(self.app_name, self._run)
@@ -78,6 +79,7 @@ class Action(ExecutionElement, Device_Base):
         self._output = None
         self._action_executable = get_app_action(self.app_name, self._run)
         self._execution_id = 'default'
+        self._trigger_executable = None
 
     def validate(self):
         errors = {}
@@ -147,11 +149,7 @@ class Action(ExecutionElement, Device_Base):
         try:
             args = validate_app_action_parameters(self._arguments_api, arguments, self.app_name, self.action_name,
                                                   accumulator=accumulator)
-            if is_app_action_bound(self.app_name, self._run):
-                result = self._action_executable(instance, **args)
-            else:
-                result = self._action_executable(**args)
-            result.set_default_status(self.app_name, self.action_name)
+            result = self.__execute_action(instance, args)
             if result.is_failure(self.app_name, self.action_name):
                 WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ActionExecutionError,
                                                        data=result.as_json())
@@ -166,6 +164,25 @@ class Action(ExecutionElement, Device_Base):
                 'Action {0}-{1} (id {2}) executed successfully'.format(self.app_name, self.action_name, self.id))
             return result
 
+    def __execute_action(self, instance, args):
+        cacheable = getattr(self._action_executable, 'cacheable', False)
+        if cacheable:
+            result = get_cached_action_result(self.app_name, self.action_name, self.device_id, args)
+            if result is not None:
+                logger.debug('Using cached result for action {0}-{1}'.format(self.app_name, self.action_name))
+                return result
+
+        if is_app_action_bound(self.app_name, self._run):
+            result = self._action_executable(instance, **args)
+        else:
+            result = self._action_executable(**args)
+        result.set_default_status(self.app_name, self.action_name)
+
+        if cacheable and not result.is_failure(self.app_name, self.action_name):
+            cache_action_result(self.app_name, self.action_name, self.device_id, args, result,
+                                ttl=self._action_executable.cache_ttl)
+        return result
+
     def __handle_execution_error(self, e):
         formatted_error = format_exception_message(e)
         if isinstance(e, InvalidArgument):
@@ -179,6 +196,15 @@ class Action(ExecutionElement, Device_Base):
         self._output = ActionResult('error: {0}'.format(formatted_error), return_type)
         WalkoffEvent.CommonWorkflowSignal.send(self, event=event, data=self._output.as_json())
 
+    def compile(self, emit_events=True):
+        """Compiles the trigger of this Action so that later executions of the trigger use the compiled expression
+
+        Args:
+            emit_events (bool, optional): Should the events for the ConditionalExpressions and Conditions be sent?
+                Defaults to True.
+        """
+        self._trigger_executable = self.trigger.compile(emit_events=emit_events) if self.trigger else None
+
     def execute_trigger(self, data_in, accumulator):
         """Executes the trigger for an Action, which will continue execution if the trigger returns True
         Args:
@@ -187,7 +213,9 @@ class Action(ExecutionElement, Device_Base):
         Returns:
             True if the trigger returned True, False otherwise
         """
-        if self.trigger.execute(data_in=data_in, accumulator=accumulator):
+        if self._trigger_executable is None:
+            self.compile()
+        if self._trigger_executable(data_in, accumulator):
             logger.debug('Trigger is valid for input {0}'.format(data_in))
             return True
         else:
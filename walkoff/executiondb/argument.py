@@ -4,11 +4,13 @@ from sqlalchemy import Column, Integer, ForeignKey, String, orm
 from sqlalchemy_utils import UUIDType, JSONType, ScalarListType
 
 from walkoff.executiondb import Device_Base
+from walkoff.executiondb.executionelement import track_executable_changes
 from walkoff.helpers import InvalidArgument
 
 logger = logging.getLogger(__name__)
 
 
+@track_executable_changes
 class Argument(Device_Base):
     __tablename__ = 'argument'
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import Column, Integer, ForeignKey, String
+from sqlalchemy import Column, Integer, ForeignKey, String, orm
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy_utils import UUIDType
 
@@ -43,12 +43,27 @@ class Branch(ExecutionElement, Device_Base):
         self.status = status
         self.priority = priority
         self.condition = condition
+        self._condition_executable = None
 
         self.validate()
 
+    @orm.reconstructor
+    def init_on_load(self):
+        """Loads all necessary fields upon Branch being loaded from database"""
+        self._condition_executable = None
+
     def validate(self):
         pass
 
+    def compile(self, emit_events=True):
+        """Compiles the ConditionalExpression of this Branch so that later executions use the compiled expression
+
+        Args:
+            emit_events (bool, optional): Should the events for the ConditionalExpressions and Conditions be sent?
+                Defaults to True.
+        """
+        self._condition_executable = self.condition.compile(emit_events=emit_events) if self.condition else None
+
     def execute(self, data_in, accumulator):
         """Executes the Branch object, determining if this Branch should be taken.
 
@@ -62,7 +77,7 @@ class Branch(ExecutionElement, Device_Base):
         """
 
         if data_in is not None and data_in.status == self.status:
-            if self.condition is None or self.condition.execute(data_in=data_in.result, accumulator=accumulator):
+            if self.condition is None or self.__execute_condition(data_in.result, accumulator):
                 WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.BranchTaken)
                 logger.debug('Branch is valid for input {0}'.format(data_in))
                 return self.destination_id
@@ -72,3 +87,8 @@ class Branch(ExecutionElement, Device_Base):
                 return None
         else:
             return None
+
+    def __execute_condition(self, data_in, accumulator):
+        if self._condition_executable is not None:
+            return self._condition_executable(data_in, accumulator)
+        return self.condition.execute(data_in=data_in, accumulator=accumulator)
@@ -0,0 +1,130 @@
+import logging
+import struct
+import zlib
+
+from six.moves import cPickle as pickle
+
+import walkoff.config.config
+from walkoff.appgateway.appinstance import AppInstance
+from walkoff.executiondb.accumulator import SpillableAccumulator
+from walkoff.resultstore import pickled_result_store as default_result_store, log_result_store
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_MAGIC = b'WKCP'
+CHECKPOINT_VERSION = 2
+
+_header = struct.Struct('!4sB')
+_compression_level = 1
+_inline = 0
+_reference = 1
+_json_reference = 2
+
+
+class InvalidCheckpoint(Exception):
+    pass
+
+
+def encode_checkpoint(accumulator, app_instances, store=None):
+    """Encodes the state of a paused workflow into a compact, versioned checkpoint.
+
+    The checkpoint is a short header followed by a zlib-compressed body. Each result is pickled on its own, and
+    results whose pickled form is larger than the result_store_threshold value in walkoff.config.config are written
+    to the ResultStore so that only their IDs are kept in the checkpoint. Results which the accumulator already
+    holds in a ResultStore or in pickled form are not pickled again. Only the state which an app instance returns
+    from its export_state method is saved, rather than the whole instance.
+
+    Args:
+        accumulator (dict): The results of the Actions executed so far
+        app_instances (dict{tuple: AppInstance}): The app instances of the workflow, keyed by (app name, device ID)
+        store (ResultStore, optional): The store used for large results. Defaults to None, meaning the store of
+            pickled results is used
+
+    Returns:
+        (bytes): The checkpoint
+    """
+    store = store if store is not None else default_result_store
+    body = {'accumulator': [_encode_entry(accumulator, key, store) for key in accumulator],
+            'app_instances': [_encode_app_instance(app_name, device_id, instance)
+                              for (app_name, device_id), instance in app_instances.items()]}
+    return _header.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION) + zlib.compress(
+        pickle.dumps(body, pickle.HIGHEST_PROTOCOL), _compression_level)
+
+
+def decode_checkpoint(checkpoint, store=None):
+    """Decodes a checkpoint created by encode_checkpoint
+
+    Args:
+        checkpoint (bytes): The checkpoint
+        store (ResultStore, optional): The store used for large results. Defaults to None, meaning the store of
+            pickled results is used
+
+    Returns:
+        (tuple(SpillableAccumulator, dict{tuple: AppInstance})): The accumulator and the recreated app instances.
+            Results are only unpickled, or loaded from the ResultStore, when they are looked up
+    """
+    if checkpoint is None or len(checkpoint) < _header.size:
+        raise InvalidCheckpoint('Checkpoint is empty')
+    magic, version = _header.unpack(bytes(checkpoint[:_header.size]))
+    if magic != CHECKPOINT_MAGIC:
+        raise InvalidCheckpoint('Data is not a workflow checkpoint')
+    if version != CHECKPOINT_VERSION:
+        raise InvalidCheckpoint('Unsupported checkpoint version {}'.format(version))
+    store = store if store is not None else default_result_store
+    try:
+        body = pickle.loads(zlib.decompress(bytes(checkpoint[_header.size:])))
+    except (zlib.error, pickle.UnpicklingError, EOFError, ValueError):
+        raise InvalidCheckpoint('Checkpoint is corrupt')
+
+    accumulator = SpillableAccumulator()
+    for key, value_type, value in body['accumulator']:
+        if value_type == _inline:
+            accumulator.add_pickled_result(key, value)
+            continue
+        if value_type == _json_reference:
+            result_store, encoding = log_result_store, 'json'
+        else:
+            result_store, encoding = store, 'pickle'
+        if result_store.get_path(value) is None:
+            raise InvalidCheckpoint('Stored result {} is missing'.format(value))
+        accumulator.add_stored_result(key, value, result_store, encoding=encoding)
+
+    app_instances = {}
+    for app_name, device_id, state in body['app_instances']:
+        app_instances[(app_name, device_id)] = _decode_app_instance(app_name, device_id, state)
+    return accumulator, app_instances
+
+
+def _encode_entry(accumulator, key, store):
+    encoded = None
+    if isinstance(accumulator, SpillableAccumulator):
+        stored = accumulator.get_stored_result(key)
+        if stored is not None:
+            result_id, encoding = stored
+            if encoding == 'pickle':
+                return key, _reference, result_id
+            return key, _json_reference, result_id
+        encoded = accumulator.get_pickled_result(key)
+    if encoded is None:
+        encoded = pickle.dumps(accumulator[key], pickle.HIGHEST_PROTOCOL)
+    threshold = walkoff.config.config.result_store_threshold
+    if threshold is not None and len(encoded) > threshold:
+        try:
+            return key, _reference, store.put(encoded)
+        except (IOError, OSError):
+            logger.exception('Could not store large result for checkpoint. Storing it inline')
+    return key, _inline, encoded
+
+
+def _encode_app_instance(app_name, device_id, app_instance):
+    instance = app_instance()
+    state = instance.export_state() if hasattr(instance, 'export_state') else None
+    return app_name, device_id, pickle.dumps(state, pickle.HIGHEST_PROTOCOL) if state is not None else None
+
+
+def _decode_app_instance(app_name, device_id, state):
+    app_instance = AppInstance.create(app_name, device_id)
+    instance = app_instance()
+    if state is not None and hasattr(instance, 'import_state'):
+        instance.import_state(pickle.loads(state))
+    return app_instance
@@ -6,16 +6,17 @@ from sqlalchemy_utils import UUIDType
 
 from walkoff import executiondb
 from walkoff.appgateway import get_condition
-from walkoff.appgateway.validator import validate_condition_parameters
+from walkoff.appgateway.validator import validate_condition_parameters, compile_parameters
 from walkoff.events import WalkoffEvent
-from walkoff.executiondb.argument import Argument
-from walkoff.executiondb.executionelement import ExecutionElement
+from walkoff.executiondb.executionelement import (ExecutionElement, track_executable_changes,
+                                                  get_executable_generation)
 from walkoff.helpers import (UnknownCondition, UnknownApp, InvalidExecutionElement)
 from walkoff.helpers import get_condition_api, InvalidArgument, format_exception_message, split_api_params
 
 logger = logging.getLogger(__name__)
 
 
+@track_executable_changes
 class Condition(ExecutionElement, executiondb.Device_Base):
     __tablename__ = 'condition'
     conditional_expression_id = Column(UUIDType(binary=False), ForeignKey('conditional_expression.id'))
@@ -56,6 +57,8 @@ class Condition(ExecutionElement, executiondb.Device_Base):
         self._run = None
         self._api = None
         self._condition_executable = None
+        self._executable = None
+        self._executable_generation = None
 
         self.validate()
 
@@ -64,6 +67,8 @@ class Condition(ExecutionElement, executiondb.Device_Base):
         """Loads all necessary fields upon Condition being loaded from database"""
         self._data_param_name, self._run, self._api = get_condition_api(self.app_name, self.action_name)
         self._condition_executable = get_condition(self.app_name, self._run)
+        self._executable = None
+        self._executable_generation = None
 
     def validate(self):
         errors = {}
@@ -93,37 +98,54 @@ class Condition(ExecutionElement, executiondb.Device_Base):
         Returns:
             True if the Condition evaluated to True, False otherwise
         """
-        data = data_in
-
-        for transform in self.transforms:
-            data = transform.execute(data, accumulator)
-        try:
-            arguments = self.__update_arguments_with_data(data)
-            args = validate_condition_parameters(self._api, arguments, self.action_name, accumulator=accumulator)
-            logger.debug('Arguments passed to condition {} are valid'.format(self.id))
-            ret = self._condition_executable(**args)
-            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionSuccess)
-            if self.is_negated:
-                return not ret
-            else:
-                return ret
-        except InvalidArgument as e:
-            logger.error('Condition {0} has invalid input {1} which was converted to {2}. Error: {3}. '
-                         'Returning False'.format(self.action_name, data_in, data, format_exception_message(e)))
-            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionError)
-            raise
-        except Exception as e:
-            logger.error('Error encountered executing '
-                         'condition {0} with arguments {1} and value {2}: '
-                         'Error {3}. Returning False'.format(self.action_name, arguments, data,
-                                                             format_exception_message(e)))
-            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionError)
-            raise
-
-    def __update_arguments_with_data(self, data):
-        arguments = []
-        for argument in self.arguments:
-            if argument.name != self._data_param_name:
-                arguments.append(argument)
-        arguments.append(Argument(self._data_param_name, value=data))
-        return arguments
+        generation = get_executable_generation()
+        if self._executable_generation != generation:
+            self._executable = self.compile()
+            self._executable_generation = generation
+        return self._executable(data_in, accumulator)
+
+    def compile(self, emit_events=True):
+        """Compiles the Condition into a function which can be executed repeatedly without re-resolving the condition
+            or re-validating its static Arguments.
+        Args:
+            emit_events (bool, optional): Should the events for this Condition and its Transforms be sent? Defaults to
+                True.
+        Returns:
+            (func): A function with signature (data_in, accumulator) which returns True if the Condition evaluated to
+                True, False otherwise. Errors raised while executing the condition are propagated.
+        """
+        arguments = [argument for argument in self.arguments if argument.name != self._data_param_name]
+        validate_arguments = compile_parameters(self._api, arguments, 'condition {0}'.format(self.action_name),
+                                                runtime_params=(self._data_param_name,))
+        transforms = [transform.compile(emit_events=emit_events) for transform in self.transforms]
+        data_param_name = self._data_param_name
+        condition_executable = self._condition_executable
+        is_negated = self.is_negated
+
+        def execute(data_in, accumulator):
+            data = data_in
+            for transform in transforms:
+                data = transform(data, accumulator)
+            try:
+                args = validate_arguments({data_param_name: data}, accumulator=accumulator)
+                logger.debug('Arguments passed to condition {} are valid'.format(self.id))
+                ret = condition_executable(**args)
+                if emit_events:
+                    WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionSuccess)
+                return not ret if is_negated else ret
+            except InvalidArgument as e:
+                logger.error('Condition {0} has invalid input {1} which was converted to {2}. Error: {3}. '
+                             'Returning False'.format(self.action_name, data_in, data, format_exception_message(e)))
+                if emit_events:
+                    WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionError)
+                raise
+            except Exception as e:
+                logger.error('Error encountered executing '
+                             'condition {0} with arguments {1} and value {2}: '
+                             'Error {3}. Returning False'.format(self.action_name, self.arguments, data,
+                                                                 format_exception_message(e)))
+                if emit_events:
+                    WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionError)
+                raise
+
+        return execute
@@ -1,13 +1,14 @@
 import logging
 from uuid import uuid4
 
-from sqlalchemy import Column, ForeignKey, Enum, orm, Boolean
+from sqlalchemy import Column, ForeignKey, Enum, Boolean, orm
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy_utils import UUIDType
 
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import Device_Base
-from walkoff.executiondb.executionelement import ExecutionElement
+from walkoff.executiondb.executionelement import (ExecutionElement, track_executable_changes,
+                                                  get_executable_generation)
 from walkoff.helpers import InvalidArgument
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,7 @@ logger = logging.getLogger(__name__)
 valid_operators = ('and', 'or', 'xor')
 
 
+@track_executable_changes
 class ConditionalExpression(ExecutionElement, Device_Base):
     __tablename__ = 'conditional_expression'
     id = Column(UUIDType(binary=False), primary_key=True, default=uuid4)
@@ -49,18 +51,16 @@ class ConditionalExpression(ExecutionElement, Device_Base):
             self._construct_children(child_expressions)
         self.child_expressions = child_expressions if child_expressions is not None else []
         self.conditions = conditions if conditions is not None else []
-        self.__operator_lookup = {'and': self._and,
-                                  'or': self._or,
-                                  'xor': self._xor}
+        self._executable = None
+        self._executable_generation = None
 
         self.validate()
 
     @orm.reconstructor
     def init_on_load(self):
         """Loads all necessary fields upon ConditionalExpression being loaded from database"""
-        self.__operator_lookup = {'and': self._and,
-                                  'or': self._or,
-                                  'xor': self._xor}
+        self._executable = None
+        self._executable_generation = None
 
     def validate(self):
         pass
@@ -79,41 +79,87 @@ class ConditionalExpression(ExecutionElement, Device_Base):
         Returns:
             True if the Condition evaluated to True, False otherwise
         """
-        try:
-            result = self.__operator_lookup[self.operator](data_in, accumulator)
-            if self.is_negated:
-                result = not result
-            if result:
-                WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionalExpressionTrue)
-            else:
-                WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionalExpressionFalse)
-            return result
-        except (InvalidArgument, Exception) as e:
-            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionalExpressionError)
-            return False
-
-    def _and(self, data_in, accumulator):
-        return (all(condition.execute(data_in, accumulator) for condition in self.conditions)
-                and all(expression.execute(data_in, accumulator) for expression in self.child_expressions))
-
-    def _or(self, data_in, accumulator):
-        if not self.conditions and not self.child_expressions:
-            return True
-        return (any(condition.execute(data_in, accumulator) for condition in self.conditions)
-                or any(expression.execute(data_in, accumulator) for expression in self.child_expressions))
-
-    def _xor(self, data_in, accumulator):
-        if not self.conditions and not self.child_expressions:
-            return True
+        generation = get_executable_generation()
+        if self._executable_generation != generation:
+            self._executable = self.compile()
+            self._executable_generation = generation
+        return self._executable(data_in, accumulator)
+
+    def compile(self, emit_events=True):
+        """Compiles the ConditionalExpression tree into a tree of functions. The conditions are resolved and their
+            static Arguments are validated once, so the returned function can be executed repeatedly.
+
+        Args:
+            emit_events (bool, optional): Should the events for the ConditionalExpressions and Conditions in this
+                tree be sent? Defaults to True.
+
+        Returns:
+            (func): A function with signature (data_in, accumulator) which returns True if the ConditionalExpression
+                evaluated to True, False otherwise
+        """
+        operands = ([condition.compile(emit_events=emit_events) for condition in self.conditions]
+                    + [expression.compile(emit_events=emit_events) for expression in self.child_expressions])
+        evaluate = _operator_lookup[self.operator](operands)
+        is_negated = self.is_negated
+
+        def execute(data_in, accumulator):
+            try:
+                result = evaluate(data_in, accumulator)
+                if is_negated:
+                    result = not result
+                if emit_events:
+                    if result:
+                        WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionalExpressionTrue)
+                    else:
+                        WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionalExpressionFalse)
+                return result
+            except (InvalidArgument, Exception) as e:
+                if emit_events:
+                    WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.ConditionalExpressionError)
+                return False
+
+        return execute
+
+
+def _and(operands):
+    def evaluate(data_in, accumulator):
+        for operand in operands:
+            if not operand(data_in, accumulator):
+                return False
+        return True
+
+    return evaluate
+
+
+def _or(operands):
+    if not operands:
+        return lambda data_in, accumulator: True
+
+    def evaluate(data_in, accumulator):
+        for operand in operands:
+            if operand(data_in, accumulator):
+                return True
+        return False
+
+    return evaluate
+
+
+def _xor(operands):
+    if not operands:
+        return lambda data_in, accumulator: True
+
+    def evaluate(data_in, accumulator):
         is_one_found = False
-        for condition in self.conditions:
-            if condition.execute(data_in, accumulator):
-                if is_one_found:
-                    return False
-                is_one_found = True
-        for expression in self.child_expressions:
-            if expression.execute(data_in, accumulator):
+        for operand in operands:
+            if operand(data_in, accumulator):
                 if is_one_found:
                     return False
                 is_one_found = True
         return is_one_found
+
+    return evaluate
+
+
+_operator_lookup = {'and': _and,
+                    'or': _or,
+                    'xor': _xor}
@@ -1,8 +1,54 @@
 from uuid import uuid4
 
-from sqlalchemy import Column
+from sqlalchemy import Column, event
+from sqlalchemy.orm import RelationshipProperty
 from sqlalchemy_utils import UUIDType
 
+_executable_generation = 0
+
+
+def get_executable_generation():
+    """Gets the generation of the executables compiled from execution elements. The generation changes whenever a
+        mapped attribute of a class tracked by track_executable_changes is set, or one of its collections is modified
+
+    Note:
+        Values which are modified in place, such as a dict held by an Argument, do not change the generation
+
+    Returns:
+        (int): The generation of the compiled executables
+    """
+    return _executable_generation
+
+
+def invalidate_executables(*args, **kwargs):
+    """Invalidates all of the executables compiled from execution elements, so that they are compiled again when they
+        are next executed
+    """
+    global _executable_generation
+    _executable_generation += 1
+
+
+def track_executable_changes(cls):
+    """A class decorator which invalidates the compiled executables whenever a mapped attribute of the class changes
+
+    Args:
+        cls (cls): The mapped class
+
+    Returns:
+        cls: The class
+    """
+    event.listen(cls, 'mapper_configured', _listen_for_changes)
+    return cls
+
+
+def _listen_for_changes(mapper, cls):
+    for prop in mapper.attrs:
+        attribute = getattr(cls, prop.key)
+        event.listen(attribute, 'set', invalidate_executables)
+        if isinstance(prop, RelationshipProperty) and prop.uselist:
+            event.listen(attribute, 'append', invalidate_executables)
+            event.listen(attribute, 'remove', invalidate_executables)
+
 
 class ExecutionElement(object):
     id = Column(UUIDType(binary=False), primary_key=True, nullable=False, default=uuid4)
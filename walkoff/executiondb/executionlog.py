@@ -0,0 +1,149 @@
+import json
+import logging
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, func
+from sqlalchemy_utils import UUIDType
+
+import walkoff.config.config
+from walkoff import executiondb
+from walkoff.appgateway.actionresult import ActionResult
+from walkoff.executiondb import Device_Base
+from walkoff.executiondb.accumulator import SpillableAccumulator
+from walkoff.resultstore import log_result_store
+
+logger = logging.getLogger(__name__)
+
+ACTION_COMPLETED = 'action_completed'
+WORKFLOW_PAUSED = 'paused'
+WORKFLOW_AWAITING_DATA = 'awaiting_data'
+
+_waiting_events = (WORKFLOW_PAUSED, WORKFLOW_AWAITING_DATA)
+
+
+class ExecutionLogEntry(Device_Base):
+    """ORM for an entry in the append-only log written by workflows executing in durable mode. Each entry records a
+        completed action, or that the workflow stopped to wait for a resume or trigger data
+    """
+    __tablename__ = 'execution_log'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    workflow_execution_id = Column(UUIDType(binary=False), nullable=False, index=True)
+    workflow_id = Column(UUIDType(binary=False), nullable=False)
+    action_id = Column(UUIDType(binary=False), nullable=False)
+    event = Column(String(80), nullable=False)
+    status = Column(String(80))
+    result = Column(Text)
+    result_id = Column(String(64))
+    worker_id = Column(Integer)
+    timestamp = Column(DateTime, default=datetime.utcnow)
+
+    def __init__(self, workflow_execution_id, workflow_id, action_id, event, status=None, result=None,
+                 result_id=None, worker_id=None):
+        self.workflow_execution_id = workflow_execution_id
+        self.workflow_id = workflow_id
+        self.action_id = action_id
+        self.event = event
+        self.status = status
+        self.result = result
+        self.result_id = result_id
+        self.worker_id = worker_id
+
+
+def append_log_entry(workflow_execution_id, workflow_id, action_id, event, result=None, worker_id=None):
+    """Appends an entry to the execution log with a single insert on its own connection, so that the session of the
+        executing workflow is not committed. The JSON-encoded result of a completed action is kept in the log, unless
+        it is longer than the result_store_threshold value in walkoff.config.config, in which case it is written to
+        the log_result_store and only its ID is kept in the log
+
+    Args:
+        workflow_execution_id (str): The execution ID of the workflow
+        workflow_id (str): The ID of the workflow
+        action_id (str): The ID of the action which completed, or which the workflow is waiting to execute
+        event (str): One of ACTION_COMPLETED, WORKFLOW_PAUSED, or WORKFLOW_AWAITING_DATA
+        result (ActionResult, optional): The result of the completed action. Defaults to None
+        worker_id (int, optional): The ID of the worker executing the workflow. Defaults to None
+    """
+    values = {'workflow_execution_id': workflow_execution_id,
+              'workflow_id': workflow_id,
+              'action_id': action_id,
+              'event': event,
+              'worker_id': worker_id,
+              'timestamp': datetime.utcnow()}
+    if result is not None:
+        values['status'] = result.status
+        body = json.dumps(result.as_json()['result'])
+        threshold = walkoff.config.config.result_store_threshold
+        if threshold is not None and len(body) > threshold:
+            values['result_id'] = log_result_store.put(body)
+        else:
+            values['result'] = body
+    with executiondb.execution_db.status_engine.begin() as connection:
+        connection.execute(ExecutionLogEntry.__table__.insert().values(**values))
+
+
+def clear_log(workflow_execution_id):
+    """Removes all entries for a workflow execution from the execution log, along with the stored results which no
+        other entry refers to
+
+    Args:
+        workflow_execution_id (str): The execution ID of the workflow
+    """
+    table = ExecutionLogEntry.__table__
+    with executiondb.execution_db.status_engine.begin() as connection:
+        result_ids = {row[0] for row in connection.execute(
+            table.select().with_only_columns([table.c.result_id]).where(
+                table.c.workflow_execution_id == workflow_execution_id).where(table.c.result_id.isnot(None)))}
+        connection.execute(table.delete().where(table.c.workflow_execution_id == workflow_execution_id))
+        if result_ids:
+            result_ids -= {row[0] for row in connection.execute(
+                table.select().with_only_columns([table.c.result_id]).where(table.c.result_id.in_(result_ids)))}
+    for result_id in result_ids:
+        try:
+            log_result_store.delete(result_id)
+        except OSError:
+            logger.exception('Could not remove stored result {}'.format(result_id))
+
+
+def get_recoverable_executions(worker_id=None):
+    """Gets the workflow executions which were interrupted while running, such as by a worker crashing. Executions
+        which are paused or awaiting trigger data are not included
+
+    Args:
+        worker_id (int, optional): Only include executions which were running on the worker with this ID. Defaults to
+            None, meaning executions from every worker are included
+
+    Returns:
+        (list[tuple(UUID, UUID)]): The execution IDs of the interrupted workflows and the IDs of their workflows
+    """
+    session = executiondb.execution_db.session
+    last_entries = session.query(func.max(ExecutionLogEntry.id)).group_by(ExecutionLogEntry.workflow_execution_id)
+    query = session.query(ExecutionLogEntry).filter(ExecutionLogEntry.id.in_(last_entries))
+    if worker_id is not None:
+        query = query.filter(ExecutionLogEntry.worker_id == worker_id)
+    return [(entry.workflow_execution_id, entry.workflow_id) for entry in query.all()
+            if entry.event not in _waiting_events]
+
+
+def load_recovery_state(workflow_execution_id):
+    """Rebuilds the state of an interrupted workflow execution from the execution log
+
+    Args:
+        workflow_execution_id (str): The execution ID of the workflow
+
+    Returns:
+        (tuple(UUID, SpillableAccumulator, UUID, ActionResult)): The workflow ID, the accumulator, and the ID and result
+            of the last completed action, or None if no action completed
+    """
+    entries = executiondb.execution_db.session.query(ExecutionLogEntry).filter_by(
+        workflow_execution_id=workflow_execution_id).order_by(ExecutionLogEntry.id).all()
+    completed = [entry for entry in entries if entry.event == ACTION_COMPLETED]
+    if not completed:
+        return None
+    accumulator = SpillableAccumulator()
+    for entry in completed:
+        if entry.result_id is not None:
+            accumulator.add_stored_result(entry.action_id, entry.result_id, log_result_store)
+        else:
+            accumulator[entry.action_id] = json.loads(entry.result) if entry.result is not None else None
+    last = completed[-1]
+    return last.workflow_id, accumulator, last.action_id, ActionResult(accumulator[last.action_id], last.status)
@@ -0,0 +1,87 @@
+import logging
+
+from walkoff.appgateway.appdatacache import estimate_size
+
+logger = logging.getLogger(__name__)
+
+
+def get_references(element):
+    """Gets the IDs of the Actions whose results are referenced by the Arguments of an execution element and all of
+        its children
+
+    Args:
+        element (Action|Branch|ConditionalExpression|Condition|Transform): The element to inspect
+
+    Returns:
+        (set(str)): The string IDs of the referenced Actions
+    """
+    references = set()
+    stack = [element]
+    while stack:
+        elem = stack.pop()
+        if elem is None:
+            continue
+        for argument in getattr(elem, 'arguments', None) or []:
+            if argument.value is None and argument.reference:
+                references.add(str(argument.reference))
+        stack.append(getattr(elem, 'trigger', None))
+        stack.append(getattr(elem, 'condition', None))
+        stack.extend(getattr(elem, 'conditions', None) or [])
+        stack.extend(getattr(elem, 'child_expressions', None) or [])
+        stack.extend(getattr(elem, 'transforms', None) or [])
+    return references
+
+
+def get_live_results(workflow):
+    """Determines which results in the accumulator may still be used after each Action in a Workflow executes.
+
+    A result is live after an Action if a path through the Workflow's Branches leads from that Action to an element
+    which references the result before the referenced Action executes again. The Branches leaving an Action are
+    evaluated after the Action's result is stored, so the references in their conditions are live after the Action.
+    The result of the Action itself is always kept so that the final Action's result reaches the workflow's output.
+
+    Args:
+        workflow (Workflow): The Workflow to analyze
+
+    Returns:
+        (dict{str: frozenset(str)}): A dict of the string ID of each Action to the string IDs of the Actions whose
+            results must be kept after it executes
+    """
+    action_ids = [str(action.id) for action in workflow.actions]
+    uses = {str(action.id): get_references(action) for action in workflow.actions}
+    branch_uses = {action_id: set() for action_id in action_ids}
+    successors = {action_id: set() for action_id in action_ids}
+    for branch in workflow.branches:
+        source_id = str(branch.source_id)
+        if source_id in successors:
+            branch_uses[source_id] |= get_references(branch)
+            successors[source_id].add(str(branch.destination_id))
+
+    live_in = {action_id: set(uses[action_id]) for action_id in action_ids}
+    live_out = {action_id: set() for action_id in action_ids}
+    changed = True
+    while changed:
+        changed = False
+        for action_id in action_ids:
+            out = set(branch_uses[action_id])
+            for successor in successors[action_id]:
+                out |= live_in.get(successor, set())
+            in_ = uses[action_id] | (out - {action_id})
+            if out != live_out[action_id] or in_ != live_in[action_id]:
+                live_out[action_id] = out
+                live_in[action_id] = in_
+                changed = True
+
+    return {action_id: frozenset(live_out[action_id] | {action_id}) for action_id in action_ids}
+
+
+def summarize_result(result):
+    """Creates a small description of a result which has been released from the accumulator
+
+    Args:
+        result: The released result
+
+    Returns:
+        (dict): A dict containing the type and estimated size in bytes of the result
+    """
+    return {'released': True, 'type': type(result).__name__, 'size': estimate_size(result)}
@@ -0,0 +1,85 @@
+from sqlalchemy.orm import Load, selectinload
+
+from walkoff import executiondb
+from walkoff.executiondb.action import Action
+from walkoff.executiondb.branch import Branch
+from walkoff.executiondb.condition import Condition
+from walkoff.executiondb.conditionalexpression import ConditionalExpression
+from walkoff.executiondb.playbook import Playbook
+from walkoff.executiondb.transform import Transform
+from walkoff.executiondb.workflow import Workflow
+
+expression_depth = 4
+"""The number of levels of ConditionalExpressions whose Conditions are loaded eagerly. The contents of child
+    expressions nested more deeply are loaded lazily when they are accessed
+"""
+
+
+def workflow_load_options(workflow=None):
+    """Gets the loader options which eagerly load the Actions, Branches, and ConditionalExpressions of Workflows.
+        Each level of the Workflow graph is loaded by one query for all of the Workflows, so the number of queries
+        does not depend on the size of the Workflows
+
+    Args:
+        workflow (Load, optional): The loader of the Workflows, if they are loaded through a relationship. Defaults to
+            a loader of queried Workflows
+
+    Returns:
+        (list[Load]): The loader options
+    """
+    if workflow is None:
+        workflow = Load(Workflow)
+    actions = workflow.selectinload(Workflow.actions)
+    options = [actions.selectinload(Action.arguments), actions.selectinload(Action.position)]
+    options.extend(_expression_options(actions.selectinload(Action.trigger), expression_depth))
+    options.extend(_expression_options(workflow.selectinload(Workflow.branches).selectinload(Branch.condition),
+                                       expression_depth))
+    return options
+
+
+def playbook_load_options():
+    """Gets the loader options which eagerly load the Workflows of Playbooks and their Actions, Branches, and
+        ConditionalExpressions
+
+    Returns:
+        (list[Load]): The loader options
+    """
+    return workflow_load_options(selectinload(Playbook.workflows))
+
+
+def load_workflow(workflow_id):
+    """Loads a Workflow and its Actions, Branches, and ConditionalExpressions
+
+    Args:
+        workflow_id (UUID|str): The ID of the Workflow
+
+    Returns:
+        (Workflow): The Workflow, or None if it does not exist
+    """
+    return executiondb.execution_db.session.query(Workflow).filter_by(id=workflow_id). \
+        options(*workflow_load_options()).first()
+
+
+def load_playbook(playbook_id):
+    """Loads a Playbook and its Workflows
+
+    Args:
+        playbook_id (UUID|str): The ID of the Playbook
+
+    Returns:
+        (Playbook): The Playbook, or None if it does not exist
+    """
+    return executiondb.execution_db.session.query(Playbook).filter_by(id=playbook_id). \
+        options(*playbook_load_options()).first()
+
+
+def _expression_options(expression, depth):
+    conditions = expression.selectinload(ConditionalExpression.conditions)
+    options = [conditions.selectinload(Condition.arguments),
+               conditions.selectinload(Condition.transforms).selectinload(Transform.arguments)]
+    child_expressions = expression.selectinload(ConditionalExpression.child_expressions)
+    if depth > 1:
+        options.extend(_expression_options(child_expressions, depth - 1))
+    else:
+        options.append(child_expressions)
+    return options
@@ -0,0 +1,297 @@
+import gzip
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Float, Integer, exists, and_, func
+from sqlalchemy.orm import selectinload
+from sqlalchemy_utils import UUIDType
+
+import walkoff.config.config
+import walkoff.config.paths
+from walkoff import executiondb
+from walkoff.executiondb import Device_Base, WorkflowStatusEnum, ActionStatusEnum
+from walkoff.executiondb.statuswriter import status_writer
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+from walkoff.helpers import utc_as_rfc_datetime
+
+logger = logging.getLogger(__name__)
+
+_finished_statuses = (WorkflowStatusEnum.completed, WorkflowStatusEnum.aborted)
+
+
+class WorkflowRollup(Device_Base):
+    """ORM for the summary of the executions of a workflow which finished within an hour. Rollups outlive the
+        executions they summarize, so that execution history can be removed without losing its statistics. Executions
+        which were aborted are counted as aborted rather than as failures, even if one of their actions failed
+    """
+    __tablename__ = 'workflow_rollup'
+    workflow_id = Column(UUIDType(binary=False), primary_key=True)
+    hour = Column(DateTime, primary_key=True)
+    count = Column(Integer, nullable=False)
+    failures = Column(Integer, nullable=False)
+    aborted = Column(Integer, nullable=False)
+    duration_p50 = Column(Float)
+    duration_p90 = Column(Float)
+    duration_p99 = Column(Float)
+
+    def __init__(self, workflow_id, hour, count, failures, aborted, durations):
+        self.workflow_id = workflow_id
+        self.hour = hour
+        self.count = count
+        self.failures = failures
+        self.aborted = aborted
+        durations = sorted(durations)
+        self.duration_p50 = _percentile(durations, 50)
+        self.duration_p90 = _percentile(durations, 90)
+        self.duration_p99 = _percentile(durations, 99)
+
+    def as_json(self):
+        return {'workflow_id': str(self.workflow_id),
+                'hour': utc_as_rfc_datetime(self.hour),
+                'count': self.count,
+                'failures': self.failures,
+                'aborted': self.aborted,
+                'duration_p50': self.duration_p50,
+                'duration_p90': self.duration_p90,
+                'duration_p99': self.duration_p99}
+
+
+class ExecutionRetention(object):
+    """Rolls up and removes the statuses of finished workflow executions from the execution database. Executions are
+        rolled up by the hour in which they finished, once that hour is over. Executions which finished longer ago
+        than a maximum age are removed in chunks, each in its own transaction, after being appended to a compressed
+        NDJSON archive file if archiving is enabled. apply_if_due does this in a background thread, a bounded amount
+        at a time, so that finishing a workflow does not wait for it
+
+    Attributes:
+        archive_path (str): The directory of the archive files. If None, the execution_archive_path value in
+            walkoff.config.paths is used
+
+    Args:
+        archive_path (str, optional): The directory of the archive files. Defaults to None
+    """
+
+    def __init__(self, archive_path=None):
+        self.archive_path = archive_path
+        self._last_applied = None
+        self._behind = False
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def update_rollups(self, until=None, max_hours=None):
+        """Rolls up the executions which finished in the hours after the latest rolled up hour
+
+        Args:
+            until (datetime, optional): The end of the last hour to roll up. Defaults to the start of the current hour
+            max_hours (int, optional): The largest number of hours to roll up, starting from the first hour with
+                executions which have not been rolled up. Defaults to None, meaning every hour before until is rolled
+                up
+
+        Returns:
+            (int): The number of rollups which were added
+        """
+        return self.__update_rollups(until, max_hours)[0]
+
+    def apply(self, max_age, chunk_size=None, archive=None, max_chunks=None, max_hours=None):
+        """Rolls up the finished executions, then removes the executions which finished more than a number of seconds
+            ago. Only executions in hours which have been rolled up are removed
+
+        Args:
+            max_age (float): The number of seconds after which a finished execution is removed
+            chunk_size (int, optional): The number of executions removed in each transaction. Defaults to the
+                execution_retention_chunk_size value in walkoff.config.config
+            archive (bool, optional): Whether to archive the executions before removing them. Defaults to the
+                archive_executions value in walkoff.config.config
+            max_chunks (int, optional): The largest number of chunks to remove. Defaults to None, meaning every
+                execution older than max_age is removed
+            max_hours (int, optional): The largest number of hours to roll up. Defaults to None, meaning every hour
+                which is over is rolled up
+
+        Returns:
+            (int): The number of executions which were removed
+        """
+        if chunk_size is None:
+            chunk_size = walkoff.config.config.execution_retention_chunk_size
+        if archive is None:
+            archive = walkoff.config.config.archive_executions
+        now = datetime.utcnow()
+        _, rolled_up_until = self.__update_rollups(now, max_hours)
+        cutoff = min(now - timedelta(seconds=max_age), rolled_up_until)
+
+        session = executiondb.execution_db.session
+        archive_file = None
+        removed = 0
+        chunks = 0
+        try:
+            while max_chunks is None or chunks < max_chunks:
+                chunk = session.query(WorkflowStatus). \
+                    filter(WorkflowStatus.status.in_(_finished_statuses), WorkflowStatus.completed_at < cutoff). \
+                    options(selectinload(WorkflowStatus._action_statuses)). \
+                    order_by(WorkflowStatus.completed_at). \
+                    limit(chunk_size). \
+                    all()
+                if not chunk:
+                    break
+                if archive:
+                    if archive_file is None:
+                        archive_file = self.__open_archive(now)
+                    for workflow_status in chunk:
+                        line = json.dumps(workflow_status.as_json(full_actions=True)) + '\n'
+                        archive_file.write(line.encode('utf-8'))
+                    archive_file.flush()
+                execution_ids = [workflow_status.execution_id for workflow_status in chunk]
+                session.query(ActionStatus).filter(ActionStatus._workflow_status_id.in_(execution_ids)).delete(
+                    synchronize_session=False)
+                session.query(WorkflowStatus).filter(WorkflowStatus.execution_id.in_(execution_ids)).delete(
+                    synchronize_session=False)
+                session.commit()
+                removed += len(chunk)
+                chunks += 1
+                if len(chunk) < chunk_size:
+                    break
+            else:
+                self._behind = True
+        finally:
+            if archive_file is not None:
+                archive_file.close()
+        if removed:
+            logger.info('Removed {} finished workflow executions from the execution database'.format(removed))
+        return removed
+
+    def apply_if_due(self):
+        """Starts a background run of apply_bounded, at most once every execution_retention_interval seconds of
+            walkoff.config.config. If the previous run stopped at one of its bounds, the next run starts without waiting
+            for the interval
+
+        Returns:
+            (bool): True if a run was started
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            now = time.time()
+            interval = walkoff.config.config.execution_retention_interval
+            if not self._behind and self._last_applied is not None and now - self._last_applied < interval:
+                return False
+            self._last_applied = now
+            self._thread = threading.Thread(target=self.__run)
+            self._thread.daemon = True
+            self._thread.start()
+            return True
+
+    def apply_bounded(self):
+        """Writes the pending status transitions, then rolls up at most execution_rollup_max_hours hours of finished
+            executions, and removes at most execution_retention_max_chunks chunks of those older than the
+            execution_retention_age value in walkoff.config.config
+
+        Returns:
+            (int): The number of executions which were removed
+        """
+        self._behind = False
+        status_writer.flush()
+        max_age = walkoff.config.config.execution_retention_age
+        max_hours = walkoff.config.config.execution_rollup_max_hours
+        if max_age is None:
+            self.update_rollups(max_hours=max_hours)
+            return 0
+        return self.apply(max_age, max_chunks=walkoff.config.config.execution_retention_max_chunks,
+                          max_hours=max_hours)
+
+    def wait(self):
+        """Waits for the background run started by apply_if_due to finish"""
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def __run(self):
+        try:
+            self.apply_bounded()
+        except Exception:
+            logger.exception('Could not apply the execution retention policy')
+        finally:
+            executiondb.execution_db.session.remove()
+
+    def __update_rollups(self, until, max_hours):
+        session = executiondb.execution_db.session
+        until = _floor_hour(until if until is not None else datetime.utcnow())
+        latest = session.query(func.max(WorkflowRollup.hour)).scalar()
+        criteria = [WorkflowStatus.status.in_(_finished_statuses), WorkflowStatus.completed_at < until]
+        if latest is not None:
+            criteria.append(WorkflowStatus.completed_at >= latest + timedelta(hours=1))
+        if max_hours is not None:
+            first = session.query(func.min(WorkflowStatus.completed_at)).filter(*criteria).scalar()
+            if first is not None and _floor_hour(first) + timedelta(hours=max_hours) < until:
+                until = _floor_hour(first) + timedelta(hours=max_hours)
+                criteria.append(WorkflowStatus.completed_at < until)
+                self._behind = True
+
+        query = session.query(WorkflowStatus.workflow_id, WorkflowStatus.status, WorkflowStatus.started_at,
+                              WorkflowStatus.completed_at, _has_failed_action).filter(*criteria)
+        groups = defaultdict(lambda: [0, 0, 0, []])
+        for workflow_id, status, started_at, completed_at, failed in query:
+            group = groups[(workflow_id, _floor_hour(completed_at))]
+            group[0] += 1
+            if status == WorkflowStatusEnum.aborted:
+                group[2] += 1
+            elif failed:
+                group[1] += 1
+            if started_at is not None:
+                group[3].append((completed_at - started_at).total_seconds())
+
+        session.add_all(WorkflowRollup(workflow_id, hour, count, failures, aborted, durations)
+                        for (workflow_id, hour), (count, failures, aborted, durations) in groups.items())
+        session.commit()
+        if groups:
+            logger.debug('Added {} hourly workflow rollups'.format(len(groups)))
+        return len(groups), until
+
+    def __open_archive(self, now):
+        path = self.archive_path if self.archive_path is not None else walkoff.config.paths.execution_archive_path
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        filename = 'executions-{}.ndjson.gz'.format(now.strftime('%Y%m%dT%H%M%S%f'))
+        return gzip.open(os.path.join(path, filename), 'wb')
+
+
+def get_rollups(workflow_id=None, since=None, until=None):
+    """Gets the hourly rollups of finished executions
+
+    Args:
+        workflow_id (UUID, optional): Only get the rollups of this workflow. Defaults to None
+        since (datetime, optional): Only get the rollups of hours starting at or after this time. Defaults to None
+        until (datetime, optional): Only get the rollups of hours starting before this time. Defaults to None
+
+    Returns:
+        (list[WorkflowRollup]): The rollups, ordered by hour
+    """
+    query = executiondb.execution_db.session.query(WorkflowRollup)
+    if workflow_id is not None:
+        query = query.filter(WorkflowRollup.workflow_id == workflow_id)
+    if since is not None:
+        query = query.filter(WorkflowRollup.hour >= since)
+    if until is not None:
+        query = query.filter(WorkflowRollup.hour < until)
+    return query.order_by(WorkflowRollup.hour, WorkflowRollup.workflow_id).all()
+
+
+_has_failed_action = exists().where(and_(ActionStatus._workflow_status_id == WorkflowStatus.execution_id,
+                                         ActionStatus.status == ActionStatusEnum.failure)).label('failed')
+
+
+def _floor_hour(timestamp):
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+def _percentile(ordered, percent):
+    if not ordered:
+        return None
+    return ordered[max(int(math.ceil(percent / 100.0 * len(ordered))) - 1, 0)]
+
+
+execution_retention = ExecutionRetention()
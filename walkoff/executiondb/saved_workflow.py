@@ -1,9 +1,10 @@
 import logging
 
-from sqlalchemy import Column, PickleType
+from sqlalchemy import Column, LargeBinary, orm
 from sqlalchemy_utils import UUIDType
 
 from walkoff.executiondb import Device_Base
+from walkoff.executiondb.checkpoint import encode_checkpoint, decode_checkpoint
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +14,7 @@ class SavedWorkflow(Device_Base):
     workflow_execution_id = Column(UUIDType(binary=False), primary_key=True)
     workflow_id = Column(UUIDType(binary=False), nullable=False)
     action_id = Column(UUIDType(binary=False), nullable=False)
-    accumulator = Column(PickleType(), nullable=False)
-    app_instances = Column(PickleType(), nullable=False)
+    checkpoint = Column(LargeBinary(), nullable=False)
 
     def __init__(self, workflow_execution_id, workflow_id, action_id, accumulator, app_instances):
         """Initializes a SavedWorkflow object. This is used when a workflow pauses execution, and must be reloaded
@@ -25,10 +25,78 @@ class SavedWorkflow(Device_Base):
             workflow_id (str): The ID of the workflow that this saved state refers to.
             action_id (str): The currently executing action ID.
             accumulator (dict): The accumulator up to this point in the workflow.
-            app_instances (str): The pickled app instances for the saved workflow
+            app_instances (dict): The app instances for the saved workflow
         """
         self.workflow_execution_id = workflow_execution_id
         self.workflow_id = workflow_id
         self.action_id = action_id
-        self.accumulator = accumulator
-        self.app_instances = app_instances
+        self.checkpoint = encode_checkpoint(accumulator, app_instances)
+        self._state = None
+
+    @orm.reconstructor
+    def init_on_load(self):
+        """Loads all necessary fields upon SavedWorkflow being loaded from database"""
+        self._state = None
+
+    @property
+    def accumulator(self):
+        """The accumulator of the saved workflow, decoded from the checkpoint"""
+        return self.__get_state()[0]
+
+    @property
+    def app_instances(self):
+        """The app instances of the saved workflow, recreated from the checkpoint"""
+        return self.__get_state()[1]
+
+    def __get_state(self):
+        if self._state is None:
+            self._state = decode_checkpoint(self.checkpoint)
+        return self._state
+
+    @classmethod
+    def save(cls, session, workflow_execution_id, workflow_id, action_id, accumulator, app_instances):
+        """Saves the state of a workflow with a single upsert where the database supports it, without loading any
+            existing saved state
+
+        Args:
+            session (Session): The database session to use
+            workflow_execution_id (str): The workflow execution UID that this saved state refers to.
+            workflow_id (str): The ID of the workflow that this saved state refers to.
+            action_id (str): The currently executing action ID.
+            accumulator (dict): The accumulator up to this point in the workflow.
+            app_instances (dict): The app instances for the saved workflow
+        """
+        values = {'workflow_id': workflow_id,
+                  'action_id': action_id,
+                  'checkpoint': encode_checkpoint(accumulator, app_instances)}
+        statement = cls.__upsert_statement(session.get_bind(mapper=cls).dialect.name, workflow_execution_id, values)
+        if statement is not None:
+            session.execute(statement, mapper=cls)
+        else:
+            table = cls.__table__
+            result = session.execute(
+                table.update().where(table.c.workflow_execution_id == workflow_execution_id).values(**values),
+                mapper=cls)
+            if not result.rowcount:
+                session.execute(table.insert().values(workflow_execution_id=workflow_execution_id, **values),
+                                mapper=cls)
+        session.commit()
+
+    @classmethod
+    def __upsert_statement(cls, dialect_name, workflow_execution_id, values):
+        table = cls.__table__
+        if dialect_name == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect_name == 'mysql':
+            from sqlalchemy.dialects.mysql import insert
+        elif dialect_name == 'sqlite':
+            try:
+                from sqlalchemy.dialects.sqlite import insert
+            except ImportError:
+                return None
+        else:
+            return None
+        statement = insert(table).values(workflow_execution_id=workflow_execution_id, **values)
+        if dialect_name == 'mysql':
+            return statement.on_duplicate_key_update(**values)
+        return statement.on_conflict_do_update(index_elements=[table.c.workflow_execution_id], set_=values)
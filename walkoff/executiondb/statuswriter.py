@@ -0,0 +1,318 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import SQLAlchemyError
+
+import walkoff.config.config
+from walkoff import executiondb
+from walkoff.executiondb import WorkflowStatusEnum
+from walkoff.executiondb.saved_workflow import SavedWorkflow
+from walkoff.executiondb.workflowresults import WorkflowStatus, ActionStatus
+
+logger = logging.getLogger(__name__)
+
+_workflow = 'workflow'
+_action = 'action'
+
+
+class StatusWriter(object):
+    """Gathers the transitions of workflow and action statuses in memory, and writes them to the execution database in
+        batched transactions. A batch is written once it holds a number of transitions, or once its oldest
+        transition has waited for an interval. Until then, get_workflow_status overlays the pending transitions on
+        the statuses in the database. Transitions are applied through the methods of WorkflowStatus and ActionStatus
+        both when they are written and when they are overlaid.
+
+        Workflows starting to run, pausing, and waiting for trigger data are written immediately, along with any
+        transitions pending before them, because the load balancer, the worker processes, and the apps read these
+        statuses from the database. Other transitions are only guaranteed to be in the database after flush is called,
+        so readers which query WorkflowStatus or ActionStatus directly must call flush first.
+
+    Attributes:
+        batch_size (int): The number of transitions which causes a batch to be written. If None, the
+            status_write_batch_size value in walkoff.config.config is used
+        flush_interval (float): The number of seconds after which a batch is written. If None, the
+            status_write_interval value in walkoff.config.config is used
+
+    Args:
+        batch_size (int, optional): The number of transitions which causes a batch to be written. Defaults to None
+        flush_interval (float, optional): The number of seconds after which a batch is written. Defaults to None
+    """
+
+    def __init__(self, batch_size=None, flush_interval=None):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._transitions = []
+        self._finished = set()
+        self._first_recorded = None
+        self._timer = None
+
+    @property
+    def pending(self):
+        """The number of transitions which have not been written to the database"""
+        return len(self._transitions)
+
+    def workflow_pending(self, execution_id, workflow_id, name):
+        """Records that a workflow has been queued for execution
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+            workflow_id (str): The ID of the workflow
+            name (str): The name of the workflow
+        """
+        self.__record(_workflow, execution_id, execution_id, 'pending', _as_uuid(workflow_id), name)
+
+    def workflow_running(self, execution_id):
+        """Records that a workflow has started executing
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+        """
+        self.__record(_workflow, execution_id, execution_id, 'running', datetime.utcnow(), write=True)
+
+    def workflow_paused(self, execution_id):
+        """Records that a workflow has paused
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+        """
+        self.__record(_workflow, execution_id, execution_id, 'paused', write=True)
+
+    def workflow_awaiting_data(self, execution_id):
+        """Records that a workflow is waiting for data to be sent to a trigger
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+        """
+        self.__record(_workflow, execution_id, execution_id, 'awaiting_data', write=True)
+
+    def workflow_completed(self, execution_id):
+        """Records that a workflow has completed, and that its saved state can be removed
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+        """
+        with self._lock:
+            self._finished.add(_as_uuid(execution_id))
+            self.__record(_workflow, execution_id, execution_id, 'completed', datetime.utcnow())
+
+    def workflow_aborted(self, execution_id):
+        """Records that a workflow has been aborted, and that its saved state can be removed
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+        """
+        with self._lock:
+            self._finished.add(_as_uuid(execution_id))
+            self.__record(_workflow, execution_id, execution_id, 'aborted', datetime.utcnow())
+
+    def action_started(self, execution_id, workflow_execution_id, action_id, name, app_name, action_name,
+                       arguments=None):
+        """Records that an action has started executing
+
+        Args:
+            execution_id (str): The execution ID of the action
+            workflow_execution_id (str): The execution ID of the workflow
+            action_id (str): The ID of the action
+            name (str): The name of the action
+            app_name (str): The name of the app of the action
+            action_name (str): The name of the app action
+            arguments (str, optional): The JSON-encoded arguments of the action. Defaults to None
+        """
+        self.__record(_action, execution_id, workflow_execution_id, 'started', _as_uuid(action_id), name, app_name,
+                      action_name, arguments, datetime.utcnow())
+
+    def action_succeeded(self, execution_id, workflow_execution_id, data):
+        """Records that an action has executed successfully
+
+        Args:
+            execution_id (str): The execution ID of the action
+            workflow_execution_id (str): The execution ID of the workflow
+            data (dict): The JSON representation of the result of the action
+        """
+        self.__record(_action, execution_id, workflow_execution_id, 'completed_success', data, datetime.utcnow())
+
+    def action_failed(self, execution_id, workflow_execution_id, data):
+        """Records that an action has failed
+
+        Args:
+            execution_id (str): The execution ID of the action
+            workflow_execution_id (str): The execution ID of the workflow
+            data (dict): The JSON representation of the result of the action
+        """
+        self.__record(_action, execution_id, workflow_execution_id, 'completed_failure', data, datetime.utcnow())
+
+    def get_workflow_status(self, execution_id):
+        """Gets the latest status of a workflow, including the transitions which have not been written yet
+
+        Args:
+            execution_id (str): The execution ID of the workflow
+
+        Returns:
+            (WorkflowStatus): The status of the workflow, or None if the workflow does not exist. If transitions of
+                the workflow are pending, this is a copy which is not attached to a database session and must not be
+                modified
+        """
+        try:
+            key = _as_uuid(execution_id)
+        except ValueError:
+            return None
+        with self._lock:
+            workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
+                execution_id=key).first()
+            transitions = [transition for transition in self._transitions if transition[2] == key]
+            if not transitions:
+                return workflow_status
+
+            workflows, actions = {}, {}
+            if workflow_status is not None:
+                overlay = _copy(workflow_status)
+                overlay._action_statuses = [_copy(action_status) for action_status in
+                                            workflow_status._action_statuses]
+                workflows[key] = overlay
+                actions.update((action_status.execution_id, action_status)
+                               for action_status in overlay._action_statuses)
+            _apply(transitions, workflows, actions)
+            return workflows.get(key)
+
+    def flush_if_due(self):
+        """Writes the pending transitions to the database if the oldest of them has waited for the flush interval"""
+        with self._lock:
+            if self._transitions and time.time() - self._first_recorded >= self.__get_flush_interval():
+                self.flush()
+
+    def flush(self):
+        """Writes the pending transitions to the database in a single transaction. If the transaction fails, the
+            transitions are kept and written by the next flush
+        """
+        with self._lock:
+            self.__cancel_timer()
+            if not self._transitions:
+                return
+            transitions, finished = self._transitions, self._finished
+            first_recorded = self._first_recorded
+            self._transitions, self._finished, self._first_recorded = [], set(), None
+
+            session = executiondb.execution_db.session
+            session.expire_all()
+            try:
+                workflows, actions = self.__load(session, transitions)
+                _apply(transitions, workflows, actions, add=session.add, warn=True)
+                if finished:
+                    session.query(SavedWorkflow).filter(
+                        SavedWorkflow.workflow_execution_id.in_(list(finished))).delete(synchronize_session=False)
+                session.commit()
+            except SQLAlchemyError:
+                session.rollback()
+                self._transitions = transitions + self._transitions
+                self._finished |= finished
+                self._first_recorded = first_recorded
+                logger.exception('Could not write {} workflow and action status transitions. Retrying them with the '
+                                 'next batch'.format(len(transitions)))
+                self.__schedule_timer()
+            else:
+                logger.debug('Wrote {} workflow and action status transitions'.format(len(transitions)))
+
+    def __record(self, kind, execution_id, workflow_execution_id, method, *args, **kwargs):
+        with self._lock:
+            if not self._transitions:
+                self._first_recorded = time.time()
+            self._transitions.append((kind, _as_uuid(execution_id), _as_uuid(workflow_execution_id), method, args))
+            batch_size = self.__get_batch_size()
+            if kwargs.get('write') or batch_size is None or len(self._transitions) >= batch_size:
+                self.flush()
+            else:
+                self.__schedule_timer()
+
+    def __schedule_timer(self):
+        if self._timer is None:
+            self._timer = threading.Timer(self.__get_flush_interval(), self.__flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def __cancel_timer(self):
+        if self._timer is not None:
+            if self._timer is not threading.current_thread():
+                self._timer.cancel()
+            self._timer = None
+
+    def __flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            executiondb.execution_db.session.remove()
+
+    def __get_batch_size(self):
+        return self.batch_size if self.batch_size is not None else walkoff.config.config.status_write_batch_size
+
+    def __get_flush_interval(self):
+        return (self.flush_interval if self.flush_interval is not None
+                else walkoff.config.config.status_write_interval)
+
+    @staticmethod
+    def __load(session, transitions):
+        workflow_keys = {transition[2] for transition in transitions}
+        action_keys = {transition[1] for transition in transitions if transition[0] == _action}
+        workflows = {status.execution_id: status for status in session.query(WorkflowStatus).filter(
+            WorkflowStatus.execution_id.in_(list(workflow_keys))).all()}
+        actions = {}
+        if action_keys:
+            actions = {status.execution_id: status for status in session.query(ActionStatus).filter(
+                ActionStatus.execution_id.in_(list(action_keys))).all()}
+        return workflows, actions
+
+
+def _apply(transitions, workflows, actions, add=None, warn=False):
+    for kind, key, workflow_key, method, args in transitions:
+        if kind == _workflow:
+            status = workflows.get(key)
+            if method == 'pending':
+                if status is None:
+                    status = workflows[key] = WorkflowStatus(key, *args)
+                    if add is not None:
+                        add(status)
+                else:
+                    status.status = WorkflowStatusEnum.pending
+                continue
+        else:
+            status = actions.get(key)
+            if method == 'started':
+                if status is None:
+                    workflow_status = workflows.get(workflow_key)
+                    if workflow_status is None:
+                        if warn:
+                            logger.warning('Cannot add status of action {0}. Workflow {1} does not exist'.format(
+                                key, workflow_key))
+                        continue
+                    status = actions[key] = ActionStatus(key, *args[:-1])
+                    status.started_at = args[-1]
+                    workflow_status.add_action_status(status)
+                    if add is not None:
+                        add(status)
+                else:
+                    status.running()
+                continue
+        if status is None:
+            if warn:
+                logger.warning('Cannot update status of {0} {1}. It does not exist'.format(kind, key))
+            continue
+        getattr(status, method)(*args)
+
+
+def _as_uuid(value):
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _copy(status):
+    status_class = type(status)
+    copy = inspect(status_class).class_manager.new_instance()
+    for column in inspect(status_class).column_attrs:
+        setattr(copy, column.key, getattr(status, column.key))
+    return copy
+
+
+status_writer = StatusWriter()
@@ -6,11 +6,11 @@ from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
 from walkoff.appgateway import get_transform
-from walkoff.appgateway.validator import validate_transform_parameters
+from walkoff.appgateway.validator import validate_transform_parameters, compile_parameters
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import Device_Base
-from walkoff.executiondb.argument import Argument
-from walkoff.executiondb.executionelement import ExecutionElement
+from walkoff.executiondb.executionelement import (ExecutionElement, track_executable_changes,
+                                                  get_executable_generation)
 from walkoff.helpers import UnknownTransform, UnknownApp, \
     InvalidExecutionElement
 from walkoff.helpers import get_transform_api, InvalidArgument, split_api_params
@@ -18,6 +18,7 @@ from walkoff.helpers import get_transform_api, InvalidArgument, split_api_params
 logger = logging.getLogger(__name__)
 
 
+@track_executable_changes
 class Transform(ExecutionElement, Device_Base):
     __tablename__ = 'transform'
     condition_id = Column(UUIDType(binary=False), ForeignKey('condition.id'))
@@ -50,6 +51,8 @@ class Transform(ExecutionElement, Device_Base):
 
         self.validate()
         self._transform_executable = get_transform(self.app_name, self._run)
+        self._executable = None
+        self._executable_generation = None
 
     def validate(self):
         errors = {}
@@ -75,6 +78,8 @@ class Transform(ExecutionElement, Device_Base):
         """Loads all necessary fields upon Condition being loaded from database"""
         self._data_param_name, self._run, self._api = get_transform_api(self.app_name, self.action_name)
         self._transform_executable = get_transform(self.app_name, self._run)
+        self._executable = None
+        self._executable_generation = None
 
     def execute(self, data_in, accumulator):
         """Executes the transform.
@@ -84,27 +89,47 @@ class Transform(ExecutionElement, Device_Base):
         Returns:
             (obj): The transformed data
         """
-        original_data_in = deepcopy(data_in)
-        try:
-            arguments = self.__update_arguments_with_data(data_in)
-            args = validate_transform_parameters(self._api, arguments, self.action_name, accumulator=accumulator)
-            result = self._transform_executable(**args)
-            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformSuccess)
-            return result
-        except InvalidArgument as e:
-            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformError)
-            logger.error('Transform {0} has invalid input {1}. Error: {2}. '
-                         'Returning unmodified data'.format(self.action_name, original_data_in, str(e)))
-        except Exception as e:
-            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformError)
-            logger.error(
-                'Transform {0} encountered an error: {1}. Returning unmodified data'.format(self.action_name, str(e)))
-        return original_data_in
-
-    def __update_arguments_with_data(self, data):
-        arguments = []
-        for argument in self.arguments:
-            if argument.name != self._data_param_name:
-                arguments.append(argument)
-        arguments.append(Argument(self._data_param_name, value=data))
-        return arguments
+        generation = get_executable_generation()
+        if self._executable_generation != generation:
+            self._executable = self.compile()
+            self._executable_generation = generation
+        return self._executable(data_in, accumulator)
+
+    def compile(self, emit_events=True):
+        """Compiles the transform into a function which can be executed repeatedly without re-validating its static
+            Arguments. The input is only copied if the transform is declared to mutate it, so the original input can
+            be returned by reference if the transform fails.
+        Args:
+            emit_events (bool, optional): Should the TransformSuccess and TransformError events be sent? Defaults to
+                True.
+        Returns:
+            (func): A function with signature (data_in, accumulator) which returns the transformed data
+        """
+        arguments = [argument for argument in self.arguments if argument.name != self._data_param_name]
+        validate_arguments = compile_parameters(self._api, arguments, 'transform {0}'.format(self.action_name),
+                                                runtime_params=(self._data_param_name,))
+        data_param_name = self._data_param_name
+        transform_executable = self._transform_executable
+        mutates = getattr(transform_executable, 'mutates', False)
+
+        def execute(data_in, accumulator):
+            try:
+                data = deepcopy(data_in) if mutates else data_in
+                args = validate_arguments({data_param_name: data}, accumulator=accumulator)
+                result = transform_executable(**args)
+                if emit_events:
+                    WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformSuccess)
+                return result
+            except InvalidArgument as e:
+                if emit_events:
+                    WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformError)
+                logger.error('Transform {0} has invalid input {1}. Error: {2}. '
+                             'Returning unmodified data'.format(self.action_name, data_in, str(e)))
+            except Exception as e:
+                if emit_events:
+                    WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.TransformError)
+                logger.error('Transform {0} encountered an error: {1}. '
+                             'Returning unmodified data'.format(self.action_name, str(e)))
+            return data_in
+
+        return execute
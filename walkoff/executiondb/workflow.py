@@ -6,11 +6,16 @@ from sqlalchemy import Column, String, ForeignKey, orm, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy_utils import UUIDType
 
+import walkoff.config.config
 from walkoff.appgateway.appinstancerepo import AppInstanceRepo
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import Device_Base
+from walkoff.executiondb.accumulator import SpillableAccumulator
 from walkoff.executiondb.action import Action
 from walkoff.executiondb.executionelement import ExecutionElement
+from walkoff.executiondb.executionlog import append_log_entry, clear_log, ACTION_COMPLETED, WORKFLOW_PAUSED, \
+    WORKFLOW_AWAITING_DATA
+from walkoff.executiondb.liveness import get_live_results, summarize_result
 from walkoff.helpers import InvalidExecutionElement
 
 logger = logging.getLogger(__name__)
@@ -45,9 +50,12 @@ class Workflow(ExecutionElement, Device_Base):
 
         self._is_paused = False
         self._abort = False
-        self._accumulator = {}
+        self._accumulator = SpillableAccumulator()
+        self._released_results = {}
+        self._live_results = None
         self._execution_id = 'default'
         self._instance_repo = None
+        self._worker_id = None
 
         self.validate()
 
@@ -56,9 +64,12 @@ class Workflow(ExecutionElement, Device_Base):
         """Loads all necessary fields upon Workflow being loaded from database"""
         self._is_paused = False
         self._abort = False
-        self._accumulator = {}
+        self._accumulator = SpillableAccumulator()
+        self._released_results = {}
+        self._live_results = None
         self._instance_repo = AppInstanceRepo()
         self._execution_id = 'default'
+        self._worker_id = None
 
     def validate(self):
         action_ids = [action.id for action in self.actions]
@@ -124,6 +135,11 @@ class Workflow(ExecutionElement, Device_Base):
         start = start if start is not None else self.start
         if not isinstance(start, UUID):
             start = UUID(start)
+        for branch in self.branches:
+            branch.compile()
+        for action in self.actions:
+            action.compile()
+        self._live_results = get_live_results(self) if self.__get_pruning_mode() != 'keep' else None
         executor = self.__execute(start, start_arguments, resume)
         next(executor)
 
@@ -137,10 +153,14 @@ class Workflow(ExecutionElement, Device_Base):
             if self._is_paused:
                 self._is_paused = False
                 WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.WorkflowPaused)
+                self.__log(action.id, WORKFLOW_PAUSED)
                 yield
             if self._abort:
                 self._abort = False
                 WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.WorkflowAborted)
+                if self.__is_durable():
+                    clear_log(self._execution_id)
+                self._accumulator.remove_spilled()
                 yield
 
             device_id = self._instance_repo.setup_app_instance(action)
@@ -153,8 +173,11 @@ class Workflow(ExecutionElement, Device_Base):
                 result = action.execute(instance=self._instance_repo.get_app_instance(device_id)(),
                                         accumulator=self._accumulator, resume=resume)
             if result and result.status == "trigger":
+                self.__log(action.id, WORKFLOW_AWAITING_DATA)
                 yield
             self._accumulator[action.id] = action.get_output().result
+            self.__log(action.id, ACTION_COMPLETED, result=action.get_output())
+            self.__release_dead_results(action)
         self.__shutdown()
         yield
 
@@ -198,23 +221,88 @@ class Workflow(ExecutionElement, Device_Base):
                     branches.append(branch)
         return branches
 
+    def recover(self, execution_id, accumulator, last_action_id, last_result):
+        """Resumes a workflow execution which was interrupted, such as by its worker crashing, from the action after
+            the last action which completed. Used with the state recorded by durable mode.
+        Args:
+            execution_id (str): The execution ID of the interrupted workflow
+            accumulator (dict): The results of the completed actions
+            last_action_id (UUID): The ID of the last action which completed
+            last_result (ActionResult): The result of the last action which completed
+        """
+        self._execution_id = execution_id
+        self._accumulator = accumulator
+        last_action = self.get_action_by_id(last_action_id)
+        if last_action is None:
+            logger.error('Cannot recover workflow {0}. Action {1} not found'.format(self.name, last_action_id))
+            return
+        last_action._output = last_result
+        for branch in self.branches:
+            branch.compile()
+        for action in self.actions:
+            action.compile()
+        start = self.get_branch(last_action, self._accumulator)
+        logger.info('Recovering workflow {0} after action {1}'.format(self.name, last_action.name))
+        if start is None:
+            self._live_results = None
+            WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.WorkflowExecutionStart)
+            self.__shutdown()
+        else:
+            self.execute(execution_id, start=start)
+
+    @staticmethod
+    def __is_durable():
+        return walkoff.config.config.durable_workflows
+
+    def __log(self, action_id, event, result=None):
+        if self.__is_durable():
+            append_log_entry(self._execution_id, self.id, action_id, event, result=result, worker_id=self._worker_id)
+
+    @staticmethod
+    def __get_pruning_mode():
+        return walkoff.config.config.accumulator_pruning
+
+    def __release_dead_results(self, action):
+        if not self._live_results:
+            return
+        live = self._live_results.get(str(action.id))
+        if live is None:
+            return
+        summarize = self.__get_pruning_mode() == 'summarize'
+        for action_id in [action_id for action_id in self._accumulator if str(action_id) not in live]:
+            if summarize:
+                self._released_results[action_id] = summarize_result(self._accumulator[action_id])
+            del self._accumulator[action_id]
+            logger.debug('Released result of action {0} from workflow {1}'.format(action_id, self.name))
+
     def __shutdown(self):
         # Upon finishing shut down instances
         self._instance_repo.shutdown_instances()
-        result_str = {}
-        for action, action_result in self._accumulator.items():
-            try:
-                result_str[action] = json.dumps(action_result)
-            except TypeError:
-                logger.error('Result of workflow is neither string or a JSON-able. Cannot record')
-                result_str[action] = 'error: could not convert to JSON'
-        data = dict(self._accumulator)
+        if self.__is_durable():
+            clear_log(self._execution_id)
+        data_json = self.__encode_results()
+        self._accumulator.remove_spilled()
+        WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.WorkflowShutdown, data=data_json)
+        logger.info('Workflow {0} completed'.format(self.name))
+
+    def __encode_results(self):
+        """Encodes the results of the workflow as JSON, or as the string form of a dict if they cannot be encoded as
+            JSON. At most one spilled or stored result is decoded at a time, and results held as JSON in a ResultStore
+            are passed through without being decoded
+        """
         try:
-            data_json = json.dumps(data)
+            entries = ['{0}: {1}'.format(json.dumps({action_id: None})[1:-7], json.dumps(result))
+                       for action_id, result in self._released_results.items()]
+            for action_id in self._accumulator:
+                encoded = self._accumulator.get_json_result(action_id)
+                if encoded is None:
+                    encoded = json.dumps(self._accumulator.peek(action_id))
+                entries.append('{0}: {1}'.format(json.dumps({action_id: None})[1:-7], encoded))
         except TypeError:
-            data_json = str(data)
-        WalkoffEvent.CommonWorkflowSignal.send(self, event=WalkoffEvent.WorkflowShutdown, data=data_json)
-        logger.info('Workflow {0} completed. Result: {1}'.format(self.name, self._accumulator))
+            entries = ['{0!r}: {1!r}'.format(action_id, result) for action_id, result in self._released_results.items()]
+            entries.extend('{0!r}: {1!r}'.format(action_id, self._accumulator.peek(action_id))
+                           for action_id in self._accumulator)
+        return '{' + ', '.join(entries) + '}'
 
     def set_execution_id(self, execution_id):
         """Sets the execution UD for the Workflow
@@ -14,10 +14,10 @@ class WorkflowStatus(Device_Base):
     """
     __tablename__ = 'workflow_status'
     execution_id = Column(UUIDType(binary=False), primary_key=True)
-    workflow_id = Column(UUIDType(binary=False), nullable=False)
+    workflow_id = Column(UUIDType(binary=False), nullable=False, index=True)
     name = Column(String, nullable=False)
-    status = Column(Enum(WorkflowStatusEnum), nullable=False)
-    started_at = Column(DateTime)
+    status = Column(Enum(WorkflowStatusEnum), nullable=False, index=True)
+    started_at = Column(DateTime, index=True)
     completed_at = Column(DateTime)
     _action_statuses = relationship('ActionStatus', backref=backref('_workflow_status'), cascade='all, delete-orphan')
 
@@ -27,8 +27,8 @@ class WorkflowStatus(Device_Base):
         self.name = name
         self.status = WorkflowStatusEnum.pending
 
-    def running(self):
-        self.started_at = datetime.utcnow()
+    def running(self, started_at=None):
+        self.started_at = started_at if started_at is not None else datetime.utcnow()
         self.status = WorkflowStatusEnum.running
 
     def paused(self):
@@ -39,12 +39,12 @@ class WorkflowStatus(Device_Base):
         if self._action_statuses:
             self._action_statuses[-1].awaiting_data()
 
-    def completed(self):
-        self.completed_at = datetime.utcnow()
+    def completed(self, completed_at=None):
+        self.completed_at = completed_at if completed_at is not None else datetime.utcnow()
         self.status = WorkflowStatusEnum.completed
 
-    def aborted(self):
-        self.completed_at = datetime.utcnow()
+    def aborted(self, completed_at=None):
+        self.completed_at = completed_at if completed_at is not None else datetime.utcnow()
         self.status = WorkflowStatusEnum.aborted
         if self._action_statuses:
             self._action_statuses[-1].aborted()
@@ -84,7 +84,7 @@ class ActionStatus(Device_Base):
     status = Column(Enum(ActionStatusEnum), nullable=False)
     started_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime)
-    _workflow_status_id = Column(UUIDType(binary=False), ForeignKey('workflow_status.execution_id'))
+    _workflow_status_id = Column(UUIDType(binary=False), ForeignKey('workflow_status.execution_id'), index=True)
 
     def __init__(self, execution_id, action_id, name, app_name, action_name, arguments=None):
         self.execution_id = execution_id
@@ -105,15 +105,15 @@ class ActionStatus(Device_Base):
     def awaiting_data(self):
         self.status = ActionStatusEnum.awaiting_data
 
-    def completed_success(self, data):
+    def completed_success(self, data, completed_at=None):
         self.status = ActionStatusEnum.success
         self.result = json.dumps(data['result'])
-        self.completed_at = datetime.utcnow()
+        self.completed_at = completed_at if completed_at is not None else datetime.utcnow()
 
-    def completed_failure(self, data):
+    def completed_failure(self, data, completed_at=None):
         self.status = ActionStatusEnum.failure
         self.result = json.dumps(data['result'])
-        self.completed_at = datetime.utcnow()
+        self.completed_at = completed_at if completed_at is not None else datetime.utcnow()
 
     def as_json(self, summary=False):
         ret = {"execution_id": str(self.execution_id),
@@ -7,6 +7,9 @@ import sys
 from datetime import datetime
 from uuid import uuid4
 
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import NullPool, QueuePool
+
 import walkoff.config.config
 import walkoff.config.paths
 
@@ -260,6 +263,50 @@ def format_db_path(db_type, path):
     return '{0}://{1}'.format(db_type, path) if db_type != 'sqlite' else '{0}:///{1}'.format(db_type, path)
 
 
+def create_database_engine(db_type, path, profile='pooled'):
+    """Creates a SQLAlchemy engine for a database using one of the engine profiles
+
+    The 'pooled' profile keeps a pool of database_pool_size connections, plus up to database_max_overflow more, using
+    the values in walkoff.config.config. SQLite databases are opened in write-ahead logging mode with
+    synchronous=NORMAL, so that readers are not blocked by a writer, and the pooled connections may be used by any
+    thread. Connections to other databases are checked before use and recycled after database_pool_recycle seconds.
+    The 'unpooled' profile opens a new connection for every checkout.
+
+    Args:
+        db_type (str): Type of database being used
+        path (str): Path to the database
+        profile (str, optional): Either 'pooled' or 'unpooled'. Defaults to 'pooled'
+
+    Returns:
+        (Engine): The engine
+    """
+    url = format_db_path(db_type, path)
+    if profile == 'unpooled':
+        return create_engine(url, poolclass=NullPool)
+    if profile != 'pooled':
+        raise ValueError('Unknown database engine profile {}'.format(profile))
+
+    config = walkoff.config.config
+    if db_type != 'sqlite':
+        return create_engine(url, pool_size=config.database_pool_size, max_overflow=config.database_max_overflow,
+                             pool_recycle=config.database_pool_recycle, pool_pre_ping=True)
+    if path == ':memory:':
+        return create_engine(url)
+
+    engine = create_engine(url, poolclass=QueuePool, pool_size=config.database_pool_size,
+                           max_overflow=config.database_max_overflow,
+                           connect_args={'check_same_thread': False, 'timeout': config.sqlite_busy_timeout})
+
+    @event.listens_for(engine, 'connect')
+    def __set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
+    return engine
+
+
 def get_app_action_api(app, action):
     """
     Gets the api for a given app and action
@@ -533,3 +580,23 @@ def utc_as_rfc_datetime(timestamp):
 
 def timestamp_to_datetime(time):
     return datetime.strptime(time, '%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+def rfc_datetime_to_utc(time):
+    """Parses an RFC 3339 UTC timestamp, with or without fractional seconds and the trailing Z
+
+    Args:
+        time (str): The timestamp
+
+    Returns:
+        (datetime): The naive UTC datetime
+
+    Raises:
+        ValueError: If the timestamp is malformed
+    """
+    for time_format in ('%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S'):
+        try:
+            return datetime.strptime(time, time_format)
+        except ValueError:
+            pass
+    raise ValueError('Invalid time {}'.format(time))
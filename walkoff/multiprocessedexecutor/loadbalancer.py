@@ -11,9 +11,9 @@ from six import string_types
 
 import walkoff.config.config
 import walkoff.config.paths
-from walkoff import executiondb
 from walkoff.events import WalkoffEvent, EventType
-from walkoff.executiondb.workflowresults import WorkflowStatus, WorkflowStatusEnum
+from walkoff.executiondb.statuswriter import status_writer
+from walkoff.executiondb.workflowresults import WorkflowStatusEnum
 from walkoff.proto.build.data_pb2 import Message, CommunicationPacket, ExecuteWorkflowMessage
 
 try:
@@ -90,12 +90,11 @@ class LoadBalancer:
 
             # There is a worker available and a workflow in the queue, so pop it off and send it to the worker
             if any(val > 0 for val in self.workers.values()) and not self.pending_workflows.empty():
-                workflow_id, workflow_execution_id, start, start_arguments, resume = self.pending_workflows.get()
+                workflow_id, workflow_execution_id, start, start_arguments, resume, recover = \
+                    self.pending_workflows.get()
 
-                executiondb.execution_db.session.expire_all()
-                workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-                    execution_id=workflow_execution_id).first()
-                if workflow_status.status == WorkflowStatusEnum.aborted:
+                workflow_status = status_writer.get_workflow_status(workflow_execution_id)
+                if workflow_status is not None and workflow_status.status == WorkflowStatusEnum.aborted:
                     continue
 
                 worker = self.__get_available_worker()
@@ -105,6 +104,7 @@ class LoadBalancer:
                 message.workflow_id = str(workflow_id)
                 message.workflow_execution_id = workflow_execution_id
                 message.resume = resume
+                message.recover = recover
 
                 if start:
                     message.start = str(start)
@@ -130,7 +130,8 @@ class LoadBalancer:
             self.workers[available_worker] -= 1
         return available_worker
 
-    def add_workflow(self, workflow_id, workflow_execution_id, start=None, start_arguments=None, resume=False):
+    def add_workflow(self, workflow_id, workflow_execution_id, start=None, start_arguments=None, resume=False,
+                     recover=False):
         """Adds a workflow ID to the queue to be executed.
 
         Args:
@@ -139,8 +140,10 @@ class LoadBalancer:
             start (str, optional): The ID of the first, or starting action. Defaults to None.
             start_arguments (list[Argument]): The arguments to the starting action of the workflow. Defaults to None.
             resume (bool, optional): Optional boolean to resume a previously paused workflow. Defaults to False.
+            recover (bool, optional): Optional boolean to recover an interrupted workflow from the execution log.
+                Defaults to False.
         """
-        self.pending_workflows.put((workflow_id, workflow_execution_id, start, start_arguments, resume))
+        self.pending_workflows.put((workflow_id, workflow_execution_id, start, start_arguments, resume, recover))
 
     def pause_workflow(self, workflow_execution_id):
         """Pauses a workflow currently executing.
@@ -176,6 +179,34 @@ class LoadBalancer:
         else:
             return False
 
+    def invalidate_cached_action_results(self, app_name=None):
+        """Sends a message to every worker to remove results from its action result cache.
+
+        Args:
+            app_name (str, optional): The name of the app whose results should be removed. Defaults to None, which
+                removes the results of all apps
+        """
+        message = CommunicationPacket()
+        message.type = CommunicationPacket.INVALIDATE_CACHE
+        if app_name is not None:
+            message.app_name = app_name
+        message_bytes = message.SerializeToString()
+        for worker in self.workers:
+            self.comm_socket.send_multipart([worker, message_bytes])
+
+    def request_action_result_cache_metrics(self):
+        """Sends a message to every worker to send the metrics of its action result cache to the Receiver.
+
+        Returns:
+            (int): The number of workers the request was sent to
+        """
+        message = CommunicationPacket()
+        message.type = CommunicationPacket.CACHE_METRICS
+        message_bytes = message.SerializeToString()
+        for worker in self.workers:
+            self.comm_socket.send_multipart([worker, message_bytes])
+        return len(self.workers)
+
     def send_exit_to_worker_comms(self):
         """Sends the exit message over the communication sockets, otherwise worker receiver threads will hang
         """
@@ -185,6 +216,18 @@ class LoadBalancer:
         for worker in self.workers:
             self.comm_socket.send_multipart([worker, message_bytes])
 
+    def remove_worker(self, worker):
+        """Forgets a worker which has died, along with the workflow executions which were sent to it. A worker with the
+            same identity is registered again once it sends that it is ready
+
+        Args:
+            worker (bytes): The identity of the worker
+        """
+        self.workers.pop(worker, None)
+        for workflow_execution_id, execution_worker in list(self.workflow_comms.items()):
+            if execution_worker == worker:
+                self.workflow_comms.pop(workflow_execution_id, None)
+
     def on_worker_available(self, sender, **kwargs):
         if sender['execution_id'] in self.workflow_comms:
             worker = self.workflow_comms[sender['execution_id']]
@@ -217,6 +260,7 @@ class Receiver:
         """
         self.thread_exit = False
         self.workflows_executed = 0
+        self.cache_metrics = {}
 
         server_secret_file = os.path.join(walkoff.config.paths.zmq_private_keys_path, "server.key_secret")
         server_public, server_secret = auth.load_certificate(server_secret_file)
@@ -239,17 +283,23 @@ class Receiver:
             try:
                 message_bytes = self.results_sock.recv(zmq.NOBLOCK)
             except zmq.ZMQError:
+                status_writer.flush_if_due()
                 gevent.sleep(0.1)
                 continue
 
             self.send_callback(message_bytes)
 
+        status_writer.flush()
         self.results_sock.close()
         return
 
     def send_callback(self, message_bytes):
         message_outer = Message()
         message_outer.ParseFromString(message_bytes)
+        if message_outer.type == Message.CACHEMETRICSPACKET:
+            self.cache_metrics[message_outer.cache_metrics_packet.worker] = json.loads(
+                message_outer.cache_metrics_packet.metrics)
+            return
         callback_name = message_outer.event_name
         if message_outer.type == Message.WORKFLOWPACKET:
             message = message_outer.workflow_packet
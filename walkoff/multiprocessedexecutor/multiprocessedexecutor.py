@@ -12,9 +12,14 @@ import zmq.green as zmq
 import walkoff.config.config
 import walkoff.config.paths
 from walkoff import executiondb
+from walkoff.appgateway.actionresultcache import combine_action_result_cache_metrics
+from walkoff.case.eventsink import case_event_sink
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import WorkflowStatusEnum
+from walkoff.executiondb.executionlog import get_recoverable_executions, clear_log
+from walkoff.executiondb.loader import load_workflow
 from walkoff.executiondb.saved_workflow import SavedWorkflow
+from walkoff.executiondb.statuswriter import status_writer
 from walkoff.executiondb.workflow import Workflow
 from walkoff.executiondb.workflowresults import WorkflowStatus
 from walkoff.multiprocessedexecutor.loadbalancer import LoadBalancer, Receiver
@@ -30,14 +35,23 @@ def spawn_worker_processes(worker_environment_setup=None):
     Args:
         worker_environment_setup (function, optional): Optional alternative worker setup environment function.
     """
-    pids = []
-    for i in range(walkoff.config.config.num_processes):
-        args = (i, worker_environment_setup) if worker_environment_setup else (i,)
+    return [spawn_worker_process(i, worker_environment_setup) for i in range(walkoff.config.config.num_processes)]
 
-        pid = multiprocessing.Process(target=Worker, args=args)
-        pid.start()
-        pids.append(pid)
-    return pids
+
+def spawn_worker_process(worker_id, worker_environment_setup=None):
+    """Starts a single worker process
+
+    Args:
+        worker_id (int): The ID of the worker
+        worker_environment_setup (function, optional): Optional alternative worker setup environment function.
+
+    Returns:
+        (multiprocessing.Process): The worker process
+    """
+    args = (worker_id, worker_environment_setup) if worker_environment_setup else (worker_id,)
+    pid = multiprocessing.Process(target=Worker, args=args)
+    pid.start()
+    return pid
 
 
 class MultiprocessedExecutor(object):
@@ -47,6 +61,7 @@ class MultiprocessedExecutor(object):
         self.threading_is_initialized = False
         self.id = "controller"
         self.pids = None
+        self.worker_environment_setup = None
         self.workflows_executed = 0
 
         self.ctx = None
@@ -56,16 +71,23 @@ class MultiprocessedExecutor(object):
         self.manager_thread = None
         self.receiver = None
         self.receiver_thread = None
+        self.monitor_thread = None
+        self.monitor_exit = None
 
-    def initialize_threading(self, pids=None):
+    def initialize_threading(self, pids=None, worker_environment_setup=None):
         """Initialize the multiprocessing communication threads, allowing for parallel execution of workflows.
 
+        Args:
+            pids (list[multiprocessing.Process], optional): The worker processes. Defaults to None
+            worker_environment_setup (function, optional): The alternative worker setup environment function the
+                worker processes were spawned with, which is used to restart them. Defaults to None
         """
         if not (os.path.exists(walkoff.config.paths.zmq_public_keys_path) and
                 os.path.exists(walkoff.config.paths.zmq_private_keys_path)):
             logging.error("Certificates are missing - run generate_certificates.py script first.")
             sys.exit(0)
         self.pids = pids
+        self.worker_environment_setup = worker_environment_setup
         self.ctx = zmq.Context.instance()
         self.auth = ThreadAuthenticator(self.ctx)
         self.auth.start()
@@ -81,9 +103,17 @@ class MultiprocessedExecutor(object):
         self.manager_thread = threading.Thread(target=self.manager.manage_workflows)
         self.manager_thread.start()
 
+        if self.pids and walkoff.config.config.worker_monitor_interval:
+            self.monitor_exit = threading.Event()
+            self.monitor_thread = threading.Thread(target=self.monitor_workers)
+            self.monitor_thread.start()
+
         self.threading_is_initialized = True
         logger.debug('Controller threading initialized')
 
+        if walkoff.config.config.durable_workflows:
+            self.recover_workflows()
+
     def wait_and_reset(self, num_workflows):
         timeout = 0
         shutdown = 10
@@ -94,10 +124,15 @@ class MultiprocessedExecutor(object):
             timeout += 0.1
             gevent.sleep(0.1)
         self.receiver.workflows_executed = 0
+        status_writer.flush()
+        case_event_sink.flush()
 
     def shutdown_pool(self):
         """Shuts down the threadpool.
         """
+        if self.monitor_thread:
+            self.monitor_exit.set()
+            self.monitor_thread.join(timeout=1)
         self.manager.send_exit_to_worker_comms()
         if self.manager_thread:
             self.manager.thread_exit = True
@@ -114,6 +149,8 @@ class MultiprocessedExecutor(object):
         if self.receiver_thread:
             self.receiver.thread_exit = True
             self.receiver_thread.join(timeout=1)
+        status_writer.flush()
+        case_event_sink.flush()
         self.threading_is_initialized = False
         logger.debug('Controller thread pool shutdown')
 
@@ -130,6 +167,8 @@ class MultiprocessedExecutor(object):
         self.pids = []
         self.receiver_thread = None
         self.manager_thread = None
+        self.monitor_thread = None
+        self.monitor_exit = None
         self.workflows_executed = 0
         self.threading_is_initialized = False
         self.manager = None
@@ -168,14 +207,65 @@ class MultiprocessedExecutor(object):
         WalkoffEvent.SchedulerJobExecuted.send(self)
         return execution_id
 
+    def monitor_workers(self):
+        """Checks every worker_monitor_interval seconds whether any worker process has died, and restarts it
+        """
+        while not self.monitor_exit.wait(walkoff.config.config.worker_monitor_interval):
+            for worker_id, process in enumerate(self.pids):
+                if not process.is_alive() and not self.monitor_exit.is_set():
+                    self.restart_worker(worker_id)
+
+    def restart_worker(self, worker_id):
+        """Replaces a worker process which has died. In durable mode, the workflow executions which were running on the
+            worker are queued to be recovered
+
+        Args:
+            worker_id (int): The ID of the worker
+
+        Returns:
+            (list[str]): The execution IDs of the workflows which will be recovered
+        """
+        logger.error('Worker {0} exited with code {1}. Restarting it'.format(worker_id, self.pids[worker_id].exitcode))
+        self.manager.remove_worker('Worker-{}'.format(worker_id).encode('ascii'))
+        self.pids[worker_id] = spawn_worker_process(worker_id, self.worker_environment_setup)
+        if walkoff.config.config.durable_workflows:
+            return self.recover_workflows(worker_id=worker_id)
+        return []
+
+    def recover_workflows(self, worker_id=None):
+        """Queues the workflow executions which were interrupted, such as by a worker crashing, to be recovered from
+            the execution log by the next available worker.
+
+        Args:
+            worker_id (int, optional): Only recover the executions which were running on the worker with this ID.
+                Defaults to None, meaning executions are recovered regardless of which worker was executing them
+
+        Returns:
+            (list[str]): The execution IDs of the workflows which will be recovered
+        """
+        recovered = []
+        for execution_id, workflow_id in get_recoverable_executions(worker_id=worker_id):
+            workflow = executiondb.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+            if workflow is None:
+                logger.error('Cannot recover workflow execution {0}. Workflow {1} not found'.format(
+                    execution_id, workflow_id))
+                clear_log(execution_id)
+                continue
+            execution_id = str(execution_id)
+            logger.info('Recovering workflow execution {0} of workflow {1}'.format(execution_id, workflow.name))
+            WalkoffEvent.WorkflowExecutionPending.send({'execution_id': execution_id, 'id': workflow.id,
+                                                        'name': workflow.name})
+            self.manager.add_workflow(workflow.id, execution_id, recover=True)
+            recovered.append(execution_id)
+        return recovered
+
     def pause_workflow(self, execution_id):
         """Pauses a workflow that is currently executing.
 
         Args:
             execution_id (str): The execution id of the workflow.
         """
-        workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-            execution_id=execution_id).first()
+        workflow_status = status_writer.get_workflow_status(execution_id)
         if workflow_status and workflow_status.status == WorkflowStatusEnum.running:
             self.manager.pause_workflow(execution_id)
             return True
@@ -189,8 +279,7 @@ class MultiprocessedExecutor(object):
         Args:
             execution_id (str): The execution id of the workflow.
         """
-        workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-            execution_id=execution_id).first()
+        workflow_status = status_writer.get_workflow_status(execution_id)
 
         if workflow_status and workflow_status.status == WorkflowStatusEnum.paused:
             saved_state = executiondb.execution_db.session.query(SavedWorkflow).filter_by(
@@ -213,8 +302,7 @@ class MultiprocessedExecutor(object):
         Args:
             execution_id (str): The execution id of the workflow.
         """
-        workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-            execution_id=execution_id).first()
+        workflow_status = status_writer.get_workflow_status(execution_id)
 
         if workflow_status:
             if workflow_status.status in [WorkflowStatusEnum.pending, WorkflowStatusEnum.paused,
@@ -243,8 +331,7 @@ class MultiprocessedExecutor(object):
         """
         saved_state = executiondb.execution_db.session.query(SavedWorkflow).filter_by(
             workflow_execution_id=execution_id).first()
-        workflow = executiondb.execution_db.session.query(Workflow).filter_by(
-            id=saved_state.workflow_id).first()
+        workflow = load_workflow(saved_state.workflow_id)
         workflow._execution_id = execution_id
 
         executed = False
@@ -264,6 +351,36 @@ class MultiprocessedExecutor(object):
             WalkoffEvent.TriggerActionNotTaken.send(exec_action, data={'workflow_execution_id': execution_id})
             return False
 
+    def invalidate_cached_action_results(self, app_name=None):
+        """Removes results from the action result caches of the workers.
+
+        Args:
+            app_name (str, optional): The name of the app whose results should be removed. Defaults to None, which
+                removes the results of all apps
+        """
+        self.manager.invalidate_cached_action_results(app_name)
+
+    def get_action_result_cache_metrics(self, timeout=1.0):
+        """Gets the combined hit, miss, and size metrics of the action result caches of the workers.
+
+        Args:
+            timeout (float, optional): The number of seconds to wait for the workers to respond. Defaults to 1.0
+
+        Returns:
+            (dict): A dict of form {app_name: {'hits': int, 'misses': int, 'size': int}}, combining the metrics of
+                the workers which responded before the timeout
+        """
+        self.receiver.cache_metrics = {}
+        num_workers = self.manager.request_action_result_cache_metrics()
+        waited = 0
+        while len(self.receiver.cache_metrics) < num_workers and waited < timeout:
+            gevent.sleep(0.1)
+            waited += 0.1
+        if len(self.receiver.cache_metrics) < num_workers:
+            logger.warning('Only {0} of {1} workers sent their action result cache metrics'.format(
+                len(self.receiver.cache_metrics), num_workers))
+        return combine_action_result_cache_metrics(list(self.receiver.cache_metrics.values()))
+
     @staticmethod
     def get_waiting_workflows():
         """Gets a list of the execution IDs of workflows currently awaiting data to be sent to a trigger.
@@ -271,6 +388,7 @@ class MultiprocessedExecutor(object):
         Returns:
             A list of execution IDs of workflows currently awaiting data to be sent to a trigger.
         """
+        status_writer.flush()
         executiondb.execution_db.session.expire_all()
         wf_statuses = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
             status=WorkflowStatusEnum.awaiting_data).all()
@@ -285,8 +403,7 @@ class MultiprocessedExecutor(object):
         Returns:
             The status of the workflow
         """
-        workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-            execution_id=execution_id).first()
+        workflow_status = status_writer.get_workflow_status(execution_id)
         if workflow_status:
             return workflow_status.status
         else:
@@ -14,12 +14,15 @@ import walkoff.config.config
 import walkoff.config.paths
 import walkoff.executiondb
 from walkoff import initialize_databases
+from walkoff.appgateway import invalidate_cached_action_results, get_action_result_cache_metrics
 from walkoff.appgateway.appinstancerepo import AppInstanceRepo
 from walkoff.events import EventType, WalkoffEvent
 from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.executionlog import load_recovery_state, clear_log
+from walkoff.executiondb.loader import load_workflow
 from walkoff.executiondb.saved_workflow import SavedWorkflow
-from walkoff.executiondb.workflow import Workflow
 from walkoff.proto.build.data_pb2 import Message, CommunicationPacket, ExecuteWorkflowMessage
+from walkoff.resultstore import externalize_action_result
 
 try:
     from Queue import Queue
@@ -50,6 +53,8 @@ def convert_to_protobuf(sender, workflow, **kwargs):
         if event == WalkoffEvent.SendMessage:
             convert_send_message_to_protobuf(packet, sender, workflow, **kwargs)
         else:
+            if event in (WalkoffEvent.ActionExecutionSuccess, WalkoffEvent.ActionExecutionError):
+                data = externalize_action_result(data)
             convert_action_to_proto(packet, sender, workflow, data)
     elif event.event_type in (
             EventType.branch, EventType.condition, EventType.transform, EventType.conditonalexpression):
@@ -90,6 +95,23 @@ def convert_action_to_proto(packet, sender, workflow, data=None):
     add_workflow_to_proto(action_packet.workflow, workflow)
 
 
+def convert_cache_metrics_to_proto(worker, metrics):
+    """Converts the action result cache metrics of a worker to a protobuf message.
+
+    Args:
+        worker (str): The identity of the worker
+        metrics (dict): The metrics of the worker's action result cache
+
+    Returns:
+        The newly formed protobuf object, serialized as a string to send over the ZMQ socket.
+    """
+    packet = Message()
+    packet.type = Message.CACHEMETRICSPACKET
+    packet.cache_metrics_packet.worker = worker
+    packet.cache_metrics_packet.metrics = json.dumps(metrics)
+    return packet.SerializeToString()
+
+
 def add_sender_to_action_packet_proto(action_packet, sender):
     action_packet.sender.name = sender.name
     action_packet.sender.id = str(sender.id)
@@ -227,6 +249,10 @@ class Worker:
                 for arg in message.arguments:
                     start_arguments.append(Argument(**(MessageToDict(arg, preserving_proto_field_name=True))))
 
+            if message.recover:
+                self.threadpool.submit(self.recover_workflow_worker, message.workflow_execution_id)
+                continue
+
             self.threadpool.submit(self.execute_workflow_worker, message.workflow_id, message.workflow_execution_id,
                                    start, start_arguments, message.resume)
 
@@ -234,8 +260,9 @@ class Worker:
         """Execute a workflow.
         """
         walkoff.executiondb.execution_db.session.expire_all()
-        workflow = walkoff.executiondb.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+        workflow = load_workflow(workflow_id)
         workflow._execution_id = workflow_execution_id
+        workflow._worker_id = self.id_
 
         if resume:
             saved_state = walkoff.executiondb.execution_db.session.query(SavedWorkflow).filter_by(
@@ -252,6 +279,28 @@ class Worker:
         self.workflows.pop(threading.current_thread().name)
         return
 
+    def recover_workflow_worker(self, workflow_execution_id):
+        """Resume an interrupted workflow from the action after the last completed action.
+        """
+        walkoff.executiondb.execution_db.session.expire_all()
+        state = load_recovery_state(workflow_execution_id)
+        if state is None:
+            clear_log(workflow_execution_id)
+            return
+        workflow_id, accumulator, action_id, result = state
+        workflow = load_workflow(workflow_id)
+        if workflow is None:
+            logger.error('Cannot recover workflow execution {0}. Workflow {1} not found'.format(
+                workflow_execution_id, workflow_id))
+            clear_log(workflow_execution_id)
+            return
+        workflow._execution_id = workflow_execution_id
+        workflow._worker_id = self.id_
+
+        self.workflows[threading.current_thread().name] = workflow
+        workflow.recover(workflow_execution_id, accumulator, action_id, result)
+        self.workflows.pop(threading.current_thread().name)
+
     def receive_data(self):
         """Constantly receives data from the ZMQ socket and handles it accordingly.
         """
@@ -269,6 +318,14 @@ class Worker:
 
             if message.type == CommunicationPacket.EXIT:
                 break
+            elif message.type == CommunicationPacket.INVALIDATE_CACHE:
+                invalidate_cached_action_results(message.app_name or None)
+                continue
+            elif message.type == CommunicationPacket.CACHE_METRICS:
+                self.results_sock.send(
+                    convert_cache_metrics_to_proto(self.comm_sock.identity.decode('ascii'),
+                                                   get_action_result_cache_metrics()))
+                continue
 
             workflow = self.__get_workflow_by_execution_id(message.workflow_execution_id)
             if workflow:
@@ -289,13 +346,12 @@ class Worker:
         """
         workflow = self._get_current_workflow()
         if kwargs['event'] in [WalkoffEvent.TriggerActionAwaitingData, WalkoffEvent.WorkflowPaused]:
-            saved_workflow = SavedWorkflow(workflow_execution_id=workflow.get_execution_id(),
-                                           workflow_id=workflow.id,
-                                           action_id=workflow.get_executing_action_id(),
-                                           accumulator=workflow.get_accumulator(),
-                                           app_instances=workflow.get_instances())
-            walkoff.executiondb.execution_db.session.add(saved_workflow)
-            walkoff.executiondb.execution_db.session.commit()
+            SavedWorkflow.save(walkoff.executiondb.execution_db.session,
+                               workflow_execution_id=workflow.get_execution_id(),
+                               workflow_id=workflow.id,
+                               action_id=workflow.get_executing_action_id(),
+                               accumulator=workflow.get_accumulator(),
+                               app_instances=workflow.get_instances())
 
         packet_bytes = convert_to_protobuf(sender, workflow, **kwargs)
 
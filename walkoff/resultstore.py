@@ -0,0 +1,264 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from os.path import join, isfile
+
+import walkoff.config.config
+import walkoff.config.paths
+
+logger = logging.getLogger(__name__)
+
+_result_id_pattern = re.compile(r'^[0-9a-f]{64}$')
+
+
+class ResultStore(object):
+    """A content-addressed store of encoded action results, kept as files which both the workers and the
+        controller can read. Results are named by the SHA-256 digest of their body, so identical results are only
+        stored once. Storing a result again renews it, so that prune only removes results which have not been stored
+        for a while.
+
+    Attributes:
+        path (str): The directory containing the stored results. If None, the result_store_path value in
+            walkoff.config.paths is used
+        extension (str): The file extension of the stored results, which names their encoding
+
+    Args:
+        path (str, optional): The directory containing the stored results. Defaults to None
+        extension (str, optional): The file extension of the stored results. Defaults to 'json'
+    """
+
+    def __init__(self, path=None, extension='json'):
+        self.path = path
+        self.extension = extension
+        self._last_pruned = None
+
+    def put(self, body):
+        """Stores an encoded result
+
+        Args:
+            body (str|bytes): The encoded result
+
+        Returns:
+            (str): The ID of the stored result
+        """
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+        result_id = hashlib.sha256(body).hexdigest()
+        path = self.__get_file_path(result_id)
+        if isfile(path):
+            try:
+                os.utime(path, None)
+                return result_id
+            except OSError:
+                pass
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as result_file:
+                result_file.write(body)
+            os.rename(temp_path, path)
+        except (IOError, OSError):
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.debug('Stored result {0} ({1} bytes)'.format(result_id, len(body)))
+        return result_id
+
+    def get_path(self, result_id):
+        """Gets the path to the file containing a stored result
+
+        Args:
+            result_id (str): The ID of the result
+
+        Returns:
+            (str): The path to the file, or None if the result is not in the store
+        """
+        if not is_valid_result_id(result_id):
+            return None
+        path = self.__get_file_path(result_id)
+        return path if isfile(path) else None
+
+    def get(self, result_id):
+        """Gets the JSON-encoded body of a stored result
+
+        Args:
+            result_id (str): The ID of the result
+
+        Returns:
+            (str): The JSON-encoded result, or None if the result is not in the store
+        """
+        body = self.read(result_id)
+        return body.decode('utf-8') if body is not None else None
+
+    def read(self, result_id):
+        """Gets the raw body of a stored result
+
+        Args:
+            result_id (str): The ID of the result
+
+        Returns:
+            (bytes): The encoded result, or None if the result is not in the store
+        """
+        path = self.get_path(result_id)
+        if path is None:
+            return None
+        with open(path, 'rb') as result_file:
+            return result_file.read()
+
+    def delete(self, result_id):
+        """Removes a result from the store
+
+        Args:
+            result_id (str): The ID of the result
+
+        Returns:
+            (bool): True if the result was removed, False if it was not in the store
+        """
+        path = self.get_path(result_id)
+        if path is None:
+            return False
+        os.remove(path)
+        return True
+
+    def prune(self, max_age):
+        """Removes the results which have not been stored for a number of seconds
+
+        Args:
+            max_age (float): The number of seconds after which a result is removed
+
+        Returns:
+            (int): The number of results which were removed
+        """
+        oldest = time.time() - max_age
+        suffix = '.{}'.format(self.extension)
+        removed = 0
+        for directory, _, filenames in os.walk(self.__get_path()):
+            for filename in filenames:
+                if not filename.endswith(suffix) or not is_valid_result_id(filename[:-len(suffix)]):
+                    continue
+                path = join(directory, filename)
+                try:
+                    if os.path.getmtime(path) < oldest:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logger.info('Removed {} expired results from the result store'.format(removed))
+        return removed
+
+    def prune_if_due(self):
+        """Removes the results which are older than the result_store_max_age value in walkoff.config.config, at most
+            once every result_store_prune_interval seconds
+
+        Returns:
+            (int): The number of results which were removed
+        """
+        max_age = walkoff.config.config.result_store_max_age
+        if max_age is None:
+            return 0
+        now = time.time()
+        interval = walkoff.config.config.result_store_prune_interval
+        if self._last_pruned is not None and now - self._last_pruned < interval:
+            return 0
+        self._last_pruned = now
+        return self.prune(max_age)
+
+    def __get_path(self):
+        return self.path if self.path is not None else walkoff.config.paths.result_store_path
+
+    def __get_file_path(self, result_id):
+        return join(self.__get_path(), result_id[:2], '{0}.{1}'.format(result_id, self.extension))
+
+
+def is_valid_result_id(result_id):
+    """Checks whether a string has the form of a result ID
+
+    Args:
+        result_id (str): The string to check
+
+    Returns:
+        (bool): True if the string is a SHA-256 hex digest, False otherwise
+    """
+    return bool(_result_id_pattern.match(result_id or ''))
+
+
+def is_result_reference(result):
+    """Checks whether an action's result is a reference to a result in the ResultStore
+
+    Args:
+        result: The result to check
+
+    Returns:
+        (bool): True if the result is a reference, False otherwise
+    """
+    return isinstance(result, dict) and set(result.keys()) == {'result_id', 'size', 'preview'}
+
+
+def resolve_result_reference(result, store=None):
+    """Loads the full result which a reference to the ResultStore refers to
+
+    Args:
+        result: The result of an action, which may be a reference
+        store (ResultStore, optional): The store to use. Defaults to None, meaning the default store is used
+
+    Returns:
+        The full result if the result is a reference to a result which is still in the store, otherwise the result
+    """
+    if not is_result_reference(result):
+        return result
+    store = store if store is not None else result_store
+    body = store.get(result['result_id'])
+    if body is None:
+        logger.warning('Stored result {} no longer exists. Using its reference'.format(result['result_id']))
+        return result
+    return json.loads(body)
+
+
+def externalize_action_result(data, store=None):
+    """Moves the result of an action into the ResultStore if its JSON encoding is above the result_store_threshold
+        value in walkoff.config.config. The result is replaced with a reference of the form
+        {'result_id': str, 'size': int, 'preview': str}, where preview is the start of the JSON-encoded result.
+
+    Args:
+        data (dict): The JSON representation of an ActionResult
+        store (ResultStore, optional): The store to use. Defaults to None, meaning the default store is used
+
+    Returns:
+        (dict): The data with its result replaced by a reference if it was stored, otherwise the original data
+    """
+    threshold = walkoff.config.config.result_store_threshold
+    if threshold is None or not isinstance(data, dict) or 'result' not in data:
+        return data
+    body = json.dumps(data['result'])
+    if len(body) <= threshold:
+        return data
+    store = store if store is not None else result_store
+    try:
+        result_id = store.put(body)
+    except (IOError, OSError):
+        logger.exception('Could not store large action result. Sending it inline')
+        return data
+    externalized = dict(data)
+    externalized['result'] = {'result_id': result_id,
+                              'size': len(body),
+                              'preview': body[:walkoff.config.config.result_preview_size]}
+    return externalized
+
+
+result_store = ResultStore()
+pickled_result_store = ResultStore(extension='pkl')
+log_result_store = ResultStore(extension='log')
+"""The store of the results which are too large to be kept in the execution log. It is separate from the store of
+results sent to the server, so that its results can be removed along with the log entries
+"""
@@ -1,47 +1,18 @@
 from datetime import datetime
 
-from flask import Blueprint, Response
-from gevent import sleep
-from gevent.event import Event, AsyncResult
+from flask import Blueprint, Response, request
 
-from walkoff import executiondb
 from walkoff.events import WalkoffEvent
 from walkoff.executiondb import ActionStatusEnum, WorkflowStatusEnum
-from walkoff.executiondb.workflowresults import WorkflowStatus
-from walkoff.helpers import convert_action_argument, create_sse_event
+from walkoff.executiondb.statuswriter import status_writer
+from walkoff.helpers import convert_action_argument
 from walkoff.security import jwt_required_in_query
+from walkoff.server.eventbuffer import SseEventBuffer
 
 workflowqueue_page = Blueprint('workflowqueue_page', __name__)
 
-__action_event_json = AsyncResult()
-__action_signal = Event()
-
-__action_event_id_counter = 0
-
-__workflow_event_json = AsyncResult()
-__workflow_signal = Event()
-
-__workflow_event_id_counter = 0
-
-
-def __action_event_stream():
-    global __action_event_id_counter
-    __action_signal.wait()
-    while True:
-        event_type, data = __action_event_json.get()
-        yield create_sse_event(event_id=__action_event_id_counter, event=event_type, data=data)
-        __action_event_id_counter += 1
-        __action_signal.wait()
-
-
-def __workflow_event_stream():
-    global __workflow_event_id_counter
-    __workflow_signal.wait()
-    while True:
-        event_type, data = __workflow_event_json.get()
-        yield create_sse_event(event_id=__workflow_event_id_counter, event=event_type, data=data)
-        __workflow_event_id_counter += 1
-        __workflow_signal.wait()
+action_event_buffer = SseEventBuffer()
+workflow_event_buffer = SseEventBuffer()
 
 
 def format_action_data(sender, kwargs, status):
@@ -64,11 +35,7 @@ def format_action_data_with_results(sender, kwargs, status):
 
 
 def send_action_result_to_sse(result, event):
-    __action_event_json.set((event, result))
-    sleep(0)
-    __action_signal.set()
-    __action_signal.clear()
-    sleep(0)
+    action_event_buffer.publish(event, result)
 
 
 @WalkoffEvent.ActionStarted.connect
@@ -107,8 +74,7 @@ def format_workflow_result(sender, status):
 
 
 def format_workflow_result_with_current_step(workflow_execution_id, status):
-    workflow_status = executiondb.execution_db.session.query(WorkflowStatus).filter_by(
-        execution_id=workflow_execution_id).first()
+    workflow_status = status_writer.get_workflow_status(workflow_execution_id)
     if workflow_status is not None:
         status_json = workflow_status.as_json()
         for field in (field for field in list(status_json.keys())
@@ -121,11 +87,7 @@ def format_workflow_result_with_current_step(workflow_execution_id, status):
 
 
 def send_workflow_result_to_sse(result, event):
-    __workflow_event_json.set((event, result))
-    sleep(0)
-    __workflow_signal.set()
-    __workflow_signal.clear()
-    sleep(0)
+    workflow_event_buffer.publish(event, result)
 
 
 @WalkoffEvent.WorkflowExecutionPending.connect
@@ -184,10 +146,12 @@ def __workflow_shutdown_callback(sender, **kwargs):
 @workflowqueue_page.route('/actions', methods=['GET'])
 @jwt_required_in_query('access_token')
 def stream_workflow_action_events():
-    return Response(__action_event_stream(), mimetype='text/event-stream')
+    cursor = action_event_buffer.get_cursor(request.headers.get('Last-Event-ID'))
+    return Response(action_event_buffer.subscribe(cursor), mimetype='text/event-stream')
 
 
 @workflowqueue_page.route('/workflow_status', methods=['GET'])
 @jwt_required_in_query('access_token')
 def stream_workflow_status():
-    return Response(__workflow_event_stream(), mimetype='text/event-stream')
+    cursor = workflow_event_buffer.get_cursor(request.headers.get('Last-Event-ID'))
+    return Response(workflow_event_buffer.subscribe(cursor), mimetype='text/event-stream')
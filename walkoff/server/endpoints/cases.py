@@ -1,10 +1,13 @@
+import csv
 import json
 
-from flask import request, current_app, send_file
+from flask import request, current_app, send_file, Response, stream_with_context
 from flask_jwt_extended import jwt_required
+from six import string_types
 
 import walkoff.case.database as case_database
 import walkoff.case.subscription as case_subscription
+from walkoff.case.eventsink import case_event_sink
 from walkoff.case.subscription import delete_cases
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
 from walkoff.server.decorators import with_resource_factory
@@ -144,10 +147,15 @@ def delete_case(case_id):
     return __func()
 
 
-def read_all_events(case_id):
+def read_all_events(case_id, limit=None, cursor=None):
+    paginate = limit is not None or cursor is not None
+
     @jwt_required
     @permissions_accepted_for_resources(ResourcePermissions('cases', ['read']))
     def __func():
+        case_event_sink.flush()
+        if paginate:
+            return __get_page()
         try:
             result = case_database.case_db.case_events_as_json(case_id)
         except Exception:
@@ -159,4 +167,54 @@ def read_all_events(case_id):
 
         return result, SUCCESS
 
+    def __get_page():
+        if case_getter(case_id) is None:
+            current_app.logger.error('Cannot get events for case {0}. Case does not exist.'.format(case_id))
+            return Problem(
+                OBJECT_DNE_ERROR,
+                'Could not read events for case.',
+                'Case {} does not exist.'.format(case_id))
+        try:
+            page, next_cursor = case_database.case_db.case_events_page(
+                case_id, limit if limit is not None else 50, cursor=cursor)
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not read events for case.', str(e))
+        headers = {'X-Next-Cursor': next_cursor} if next_cursor is not None else {}
+        return page, SUCCESS, headers
+
+    return __func()
+
+
+def export_events(case_id, file_format='ndjson'):
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('cases', ['read']))
+    @with_case('export', case_id)
+    def __func(case_obj):
+        case_event_sink.flush()
+        events = case_database.case_db.stream_case_events(case_obj.id)
+        if file_format == 'csv':
+            rows, mimetype = _events_as_csv(events), 'text/csv'
+        else:
+            rows, mimetype = (json.dumps(event) + '\n' for event in events), 'application/x-ndjson'
+        filename = '{0}-events.{1}'.format(case_obj.name, file_format)
+        return Response(stream_with_context(rows), mimetype=mimetype,
+                        headers={'Content-Disposition': 'attachment; filename="{}"'.format(filename)})
+
     return __func()
+
+
+_csv_fields = ('id', 'timestamp', 'type', 'originator', 'message', 'note', 'data')
+
+
+def _events_as_csv(events):
+    line = StringIO()
+    writer = csv.writer(line)
+    writer.writerow(_csv_fields)
+    yield line.getvalue()
+    for event in events:
+        line.seek(0)
+        line.truncate()
+        if not isinstance(event['data'], string_types):
+            event['data'] = json.dumps(event['data'])
+        writer.writerow([event[field] for field in _csv_fields])
+        yield line.getvalue()
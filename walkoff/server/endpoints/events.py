@@ -2,14 +2,20 @@ from flask import request
 from flask_jwt_extended import jwt_required
 
 import walkoff.case.database as case_database
+from walkoff.case.eventsink import case_event_sink
+from walkoff.helpers import rfc_datetime_to_utc
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
 from walkoff.server.decorators import validate_resource_exists_factory
+from walkoff.server.problem import Problem
 from walkoff.server.returncodes import *
 
-validate_event_exists = validate_resource_exists_factory(
-    'event',
-    lambda event_id: case_database.case_db.session.query(case_database.Event).filter(
-        case_database.Event.id == event_id).first())
+
+def event_getter(event_id):
+    case_event_sink.flush()
+    return case_database.case_db.get_event(event_id)
+
+
+validate_event_exists = validate_resource_exists_factory('event', event_getter)
 
 
 def update_event_note():
@@ -34,3 +40,25 @@ def read_event(event_id):
         return case_database.case_db.event_as_json(event_id), SUCCESS
 
     return __func()
+
+
+def search_events(query, event_type=None, since=None, until=None, case_id=None, limit=50, cursor=None):
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('cases', ['read']))
+    def __func():
+        case_event_sink.flush()
+        try:
+            hits, next_cursor = case_database.case_db.search_events(
+                query,
+                limit,
+                cursor=cursor,
+                event_types=event_type,
+                since=rfc_datetime_to_utc(since) if since is not None else None,
+                until=rfc_datetime_to_utc(until) if until is not None else None,
+                case_id=case_id)
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not search events.', str(e))
+        headers = {'X-Next-Cursor': next_cursor} if next_cursor is not None else {}
+        return hits, SUCCESS, headers
+
+    return __func()
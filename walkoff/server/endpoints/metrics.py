@@ -1,6 +1,14 @@
+from uuid import UUID
+
 from flask_jwt_extended import jwt_required
 
+from interfaces.handlerpool import handler_pool
+from walkoff.case.eventsink import case_event_sink
+from walkoff.events import WalkoffEvent
+from walkoff.executiondb.retention import get_rollups
+from walkoff.helpers import rfc_datetime_to_utc
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
+from walkoff.server.problem import Problem
 from walkoff.server.returncodes import *
 
 
@@ -22,6 +30,48 @@ def read_workflow_metrics():
     return __func()
 
 
+def read_workflow_rollups(workflow_id=None, since=None, until=None):
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        try:
+            rollups = get_rollups(workflow_id=UUID(workflow_id) if workflow_id is not None else None,
+                                  since=rfc_datetime_to_utc(since) if since is not None else None,
+                                  until=rfc_datetime_to_utc(until) if until is not None else None)
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not read workflow rollups.', str(e))
+        return [rollup.as_json() for rollup in rollups], SUCCESS
+
+    return __func()
+
+
+def read_case_event_metrics():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        return case_event_sink.metrics(), SUCCESS
+
+    return __func()
+
+
+def read_interface_handler_metrics():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        return handler_pool.metrics(), SUCCESS
+
+    return __func()
+
+
+def read_event_metrics():
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('metrics', ['read']))
+    def __func():
+        return WalkoffEvent.metrics(), SUCCESS
+
+    return __func()
+
+
 def _convert_action_time_averages():
     import walkoff.server.metrics as metrics
     apps_json = []
@@ -5,8 +5,10 @@ from flask import request, current_app, send_file
 from flask_jwt_extended import jwt_required
 from sqlalchemy import exists, and_
 from sqlalchemy.exc import IntegrityError, StatementError
+from sqlalchemy.orm import selectinload
 
 from walkoff import executiondb
+from walkoff.executiondb.loader import load_playbook, load_workflow, playbook_load_options, workflow_load_options
 from walkoff.executiondb.playbook import Playbook
 from walkoff.executiondb.workflow import Workflow
 from walkoff.helpers import InvalidExecutionElement, regenerate_workflow_ids
@@ -34,12 +36,11 @@ def does_workflow_exist(playbook_id, workflow_id):
 
 
 def playbook_getter(playbook_id):
-    playbook = executiondb.execution_db.session.query(Playbook).filter_by(id=playbook_id).first()
-    return playbook
+    return load_playbook(playbook_id)
 
 
 def workflow_getter(workflow_id):
-    return executiondb.execution_db.session.query(Workflow).filter_by(id=workflow_id).first()
+    return load_workflow(workflow_id)
 
 
 with_playbook = with_resource_factory('playbook', playbook_getter, validator=is_valid_uid)
@@ -76,7 +77,11 @@ def get_playbooks(full=None):
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
     def __func():
         full_rep = bool(full)
-        playbooks = executiondb.execution_db.session.query(Playbook).all()
+        if full_rep:
+            options = playbook_load_options()
+        else:
+            options = [selectinload(Playbook.workflows).load_only('id', 'name')]
+        playbooks = executiondb.execution_db.session.query(Playbook).options(*options).all()
 
         if full_rep:
             ret_playbooks = [playbook_schema.dump(playbook).data for playbook in playbooks]
@@ -240,7 +245,7 @@ def get_workflows(playbook=None):
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
     def __get():
         return [workflow_schema.dump(workflow).data for workflow in
-                executiondb.execution_db.session.query(Workflow).all()], SUCCESS
+                executiondb.execution_db.session.query(Workflow).options(*workflow_load_options()).all()], SUCCESS
 
     if playbook:
         return get_workflows_for_playbook(playbook)
@@ -386,7 +391,7 @@ def copy_workflow(playbook_id, workflow_id):
         regenerate_workflow_ids(workflow_json)
 
         if executiondb.execution_db.session.query(exists().where(Playbook.id == playbook_id)).scalar():
-            playbook = executiondb.execution_db.session.query(Playbook).filter_by(id=playbook_id).first()
+            playbook = load_playbook(playbook_id)
         else:
             executiondb.execution_db.session.rollback()
             current_app.logger.error('Could not copy workflow {}. Playbook does not exist'.format(playbook_id))
@@ -1,14 +1,21 @@
+import base64
+import os
 from collections import OrderedDict
+from datetime import datetime
+from uuid import UUID
 
-from flask import request, current_app
+from flask import request, current_app, send_file
 from flask_jwt_extended import jwt_required
-from sqlalchemy import exists
+from sqlalchemy import exists, and_, or_
+from sqlalchemy.orm import selectinload
 
 from walkoff import executiondb
 from walkoff.executiondb.argument import Argument
+from walkoff.executiondb.statuswriter import status_writer
 from walkoff.executiondb.workflow import Workflow
 from walkoff.executiondb.workflowresults import WorkflowStatus, WorkflowStatusEnum
-from walkoff.helpers import InvalidArgument
+from walkoff.helpers import InvalidArgument, rfc_datetime_to_utc
+from walkoff.resultstore import result_store
 from walkoff.security import permissions_accepted_for_resources, ResourcePermissions
 from walkoff.server.decorators import with_resource_factory, validate_resource_exists_factory, is_valid_uid
 from walkoff.server.problem import Problem
@@ -20,11 +27,11 @@ def does_workflow_exist(workflow_id):
 
 
 def does_execution_id_exist(execution_id):
-    return executiondb.execution_db.session.query(exists().where(WorkflowStatus.execution_id == execution_id)).scalar()
+    return status_writer.get_workflow_status(execution_id) is not None
 
 
 def workflow_status_getter(execution_id):
-    return executiondb.execution_db.session.query(WorkflowStatus).filter_by(execution_id=execution_id).first()
+    return status_writer.get_workflow_status(execution_id)
 
 
 with_workflow_status = with_resource_factory('workflow', workflow_status_getter, validator=is_valid_uid)
@@ -40,13 +47,22 @@ executing_statuses = (WorkflowStatusEnum.running, WorkflowStatusEnum.awaiting_da
 completed_statuses = (WorkflowStatusEnum.aborted, WorkflowStatusEnum.completed)
 
 
-def get_all_workflow_status(limit=50):
+def get_all_workflow_status(limit=50, workflow_id=None, status=None, started_after=None, started_before=None,
+                            cursor=None, paginate=False):
+    paginate = paginate or any(param is not None for param in
+                               (workflow_id, status, started_after, started_before, cursor))
+
     @jwt_required
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
     def __func():
+        status_writer.flush()
+        if paginate:
+            return __get_page()
+
         ret = executiondb.execution_db.session.query(WorkflowStatus). \
             filter(WorkflowStatus.status.in_(executing_statuses)). \
             order_by(WorkflowStatus.started_at). \
+            limit(limit). \
             all()
 
         if len(ret) < limit:
@@ -59,9 +75,105 @@ def get_all_workflow_status(limit=50):
         ret = [workflow_status.as_json() for workflow_status in ret]
         return ret, SUCCESS
 
+    def __get_page():
+        try:
+            query = filter_workflow_statuses(workflow_id, status, started_after, started_before, cursor)
+        except ValueError as e:
+            return Problem(BAD_REQUEST, 'Could not read workflow statuses.', str(e))
+
+        page = query.options(selectinload(WorkflowStatus._action_statuses)).limit(limit + 1).all()
+        headers = {}
+        if len(page) > limit:
+            page = page[:limit]
+            headers['X-Next-Cursor'] = encode_status_cursor(page[-1])
+        return [workflow_status.as_json() for workflow_status in page], SUCCESS, headers
+
     return __func()
 
 
+def filter_workflow_statuses(workflow_id=None, status=None, started_after=None, started_before=None, cursor=None):
+    """Builds a query of the workflows which have started, newest first, for keyset pagination
+
+    Args:
+        workflow_id (str, optional): Only include executions of this workflow. Defaults to None
+        status (list[str], optional): Only include executions with one of these statuses. Defaults to None
+        started_after (str, optional): Only include executions started at or after this RFC 3339 time. Defaults to
+            None
+        started_before (str, optional): Only include executions started before this RFC 3339 time. Defaults to None
+        cursor (str, optional): The cursor returned with the previous page. Defaults to None
+
+    Returns:
+        (Query): The query of the workflow statuses
+
+    Raises:
+        ValueError: If a parameter is malformed
+    """
+    query = executiondb.execution_db.session.query(WorkflowStatus).filter(WorkflowStatus.started_at.isnot(None))
+    if workflow_id is not None:
+        query = query.filter(WorkflowStatus.workflow_id == _parse_uuid(workflow_id, 'workflow ID'))
+    if status:
+        query = query.filter(WorkflowStatus.status.in_([_parse_status(status_) for status_ in status]))
+    if started_after is not None:
+        query = query.filter(WorkflowStatus.started_at >= rfc_datetime_to_utc(started_after))
+    if started_before is not None:
+        query = query.filter(WorkflowStatus.started_at < rfc_datetime_to_utc(started_before))
+    if cursor is not None:
+        started_at, execution_id = decode_status_cursor(cursor)
+        query = query.filter(or_(WorkflowStatus.started_at < started_at,
+                                 and_(WorkflowStatus.started_at == started_at,
+                                      WorkflowStatus.execution_id < execution_id)))
+    return query.order_by(WorkflowStatus.started_at.desc(), WorkflowStatus.execution_id.desc())
+
+
+def encode_status_cursor(workflow_status):
+    """Encodes the position of a workflow status as an opaque cursor
+
+    Args:
+        workflow_status (WorkflowStatus): The last workflow status of a page
+
+    Returns:
+        (str): The cursor
+    """
+    position = '{0}|{1}'.format(workflow_status.started_at.strftime(_cursor_time_format), workflow_status.execution_id)
+    return base64.urlsafe_b64encode(position.encode('utf-8')).decode('utf-8')
+
+
+def decode_status_cursor(cursor):
+    """Decodes a cursor created by encode_status_cursor
+
+    Args:
+        cursor (str): The cursor
+
+    Returns:
+        (tuple(datetime, UUID)): The started time and execution ID of the last workflow status of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        started_at, execution_id = base64.urlsafe_b64decode(str(cursor)).decode('utf-8').split('|')
+        return datetime.strptime(started_at, _cursor_time_format), UUID(execution_id)
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Invalid cursor {}'.format(cursor))
+
+
+_cursor_time_format = '%Y-%m-%dT%H:%M:%S.%f'
+
+
+def _parse_uuid(value, name):
+    try:
+        return UUID(value)
+    except ValueError:
+        raise ValueError('Invalid {0} {1}'.format(name, value))
+
+
+def _parse_status(value):
+    try:
+        return WorkflowStatusEnum[value]
+    except KeyError:
+        raise ValueError('Invalid status {}'.format(value))
+
+
 def get_workflow_status(execution_id):
     @jwt_required
     @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
@@ -125,3 +237,16 @@ def control_workflow():
         return None, NO_CONTENT
 
     return __func()
+
+
+def get_action_result(result_id):
+    @jwt_required
+    @permissions_accepted_for_resources(ResourcePermissions('playbooks', ['read']))
+    def __func():
+        path = result_store.get_path(result_id)
+        if path is None:
+            return Problem.from_crud_resource(OBJECT_DNE_ERROR, 'result', 'read',
+                                              'Result {} does not exist.'.format(result_id))
+        return send_file(os.path.abspath(path), mimetype='application/json'), SUCCESS
+
+    return __func()
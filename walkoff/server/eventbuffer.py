@@ -0,0 +1,109 @@
+from collections import deque
+from itertools import islice
+
+from gevent.event import Event
+
+import walkoff.config.config
+from walkoff.helpers import create_sse_event
+
+
+class SseEventBuffer(object):
+    """A bounded ring buffer of the most recent events of a server-sent event stream
+
+    Each event is numbered by a sequence number which is shared by all of the subscribers of the stream, and which is
+    sent to them as the id of the event. Each subscriber reads the buffer from its own cursor, so a slow subscriber
+    does not hold up the others, and a subscriber which reconnects with the id of the last event it received is sent
+    the events it missed, as long as they are still in the buffer
+
+    Attributes:
+        maxlen (int): The maximum number of events held in the buffer. If None, the sse_event_buffer_size value in
+            walkoff.config.config is used
+        sequence (int): The sequence number of the newest event
+
+    Args:
+        maxlen (int, optional): The maximum number of events held in the buffer. Defaults to None
+    """
+
+    def __init__(self, maxlen=None):
+        self.maxlen = maxlen
+        self.sequence = 0
+        self._events = None
+        self._signal = Event()
+
+    def publish(self, event, data):
+        """Adds an event to the buffer and wakes the subscribers
+
+        Args:
+            event (str): The type of the event
+            data: The data of the event
+
+        Returns:
+            (int): The sequence number of the event
+        """
+        events = self.__get_events()
+        self.sequence += 1
+        events.append((self.sequence, event, data))
+        signal, self._signal = self._signal, Event()
+        signal.set()
+        return self.sequence
+
+    def events_after(self, cursor):
+        """Gets the events in the buffer which were published after an event
+
+        Args:
+            cursor (int): The sequence number of the event
+
+        Returns:
+            (list[tuple(int, str, object)]): The sequence number, type, and data of each event published after the
+                cursor which is still in the buffer, oldest first
+        """
+        events = self.__get_events()
+        count = min(self.sequence - cursor, len(events))
+        if count <= 0:
+            return []
+        return list(islice(reversed(events), count))[::-1]
+
+    def get_cursor(self, last_event_id=None):
+        """Gets the cursor from which a subscriber should read
+
+        Args:
+            last_event_id (str, optional): The Last-Event-ID sent by a reconnecting subscriber. Defaults to None, meaning
+                the subscriber is sent only the events published after it subscribed
+
+        Returns:
+            (int): The sequence number of the last event the subscriber has received
+        """
+        if last_event_id is not None:
+            try:
+                cursor = int(last_event_id)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if 0 <= cursor <= self.sequence:
+                    return cursor
+        return self.sequence
+
+    def subscribe(self, cursor):
+        """Streams the events of the buffer published after a cursor as server-sent events
+
+        Args:
+            cursor (int): The sequence number of the last event the subscriber has received
+
+        Yields:
+            (str): Each event formatted as a server-sent event
+        """
+        while True:
+            signal = self._signal
+            events = self.events_after(cursor)
+            if not events:
+                signal.wait()
+                continue
+            for sequence, event, data in events:
+                yield create_sse_event(event_id=sequence, event=event, data=data)
+            cursor = events[-1][0]
+
+    def __get_events(self):
+        if self._events is None:
+            maxlen = self.maxlen if self.maxlen is not None else walkoff.config.config.sse_event_buffer_size
+            self._events = deque(maxlen=maxlen)
+        return self._events